@@ -210,9 +210,12 @@ def run_export_cmd(args, config) -> int:
                 qt_renderer.save_page_png(pages[0], str(out_path), style=doc.style)
                 print(f"Exported PNG to {out_path}")
             else:
-                for i, page in enumerate(pages, start=1):
+                # Multi-page: rasterize pages concurrently, save them in page order
+                from core.layout.render_service import get_page_render_service
+                images = get_page_render_service().render_pages(pages, style=doc.style)
+                for i, image in enumerate(images, start=1):
                     p = out_path.with_name(f"{out_path.stem}-{i:03d}{out_path.suffix}")
-                    qt_renderer.save_page_png(page, str(p), style=doc.style)
+                    image.save(str(p), "PNG")
                     print(f"Exported PNG to {p}")
 
     try:
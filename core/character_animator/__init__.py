@@ -29,7 +29,8 @@ from .availability import (
     get_install_status_message,
     get_missing_dependencies,
 )
-from .ai_face_editor import AIFaceEditor, EditResult, StyleInfo, get_ai_face_editor
+from .ai_face_editor import AIFaceEditor, AssetJob, EditResult, StyleInfo, get_ai_face_editor
+from .asset_scheduler import PuppetAssetScheduler
 from .face_generator import FaceVariantGenerator
 
 __all__ = [
@@ -55,8 +56,10 @@ __all__ = [
     "get_missing_dependencies",
     # AI Face Editing
     "AIFaceEditor",
+    "AssetJob",
     "EditResult",
     "StyleInfo",
     "get_ai_face_editor",
+    "PuppetAssetScheduler",
     "FaceVariantGenerator",
 ]
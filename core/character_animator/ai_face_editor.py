@@ -12,6 +12,7 @@ Supported Providers:
 
 import logging
 import hashlib
+import threading
 import time
 import io
 from pathlib import Path
@@ -23,6 +24,7 @@ from PIL import Image
 from base64 import b64decode, b64encode
 
 from core.constants import get_user_data_dir
+from core.security import RateLimiter, rate_limiter as shared_rate_limiter
 from .constants import (
     REQUIRED_VISEMES,
     AI_VISEME_PROMPTS,
@@ -63,6 +65,23 @@ class EditResult:
     quality_score: float = 1.0
 
 
+@dataclass
+class AssetJob:
+    """One region edit producing a puppet asset (a viseme, blink or expression)."""
+    name: str  # e.g. "viseme_Ah"; doubles as the cache key suffix
+    region_bbox: Tuple[int, int, int, int]
+    prompt: str
+
+
+@dataclass
+class _EditSession:
+    """Encodings of one base image, shared by every edit of that image."""
+    image: Image.Image
+    image_hash: str
+    png: bytes
+    masks: Dict[Tuple[int, int, int, int], bytes] = field(default_factory=dict)
+
+
 class AIFaceEditor:
     """
     AI-powered face region editor for Character Animator puppet generation.
@@ -92,6 +111,7 @@ class AIFaceEditor:
         quality_threshold: float = 0.7,
         max_retries: int = 3,
         style_hint: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         """
         Initialize the AI face editor.
@@ -105,6 +125,8 @@ class AIFaceEditor:
             max_retries: Maximum retry attempts for failed generations
             style_hint: Optional user-provided style hint (e.g., "cartoon", "anime",
                         or custom description like "cel-shaded with thick black outlines")
+            rate_limiter: Call budget checked before every provider request
+                          (defaults to the application-wide limiter)
         """
         self.provider = AIProvider(provider.lower())
         self.model = model or self.DEFAULT_MODELS[self.provider]
@@ -113,11 +135,15 @@ class AIFaceEditor:
         self.quality_threshold = quality_threshold
         self.max_retries = max_retries
         self.style_hint = style_hint
+        self.rate_limiter = rate_limiter or shared_rate_limiter
 
         self._client = None
         self._chat_session = None  # For Gemini conversational editing
         self._initialized = False
         self._style_info: Optional[StyleInfo] = None  # Detected style information
+        # Hash, PNG and masks of the last edited image; edits run concurrently
+        self._session: Optional[_EditSession] = None
+        self._session_lock = threading.Lock()
 
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -236,6 +262,32 @@ class AIFaceEditor:
         img_bytes = image.tobytes()
         return hashlib.md5(img_bytes).hexdigest()[:12]
 
+    def _session_for(self, image: Image.Image) -> _EditSession:
+        """
+        The edit session of ``image``, started on its first edit.
+
+        The image is hashed and encoded once, however many assets are cut
+        from it. Sessions are matched by identity, so an image must not be
+        modified in place between edits.
+        """
+        with self._session_lock:
+            if self._session is None or self._session.image is not image:
+                self._session = _EditSession(
+                    image=image,
+                    image_hash=self._get_image_hash(image),
+                    png=self._image_to_bytes(image),
+                )
+            return self._session
+
+    def _session_mask(self, session: _EditSession, region_bbox: Tuple[int, int, int, int]) -> bytes:
+        """The alpha mask for ``region_bbox``, built once per session."""
+        with self._session_lock:
+            mask = session.masks.get(region_bbox)
+            if mask is None:
+                mask = self._create_alpha_mask(session.image.size, region_bbox)
+                session.masks[region_bbox] = mask
+            return mask
+
     def _load_cached(self, cache_key: str) -> Optional[Image.Image]:
         """Load a cached variant if available."""
         cache_path = self.cache_dir / f"{cache_key}.png"
@@ -347,21 +399,15 @@ class AIFaceEditor:
 
         # Check cache
         if use_cache:
-            image_hash = self._get_image_hash(image)
-            cache_key = self._get_cache_key(image_hash, "region", cache_key_suffix)
-            cached = self._load_cached(cache_key)
+            cache_key = self._region_cache_key(image, cache_key_suffix)
+            cached = self.load_cached_edit(image, cache_key_suffix)
             if cached is not None:
-                return EditResult(
-                    success=True,
-                    image=cached,
-                    provider=self.provider.value,
-                    model=self.model,
-                    cached=True,
-                )
+                return cached
 
         # Dispatch to provider-specific implementation
         for attempt in range(self.max_retries):
             try:
+                self.rate_limiter.check_rate_limit(self.provider.value, wait=True)
                 if self.provider == AIProvider.GOOGLE:
                     result = self._edit_with_gemini(image, region_bbox, prompt)
                 else:
@@ -395,6 +441,33 @@ class AIFaceEditor:
             model=self.model,
         )
 
+    def _region_cache_key(self, image: Image.Image, cache_key_suffix: str) -> str:
+        """Cache key of a region edit of ``image``."""
+        image_hash = self._session_for(image).image_hash
+        return self._get_cache_key(image_hash, "region", cache_key_suffix)
+
+    def load_cached_edit(self, image: Image.Image, cache_key_suffix: str) -> Optional[EditResult]:
+        """
+        Cached result of a region edit, without contacting the provider.
+
+        Args:
+            image: Full face/character image
+            cache_key_suffix: Suffix the edit was cached under
+
+        Returns:
+            EditResult with ``cached=True``, or None if nothing is cached
+        """
+        cached = self._load_cached(self._region_cache_key(image, cache_key_suffix))
+        if cached is None:
+            return None
+        return EditResult(
+            success=True,
+            image=cached,
+            provider=self.provider.value,
+            model=self.model,
+            cached=True,
+        )
+
     def _edit_with_gemini(
         self,
         image: Image.Image,
@@ -408,7 +481,7 @@ class AIFaceEditor:
         """
         try:
             # Prepare image bytes
-            image_bytes = self._image_to_bytes(image)
+            image_bytes = self._session_for(image).png
 
             # Build the editing prompt with region context
             x, y, w, h = region_bbox
@@ -481,8 +554,9 @@ class AIFaceEditor:
         """
         try:
             # Prepare image and mask
-            image_bytes = self._image_to_bytes(image)
-            mask_bytes = self._create_alpha_mask(image.size, region_bbox)
+            session = self._session_for(image)
+            image_bytes = session.png
+            mask_bytes = self._session_mask(session, region_bbox)
 
             # Build the editing prompt
             full_prompt = (
@@ -803,24 +877,22 @@ class AIFaceEditor:
 
         return " ".join(style_parts)
 
-    def generate_viseme(
+    def viseme_job(
         self,
         image: Image.Image,
         mouth_bbox: Tuple[int, int, int, int],
         viseme_name: str,
-        use_cache: bool = True,
-    ) -> EditResult:
+    ) -> AssetJob:
         """
-        Generate a single viseme by editing the mouth region.
+        Describe the edit that generates a viseme.
 
         Args:
-            image: Full face/character image
+            image: Full face/character image (used for style detection)
             mouth_bbox: (x, y, width, height) of mouth region
             viseme_name: Name of viseme (e.g., "Ah", "Ee")
-            use_cache: Whether to use caching
 
         Returns:
-            EditResult with the viseme image
+            AssetJob named "viseme_<name>"
         """
         # Extract style info if not already done
         if not self._style_info:
@@ -829,18 +901,114 @@ class AIFaceEditor:
         # Get base prompt and enhance with style
         base_prompt = AI_VISEME_PROMPTS.get(viseme_name, f"Edit the mouth to show: {viseme_name}")
         prompt = self._build_prompt_with_style(base_prompt)
-
-        logger.info(f"Generating viseme: {viseme_name}")
         logger.debug(f"Viseme prompt: {prompt[:100]}...")
 
+        return AssetJob(name=f"viseme_{viseme_name}", region_bbox=mouth_bbox, prompt=prompt)
+
+    def eye_blink_job(
+        self,
+        image: Image.Image,
+        eye_bbox: Tuple[int, int, int, int],
+        side: str,
+        state: str = "blink",
+    ) -> AssetJob:
+        """
+        Describe the edit that generates an eye blink state.
+
+        Args:
+            image: Full face/character image (used for style detection)
+            eye_bbox: (x, y, width, height) of eye region
+            side: "left" or "right"
+            state: "open" or "blink"
+
+        Returns:
+            AssetJob named "eye_<side>_<state>"
+        """
+        # Extract style info if not already done
+        if not self._style_info:
+            self.extract_style_info(image)
+
+        # Get base prompt and enhance with style
+        prompt_key = f"{side}_{state}"
+        base_prompt = AI_EYE_BLINK_PROMPTS.get(prompt_key, f"Edit the {side} eye to be {state}")
+        prompt = self._build_prompt_with_style(base_prompt)
+        logger.debug(f"Eye blink prompt: {prompt[:100]}...")
+
+        return AssetJob(name=f"eye_{side}_{state}", region_bbox=eye_bbox, prompt=prompt)
+
+    def expression_job(
+        self,
+        image: Image.Image,
+        face_bbox: Tuple[int, int, int, int],
+        expression: str,
+    ) -> AssetJob:
+        """
+        Describe the edit that generates a facial expression.
+
+        Args:
+            image: Full face/character image (used for style detection)
+            face_bbox: (x, y, width, height) of face/eyebrow region
+            expression: Expression name (e.g., "raised", "lowered", "concerned")
+
+        Returns:
+            AssetJob named "expression_<expression>"
+        """
+        # Extract style info if not already done
+        if not self._style_info:
+            self.extract_style_info(image)
+
+        # Get base prompt and enhance with style
+        base_prompt = AI_EYEBROW_PROMPTS.get(
+            expression,
+            f"Edit the eyebrows to show a {expression} expression"
+        )
+        prompt = self._build_prompt_with_style(base_prompt)
+        logger.debug(f"Expression prompt: {prompt[:100]}...")
+
+        return AssetJob(name=f"expression_{expression}", region_bbox=face_bbox, prompt=prompt)
+
+    def run_job(self, image: Image.Image, job: AssetJob, use_cache: bool = True) -> EditResult:
+        """
+        Run one asset edit.
+
+        Args:
+            image: Full face/character image
+            job: The edit, from viseme_job, eye_blink_job or expression_job
+            use_cache: Whether to use caching
+
+        Returns:
+            EditResult with the edited image
+        """
         return self.edit_face_region(
             image=image,
-            region_bbox=mouth_bbox,
-            prompt=prompt,
+            region_bbox=job.region_bbox,
+            prompt=job.prompt,
             use_cache=use_cache,
-            cache_key_suffix=f"viseme_{viseme_name}",
+            cache_key_suffix=job.name,
         )
 
+    def generate_viseme(
+        self,
+        image: Image.Image,
+        mouth_bbox: Tuple[int, int, int, int],
+        viseme_name: str,
+        use_cache: bool = True,
+    ) -> EditResult:
+        """
+        Generate a single viseme by editing the mouth region.
+
+        Args:
+            image: Full face/character image
+            mouth_bbox: (x, y, width, height) of mouth region
+            viseme_name: Name of viseme (e.g., "Ah", "Ee")
+            use_cache: Whether to use caching
+
+        Returns:
+            EditResult with the viseme image
+        """
+        logger.info(f"Generating viseme: {viseme_name}")
+        return self.run_job(image, self.viseme_job(image, mouth_bbox, viseme_name), use_cache)
+
     def generate_all_visemes(
         self,
         image: Image.Image,
@@ -849,36 +1017,34 @@ class AIFaceEditor:
         use_cache: bool = True,
     ) -> Dict[str, EditResult]:
         """
-        Generate all 14 required visemes.
+        Generate all 14 required visemes concurrently.
+
+        See PuppetAssetScheduler: cached visemes are served first, the rest
+        are edited in parallel under the provider's rate budget.
 
         Args:
             image: Full face/character image
             mouth_bbox: (x, y, width, height) of mouth region
-            progress_callback: Optional callback(viseme_name, index, total)
+            progress_callback: Optional callback(viseme_name, index, total),
+                called as each viseme finishes
             use_cache: Whether to use caching
 
         Returns:
             Dictionary mapping viseme name to EditResult
         """
-        results = {}
+        from .asset_scheduler import PuppetAssetScheduler
 
-        for i, viseme_name in enumerate(REQUIRED_VISEMES):
-            if progress_callback:
-                progress_callback(viseme_name, i, len(REQUIRED_VISEMES))
-
-            result = self.generate_viseme(
-                image=image,
-                mouth_bbox=mouth_bbox,
-                viseme_name=viseme_name,
-                use_cache=use_cache,
-            )
+        jobs = [self.viseme_job(image, mouth_bbox, name) for name in REQUIRED_VISEMES]
+        viseme_names = {job.name: name for job, name in zip(jobs, REQUIRED_VISEMES)}
 
-            results[viseme_name] = result
-
-            if not result.success:
-                logger.warning(f"Failed to generate viseme {viseme_name}: {result.error}")
+        def on_progress(job_name, index, total):
+            if progress_callback:
+                progress_callback(viseme_names[job_name], index, total)
 
-        return results
+        results = PuppetAssetScheduler(self).run(
+            image, jobs, progress_callback=on_progress, use_cache=use_cache,
+        )
+        return {viseme_names[job_name]: result for job_name, result in results.items()}
 
     def generate_eye_blink(
         self,
@@ -901,25 +1067,8 @@ class AIFaceEditor:
         Returns:
             EditResult with the blink state image
         """
-        # Extract style info if not already done
-        if not self._style_info:
-            self.extract_style_info(image)
-
-        # Get base prompt and enhance with style
-        prompt_key = f"{side}_{state}"
-        base_prompt = AI_EYE_BLINK_PROMPTS.get(prompt_key, f"Edit the {side} eye to be {state}")
-        prompt = self._build_prompt_with_style(base_prompt)
-
         logger.info(f"Generating {side} eye {state} state")
-        logger.debug(f"Eye blink prompt: {prompt[:100]}...")
-
-        return self.edit_face_region(
-            image=image,
-            region_bbox=eye_bbox,
-            prompt=prompt,
-            use_cache=use_cache,
-            cache_key_suffix=f"eye_{side}_{state}",
-        )
+        return self.run_job(image, self.eye_blink_job(image, eye_bbox, side, state), use_cache)
 
     def generate_expression(
         self,
@@ -940,27 +1089,8 @@ class AIFaceEditor:
         Returns:
             EditResult with the expression image
         """
-        # Extract style info if not already done
-        if not self._style_info:
-            self.extract_style_info(image)
-
-        # Get base prompt and enhance with style
-        base_prompt = AI_EYEBROW_PROMPTS.get(
-            expression,
-            f"Edit the eyebrows to show a {expression} expression"
-        )
-        prompt = self._build_prompt_with_style(base_prompt)
-
         logger.info(f"Generating expression: {expression}")
-        logger.debug(f"Expression prompt: {prompt[:100]}...")
-
-        return self.edit_face_region(
-            image=image,
-            region_bbox=face_bbox,
-            prompt=prompt,
-            use_cache=use_cache,
-            cache_key_suffix=f"expression_{expression}",
-        )
+        return self.run_job(image, self.expression_job(image, face_bbox, expression), use_cache)
 
     def start_conversation_session(self, character_image: Image.Image) -> bool:
         """
@@ -1040,6 +1170,7 @@ class AIFaceEditor:
     def cleanup(self):
         """Release resources."""
         self._chat_session = None
+        self._session = None
         self._client = None
         self._initialized = False
         logger.info("AIFaceEditor resources released")
@@ -447,6 +447,9 @@ PSD_SETTINGS = {
 SVG_SETTINGS = {
     "embed_images": True,  # Embed raster images as base64
     "vectorize": False,    # Convert to vector paths (slower, not always better)
+    "trace_alpha": False,  # Trace layer alpha masks into flat-filled paths
+    "simplify_tolerance": 1.0,  # Douglas-Peucker tolerance for traced paths (px)
+    "trace_colors": 8,     # Fill colors per traced layer
 }
 
 # Default canvas size for Character Animator
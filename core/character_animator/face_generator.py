@@ -26,10 +26,13 @@ from .constants import (
     REQUIRED_VISEMES,
 )
 from .availability import AI_EDITING_AVAILABLE
-from .ai_face_editor import AIFaceEditor, EditResult, get_ai_face_editor
+from .ai_face_editor import AIFaceEditor, AssetJob, EditResult, get_ai_face_editor
+from .asset_scheduler import DEFAULT_MAX_CONCURRENT, PuppetAssetScheduler
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_EYEBROW_EXPRESSIONS = ["raised", "lowered", "concerned"]
+
 
 class FaceVariantGenerator:
     """
@@ -45,6 +48,7 @@ class FaceVariantGenerator:
         quality_threshold: float = 0.7,
         provider: str = "google",
         model: Optional[str] = None,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
     ):
         """
         Initialize the face variant generator.
@@ -54,11 +58,13 @@ class FaceVariantGenerator:
             quality_threshold: Minimum quality score for acceptance (0-1)
             provider: AI provider to use ("google" or "openai")
             model: Specific model to use (defaults to provider's best option)
+            max_concurrent: AI edits in flight at once
         """
         self.cache_dir = cache_dir or (get_user_data_dir() / "cache" / "ai_visemes")
         self.quality_threshold = quality_threshold
         self.provider = provider
         self.model = model
+        self.max_concurrent = max_concurrent
         self._ai_editor: Optional[AIFaceEditor] = None
         self._initialized = False
 
@@ -282,6 +288,167 @@ class FaceVariantGenerator:
             logger.warning(f"Failed to generate viseme {viseme_name}: {result.error}")
             return full_image
 
+    def _viseme_jobs(
+        self,
+        full_image: Image.Image,
+        segmentation: SegmentationResult,
+        viseme_set: VisemeSet,
+    ) -> Dict[str, AssetJob]:
+        """Viseme name -> edit job; stores the mouth bbox on ``viseme_set``."""
+        # Extract mouth region info
+        _, _, mouth_bbox = self.get_mouth_region(segmentation, padding=25)
+
+        if mouth_bbox is None:
+            logger.error("Cannot extract mouth region")
+            return {}
+
+        # Store the mouth bbox for cropping during export
+        viseme_set.mouth_bbox = mouth_bbox
+        logger.info(f"Mouth bbox for visemes: {mouth_bbox}")
+
+        return {
+            name: self._ai_editor.viseme_job(full_image, mouth_bbox, name)
+            for name in REQUIRED_VISEMES
+        }
+
+    def _blink_jobs(
+        self,
+        full_image: Image.Image,
+        segmentation: SegmentationResult,
+        blink_set: EyeBlinkSet,
+    ) -> Dict[str, AssetJob]:
+        """Side -> blink edit job; stores eye bboxes and open states on ``blink_set``."""
+        jobs = {}
+        for side, eye_data in zip(("left", "right"), self.get_eye_regions(segmentation)):
+            if eye_data is None:
+                continue
+            _, _, bbox = eye_data
+
+            # Store bbox for positioning during export
+            setattr(blink_set, f"{side}_eye_bbox", bbox)
+            logger.info(f"{side.capitalize()} eye bbox: {bbox}")
+
+            # Open state - extract original
+            setattr(blink_set, f"{side}_open", full_image.crop((
+                bbox[0], bbox[1], bbox[0] + bbox[2], bbox[1] + bbox[3]
+            )).convert("RGBA"))
+
+            # Blink state - generate via AI
+            jobs[side] = self._ai_editor.eye_blink_job(full_image, bbox, side, "blink")
+        return jobs
+
+    def _eyebrow_jobs(
+        self,
+        full_image: Image.Image,
+        segmentation: SegmentationResult,
+        expressions: List[str],
+    ) -> Dict[str, AssetJob]:
+        """Expression -> eyebrow edit job."""
+        # Calculate combined eyebrow region bbox
+        left_brow = segmentation.left_eyebrow_region
+        right_brow = segmentation.right_eyebrow_region
+
+        if left_brow is None and right_brow is None:
+            logger.warning("No eyebrow regions found")
+            return {}
+
+        # Combine bboxes
+        if left_brow and right_brow:
+            lx, ly, lw, lh = left_brow.bbox
+            rx, ry, rw, rh = right_brow.bbox
+            x = min(lx, rx)
+            y = min(ly, ry)
+            w = max(lx + lw, rx + rw) - x
+            h = max(ly + lh, ry + rh) - y
+            combined_bbox = (x, y, w, h)
+        elif left_brow:
+            combined_bbox = left_brow.bbox
+        else:
+            combined_bbox = right_brow.bbox
+
+        # Add padding
+        padding = 10
+        x, y, w, h = combined_bbox
+        combined_bbox = (
+            max(0, x - padding),
+            max(0, y - padding),
+            w + padding * 2,
+            h + padding * 2,
+        )
+
+        return {
+            expression: self._ai_editor.expression_job(full_image, combined_bbox, expression)
+            for expression in expressions
+        }
+
+    @staticmethod
+    def _apply_visemes(
+        viseme_set: VisemeSet,
+        jobs: Dict[str, AssetJob],
+        results: Dict[str, EditResult],
+        full_image: Image.Image,
+    ):
+        """Store viseme results; a failed viseme falls back to the original image."""
+        for viseme_name, job in jobs.items():
+            result = results[job.name]
+            if result.success and result.image:
+                if result.cached:
+                    logger.info(f"Loaded viseme {viseme_name} from cache")
+                else:
+                    logger.info(f"Generated viseme {viseme_name} via {result.provider}")
+                viseme_image = result.image
+            else:
+                logger.warning(f"Failed to generate viseme {viseme_name}: {result.error}")
+                viseme_image = full_image
+
+            attr_name = viseme_name.lower().replace("-", "_")
+            if hasattr(viseme_set, attr_name):
+                setattr(viseme_set, attr_name, viseme_image)
+
+    @staticmethod
+    def _apply_blinks(
+        blink_set: EyeBlinkSet,
+        jobs: Dict[str, AssetJob],
+        results: Dict[str, EditResult],
+    ):
+        """Store blink results."""
+        for side, job in jobs.items():
+            result = results[job.name]
+            if result.success and result.image:
+                # Keep full image - Character Animator handles positioning via layer names
+                setattr(blink_set, f"{side}_blink", result.image.convert("RGBA"))
+                logger.info(f"Generated {side} eye blink state")
+            else:
+                logger.warning(f"Failed to generate {side} blink: {result.error}")
+
+    @staticmethod
+    def _apply_eyebrows(
+        jobs: Dict[str, AssetJob],
+        results: Dict[str, EditResult],
+    ) -> Dict[str, Image.Image]:
+        """Expression -> image for the successful eyebrow results."""
+        variants = {}
+        for expression, job in jobs.items():
+            result = results[job.name]
+            if result.success and result.image:
+                variants[expression] = result.image
+                logger.info(f"Generated eyebrow variant: {expression}")
+            else:
+                logger.warning(f"Failed to generate {expression}: {result.error}")
+        return variants
+
+    def _run_jobs(
+        self,
+        full_image: Image.Image,
+        jobs: List[AssetJob],
+        progress_callback: Optional[callable],
+        use_cache: bool,
+    ) -> Dict[str, EditResult]:
+        """Run asset jobs concurrently on the AI editor."""
+        scheduler = PuppetAssetScheduler(self._ai_editor, max_concurrent=self.max_concurrent)
+        return scheduler.run(full_image, jobs, progress_callback=progress_callback,
+                             use_cache=use_cache)
+
     def generate_all_visemes(
         self,
         full_image: Image.Image,
@@ -290,12 +457,13 @@ class FaceVariantGenerator:
         use_cache: bool = True,
     ) -> VisemeSet:
         """
-        Generate all 14 mouth visemes using cloud AI.
+        Generate all 14 mouth visemes concurrently using cloud AI.
 
         Args:
             full_image: Full face/head image
             segmentation: Segmentation results with mouth region
-            progress_callback: Optional callback(viseme_name, index, total)
+            progress_callback: Optional callback(viseme_name, index, total),
+                called as each viseme finishes
             use_cache: Whether to use cached visemes if available
 
         Returns:
@@ -308,36 +476,17 @@ class FaceVariantGenerator:
                 logger.error("Failed to initialize generator")
                 return viseme_set
 
-        # Extract mouth region info
-        _, _, mouth_bbox = self.get_mouth_region(segmentation, padding=25)
-
-        if mouth_bbox is None:
-            logger.error("Cannot extract mouth region")
+        jobs = self._viseme_jobs(full_image, segmentation, viseme_set)
+        if not jobs:
             return viseme_set
+        viseme_names = {job.name: name for name, job in jobs.items()}
 
-        # Store the mouth bbox for cropping during export
-        viseme_set.mouth_bbox = mouth_bbox
-        logger.info(f"Mouth bbox for visemes: {mouth_bbox}")
-
-        # Generate each viseme
-        for i, viseme_name in enumerate(REQUIRED_VISEMES):
+        def on_progress(job_name, index, total):
             if progress_callback:
-                progress_callback(viseme_name, i, len(REQUIRED_VISEMES))
-
-            logger.info(f"Generating viseme {i+1}/{len(REQUIRED_VISEMES)}: {viseme_name}")
-
-            viseme_image = self.generate_viseme(
-                full_image=full_image,
-                mouth_bbox=mouth_bbox,
-                viseme_name=viseme_name,
-                use_cache=use_cache,
-            )
-
-            # Store in VisemeSet
-            attr_name = viseme_name.lower().replace("-", "_")
-            if hasattr(viseme_set, attr_name):
-                setattr(viseme_set, attr_name, viseme_image)
+                progress_callback(viseme_names[job_name], index, total)
 
+        results = self._run_jobs(full_image, list(jobs.values()), on_progress, use_cache)
+        self._apply_visemes(viseme_set, jobs, results, full_image)
         return viseme_set
 
     def generate_blink_states(
@@ -364,67 +513,9 @@ class FaceVariantGenerator:
                 logger.error("Failed to initialize generator")
                 return blink_set
 
-        # Get eye regions
-        left_eye_data, right_eye_data = self.get_eye_regions(segmentation)
-
-        # Generate left eye states
-        if left_eye_data is not None:
-            _, _, left_bbox = left_eye_data
-
-            # Store bbox for positioning during export
-            blink_set.left_eye_bbox = left_bbox
-            logger.info(f"Left eye bbox: {left_bbox}")
-
-            # Open state - extract original
-            blink_set.left_open = full_image.crop((
-                left_bbox[0], left_bbox[1],
-                left_bbox[0] + left_bbox[2], left_bbox[1] + left_bbox[3]
-            )).convert("RGBA")
-
-            # Blink state - generate via AI
-            result = self._ai_editor.generate_eye_blink(
-                image=full_image,
-                eye_bbox=left_bbox,
-                side="left",
-                state="blink",
-                use_cache=use_cache,
-            )
-            if result.success and result.image:
-                # Keep full image - Character Animator handles positioning via layer names
-                blink_set.left_blink = result.image.convert("RGBA")
-                logger.info("Generated left eye blink state")
-            else:
-                logger.warning(f"Failed to generate left blink: {result.error}")
-
-        # Generate right eye states
-        if right_eye_data is not None:
-            _, _, right_bbox = right_eye_data
-
-            # Store bbox for positioning during export
-            blink_set.right_eye_bbox = right_bbox
-            logger.info(f"Right eye bbox: {right_bbox}")
-
-            # Open state - extract original
-            blink_set.right_open = full_image.crop((
-                right_bbox[0], right_bbox[1],
-                right_bbox[0] + right_bbox[2], right_bbox[1] + right_bbox[3]
-            )).convert("RGBA")
-
-            # Blink state - generate via AI
-            result = self._ai_editor.generate_eye_blink(
-                image=full_image,
-                eye_bbox=right_bbox,
-                side="right",
-                state="blink",
-                use_cache=use_cache,
-            )
-            if result.success and result.image:
-                # Keep full image - Character Animator handles positioning via layer names
-                blink_set.right_blink = result.image.convert("RGBA")
-                logger.info("Generated right eye blink state")
-            else:
-                logger.warning(f"Failed to generate right blink: {result.error}")
-
+        jobs = self._blink_jobs(full_image, segmentation, blink_set)
+        results = self._run_jobs(full_image, list(jobs.values()), None, use_cache)
+        self._apply_blinks(blink_set, jobs, results)
         return blink_set
 
     def generate_eyebrow_variants(
@@ -447,63 +538,66 @@ class FaceVariantGenerator:
             Dictionary of expression name to image
         """
         if expressions is None:
-            expressions = ["raised", "lowered", "concerned"]
-
-        variants = {}
+            expressions = DEFAULT_EYEBROW_EXPRESSIONS
 
         if not self._initialized:
             if not self.initialize():
                 logger.error("Failed to initialize generator")
-                return variants
+                return {}
 
-        # Calculate combined eyebrow region bbox
-        left_brow = segmentation.left_eyebrow_region
-        right_brow = segmentation.right_eyebrow_region
+        jobs = self._eyebrow_jobs(full_image, segmentation, expressions)
+        results = self._run_jobs(full_image, list(jobs.values()), None, use_cache)
+        return self._apply_eyebrows(jobs, results)
 
-        if left_brow is None and right_brow is None:
-            logger.warning("No eyebrow regions found")
-            return variants
+    def generate_puppet_assets(
+        self,
+        full_image: Image.Image,
+        segmentation: SegmentationResult,
+        visemes: bool = True,
+        blinks: bool = True,
+        expressions: Optional[List[str]] = None,
+        progress_callback: Optional[callable] = None,
+        use_cache: bool = True,
+    ) -> Tuple[VisemeSet, EyeBlinkSet, Dict[str, Image.Image]]:
+        """
+        Generate visemes, blink states and eyebrow variants in one batch.
 
-        # Combine bboxes
-        if left_brow and right_brow:
-            lx, ly, lw, lh = left_brow.bbox
-            rx, ry, rw, rh = right_brow.bbox
-            x = min(lx, rx)
-            y = min(ly, ry)
-            w = max(lx + lw, rx + rw) - x
-            h = max(ly + lh, ry + rh) - y
-            combined_bbox = (x, y, w, h)
-        elif left_brow:
-            combined_bbox = left_brow.bbox
-        else:
-            combined_bbox = right_brow.bbox
+        All edits run concurrently, so the puppet takes about as long as its
+        slowest edit rather than one provider round-trip per asset.
 
-        # Add padding
-        padding = 10
-        x, y, w, h = combined_bbox
-        combined_bbox = (
-            max(0, x - padding),
-            max(0, y - padding),
-            w + padding * 2,
-            h + padding * 2,
-        )
+        Args:
+            full_image: Full face/head image
+            segmentation: Segmentation results with facial regions
+            visemes: Whether to generate the 14 mouth visemes
+            blinks: Whether to generate eye blink states
+            expressions: Eyebrow expressions to generate (None for none)
+            progress_callback: Optional callback(asset_name, index, total),
+                called as each asset finishes; asset names are e.g.
+                "viseme_Ah", "eye_left_blink", "expression_raised"
+            use_cache: Whether to use cached assets if available
 
-        # Generate each expression
-        for expression in expressions:
-            result = self._ai_editor.generate_expression(
-                image=full_image,
-                face_bbox=combined_bbox,
-                expression=expression,
-                use_cache=use_cache,
-            )
+        Returns:
+            Tuple of (VisemeSet, EyeBlinkSet, expression name to image)
+        """
+        viseme_set = VisemeSet()
+        blink_set = EyeBlinkSet()
 
-            if result.success and result.image:
-                variants[expression] = result.image
-                logger.info(f"Generated eyebrow variant: {expression}")
-            else:
-                logger.warning(f"Failed to generate {expression}: {result.error}")
+        if not self._initialized:
+            if not self.initialize():
+                logger.error("Failed to initialize generator")
+                return viseme_set, blink_set, {}
 
-        return variants
+        viseme_jobs = self._viseme_jobs(full_image, segmentation, viseme_set) if visemes else {}
+        blink_jobs = self._blink_jobs(full_image, segmentation, blink_set) if blinks else {}
+        eyebrow_jobs = (self._eyebrow_jobs(full_image, segmentation, expressions)
+                        if expressions else {})
+
+        jobs = [*viseme_jobs.values(), *blink_jobs.values(), *eyebrow_jobs.values()]
+        results = self._run_jobs(full_image, jobs, progress_callback, use_cache)
+
+        self._apply_visemes(viseme_set, viseme_jobs, results, full_image)
+        self._apply_blinks(blink_set, blink_jobs, results)
+        return viseme_set, blink_set, self._apply_eyebrows(eyebrow_jobs, results)
 
     def start_batch_session(self, character_image: Image.Image) -> bool:
         """
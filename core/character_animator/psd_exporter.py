@@ -9,7 +9,7 @@ Uses psd-tools library for PSD creation.
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple
 import numpy as np
 from PIL import Image
 import struct
@@ -21,6 +21,77 @@ from .availability import PSD_EXPORT_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# Channel image data compression types
+_RAW = 0
+_RLE = 1
+
+# Longest run or literal a PackBits header can describe
+_PACKBITS_MAX = 128
+
+
+def packbits_rows(plane: np.ndarray) -> Tuple[np.ndarray, bytes]:
+    """
+    PackBits-encode every row of an 8-bit image plane, as PSD RLE data.
+
+    Runs of three or more equal bytes become repeat packets, everything else
+    is gathered into literal packets; no packet crosses a row boundary.
+
+    Args:
+        plane: (height, width) uint8 array
+
+    Returns:
+        (row_counts, data): encoded size of each row and the encoded rows
+    """
+    height, width = plane.shape
+    flat = np.ascontiguousarray(plane, dtype=np.uint8).ravel()
+    if not flat.size:
+        return np.zeros(height, dtype=np.int64), b""
+
+    # Runs of equal bytes, broken at row starts and at the longest packet
+    change = np.ones(flat.size, dtype=bool)
+    change[1:] = flat[1:] != flat[:-1]
+    change[::width] = True
+    run_start = np.flatnonzero(change)
+    run_len = np.diff(np.append(run_start, flat.size))
+    pieces = -(-run_len // _PACKBITS_MAX)
+    offset = (np.arange(pieces.sum()) - np.repeat(np.cumsum(pieces) - pieces, pieces)) * _PACKBITS_MAX
+    start = np.repeat(run_start, pieces) + offset
+    length = np.minimum(np.repeat(run_len, pieces) - offset, _PACKBITS_MAX)
+
+    # Short runs merge into literals spanning up to the next repeat or row start
+    repeat = length >= 3
+    row = start // width
+    first = ~repeat
+    first[1:] &= repeat[:-1] | (row[1:] != row[:-1])
+    group = np.cumsum(first) - 1
+    literal_start = start[first]
+    literal_len = np.bincount(group[~repeat], weights=length[~repeat],
+                              minlength=len(literal_start)).astype(np.int64)
+    pieces = -(-literal_len // _PACKBITS_MAX)
+    offset = (np.arange(pieces.sum()) - np.repeat(np.cumsum(pieces) - pieces, pieces)) * _PACKBITS_MAX
+    literal_start = np.repeat(literal_start, pieces) + offset
+    literal_len = np.minimum(np.repeat(literal_len, pieces) - offset, _PACKBITS_MAX)
+
+    # Packets in source order: a header byte, then the value or the literal bytes
+    packet_start = np.concatenate([start[repeat], literal_start])
+    packet_len = np.concatenate([length[repeat], literal_len])
+    is_repeat = np.arange(len(packet_start)) < repeat.sum()
+    order = np.argsort(packet_start, kind="stable")
+    packet_start, packet_len, is_repeat = packet_start[order], packet_len[order], is_repeat[order]
+    size = np.where(is_repeat, 2, packet_len + 1)
+    out_start = np.cumsum(size) - size
+
+    out = np.empty(int(size.sum()), dtype=np.uint8)
+    out[out_start] = np.where(is_repeat, 257 - packet_len, packet_len - 1)
+    out[out_start[is_repeat] + 1] = flat[packet_start[is_repeat]]
+    lit_start, lit_len = packet_start[~is_repeat], packet_len[~is_repeat]
+    within = np.arange(lit_len.sum()) - np.repeat(np.cumsum(lit_len) - lit_len, lit_len)
+    out[np.repeat(out_start[~is_repeat] + 1, lit_len) + within] = \
+        flat[np.repeat(lit_start, lit_len) + within]
+
+    row_counts = np.bincount(packet_start // width, weights=size, minlength=height).astype(np.int64)
+    return row_counts, out.tobytes()
+
 
 class PSDExporter:
     """
@@ -329,6 +400,9 @@ class PSDExporter:
         Create PSD file manually using binary format.
 
         This creates a basic PSD file that Character Animator can read.
+        Layers are cropped to their non-transparent bounds and all channel
+        data is PackBits (RLE) compressed. Each layer is written straight to
+        the file; lengths that precede the data are patched in afterwards.
         """
         try:
             # Collect all layers with images
@@ -366,16 +440,12 @@ class PSDExporter:
                 f.write(struct.pack('>I', 0))
 
                 # Layer and Mask Info
-                layer_data = self._build_layer_section(flat_layers, width, height)
-                f.write(struct.pack('>I', len(layer_data)))
-                f.write(layer_data)
+                self._write_layer_section(f, flat_layers)
 
                 # Image Data (composite)
                 composite = self._create_composite_image(flat_layers, width, height)
-                f.write(struct.pack('>H', 0))  # Compression (raw)
-                for channel in range(4):  # RGBA
-                    channel_data = composite[:, :, channel].tobytes()
-                    f.write(channel_data)
+                f.write(struct.pack('>H', _RLE))  # Compression
+                self._write_rle_planes(f, [composite[:, :, channel] for channel in range(4)])
 
             logger.info(f"PSD exported to {output_path}")
             return True
@@ -396,9 +466,10 @@ class PSDExporter:
             logger.debug(f"{indent}Processing layer: {layer.name}, is_group: {layer.is_group()}, has_image: {layer.image is not None}, children: {len(layer.children)}")
 
             if layer.image is not None:
+                image = layer.image
                 layers.append({
                     "name": layer.display_name,
-                    "image": layer.image.convert("RGBA"),
+                    "image": image if image.mode == "RGBA" else image.convert("RGBA"),
                     "visible": layer.visible,
                     "opacity": layer.opacity,
                     "position": layer.position,
@@ -416,79 +487,108 @@ class PSDExporter:
             logger.info(f"  Layer {i+1}: {layer['name']} at position {layer['position']}")
         return layers
 
-    def _build_layer_section(
-        self, layers: List[Dict], width: int, height: int
-    ) -> bytes:
-        """Build the layer and mask information section."""
-        # Simplified layer section - just enough for basic compatibility
-        data = io.BytesIO()
+    def _write_layer_section(self, f: BinaryIO, layers: List[Dict]) -> None:
+        """
+        Write the layer and mask information section.
 
-        # Layer Info
-        layer_info = io.BytesIO()
+        Layer records come before the channel data they describe, so each
+        record is written with placeholder channel lengths that are filled
+        in once that layer's data has been written.
+        """
+        section_start = f.tell()
+        f.write(struct.pack('>II', 0, 0))  # Section and layer info lengths
 
         # Layer count (negative for absolute count)
-        layer_info.write(struct.pack('>h', -len(layers)))
+        f.write(struct.pack('>h', -len(layers)))
 
         # Layer records
+        bounds = []
+        length_offsets = []
         for layer in layers:
             img = layer["image"]
             pos = layer.get("position", (0, 0))
 
-            # Layer bounds (top, left, bottom, right)
-            top = pos[1]
-            left = pos[0]
-            bottom = top + img.height
-            right = left + img.width
-            layer_info.write(struct.pack('>iiii', top, left, bottom, right))
+            # Layer bounds (top, left, bottom, right), cropped to the opaque pixels
+            bbox = img.getchannel("A").getbbox() or (0, 0, 0, 0)
+            top = pos[1] + bbox[1]
+            left = pos[0] + bbox[0]
+            bottom = pos[1] + bbox[3]
+            right = pos[0] + bbox[2]
+            bounds.append(bbox)
+            f.write(struct.pack('>iiii', top, left, bottom, right))
             logger.debug(f"Layer '{layer['name']}' bounds: top={top}, left={left}, bottom={bottom}, right={right}")
 
             # Number of channels
-            layer_info.write(struct.pack('>H', 4))
+            f.write(struct.pack('>H', 4))
 
-            # Channel info
+            # Channel info: -1=alpha, 0=red, 1=green, 2=blue (lengths patched below)
             for ch in range(4):
-                layer_info.write(struct.pack('>hI', ch - 1 if ch > 0 else -1, img.width * img.height + 2))
+                f.write(struct.pack('>h', ch - 1))
+                length_offsets.append(f.tell())
+                f.write(struct.pack('>I', 0))
 
             # Blend mode signature and key
-            layer_info.write(b'8BIM')
-            layer_info.write(b'norm')
+            f.write(b'8BIM')
+            f.write(b'norm')
 
             # Opacity
-            layer_info.write(struct.pack('B', int(layer["opacity"] * 255)))
+            f.write(struct.pack('B', int(layer["opacity"] * 255)))
 
             # Clipping, flags, filler
-            layer_info.write(struct.pack('BBB', 0, 0, 0))
-            layer_info.write(struct.pack('B', 0))  # Filler
+            f.write(struct.pack('BBB', 0, 0, 0))
 
             # Extra data length
             extra_data = self._build_layer_extra_data(layer["name"])
-            layer_info.write(struct.pack('>I', len(extra_data)))
-            layer_info.write(extra_data)
+            f.write(struct.pack('>I', len(extra_data)))
+            f.write(extra_data)
 
-        # Channel image data
+        # Channel image data, one layer at a time
         # Channel order must match declaration: -1=alpha, 0=red, 1=green, 2=blue
         # RGBA array indices: 0=R, 1=G, 2=B, 3=A
         # So we write: A(3), R(0), G(1), B(2)
         channel_order = [3, 0, 1, 2]  # Alpha, Red, Green, Blue
-        for layer in layers:
-            img = layer["image"]
-            img_array = np.array(img)
-
+        lengths = []
+        for layer, bbox in zip(layers, bounds):
+            img_array = np.asarray(layer["image"].crop(bbox))
             for ch_idx in channel_order:
-                # Compression type (raw)
-                layer_info.write(struct.pack('>H', 0))
-                # Channel data
-                layer_info.write(img_array[:, :, ch_idx].tobytes())
+                channel_start = f.tell()
+                if img_array.size:
+                    f.write(struct.pack('>H', _RLE))
+                    self._write_rle_planes(f, [img_array[:, :, ch_idx]])
+                else:
+                    f.write(struct.pack('>H', _RAW))  # Empty layer: no pixel data
+                lengths.append(f.tell() - channel_start)
 
-        # Write layer info with length
-        layer_info_data = layer_info.getvalue()
-        data.write(struct.pack('>I', len(layer_info_data)))
-        data.write(layer_info_data)
+        # Layer info length is rounded up to an even number of bytes
+        if (f.tell() - section_start) % 2:
+            f.write(b'\x00')
+        layer_info_end = f.tell()
 
         # Global layer mask info (none)
-        data.write(struct.pack('>I', 0))
-
-        return data.getvalue()
+        f.write(struct.pack('>I', 0))
+        section_end = f.tell()
+
+        for offset, length in zip(length_offsets, lengths):
+            f.seek(offset)
+            f.write(struct.pack('>I', length))
+        f.seek(section_start)
+        f.write(struct.pack('>II', section_end - section_start - 4,
+                            layer_info_end - section_start - 8))
+        f.seek(section_end)
+
+    def _write_rle_planes(self, f: BinaryIO, planes: List[np.ndarray]) -> None:
+        """Write planes as one RLE block: the row counts of every plane, then their data."""
+        counts_start = f.tell()
+        f.write(bytes(2 * sum(plane.shape[0] for plane in planes)))
+        row_counts = []
+        for plane in planes:
+            counts, data = packbits_rows(plane)
+            row_counts.append(counts)
+            f.write(data)
+        end = f.tell()
+        f.seek(counts_start)
+        f.write(np.concatenate(row_counts).astype('>u2').tobytes())
+        f.seek(end)
 
     def _build_layer_extra_data(self, name: str) -> bytes:
         """Build extra layer data (mask, blending, name)."""
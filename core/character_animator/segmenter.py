@@ -11,9 +11,19 @@ a single image, preparing them for puppet layer creation.
 Note: SAM 2 and Depth-Anything have been removed in favor of simpler
 MediaPipe-only detection. Cloud AI (Gemini/OpenAI) handles the complex
 viseme generation. See Plans/AICharacterGenerator.md.
+
+Detection results are cached on disk, keyed by the image content and the
+model versions, and get_shared_segmenter() keeps the models loaded between
+wizard runs, so stepping back and forth over the same character image does
+not repeat inference.
 """
 
+import hashlib
 import logging
+import os
+import tempfile
+import threading
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import numpy as np
@@ -38,6 +48,16 @@ from .availability import (
 
 logger = logging.getLogger(__name__)
 
+# Bump when the cached result layout or the landmark -> region logic changes
+SEGMENTATION_CACHE_VERSION = "v1"
+
+# MediaPipe settings; part of the cache key
+POSE_MODEL_COMPLEXITY = 2  # Most accurate
+MIN_DETECTION_CONFIDENCE = 0.5
+
+_BODY_PARTS = ("head", "torso", "left_arm", "right_arm")
+_FACIAL_REGIONS = ("left_eye", "right_eye", "mouth", "left_eyebrow", "right_eyebrow")
+
 
 class BodyPartSegmenter:
     """
@@ -47,18 +67,22 @@ class BodyPartSegmenter:
     for more precise mask generation if available.
     """
 
-    def __init__(self, model_path: Optional[Path] = None):
+    def __init__(self, model_path: Optional[Path] = None, cache_dir: Optional[Path] = None):
         """
         Initialize the segmenter.
 
         Args:
             model_path: Optional path to SAM 2 model weights (if using SAM)
+            cache_dir: Directory for cached segmentation results
         """
         self.model_path = model_path
+        self.cache_dir = cache_dir or (get_user_data_dir() / "cache" / "segmentation")
         self._mp_pose = None
         self._mp_face_mesh = None
         self._sam_predictor = None
         self._initialized = False
+        # MediaPipe graphs must not process two images at once
+        self._inference_lock = threading.Lock()
 
     def _init_mediapipe(self):
         """Initialize MediaPipe models."""
@@ -72,9 +96,9 @@ class BodyPartSegmenter:
             # Initialize pose detection
             self._mp_pose = mp.solutions.pose.Pose(
                 static_image_mode=True,
-                model_complexity=2,  # Most accurate
+                model_complexity=POSE_MODEL_COMPLEXITY,
                 enable_segmentation=True,
-                min_detection_confidence=0.5,
+                min_detection_confidence=MIN_DETECTION_CONFIDENCE,
             )
 
             # Initialize face mesh
@@ -82,7 +106,7 @@ class BodyPartSegmenter:
                 static_image_mode=True,
                 max_num_faces=1,
                 refine_landmarks=True,  # Include iris landmarks
-                min_detection_confidence=0.5,
+                min_detection_confidence=MIN_DETECTION_CONFIDENCE,
             )
 
             logger.info("MediaPipe pose and face detection initialized")
@@ -92,6 +116,12 @@ class BodyPartSegmenter:
             logger.error(f"Failed to initialize MediaPipe: {e}")
             return False
 
+    def _sam_model_path(self) -> Path:
+        """Path of the SAM 2 weights (the default location if not specified)."""
+        if self.model_path is None:
+            return get_user_data_dir() / "weights" / "character_animator" / "sam2_hiera_large.pt"
+        return self.model_path
+
     def _init_sam(self):
         """Initialize SAM 2 for optional mask refinement."""
         if not SEGMENTATION_AVAILABLE:
@@ -104,8 +134,7 @@ class BodyPartSegmenter:
             import torch
 
             # Use default model path if not specified
-            if self.model_path is None:
-                self.model_path = get_user_data_dir() / "weights" / "character_animator" / "sam2_hiera_large.pt"
+            self.model_path = self._sam_model_path()
 
             if not self.model_path.exists():
                 logger.debug(f"SAM 2 model not found at {self.model_path}")
@@ -160,33 +189,36 @@ class BodyPartSegmenter:
         Returns:
             Array of 33 pose landmarks (x, y, z, visibility) or None
         """
+        try:
+            return self._pose_landmarks(image)
+        except Exception as e:
+            logger.error(f"Pose detection failed: {e}")
+            return None
+
+    def _pose_landmarks(self, image: Image.Image) -> Optional[np.ndarray]:
+        """detect_pose() that raises on failure; None only means no pose."""
         if self._mp_pose is None:
             if not self._init_mediapipe():
-                return None
+                raise RuntimeError("MediaPipe pose model is unavailable")
 
-        try:
-            # Convert to RGB numpy array
-            img_array = np.array(image.convert("RGB"))
+        # Convert to RGB numpy array
+        img_array = np.array(image.convert("RGB"))
 
-            # Process with MediaPipe
-            results = self._mp_pose.process(img_array)
+        # Process with MediaPipe
+        results = self._mp_pose.process(img_array)
 
-            if results.pose_landmarks is None:
-                logger.warning("No pose detected in image")
-                return None
-
-            # Extract landmarks as numpy array
-            landmarks = np.array([
-                [lm.x * image.width, lm.y * image.height, lm.z, lm.visibility]
-                for lm in results.pose_landmarks.landmark
-            ])
+        if results.pose_landmarks is None:
+            logger.warning("No pose detected in image")
+            return None
 
-            logger.info(f"Detected {len(landmarks)} pose landmarks")
-            return landmarks
+        # Extract landmarks as numpy array
+        landmarks = np.array([
+            [lm.x * image.width, lm.y * image.height, lm.z, lm.visibility]
+            for lm in results.pose_landmarks.landmark
+        ])
 
-        except Exception as e:
-            logger.error(f"Pose detection failed: {e}")
-            return None
+        logger.info(f"Detected {len(landmarks)} pose landmarks")
+        return landmarks
 
     def detect_face(self, image: Image.Image) -> Optional[np.ndarray]:
         """
@@ -198,36 +230,39 @@ class BodyPartSegmenter:
         Returns:
             Array of 478 face landmarks (x, y, z) or None
         """
+        try:
+            return self._face_landmarks(image)
+        except Exception as e:
+            logger.error(f"Face detection failed: {e}")
+            return None
+
+    def _face_landmarks(self, image: Image.Image) -> Optional[np.ndarray]:
+        """detect_face() that raises on failure; None only means no face."""
         if self._mp_face_mesh is None:
             if not self._init_mediapipe():
-                return None
+                raise RuntimeError("MediaPipe face mesh model is unavailable")
 
-        try:
-            # Convert to RGB numpy array
-            img_array = np.array(image.convert("RGB"))
+        # Convert to RGB numpy array
+        img_array = np.array(image.convert("RGB"))
 
-            # Process with MediaPipe
-            results = self._mp_face_mesh.process(img_array)
+        # Process with MediaPipe
+        results = self._mp_face_mesh.process(img_array)
 
-            if not results.multi_face_landmarks:
-                logger.warning("No face detected in image")
-                return None
+        if not results.multi_face_landmarks:
+            logger.warning("No face detected in image")
+            return None
 
-            # Get first face
-            face_landmarks = results.multi_face_landmarks[0]
+        # Get first face
+        face_landmarks = results.multi_face_landmarks[0]
 
-            # Extract landmarks as numpy array
-            landmarks = np.array([
-                [lm.x * image.width, lm.y * image.height, lm.z]
-                for lm in face_landmarks.landmark
-            ])
+        # Extract landmarks as numpy array
+        landmarks = np.array([
+            [lm.x * image.width, lm.y * image.height, lm.z]
+            for lm in face_landmarks.landmark
+        ])
 
-            logger.info(f"Detected {len(landmarks)} face landmarks")
-            return landmarks
-
-        except Exception as e:
-            logger.error(f"Face detection failed: {e}")
-            return None
+        logger.info(f"Detected {len(landmarks)} face landmarks")
+        return landmarks
 
     def _get_bbox_from_landmarks(
         self, landmarks: np.ndarray, indices: List[int], padding: int = 10
@@ -318,7 +353,36 @@ class BodyPartSegmenter:
             landmarks=region_landmarks,
         )
 
-    def segment_body_parts(self, image: Image.Image) -> SegmentationResult:
+    def model_signature(self) -> str:
+        """
+        Identify the models and settings that produce a segmentation.
+
+        Part of the result cache key, so upgrading MediaPipe or adding SAM 2
+        weights invalidates cached results. Computed without loading models.
+        """
+        try:
+            mediapipe_version = version("mediapipe") if POSE_DETECTION_AVAILABLE else "none"
+        except PackageNotFoundError:
+            mediapipe_version = "unknown"
+
+        sam = "none"
+        if SEGMENTATION_AVAILABLE:
+            sam_path = self._sam_model_path()
+            if sam_path.exists():
+                sam = f"{sam_path.name}-{sam_path.stat().st_size}"
+
+        return (f"{SEGMENTATION_CACHE_VERSION}_mediapipe-{mediapipe_version}"
+                f"_pose{POSE_MODEL_COMPLEXITY}_conf{MIN_DETECTION_CONFIDENCE}_sam-{sam}")
+
+    def _get_cache_path(self, image: Image.Image) -> Path:
+        """Cache file for the segmentation of ``image`` with the current models."""
+        digest = hashlib.sha256()
+        digest.update(f"{image.mode}{image.size}".encode())
+        digest.update(image.tobytes())
+        digest.update(self.model_signature().encode())
+        return self.cache_dir / f"{digest.hexdigest()[:32]}.npz"
+
+    def segment_body_parts(self, image: Image.Image, use_cache: bool = True) -> SegmentationResult:
         """
         Segment all body parts from the image.
 
@@ -328,39 +392,143 @@ class BodyPartSegmenter:
         3. Creates bounding boxes and masks for body parts
         4. Extracts facial regions for viseme/blink generation
 
+        A result cached for the same image content and models is returned
+        without loading any model.
+
         Args:
             image: PIL Image to process
+            use_cache: Whether to use cached results if available
 
         Returns:
             SegmentationResult with all detected regions
         """
-        if not self.initialize():
-            raise RuntimeError("Failed to initialize segmentation models")
+        cache_path = self._get_cache_path(image) if use_cache else None
+        if cache_path is not None:
+            cached = self._load_cached(cache_path, image)
+            if cached is not None:
+                return cached
 
         result = SegmentationResult(original_image=image)
+        failed = []
+
+        # Initialize under the lock too, so release_shared_segmenter() cannot
+        # close the models between loading them and using them
+        with self._inference_lock:
+            if not self.initialize():
+                raise RuntimeError("Failed to initialize segmentation models")
+
+            # Step 1: Detect pose
+            try:
+                pose_landmarks = self._pose_landmarks(image)
+            except Exception as e:
+                logger.error(f"Pose detection failed: {e}")
+                failed.append("pose")
+                pose_landmarks = None
+            if pose_landmarks is not None:
+                result.pose_landmarks = pose_landmarks
+
+                # Create body part regions from pose
+                self._segment_body_from_pose(result, pose_landmarks, image.size)
+
+            # Step 2: Detect face mesh
+            try:
+                face_landmarks = self._face_landmarks(image)
+            except Exception as e:
+                logger.error(f"Face detection failed: {e}")
+                failed.append("face")
+                face_landmarks = None
+            if face_landmarks is not None:
+                result.face_landmarks = face_landmarks
+
+                # Extract facial regions
+                self._segment_face_from_mesh(result, face_landmarks, image.size)
+
+            # Step 3: Optionally refine with SAM if available
+            if self._sam_predictor is not None and not self._refine_with_sam(result, image):
+                failed.append("sam")
+
+        # A failed model run is not an answer for this image: only results
+        # that every model produced are cached
+        if failed:
+            logger.info(f"Not caching segmentation ({', '.join(failed)} failed)")
+        elif cache_path is not None:
+            self._save_to_cache(cache_path, result)
 
-        # Step 1: Detect pose
-        pose_landmarks = self.detect_pose(image)
-        if pose_landmarks is not None:
-            result.pose_landmarks = pose_landmarks
-
-            # Create body part regions from pose
-            self._segment_body_from_pose(result, pose_landmarks, image.size)
+        return result
 
-        # Step 2: Detect face mesh
-        face_landmarks = self.detect_face(image)
-        if face_landmarks is not None:
-            result.face_landmarks = face_landmarks
+    def _load_cached(self, cache_path: Path, image: Image.Image) -> Optional[SegmentationResult]:
+        """Load a cached segmentation of ``image`` if available."""
+        if not cache_path.exists():
+            return None
 
-            # Extract facial regions
-            self._segment_face_from_mesh(result, face_landmarks, image.size)
+        try:
+            with np.load(cache_path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except Exception as e:
+            logger.debug(f"Failed to load segmentation cache: {e}")
+            return None
 
-        # Step 3: Optionally refine with SAM if available
-        if self._sam_predictor is not None:
-            self._refine_with_sam(result, image)
+        def bbox(name: str) -> Optional[Tuple[int, int, int, int]]:
+            value = arrays.get(f"{name}_bbox")
+            return None if value is None else tuple(int(v) for v in value)
 
+        result = SegmentationResult(
+            original_image=image,
+            pose_landmarks=arrays.get("pose_landmarks"),
+            face_landmarks=arrays.get("face_landmarks"),
+            depth_map=arrays.get("depth_map"),
+        )
+        for part in _BODY_PARTS:
+            setattr(result, f"{part}_bbox", bbox(part))
+            setattr(result, f"{part}_mask", arrays.get(f"{part}_mask"))
+        for name in _FACIAL_REGIONS:
+            region_bbox = bbox(f"region_{name}")
+            if region_bbox is not None:
+                setattr(result, f"{name}_region", FacialRegion(
+                    name=name,
+                    bbox=region_bbox,
+                    landmarks=arrays.get(f"region_{name}_landmarks"),
+                    mask=arrays.get(f"region_{name}_mask"),
+                ))
+
+        logger.info(f"Loaded segmentation from cache: {cache_path.name}")
         return result
 
+    def _save_to_cache(self, cache_path: Path, result: SegmentationResult):
+        """Save a segmentation; masks are stored compressed."""
+        arrays = {}
+        for name in ("pose_landmarks", "face_landmarks", "depth_map"):
+            if getattr(result, name) is not None:
+                arrays[name] = getattr(result, name)
+        for part in _BODY_PARTS:
+            if getattr(result, f"{part}_bbox") is not None:
+                arrays[f"{part}_bbox"] = np.asarray(getattr(result, f"{part}_bbox"))
+            if getattr(result, f"{part}_mask") is not None:
+                arrays[f"{part}_mask"] = getattr(result, f"{part}_mask")
+        for name, region in result.get_facial_regions().items():
+            if region is None:
+                continue
+            arrays[f"region_{name}_bbox"] = np.asarray(region.bbox)
+            if region.landmarks is not None:
+                arrays[f"region_{name}_landmarks"] = region.landmarks
+            if region.mask is not None:
+                arrays[f"region_{name}_mask"] = region.mask
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so a concurrent reader never sees a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.savez_compressed(f, **arrays)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            logger.debug(f"Saved segmentation to cache: {cache_path.name}")
+        except Exception as e:
+            logger.warning(f"Failed to save segmentation cache: {e}")
+
     def _segment_body_from_pose(
         self,
         result: SegmentationResult,
@@ -474,7 +642,7 @@ class BodyPartSegmenter:
 
         logger.info("Extracted facial regions from face mesh")
 
-    def _refine_with_sam(self, result: SegmentationResult, image: Image.Image):
+    def _refine_with_sam(self, result: SegmentationResult, image: Image.Image) -> bool:
         """
         Optionally refine segmentation masks using SAM 2.
 
@@ -485,9 +653,12 @@ class BodyPartSegmenter:
         Args:
             result: SegmentationResult to update
             image: Original image
+
+        Returns:
+            False if SAM failed (the MediaPipe masks are kept)
         """
         if self._sam_predictor is None:
-            return
+            return True
 
         try:
             # Set image for SAM
@@ -547,6 +718,9 @@ class BodyPartSegmenter:
 
         except Exception as e:
             logger.warning(f"SAM refinement failed (using MediaPipe masks): {e}")
+            return False
+
+        return True
 
     def extract_layer_image(
         self,
@@ -594,15 +768,44 @@ class BodyPartSegmenter:
 
     def cleanup(self):
         """Release resources."""
-        if self._mp_pose is not None:
-            self._mp_pose.close()
-            self._mp_pose = None
+        with self._inference_lock:
+            if self._mp_pose is not None:
+                self._mp_pose.close()
+                self._mp_pose = None
 
-        if self._mp_face_mesh is not None:
-            self._mp_face_mesh.close()
-            self._mp_face_mesh = None
+            if self._mp_face_mesh is not None:
+                self._mp_face_mesh.close()
+                self._mp_face_mesh = None
 
-        self._sam_predictor = None
-        self._initialized = False
+            self._sam_predictor = None
+            self._initialized = False
 
         logger.info("Segmenter resources released")
+
+
+_shared_segmenter: Optional[BodyPartSegmenter] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_segmenter() -> BodyPartSegmenter:
+    """
+    The process-wide segmenter, whose models stay loaded between uses.
+
+    Models are loaded on the first cache miss and kept until
+    release_shared_segmenter(), so re-running detection while iterating
+    on a puppet does not pay for model start-up again.
+    """
+    global _shared_segmenter
+    with _shared_lock:
+        if _shared_segmenter is None:
+            _shared_segmenter = BodyPartSegmenter()
+        return _shared_segmenter
+
+
+def release_shared_segmenter():
+    """Release the models of the process-wide segmenter."""
+    global _shared_segmenter
+    with _shared_lock:
+        if _shared_segmenter is not None:
+            _shared_segmenter.cleanup()
+            _shared_segmenter = None
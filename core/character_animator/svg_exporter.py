@@ -4,13 +4,18 @@ SVG file exporter for Character Animator puppets.
 Creates SVG files with grouped structure that Adobe Character Animator
 can import and auto-rig. SVG groups map to Character Animator layers.
 
-Supports both:
+Supports:
 - Embedded raster (PNG images as base64 within SVG)
 - Pure vector (vectorized paths - better for cartoons)
+- Traced alpha (each layer's alpha mask and main colors traced into
+  Douglas-Peucker simplified paths - much smaller and faster to load)
 """
 
 import logging
 import base64
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import io
@@ -23,6 +28,104 @@ from .availability import SVG_EXPORT_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# Traced paths: (fill color, path data), in paint order
+TracedPaths = List[Tuple[str, str]]
+
+
+def layer_hash(image: Image.Image) -> str:
+    """Content hash of a layer image; identical layers are traced once."""
+    digest = hashlib.sha256()
+    digest.update(f"{image.mode}{image.size}".encode())
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def _mask_path_data(mask: np.ndarray, tolerance: float, offset: Tuple[int, int]) -> str:
+    """
+    Trace a binary mask into SVG path data (holes included, for evenodd fill).
+
+    Args:
+        mask: Boolean mask
+        tolerance: Douglas-Peucker tolerance in pixels (0 keeps every corner)
+        offset: (x, y) added to every point
+
+    Returns:
+        Path data of all outer and hole contours
+    """
+    import cv2
+
+    contours, _ = cv2.findContours(
+        mask.astype(np.uint8), cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE
+    )
+
+    subpaths = []
+    for contour in contours:
+        if tolerance > 0:
+            contour = cv2.approxPolyDP(contour, tolerance, True)
+        if len(contour) < 3:
+            continue
+        points = contour.reshape(-1, 2) + offset
+        # After "L", further coordinate pairs are implicit line-tos
+        subpaths.append(
+            f"M{points[0, 0]} {points[0, 1]}L" + " ".join(map(str, points[1:].ravel())) + "Z"
+        )
+    return "".join(subpaths)
+
+
+def trace_layer(
+    image: Image.Image,
+    tolerance: float = SVG_SETTINGS["simplify_tolerance"],
+    max_colors: int = SVG_SETTINGS["trace_colors"],
+    alpha_threshold: int = 128,
+) -> TracedPaths:
+    """
+    Trace a layer into flat-filled vector paths.
+
+    The opaque pixels are reduced to ``max_colors`` colors. The whole alpha
+    mask is filled with the most common one, so no background shows through
+    seams between regions, and every other color is traced on top of it.
+
+    Args:
+        image: Layer image
+        tolerance: Douglas-Peucker tolerance in pixels
+        max_colors: Fill colors to reduce the layer to
+        alpha_threshold: Alpha at or above which a pixel is opaque
+
+    Returns:
+        (fill color, path data) pairs in paint order; empty for a blank layer
+    """
+    rgba = np.asarray(image if image.mode == "RGBA" else image.convert("RGBA"))
+    opaque = rgba[:, :, 3] >= alpha_threshold
+    rows, cols = np.flatnonzero(opaque.any(axis=1)), np.flatnonzero(opaque.any(axis=0))
+    if rows.size == 0:
+        return []
+
+    # Trace only the opaque bounding box
+    top, bottom, left, right = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+    opaque = opaque[top:bottom, left:right]
+    pixels = rgba[top:bottom, left:right, :3][opaque]
+
+    # Reduce the opaque pixels (only) to a small palette
+    strip = Image.fromarray(pixels.reshape(1, -1, 3))
+    quantized = strip.quantize(colors=max_colors, method=Image.Quantize.MEDIANCUT)
+    indices = np.asarray(quantized).ravel()
+    palette = np.asarray(quantized.getpalette()[:3 * max_colors]).reshape(-1, 3)
+    counts = np.bincount(indices, minlength=len(palette))
+
+    labels = np.full(opaque.shape, -1, dtype=np.int16)
+    labels[opaque] = indices
+    offset = (int(left), int(top))
+
+    order = [int(i) for i in np.argsort(-counts, kind="stable") if counts[i]]
+    paths = []
+    for rank, color in enumerate(order):
+        mask = opaque if rank == 0 else labels == color
+        path_data = _mask_path_data(mask, tolerance, offset)
+        if path_data:
+            r, g, b = palette[color]
+            paths.append((f"#{r:02x}{g:02x}{b:02x}", path_data))
+    return paths
+
 
 class SVGExporter:
     """
@@ -35,8 +138,13 @@ class SVGExporter:
     def __init__(
         self,
         puppet: PuppetStructure,
-        embed_images: bool = True,
-        vectorize: bool = False,
+        embed_images: bool = SVG_SETTINGS["embed_images"],
+        vectorize: bool = SVG_SETTINGS["vectorize"],
+        trace_alpha: bool = SVG_SETTINGS["trace_alpha"],
+        simplify_tolerance: float = SVG_SETTINGS["simplify_tolerance"],
+        trace_colors: int = SVG_SETTINGS["trace_colors"],
+        report_savings: bool = False,
+        workers: Optional[int] = None,
     ):
         """
         Initialize the SVG exporter.
@@ -45,11 +153,29 @@ class SVGExporter:
             puppet: PuppetStructure to export
             embed_images: Embed raster images as base64 (vs external files)
             vectorize: Convert raster to vector paths
+            trace_alpha: Trace every layer into flat-filled paths (see trace_layer);
+                takes precedence over vectorize and embedded images
+            simplify_tolerance: Douglas-Peucker tolerance in pixels for traced paths
+            trace_colors: Fill colors per traced layer
+            report_savings: Also measure what raster mode would embed for the
+                traced layers (fills trace_savings; PNG-encodes every layer,
+                so it costs as much as a raster export)
+            workers: Layers traced concurrently (None = one per CPU)
         """
         self.puppet = puppet
         self.embed_images = embed_images
         self.vectorize = vectorize
+        self.trace_alpha = trace_alpha
+        self.simplify_tolerance = simplify_tolerance
+        self.trace_colors = trace_colors
+        self.report_savings = report_savings
+        self.workers = workers or os.cpu_count() or 1
         self._svg_content: List[str] = []
+        # id(layer) -> traced paths, shared between identical layers
+        self._traced: Dict[int, TracedPaths] = {}
+        # (embedded PNG bytes, traced path bytes) of the last traced export,
+        # when report_savings is set
+        self.trace_savings: Optional[Tuple[int, int]] = None
 
     def image_to_svg_path(
         self,
@@ -131,6 +257,8 @@ class SVGExporter:
             Complete SVG content string
         """
         self._svg_content = []
+        if self.trace_alpha:
+            self._traced = self._trace_layers()
 
         # SVG header
         width = self.puppet.width or 1024
@@ -158,6 +286,53 @@ class SVGExporter:
 
         return "".join(self._svg_content)
 
+    def _trace_layers(self) -> Dict[int, TracedPaths]:
+        """
+        Trace every image layer of the puppet, in parallel.
+
+        Layers with identical images (e.g. visemes that fell back to the
+        original face) are traced once and share the result.
+
+        Returns:
+            Dictionary mapping id(layer) to its traced paths
+        """
+        layers = []
+
+        def collect(layer: PuppetLayer):
+            if layer.image is not None and not layer.is_group():
+                layers.append(layer)
+            for child in layer.children:
+                collect(child)
+
+        collect(self.puppet.root_layer)
+        if not layers:
+            return {}
+
+        def trace(image: Image.Image) -> TracedPaths:
+            return trace_layer(image, tolerance=self.simplify_tolerance,
+                               max_colors=self.trace_colors)
+
+        def embedded_size(image: Image.Image) -> int:
+            # What the raster mode would embed for this layer
+            return len(self._image_to_base64(image))
+
+        # Hashing and tracing both run outside the GIL (hashlib, OpenCV)
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(layers)),
+                                thread_name_prefix="svg-trace") as pool:
+            images = [layer.image for layer in layers]
+            keys = list(pool.map(layer_hash, images))
+            unique = dict(zip(keys, images))  # any of the identical images
+            logger.info(f"Tracing {len(unique)} unique layers of {len(layers)}")
+            traced = dict(zip(unique, pool.map(trace, unique.values())))
+            if self.report_savings:
+                embedded = dict(zip(unique, pool.map(embedded_size, unique.values())))
+                self.trace_savings = (
+                    sum(embedded[key] for key in keys),
+                    sum(len(fill) + len(d) for key in keys for fill, d in traced[key]),
+                )
+
+        return {id(layer): traced[key] for layer, key in zip(layers, keys)}
+
     def _process_layer_to_svg(self, layer: PuppetLayer, indent: int = 2):
         """
         Recursively process a layer to SVG groups/elements.
@@ -220,6 +395,20 @@ class SVGExporter:
         visibility = "visible" if layer.visible else "hidden"
         opacity = layer.opacity
 
+        if self.trace_alpha:
+            self._svg_content.append(
+                f'{indent}<g id="{layer_id}" '
+                f'opacity="{opacity}" '
+                f'visibility="{visibility}" '
+                f'transform="translate({x},{y})">\n'
+            )
+            for fill, path_data in self._traced.get(id(layer), []):
+                self._svg_content.append(
+                    f'{indent}  <path fill="{fill}" fill-rule="evenodd" d="{path_data}"/>\n'
+                )
+            self._svg_content.append(f'{indent}</g>\n')
+            return
+
         if self.vectorize:
             # Try to vectorize
             path_data = self.image_to_svg_path(image)
@@ -384,6 +573,10 @@ class SVGExporter:
                 self._save_external_images(output_path.parent)
 
             logger.info(f"SVG exported to {output_path}")
+            if self.trace_alpha and self.trace_savings:
+                raster, traced = self.trace_savings
+                logger.info(f"Traced layers: {traced / 1024:.0f} KB of paths "
+                            f"instead of {raster / 1024:.0f} KB of embedded PNG")
             return True
 
         except Exception as e:
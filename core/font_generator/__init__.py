@@ -37,6 +37,10 @@ from .metrics import (
     FontMetrics,
     FontMetricsCalculator,
 )
+from .kerning import (
+    ClassKerning,
+    KerningEngine,
+)
 from .font_builder import (
     FontBuilder,
     FontInfo,
@@ -85,6 +89,8 @@ __all__ = [
     # Metrics
     "FontMetrics",
     "FontMetricsCalculator",
+    "ClassKerning",
+    "KerningEngine",
     # Font Building
     "FontBuilder",
     "FontInfo",
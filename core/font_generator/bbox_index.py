@@ -0,0 +1,90 @@
+"""
+Candidate-pair search and grouping over component bounding boxes.
+
+Segmentation merges (dots onto stems, the parts of '%') used to test every
+pair of components. Both merge rules require the two boxes to share some
+horizontal extent. So a sorted sweep over the boxes' x intervals lists the
+only pairs worth testing, and the rules are then evaluated on those pairs
+as NumPy arrays.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+# Sorted boxes expanded per block, bounding the size of the pair arrays
+SWEEP_BLOCK = 4096
+
+
+def overlapping_pairs(start: np.ndarray, end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    All pairs of closed intervals ``[start, end]`` that intersect or touch.
+
+    Args:
+        start: Interval starts, shape (N,)
+        end: Interval ends, shape (N,), ``end >= start``
+
+    Returns:
+        (i, j): index arrays with ``i < j``, sorted by ``i`` then ``j``
+    """
+    start = np.asarray(start)
+    end = np.asarray(end)
+    n = len(start)
+    if n < 2:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty.copy()
+
+    order = np.argsort(start, kind="stable")
+    sorted_start = start[order]
+    # Every later interval starting at or before this one's end intersects it
+    stop = np.searchsorted(sorted_start, end[order], side="right")
+
+    firsts, seconds = [], []
+    for block in range(0, n, SWEEP_BLOCK):
+        rows = np.arange(block, min(block + SWEEP_BLOCK, n))
+        counts = np.maximum(stop[rows] - rows - 1, 0)
+        total = int(counts.sum())
+        if not total:
+            continue
+        a = np.repeat(rows, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        b = a + 1 + offsets
+        firsts.append(order[a])
+        seconds.append(order[b])
+
+    if not firsts:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty.copy()
+    a = np.concatenate(firsts)
+    b = np.concatenate(seconds)
+    i, j = np.minimum(a, b), np.maximum(a, b)
+    keys = np.lexsort((j, i))
+    return i[keys], j[keys]
+
+
+def connected_components(n: int, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """
+    Label the connected components of the graph on ``n`` nodes with edges ``(i, j)``.
+
+    Returns:
+        Label per node: the smallest node index in its component
+    """
+    labels = np.arange(n)
+    if not len(i):
+        return labels
+    while True:
+        # Hook both ends of every edge, and their labels, onto the smaller
+        # label, then pointer-jump until every node points at its root
+        li, lj = labels[i], labels[j]
+        low = np.minimum(li, lj)
+        hooked = labels.copy()
+        for nodes in (i, j, li, lj):
+            np.minimum.at(hooked, nodes, low)
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
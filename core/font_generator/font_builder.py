@@ -5,16 +5,22 @@ This module uses fonttools to create TTF/OTF font files from
 vectorized glyphs and calculated metrics.
 """
 
+import hashlib
 import logging
+import threading
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
+from typing import Hashable, List, Dict, Optional, Tuple, Any
 
 try:
     from fontTools.fontBuilder import FontBuilder as FTFontBuilder
+    from fontTools.misc.psCharStrings import T2CharString
     from fontTools.pens.t2CharStringPen import T2CharStringPen
     from fontTools.ttLib import TTFont
+    from fontTools.ttLib.tables._g_l_y_f import Glyph
     from fontTools.designspaceLib import DesignSpaceDocument
     FONTTOOLS_AVAILABLE = True
 except ImportError:
@@ -28,6 +34,7 @@ except ImportError:
     CU2QU_AVAILABLE = False
 
 from .vectorizer import VectorGlyph, VectorPath, PathCommand
+from .kerning import ClassKerning
 from .metrics import FontMetrics
 
 logger = logging.getLogger(__name__)
@@ -41,6 +48,48 @@ def _datetime_to_font_timestamp(dt: datetime) -> int:
     return int((dt - _FONT_EPOCH).total_seconds())
 
 
+# Converted glyph outlines by (outline hash, table tag[, advance width]),
+# shared by every builder: the wizard builds a new preview font whenever a
+# glyph changes, and only outlines that changed need converting again.
+# TrueType entries are glyf glyphs that keep their compiled data, CFF entries
+# Type 2 charstring bytecode (which includes the advance width).
+_MAX_CACHED = 5000
+_outline_cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+_outline_cache_lock = threading.Lock()
+
+
+def clear_outline_cache() -> None:
+    """Forget all cached glyph outlines."""
+    with _outline_cache_lock:
+        _outline_cache.clear()
+
+
+def outline_hash(glyph: VectorGlyph) -> str:
+    """Hash of a glyph's outline: its path commands, points and hole flags."""
+    commands = "".join(("H" if path.is_hole else "P")
+                       + "".join(seg.command.value + str(len(seg.points)) for seg in path.segments)
+                       for path in glyph.paths)
+    coords = array("d", [c for path in glyph.paths for seg in path.segments
+                         for point in seg.points for c in point])
+    digest = hashlib.blake2b(commands.encode(), digest_size=16)
+    digest.update(coords.tobytes())
+    return digest.hexdigest()
+
+
+if FONTTOOLS_AVAILABLE:
+    class _CompiledGlyph(Glyph):
+        """
+        A glyf glyph that compiles once and is then shared by every font built
+        from the same outline. Its coordinates and bounds stay expanded for the
+        tables recalculated on save (head, hhea, maxp), so it must not be edited.
+        """
+
+        def compile(self, glyfTable, recalcBBoxes=True, **kwargs):
+            if getattr(self, "_compiled", None) is None:
+                self._compiled = super().compile(glyfTable, recalcBBoxes, **kwargs)
+            return self._compiled
+
+
 @dataclass
 class FontInfo:
     """Font metadata and naming information."""
@@ -96,10 +145,14 @@ class FontBuilder:
         self.info = info or FontInfo()
         self.metrics = metrics
         self._glyphs: Dict[str, VectorGlyph] = {}
+        # (metrics given, metrics used, glyphs to draw) of the current glyph set
+        self._prepared: Optional[Tuple[Optional[FontMetrics], FontMetrics,
+                                       Dict[str, VectorGlyph]]] = None
 
     def add_glyph(self, glyph: VectorGlyph) -> None:
         """Add a single glyph to the font."""
         self._glyphs[glyph.label] = glyph
+        self._prepared = None
         logger.debug(f"Added glyph '{glyph.label}'")
 
     def add_glyphs(self, glyphs: List[VectorGlyph]) -> None:
@@ -111,6 +164,11 @@ class FontBuilder:
         """
         Build the font file and save to disk.
 
+        Metrics are calculated once per glyph set, so the same builder can
+        save several formats. Glyph outlines are converted once per outline
+        and format (see :func:`outline_hash`); rebuilding after one glyph
+        changed only converts that glyph and reassembles the tables.
+
         Args:
             output_path: Path for output file (.ttf or .otf)
 
@@ -129,22 +187,13 @@ class FontBuilder:
         if ext not in (".ttf", ".otf"):
             output_path = output_path.with_suffix(".ttf")
 
-        # Get or calculate metrics and normalize glyphs
-        metrics = self.metrics
-        if metrics is None:
-            from .metrics import FontMetricsCalculator
-            calculator = FontMetricsCalculator()
-            metrics = calculator.calculate(list(self._glyphs.values()))
-            # Use normalized glyphs with proper baseline/descender positioning
-            normalized_glyphs = calculator.get_normalized_glyphs()
-            self._glyphs = {g.label: g for g in normalized_glyphs}
-            logger.debug(f"Using {len(normalized_glyphs)} normalized glyphs")
+        metrics, glyphs = self._prepare()
 
         # Build the font
         if output_path.suffix.lower() == ".otf":
-            font = self._build_cff(metrics)
+            font = self._build_cff(metrics, glyphs)
         else:
-            font = self._build_truetype(metrics)
+            font = self._build_truetype(metrics, glyphs)
 
         # Save
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -153,17 +202,36 @@ class FontBuilder:
 
         return output_path
 
-    def _build_truetype(self, metrics: FontMetrics) -> TTFont:
+    def _prepare(self) -> Tuple[FontMetrics, Dict[str, VectorGlyph]]:
+        """Get or calculate metrics, and the glyphs to draw with them."""
+        if self._prepared is not None and self._prepared[0] is self.metrics:
+            return self._prepared[1], self._prepared[2]
+
+        metrics = self.metrics
+        glyphs = self._glyphs
+        if metrics is None:
+            from .metrics import FontMetricsCalculator
+            calculator = FontMetricsCalculator()
+            metrics = calculator.calculate(list(self._glyphs.values()))
+            # Use normalized glyphs with proper baseline/descender positioning
+            normalized_glyphs = calculator.get_normalized_glyphs()
+            glyphs = {g.label: g for g in normalized_glyphs}
+            logger.debug(f"Using {len(normalized_glyphs)} normalized glyphs")
+
+        self._prepared = (self.metrics, metrics, glyphs)
+        return metrics, glyphs
+
+    def _build_truetype(self, metrics: FontMetrics, glyphs: Dict[str, VectorGlyph]) -> TTFont:
         """Build a TrueType font (.ttf)."""
         from fontTools.pens.t2CharStringPen import T2CharStringPen
         from fontTools.pens.ttGlyphPen import TTGlyphPen
 
         # Create glyph order
-        glyph_order = [".notdef", "space"] + sorted(self._glyphs.keys())
+        glyph_order = [".notdef", "space"] + sorted(glyphs.keys())
 
         # Create character map (Unicode -> glyph name)
         cmap = {ord(" "): "space"}
-        for label in self._glyphs.keys():
+        for label in glyphs.keys():
             if len(label) == 1:
                 cmap[ord(label)] = label
 
@@ -171,7 +239,7 @@ class FontBuilder:
         advance_widths = {".notdef": metrics.units_per_em // 2}
         advance_widths["space"] = metrics.units_per_em // 4
 
-        for label in self._glyphs.keys():
+        for label in glyphs.keys():
             if label in metrics.advance_widths:
                 advance_widths[label] = int(metrics.advance_widths[label])
             else:
@@ -194,8 +262,8 @@ class FontBuilder:
         pen_glyphs["space"] = self._draw_empty_tt()
 
         # User glyphs
-        for label, glyph in self._glyphs.items():
-            pen_glyphs[label] = self._draw_glyph_tt(glyph)
+        for label, glyph in glyphs.items():
+            pen_glyphs[label] = self._tt_glyph(glyph)
 
         # Setup glyph outlines
         fb.setupGlyf(pen_glyphs)
@@ -248,14 +316,14 @@ class FontBuilder:
 
         # Add kerning if available
         if metrics.kerning:
-            self._add_kerning(fb.font, metrics.kerning)
+            self._add_kerning(fb.font, metrics.kerning, metrics.kerning_classes)
 
         return fb.font
 
-    def _build_cff(self, metrics: FontMetrics) -> TTFont:
+    def _build_cff(self, metrics: FontMetrics, glyphs: Dict[str, VectorGlyph]) -> TTFont:
         """Build a CFF-based OpenType font (.otf)."""
         # Create glyph order
-        glyph_order = [".notdef", "space"] + sorted(self._glyphs.keys())
+        glyph_order = [".notdef", "space"] + sorted(glyphs.keys())
 
         # Create CharStrings for CFF
         charstrings = {}
@@ -268,13 +336,13 @@ class FontBuilder:
         charstrings["space"] = pen.getCharString()
 
         # User glyphs
-        for label, glyph in self._glyphs.items():
+        for label, glyph in glyphs.items():
             width = metrics.advance_widths.get(label, metrics.units_per_em * 0.6)
-            charstrings[label] = self._glyph_to_charstring(glyph, int(width))
+            charstrings[label] = self._cff_charstring(glyph, int(width))
 
         # Character map
         cmap = {ord(" "): "space"}
-        for label in self._glyphs.keys():
+        for label in glyphs.keys():
             if len(label) == 1:
                 cmap[ord(label)] = label
 
@@ -294,7 +362,7 @@ class FontBuilder:
         # Calculate advance widths
         advance_widths = {".notdef": metrics.units_per_em // 2}
         advance_widths["space"] = metrics.units_per_em // 4
-        for label in self._glyphs.keys():
+        for label in glyphs.keys():
             if label in metrics.advance_widths:
                 advance_widths[label] = int(metrics.advance_widths[label])
             else:
@@ -340,7 +408,7 @@ class FontBuilder:
         })
 
         if metrics.kerning:
-            self._add_kerning(fb.font, metrics.kerning)
+            self._add_kerning(fb.font, metrics.kerning, metrics.kerning_classes)
 
         return fb.font
 
@@ -376,6 +444,40 @@ class FontBuilder:
 
         return pen.glyph()
 
+    def _cached_outline(self, key: Hashable, convert) -> Any:
+        """Converted outline for ``key``, calling ``convert()`` only on a cache miss."""
+        with _outline_cache_lock:
+            data = _outline_cache.get(key)
+            if data is not None:
+                _outline_cache.move_to_end(key)
+                return data
+        data = convert()
+        with _outline_cache_lock:
+            _outline_cache[key] = data
+            while len(_outline_cache) > _MAX_CACHED:
+                _outline_cache.popitem(last=False)
+        return data
+
+    def _tt_glyph(self, glyph: VectorGlyph) -> "Glyph":
+        """TrueType glyph for a VectorGlyph, converted and compiled once per outline."""
+        def convert() -> "_CompiledGlyph":
+            tt_glyph = _CompiledGlyph()
+            tt_glyph.__dict__.update(self._draw_glyph_tt(glyph).__dict__)
+            return tt_glyph
+
+        return self._cached_outline((outline_hash(glyph), "glyf"), convert)
+
+    def _cff_charstring(self, glyph: VectorGlyph, width: int) -> "T2CharString":
+        """CFF CharString for a VectorGlyph, converted once per outline and width."""
+        def convert() -> bytes:
+            charstring = self._glyph_to_charstring(glyph, width)
+            charstring.compile()
+            return charstring.bytecode
+
+        # A new CharString per font: setupCFF attaches the font's private dict
+        return T2CharString(
+            bytecode=self._cached_outline((outline_hash(glyph), "CFF ", width), convert))
+
     def _draw_glyph_tt(self, glyph: VectorGlyph):
         """Draw a VectorGlyph to TrueType format using TTGlyphPen.
 
@@ -544,8 +646,19 @@ class FontBuilder:
         self,
         font: TTFont,
         kerning: Dict[Tuple[str, str], float],
+        classes: Optional[ClassKerning] = None,
     ) -> None:
-        """Add kerning table to font."""
+        """
+        Add kerning to the font.
+
+        Class kerning goes into a GPOS ``kern`` feature (one class pair
+        subtable covers the whole glyph set); plain pairs fall back to a
+        legacy ``kern`` table.
+        """
+        if classes is not None and classes.values:
+            self._add_class_kerning(font, classes)
+            return
+
         if not kerning:
             return
 
@@ -574,6 +687,72 @@ class FontBuilder:
 
         logger.info(f"Added {len(kern_pairs)} kerning pairs")
 
+    def _add_class_kerning(self, font: TTFont, classes: ClassKerning) -> None:
+        """Add class-based pair positioning as a GPOS ``kern`` feature."""
+        from fontTools.otlLib.builder import (
+            buildLookup, buildPairPosClassesSubtable, buildValue,
+        )
+        from fontTools.ttLib import newTable
+        from fontTools.ttLib.tables import otTables
+
+        def members(glyph_class):
+            return tuple(sorted(g for g in glyph_class if g in self._glyphs))
+
+        pairs = {}
+        for (li, ri), value in classes.values.items():
+            left, right = members(classes.left_classes[li]), members(classes.right_classes[ri])
+            if left and right:
+                pairs[(left, right)] = (buildValue({"XAdvance": int(value)}), None)
+
+        if not pairs:
+            return
+
+        glyph_map = font.getReverseGlyphMap()
+        lookup = buildLookup([buildPairPosClassesSubtable(pairs, glyph_map)])
+
+        feature = otTables.Feature()
+        feature.FeatureParams = None
+        feature.LookupListIndex = [0]
+        feature.LookupCount = 1
+        feature_record = otTables.FeatureRecord()
+        feature_record.FeatureTag = "kern"
+        feature_record.Feature = feature
+
+        script_records = []
+        for tag in ("DFLT", "latn"):
+            lang_sys = otTables.LangSys()
+            lang_sys.LookupOrder = None
+            lang_sys.ReqFeatureIndex = 0xFFFF
+            lang_sys.FeatureIndex = [0]
+            lang_sys.FeatureCount = 1
+            script = otTables.Script()
+            script.DefaultLangSys = lang_sys
+            script.LangSysRecord = []
+            script.LangSysCount = 0
+            record = otTables.ScriptRecord()
+            record.ScriptTag = tag
+            record.Script = script
+            script_records.append(record)
+
+        gpos = otTables.GPOS()
+        gpos.Version = 0x00010000
+        gpos.ScriptList = otTables.ScriptList()
+        gpos.ScriptList.ScriptRecord = script_records
+        gpos.ScriptList.ScriptCount = len(script_records)
+        gpos.FeatureList = otTables.FeatureList()
+        gpos.FeatureList.FeatureRecord = [feature_record]
+        gpos.FeatureList.FeatureCount = 1
+        gpos.LookupList = otTables.LookupList()
+        gpos.LookupList.Lookup = [lookup]
+        gpos.LookupList.LookupCount = 1
+
+        table = newTable("GPOS")
+        table.table = gpos
+        font["GPOS"] = table
+
+        logger.info(f"Added {len(pairs)} kerning class pairs "
+                    f"({len(classes.left_classes)} left x {len(classes.right_classes)} right classes)")
+
 
 def create_font_from_glyphs(
     glyphs: List[VectorGlyph],
@@ -5,8 +5,11 @@ This module generates missing glyphs using AI image models, matching
 the style of existing detected characters from the font.
 """
 
+import hashlib
 import logging
 import io
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Optional, Callable, Any, Dict
 
@@ -17,6 +20,10 @@ from .segmentation import CharacterCell
 
 logger = logging.getLogger(__name__)
 
+# Concurrent provider requests in generate_multiple; each glyph is one
+# round-trip that spends nearly all of its time waiting on the provider.
+DEFAULT_MAX_WORKERS = 4
+
 
 @dataclass
 class GlyphGenerationResult:
@@ -48,7 +55,8 @@ class GlyphGenerator:
         'ascenders': set('bdfhklt'),
     }
 
-    def __init__(self, provider: str, model: str, api_key: str, auth_mode: str = "api-key"):
+    def __init__(self, provider: str, model: str, api_key: str, auth_mode: str = "api-key",
+                 max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Initialize the glyph generator.
 
@@ -57,26 +65,34 @@ class GlyphGenerator:
             model: Model ID to use for generation
             api_key: API key for the provider
             auth_mode: Authentication mode ('api-key' or 'gcloud')
+            max_workers: Glyphs generated concurrently by generate_multiple
         """
         self.provider_name = provider
         self.model = model
         self.api_key = api_key
         self.auth_mode = auth_mode
+        self.max_workers = max(1, max_workers)
         self._provider = None
+        self._provider_lock = threading.Lock()
+        # Content key of a reference image -> future PNG bytes. The lock only
+        # guards the dict; encoding runs outside it, one worker per image.
+        self._reference_png: Dict[str, Future] = {}
+        self._reference_lock = threading.Lock()
 
         logger.info(f"GlyphGenerator initialized: provider={provider}, model={model}, auth_mode={auth_mode}")
 
     def _get_provider(self):
-        """Lazy-load the provider instance."""
-        if self._provider is None:
-            from providers import get_provider
-            config = {
-                'api_key': self.api_key,
-                'auth_mode': self.auth_mode,
-            }
-            self._provider = get_provider(self.provider_name, config, use_cache=False)
-            logger.debug(f"Loaded provider: {self.provider_name}")
-        return self._provider
+        """Lazy-load the provider instance (shared by all worker threads)."""
+        with self._provider_lock:
+            if self._provider is None:
+                from providers import get_provider
+                config = {
+                    'api_key': self.api_key,
+                    'auth_mode': self.auth_mode,
+                }
+                self._provider = get_provider(self.provider_name, config, use_cache=False)
+                logger.debug(f"Loaded provider: {self.provider_name}")
+            return self._provider
 
     def generate_glyph(
         self,
@@ -381,6 +397,10 @@ Requirements:
         """
         Convert reference glyphs to image bytes for the AI.
 
+        Each distinct reference image is encoded once per generator, even
+        when workers need it at the same time; the reference sets of
+        different characters overlap heavily.
+
         Args:
             references: Reference CharacterCells
 
@@ -389,17 +409,41 @@ Requirements:
         """
         images = []
         for ref in references:
+            key = self._reference_key(ref)
+            with self._reference_lock:
+                future = self._reference_png.get(key)
+                owner = future is None
+                if owner:
+                    future = self._reference_png[key] = Future()
+            if owner:
+                # First worker to need this image encodes it; the rest wait on
+                # the future instead of encoding it again.
+                try:
+                    pil_img = ref.to_pil()
+                    buf = io.BytesIO()
+                    pil_img.save(buf, format='PNG')
+                    future.set_result(buf.getvalue())
+                    logger.debug(f"Prepared reference image for '{ref.label}': {pil_img.size}")
+                except Exception as e:
+                    # Not cached: a later request gets to retry the encode
+                    with self._reference_lock:
+                        self._reference_png.pop(key, None)
+                    future.set_exception(e)
             try:
-                pil_img = ref.to_pil()
-                buf = io.BytesIO()
-                pil_img.save(buf, format='PNG')
-                images.append(buf.getvalue())
-                logger.debug(f"Prepared reference image for '{ref.label}': {pil_img.size}")
+                images.append(future.result())
             except Exception as e:
                 logger.warning(f"Failed to prepare reference '{ref.label}': {e}")
 
         return images
 
+    @staticmethod
+    def _reference_key(ref: CharacterCell) -> str:
+        """Key a reference by its pixels, so equal images share one encode."""
+        image = np.ascontiguousarray(ref.image)
+        digest = hashlib.blake2b(image.data, digest_size=16)
+        digest.update(f"{image.shape}{image.dtype}".encode())
+        return digest.hexdigest()
+
     def _process_image(
         self,
         raw_bytes: bytes,
@@ -493,38 +537,75 @@ Requirements:
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
     ) -> List[GlyphGenerationResult]:
         """
-        Generate multiple missing glyphs.
+        Generate multiple missing glyphs concurrently.
+
+        Up to ``max_workers`` glyphs are requested from the provider at once.
+        Characters that can be mirrored from another character in ``chars``
+        (see MIRROR_PAIRS) wait for that glyph and are derived from it; they
+        only fall back to a provider request if it failed.
 
         Args:
             chars: List of characters to generate
             reference_glyphs: Existing glyphs for style reference
             target_height: Target height for generated glyphs
-            progress_callback: Optional callback(current, total, char) for progress
+            progress_callback: Optional callback(current, total, char), called
+                as each character is started (from worker threads)
 
         Returns:
-            List of GlyphGenerationResults
+            List of GlyphGenerationResults, in the order of ``chars``
         """
-        results = []
         total = len(chars)
+        results: Dict[int, GlyphGenerationResult] = {}
+        started = [0]
+        progress_lock = threading.Lock()
 
         logger.info(f"Generating {total} missing glyphs: {chars}")
 
-        for i, char in enumerate(chars):
+        def run(index: int, char: str, derived_from: List[CharacterCell]) -> GlyphGenerationResult:
+            with progress_lock:
+                current = started[0]
+                started[0] += 1
             if progress_callback:
-                progress_callback(i, total, char)
-
-            result = self.generate_glyph(char, reference_glyphs, target_height)
-            results.append(result)
-
+                progress_callback(current, total, char)
+            result = None
+            if derived_from:
+                result = self._try_mirror_glyph(char, derived_from, target_height)
+            if result is None:
+                result = self.generate_glyph(char, reference_glyphs, target_height)
             if result.success:
-                logger.info(f"[{i+1}/{total}] Generated '{char}' successfully")
+                logger.info(f"[{index+1}/{total}] Generated '{char}' successfully")
             else:
-                logger.warning(f"[{i+1}/{total}] Failed to generate '{char}': {result.error}")
+                logger.warning(f"[{index+1}/{total}] Failed to generate '{char}': {result.error}")
+            return result
+
+        # Waves: a character whose mirror source is still to be generated
+        # waits for the wave that produces the source.
+        pending = list(enumerate(chars))
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="glyph-gen") as pool:
+            while pending:
+                waiting = {c for _, c in pending}
+                wave, deferred = [], []
+                for index, char in pending:
+                    source = self.MIRROR_PAIRS.get(char, (None,))[0]
+                    if source in waiting and source != char:
+                        deferred.append((index, char))
+                    else:
+                        wave.append((index, char))
+                if not wave:  # Mirror cycle: generate the rest directly
+                    wave, deferred = deferred, []
+                generated = [r.cell for r in results.values() if r.success and r.cell is not None]
+                futures = [(index, pool.submit(run, index, char, generated))
+                           for index, char in wave]
+                for index, future in futures:
+                    results[index] = future.result()
+                pending = deferred
 
         if progress_callback:
             progress_callback(total, total, "")
 
-        success_count = sum(1 for r in results if r.success)
+        ordered = [results[i] for i in range(total)]
+        success_count = sum(1 for r in ordered if r.success)
         logger.info(f"Generation complete: {success_count}/{total} successful")
 
-        return results
+        return ordered
@@ -13,9 +13,14 @@ Supports multiple providers:
 import logging
 import io
 import base64
+import hashlib
 import os
-from typing import List, Optional, Tuple
-from dataclasses import dataclass
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Hashable, List, Optional, Tuple
+from dataclasses import dataclass, replace
 
 import numpy as np
 from PIL import Image
@@ -42,6 +47,65 @@ class BatchIdentificationResult:
     error: Optional[str] = None
 
 
+def glyph_hash(image: Image.Image) -> str:
+    """
+    Content hash of a glyph bitmap.
+
+    The glyph is thresholded and cropped to its ink, and the ink bitmap is
+    hashed at full resolution together with its size. Crops that differ by
+    a few pixels of margin or by anti-aliasing, as re-running segmentation
+    with other thresholds produces, hash the same; glyphs that differ only
+    in size (l/I/|, o/O, c/C) do not.
+
+    Args:
+        image: Glyph image (dark ink on a light background)
+
+    Returns:
+        Hex digest; identical for identical ink bitmaps
+    """
+    gray = np.asarray(image.convert('L'), dtype=np.float32)
+    lo, hi = float(gray.min()), float(gray.max())
+    if hi - lo < 16:
+        return "blank"
+    ink = gray < (lo + hi) / 2
+    ys, xs = np.nonzero(ink)
+    cropped = np.ascontiguousarray(ink[ys.min():ys.max() + 1, xs.min():xs.max() + 1])
+    digest = hashlib.sha256(np.asarray(cropped.shape, dtype=np.uint32).tobytes())
+    digest.update(np.packbits(cropped).tobytes())
+    return digest.hexdigest()
+
+
+class _RateBudget:
+    """Spaces request starts so that at most ``per_minute`` begin in any minute."""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+# Identifications by (provider, model, expected chars, glyph hash), shared by
+# every identifier: segmentation creates a new one per run, and re-running it
+# on the same sheet should only send glyphs that changed.
+_MAX_CACHED = 5000
+_identification_cache: "OrderedDict[Hashable, GlyphIdentificationResult]" = OrderedDict()
+_identification_cache_lock = threading.Lock()
+
+
+def clear_identification_cache() -> None:
+    """Forget all cached glyph identifications."""
+    with _identification_cache_lock:
+        _identification_cache.clear()
+
+
 def get_position_hint(glyph_y: int, glyph_height: int, row_height: int) -> str:
     """
     Determine vertical position hint for a glyph within its row.
@@ -742,54 +806,107 @@ Respond with ONLY a number, nothing else."""
             logger.error(f"AI character counting failed: {e}")
             return 0
 
+    # Concurrency and rate budget for batch_identify requests
+    MAX_CONCURRENT_REQUESTS = 4
+    REQUESTS_PER_MINUTE = 30
+
     def batch_identify(
         self,
         glyph_images: List[np.ndarray | Image.Image],
         expected_chars: Optional[str] = None,
         max_per_request: int = 20,
     ) -> List[GlyphIdentificationResult]:
-        """Identify multiple glyphs in batch using a single AI request."""
+        """
+        Identify multiple glyphs, up to ``max_per_request`` per AI request.
+
+        Glyphs identified before (by ink bitmap, see glyph_hash) come from
+        a shared cache, and identical glyphs are only sent once. The remaining
+        batches are sent concurrently, at most MAX_CONCURRENT_REQUESTS at a
+        time and REQUESTS_PER_MINUTE in total.
+        """
         if not glyph_images:
             return []
 
+        pil_images = []
+        for img in glyph_images:
+            if isinstance(img, np.ndarray):
+                pil_img = Image.fromarray(img)
+            else:
+                pil_img = img
+            if pil_img.mode != 'RGB':
+                pil_img = pil_img.convert('RGB')
+            pil_images.append(pil_img)
+
+        keys = [(self.provider, self.model, expected_chars or "", glyph_hash(img))
+                for img in pil_images]
+        results: Dict[Hashable, GlyphIdentificationResult] = {}
+        with _identification_cache_lock:
+            for key in keys:
+                cached = _identification_cache.get(key)
+                if cached is not None:
+                    _identification_cache.move_to_end(key)
+                    results[key] = cached
+        # First image of each glyph not in the cache
+        to_send: Dict[Hashable, Image.Image] = {}
+        for key, img in zip(keys, pil_images):
+            if key not in results and key not in to_send:
+                to_send[key] = img
+        if to_send:
+            logger.info(f"Batch identification: {len(pil_images) - len(to_send)} of "
+                        f"{len(pil_images)} glyphs cached, sending {len(to_send)}")
+            results.update(self._identify_uncached(to_send, expected_chars, max_per_request))
+
+        return [replace(results[key], alternatives=list(results[key].alternatives))
+                for key in keys]
+
+    def _identify_uncached(
+        self,
+        images: Dict[Hashable, Image.Image],
+        expected_chars: Optional[str],
+        max_per_request: int,
+    ) -> Dict[Hashable, GlyphIdentificationResult]:
+        """Send glyphs in concurrent batches and cache what was identified."""
         if not self._ensure_client():
-            return [
-                GlyphIdentificationResult(
-                    identified_char=None, confidence=0.0, alternatives=[],
-                    error="Gemini client not available"
-                )
-                for _ in glyph_images
-            ]
-
-        try:
-            from google.genai import types
-
-            pil_images = []
-            for img in glyph_images:
-                if isinstance(img, np.ndarray):
-                    pil_img = Image.fromarray(img)
-                else:
-                    pil_img = img
-                if pil_img.mode != 'RGB':
-                    pil_img = pil_img.convert('RGB')
-                pil_images.append(pil_img)
-
-            all_results = []
-            for batch_start in range(0, len(pil_images), max_per_request):
-                batch_images = pil_images[batch_start:batch_start + max_per_request]
-                batch_results = self._identify_batch(batch_images, expected_chars)
-                all_results.extend(batch_results)
-
-            return all_results
-
-        except Exception as e:
-            logger.error(f"Batch identification failed: {e}")
-            return [
-                GlyphIdentificationResult(
-                    identified_char=None, confidence=0.0, alternatives=[], error=str(e)
-                )
-                for _ in glyph_images
-            ]
+            error = GlyphIdentificationResult(
+                identified_char=None, confidence=0.0, alternatives=[],
+                error="Gemini client not available"
+            )
+            return {key: error for key in images}
+
+        keys = list(images)
+        batches = [keys[start:start + max_per_request]
+                   for start in range(0, len(keys), max_per_request)]
+        budget = _RateBudget(self.REQUESTS_PER_MINUTE)
+
+        def run(batch: List[Hashable]) -> List[GlyphIdentificationResult]:
+            budget.acquire()
+            try:
+                return self._identify_batch([images[key] for key in batch], expected_chars)
+            except Exception as e:
+                logger.error(f"Batch identification failed: {e}")
+                return [
+                    GlyphIdentificationResult(
+                        identified_char=None, confidence=0.0, alternatives=[], error=str(e)
+                    )
+                    for _ in batch
+                ]
+
+        workers = max(1, min(self.MAX_CONCURRENT_REQUESTS, len(batches)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="glyph-id") as pool:
+            batch_results = list(pool.map(run, batches))
+
+        results: Dict[Hashable, GlyphIdentificationResult] = {}
+        with _identification_cache_lock:
+            for batch, identified in zip(batches, batch_results):
+                for key, result in zip(batch, identified):
+                    results[key] = result
+                    # Errors and "?" are not cached, so they are retried next time
+                    if result.identified_char is not None:
+                        _identification_cache[key] = result
+                        _identification_cache.move_to_end(key)
+            while len(_identification_cache) > _MAX_CACHED:
+                _identification_cache.popitem(last=False)
+        return results
 
     def _identify_batch(
         self,
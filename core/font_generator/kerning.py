@@ -0,0 +1,237 @@
+"""
+Profile-based kerning for vectorized glyphs.
+
+Each glyph is reduced once to a pair of horizontal side profiles: for a fixed
+set of heights shared by the whole font, the distance from the glyph's ink to
+its left and right side of the advance. The optical spacing of every pair is
+then a single array operation over an N x N x samples distance cube, so the
+whole character set is kerned instead of a hand-picked list of pairs.
+
+Glyphs whose kerning behaves alike are grouped into left and right classes,
+which is what the font's GPOS ``kern`` feature stores.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .vectorizer import PathCommand, VectorGlyph
+
+logger = logging.getLogger(__name__)
+
+# Points per curve segment when flattening outlines for the profiles
+CURVE_STEPS = 8
+
+
+@dataclass
+class ClassKerning:
+    """Class-based kerning: left classes x right classes -> adjustment."""
+    left_classes: List[List[str]] = field(default_factory=list)
+    right_classes: List[List[str]] = field(default_factory=list)
+    # (left class index, right class index) -> adjustment in font units
+    values: Dict[Tuple[int, int], float] = field(default_factory=dict)
+
+    def pairs(self) -> Dict[Tuple[str, str], float]:
+        """Expand the classes into glyph pairs."""
+        expanded = {}
+        for (li, ri), value in self.values.items():
+            for left in self.left_classes[li]:
+                for right in self.right_classes[ri]:
+                    expanded[(left, right)] = value
+        return expanded
+
+
+def _outline_edges(glyph: VectorGlyph) -> np.ndarray:
+    """Flatten a glyph's outer contours into an (E, 4) array of x0, y0, x1, y1."""
+    t = np.linspace(0.0, 1.0, CURVE_STEPS + 1)[1:, None]
+    edges = []
+    for path in glyph.paths:
+        if path.is_hole:
+            continue  # Holes never reach the outer profile
+        points: List[np.ndarray] = []
+        start = last = None
+        for seg in path.segments:
+            if seg.command == PathCommand.MOVE and seg.points:
+                start = last = np.asarray(seg.points[0], dtype=float)
+                points.append(start[None])
+            elif last is None:
+                continue
+            elif seg.command == PathCommand.LINE and seg.points:
+                last = np.asarray(seg.points[0], dtype=float)
+                points.append(last[None])
+            elif seg.command == PathCommand.CURVE and len(seg.points) >= 3:
+                c1, c2, end = (np.asarray(p, dtype=float) for p in seg.points[:3])
+                points.append((1 - t) ** 3 * last + 3 * (1 - t) ** 2 * t * c1
+                              + 3 * (1 - t) * t ** 2 * c2 + t ** 3 * end)
+                last = end
+            elif seg.command == PathCommand.QUAD and len(seg.points) >= 2:
+                ctrl, end = (np.asarray(p, dtype=float) for p in seg.points[:2])
+                points.append((1 - t) ** 2 * last + 2 * (1 - t) * t * ctrl + t ** 2 * end)
+                last = end
+        if start is None or len(points) < 2:
+            continue
+        polyline = np.vstack(points + [start[None]])
+        edges.append(np.hstack([polyline[:-1], polyline[1:]]))
+    return np.vstack(edges) if edges else np.empty((0, 4))
+
+
+def side_profiles(glyph: VectorGlyph, heights: np.ndarray,
+                  side_bearing: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Horizontal side profiles of a glyph at the given heights.
+
+    The glyph is measured as the font's spacing places it: ink starts
+    ``side_bearing`` after the origin and ends ``side_bearing`` before the
+    advance.
+
+    Returns:
+        (left, right): distance from the left and right side of the advance
+        to the ink at each height, NaN where the glyph has no ink
+    """
+    edges = _outline_edges(glyph)
+    nan = np.full(len(heights), np.nan)
+    if not len(edges):
+        return nan, nan.copy()
+
+    x0, y0, x1, y1 = edges.T[:, :, None]
+    y = heights[None, :]
+    # Half-open crossing test, so a vertex shared by two edges counts once
+    crosses = (y0 <= y) != (y1 <= y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xs = np.where(crosses, x0 + (y - y0) * (x1 - x0) / (y1 - y0), np.nan)
+    has_ink = crosses.any(axis=0)
+    xs_min = np.where(has_ink, np.nanmin(np.where(crosses, xs, np.inf), axis=0), np.nan)
+    xs_max = np.where(has_ink, np.nanmax(np.where(crosses, xs, -np.inf), axis=0), np.nan)
+
+    xmin, _, xmax, _ = glyph.bounds
+    return side_bearing + (xs_min - xmin), side_bearing + (xmax - xs_max)
+
+
+def _group(rows: np.ndarray, tolerance: float) -> np.ndarray:
+    """Greedy grouping of kerning rows that agree within ``tolerance`` everywhere."""
+    labels = np.empty(len(rows), dtype=int)
+    representatives: List[np.ndarray] = []
+    for i, row in enumerate(rows):
+        if representatives:
+            diff = np.abs(np.asarray(representatives) - row).max(axis=1)
+            best = int(np.argmin(diff))
+            if diff[best] <= tolerance:
+                labels[i] = best
+                continue
+        labels[i] = len(representatives)
+        representatives.append(row)
+    return labels
+
+
+class KerningEngine:
+    """
+    Computes class-based kerning for a whole glyph set from side profiles.
+
+    The gap between two glyphs at each shared height is the sum of the left
+    glyph's right profile and the right glyph's left profile. Gaps are capped
+    at ``depth`` beyond the regular spacing (deep counters read as open space
+    only up to a point), averaged over the heights where both glyphs have ink,
+    and compared with the spacing of two flat sides. The result is scaled by
+    ``strength`` and never brings ink closer than one side bearing.
+    """
+
+    def __init__(
+        self,
+        units_per_em: int = 1000,
+        side_bearing: float = 30,
+        samples: int = 64,
+        depth: float = 0.1,
+        strength: float = 0.5,
+        class_tolerance: float = 0.01,
+        threshold: float = 5,
+        min_overlap: int = 3,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            units_per_em: Font units per em
+            side_bearing: Side bearing on each side of every glyph (font units)
+            samples: Heights at which profiles are measured
+            depth: Deepest gap that still counts as open space (fraction of em)
+            strength: Fraction of the optical difference applied as kerning
+            class_tolerance: Largest kerning difference within a class (fraction of em)
+            threshold: Smallest adjustment that is kept (font units)
+            min_overlap: Shared heights a pair needs before it is kerned
+        """
+        self.units_per_em = units_per_em
+        self.side_bearing = side_bearing
+        self.samples = samples
+        self.depth = depth * units_per_em
+        self.strength = strength
+        self.class_tolerance = class_tolerance * units_per_em
+        self.threshold = threshold
+        self.min_overlap = min_overlap
+
+    def profiles(self, glyphs: Sequence[VectorGlyph]) -> Tuple[np.ndarray, np.ndarray]:
+        """Left and right profiles of every glyph, as two (N, samples) arrays."""
+        bounds = [g.bounds for g in glyphs if g.paths]
+        if not bounds:
+            empty = np.full((len(glyphs), self.samples), np.nan)
+            return empty, empty.copy()
+        bottom = min(b[1] for b in bounds)
+        top = max(b[3] for b in bounds)
+        # Sample at the middle of equal bands, never exactly on a flat top or bottom
+        step = (top - bottom) / self.samples
+        heights = bottom + step * (np.arange(self.samples) + 0.5)
+        lefts, rights = zip(*(side_profiles(g, heights, self.side_bearing) for g in glyphs))
+        return np.vstack(lefts), np.vstack(rights)
+
+    def kerning_matrix(self, glyphs: Sequence[VectorGlyph]) -> np.ndarray:
+        """Kerning for every (left, right) pair, as an (N, N) array in font units."""
+        lefts, rights = self.profiles(glyphs)
+        gaps = rights[:, None, :] + lefts[None, :, :]  # (left, right, height)
+        shared = ~np.isnan(gaps)
+        overlap = shared.sum(axis=2)
+
+        flat = 2 * self.side_bearing
+        capped = np.where(shared, np.minimum(gaps, flat + self.depth), 0.0)
+        optical = capped.sum(axis=2) / np.maximum(overlap, 1)
+        closest = np.where(shared, gaps, np.inf).min(axis=2)
+
+        kern = np.round(self.strength * (flat - optical))
+        kern = np.maximum(kern, np.ceil(self.side_bearing - closest))  # one side bearing of air
+        kern[overlap < self.min_overlap] = 0.0
+        return kern
+
+    def calculate(self, glyphs: Sequence[VectorGlyph]) -> ClassKerning:
+        """
+        Kern every pair of ``glyphs`` and group the result into classes.
+
+        Returns:
+            ClassKerning whose values all satisfy ``threshold``
+        """
+        glyphs = [g for g in glyphs if g.paths]
+        if not glyphs:
+            return ClassKerning()
+        labels = [g.label for g in glyphs]
+        matrix = self.kerning_matrix(glyphs)
+
+        left_of = _group(matrix, self.class_tolerance)
+        right_of = _group(matrix.T, self.class_tolerance)
+        n_left, n_right = left_of.max() + 1, right_of.max() + 1
+
+        sums = np.zeros((n_left, n_right))
+        counts = np.zeros((n_left, n_right))
+        np.add.at(sums, (left_of[:, None], right_of[None, :]), matrix)
+        np.add.at(counts, (left_of[:, None], right_of[None, :]), 1)
+        means = np.round(sums / np.maximum(counts, 1))
+
+        result = ClassKerning(
+            left_classes=[[labels[i] for i in np.flatnonzero(left_of == c)] for c in range(n_left)],
+            right_classes=[[labels[i] for i in np.flatnonzero(right_of == c)]
+                           for c in range(n_right)],
+        )
+        for li, ri in zip(*np.nonzero(np.abs(means) >= self.threshold)):
+            result.values[(int(li), int(ri))] = float(means[li, ri])
+
+        logger.info(f"Kerned {len(glyphs)}x{len(glyphs)} pairs into {n_left}x{n_right} classes, "
+                    f"{len(result.values)} class pairs")
+        return result
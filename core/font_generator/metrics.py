@@ -3,13 +3,14 @@ Font metrics calculation for vectorized glyphs.
 
 This module analyzes vectorized characters to calculate font metrics
 including baseline, x-height, cap-height, ascenders, descenders,
-and basic kerning pairs.
+and kerning for every pair of glyphs.
 """
 
 import logging
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple, Set
 
+from .kerning import ClassKerning, KerningEngine
 from .vectorizer import VectorGlyph
 
 logger = logging.getLogger(__name__)
@@ -39,32 +40,6 @@ PUNCT_FULL = set("!?|/\\()[]{}@#$%&+<>=:")
 # SUPERSCRIPT-like: Small marks at top (degree, etc.)
 PUNCT_SUPER = set("°")
 
-# Common kerning pairs (characters that often need spacing adjustment)
-KERNING_PAIRS = [
-    # Capital + lowercase
-    ("A", "v"), ("A", "w"), ("A", "y"),
-    ("F", "a"), ("F", "e"), ("F", "o"),
-    ("L", "T"), ("L", "V"), ("L", "W"), ("L", "Y"),
-    ("P", "a"), ("P", "e"), ("P", "o"),
-    ("T", "a"), ("T", "e"), ("T", "o"), ("T", "r"), ("T", "y"),
-    ("V", "a"), ("V", "e"), ("V", "o"),
-    ("W", "a"), ("W", "e"), ("W", "o"),
-    ("Y", "a"), ("Y", "e"), ("Y", "o"),
-    # Capital + Capital
-    ("A", "T"), ("A", "V"), ("A", "W"), ("A", "Y"),
-    ("L", "A"),
-    # Lowercase pairs
-    ("f", "f"), ("f", "i"), ("f", "l"),
-    ("r", "a"), ("r", "e"), ("r", "o"),
-    ("v", "a"), ("v", "e"), ("v", "o"),
-    ("w", "a"), ("w", "e"), ("w", "o"),
-    ("y", "a"), ("y", "e"), ("y", "o"),
-    # Punctuation
-    (".", "'"), (",", "'"),
-    ("A", "'"), ("T", "'"),
-]
-
-
 @dataclass
 class FontMetrics:
     """
@@ -90,6 +65,9 @@ class FontMetrics:
     # Kerning adjustments (pair -> adjustment)
     kerning: Dict[Tuple[str, str], float] = field(default_factory=dict)
 
+    # The same kerning as left/right glyph classes (what the font stores)
+    kerning_classes: Optional[ClassKerning] = None
+
     # Bounding boxes per character (label -> (xMin, yMin, xMax, yMax))
     bboxes: Dict[str, Tuple[float, float, float, float]] = field(default_factory=dict)
 
@@ -119,14 +97,15 @@ class FontMetricsCalculator:
     Calculates font metrics from a set of vectorized glyphs.
 
     Analyzes glyph bounds to determine baseline, x-height, cap-height,
-    ascenders, and descenders. Also generates basic kerning pairs.
+    ascenders, and descenders. Also kerns every pair of glyphs from their
+    side profiles (see :class:`KerningEngine`).
     """
 
     def __init__(
         self,
         units_per_em: int = 1000,
         default_side_bearing: float = 3,
-        kerning_threshold: float = 0.15,
+        kerning_threshold: float = 0.5,
     ):
         """
         Initialize the calculator.
@@ -138,7 +117,7 @@ class FontMetricsCalculator:
         """
         self.units_per_em = units_per_em
         self.default_side_bearing = default_side_bearing * units_per_em / 100
-        self.kerning_threshold = kerning_threshold * units_per_em
+        self.kerning_threshold = kerning_threshold * units_per_em / 100
         self._normalized_glyphs: List[VectorGlyph] = []
 
     def get_normalized_glyphs(self) -> List[VectorGlyph]:
@@ -194,7 +173,8 @@ class FontMetricsCalculator:
             metrics.advance_widths[glyph.label] = glyph_width + self.default_side_bearing * 2
 
         # Calculate kerning
-        metrics.kerning = self._calculate_kerning(norm_map, metrics.advance_widths)
+        metrics.kerning_classes = self._calculate_kerning(normalized)
+        metrics.kerning = metrics.kerning_classes.pairs()
 
         logger.info(
             f"Calculated metrics: cap={metrics.cap_height:.0f}, "
@@ -440,124 +420,16 @@ class FontMetricsCalculator:
         # Fallback: ~20% below baseline
         return -self.units_per_em * 0.2
 
-    def _calculate_kerning(
-        self,
-        glyph_map: Dict[str, VectorGlyph],
-        advance_widths: Dict[str, float],
-    ) -> Dict[Tuple[str, str], float]:
+    def _calculate_kerning(self, glyphs: List[VectorGlyph]) -> ClassKerning:
         """
-        Calculate basic kerning pairs.
+        Calculate kerning for every pair of glyphs.
 
-        Uses simple heuristics based on glyph shapes to determine
-        which character pairs need spacing adjustment.
+        Side profiles are measured once per glyph and all pairs are spaced
+        in one pass, then grouped into left/right kerning classes.
         """
-        kerning = {}
-
-        for left, right in KERNING_PAIRS:
-            if left not in glyph_map or right not in glyph_map:
-                continue
-
-            # Get glyph shapes
-            left_glyph = glyph_map[left]
-            right_glyph = glyph_map[right]
-
-            # Calculate kern value based on shape analysis
-            kern = self._calculate_kern_value(left_glyph, right_glyph)
-
-            if abs(kern) >= self.kerning_threshold:
-                kerning[(left, right)] = kern
-                logger.debug(f"Kerning '{left}'+'{right}': {kern:.0f}")
-
-        return kerning
-
-    def _calculate_kern_value(
-        self,
-        left: VectorGlyph,
-        right: VectorGlyph,
-    ) -> float:
-        """
-        Calculate kerning value for a pair of glyphs.
-
-        Uses shape analysis to determine optimal spacing.
-        Negative values bring characters closer together.
-        """
-        left_bbox = left.bounds
-        right_bbox = right.bounds
-
-        # Analyze right edge of left glyph
-        left_edge_type = self._analyze_edge(left, "right")
-
-        # Analyze left edge of right glyph
-        right_edge_type = self._analyze_edge(right, "left")
-
-        # Determine kern based on edge types
-        # Diagonal + diagonal = tighten
-        # Diagonal + straight = slight tighten
-        # Round + round = no change
-
-        kern = 0.0
-        base_kern = -self.units_per_em * 0.05  # -5% of em
-
-        if left_edge_type == "diagonal" and right_edge_type == "diagonal":
-            kern = base_kern * 2
-        elif left_edge_type == "diagonal" or right_edge_type == "diagonal":
-            kern = base_kern
-        elif left_edge_type == "open" or right_edge_type == "open":
-            kern = base_kern * 0.5
-
-        # Special cases
-        if left.label in "FPTY" and right.label in "aeo":
-            kern = base_kern * 2.5
-        if left.label == "L" and right.label in "TVWY":
-            kern = base_kern * 3
-        if left.label == "A" and right.label in "VWY":
-            kern = base_kern * 2.5
-
-        return kern
-
-    def _analyze_edge(self, glyph: VectorGlyph, side: str) -> str:
-        """
-        Analyze the edge shape of a glyph.
-
-        Returns:
-            "straight": Vertical edge (H, I, etc.)
-            "diagonal": Angled edge (A, V, W, etc.)
-            "round": Curved edge (O, C, etc.)
-            "open": Open/concave edge (L, T crossbar, etc.)
-        """
-        bbox = glyph.bounds
-
-        if not glyph.paths:
-            return "straight"
-
-        # Sample points along the edge
-        edge_points = []
-        for path in glyph.paths:
-            if path.is_hole:
-                continue
-            for seg in path.segments:
-                for x, y in seg.points:
-                    if side == "right" and x > bbox[2] - (bbox[2] - bbox[0]) * 0.2:
-                        edge_points.append((x, y))
-                    elif side == "left" and x < bbox[0] + (bbox[2] - bbox[0]) * 0.2:
-                        edge_points.append((x, y))
-
-        if not edge_points:
-            return "straight"
-
-        # Analyze distribution
-        xs = [p[0] for p in edge_points]
-        x_range = max(xs) - min(xs) if xs else 0
-
-        width = bbox[2] - bbox[0]
-        if width == 0:
-            return "straight"
-
-        variation = x_range / width
-
-        if variation < 0.1:
-            return "straight"
-        elif variation < 0.3:
-            return "round"
-        else:
-            return "diagonal"
+        engine = KerningEngine(
+            units_per_em=self.units_per_em,
+            side_bearing=self.default_side_bearing,
+            threshold=self.kerning_threshold,
+        )
+        return engine.calculate(glyphs)
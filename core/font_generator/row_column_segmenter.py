@@ -10,6 +10,7 @@ import cv2
 import numpy as np
 from PIL import Image
 
+from .bbox_index import connected_components, overlapping_pairs
 from .row_detector import RowDetector, TextRow, CharacterColumn
 from .segmentation import (
     CharacterCell,
@@ -467,77 +468,48 @@ class RowColumnSegmenter:
         widths = [w for _, _, w, _ in boxes]
         median_width = sorted(widths)[len(widths) // 2]
 
-        def get_x_range(box):
-            x, _, w, _ = box
-            return x, x + w
-
-        def horizontal_overlap(box1, box2):
-            """Calculate horizontal overlap ratio between two boxes."""
-            x1_min, x1_max = get_x_range(box1)
-            x2_min, x2_max = get_x_range(box2)
-
-            overlap_start = max(x1_min, x2_min)
-            overlap_end = min(x1_max, x2_max)
-
-            if overlap_end <= overlap_start:
-                return 0.0
-
-            overlap = overlap_end - overlap_start
-            min_width = min(x1_max - x1_min, x2_max - x2_min)
-            return overlap / min_width if min_width > 0 else 0.0
-
-        # Use union-find to group overlapping boxes
-        n = len(boxes)
-        parent = list(range(n))
-
-        def find(i):
-            if parent[i] != i:
-                parent[i] = find(parent[i])
-            return parent[i]
-
-        def union(i, j):
-            pi, pj = find(i), find(j)
-            if pi != pj:
-                parent[pi] = pj
-
-        # Group boxes with significant horizontal overlap (> 50%)
-        for i in range(n):
-            for j in range(i + 1, n):
-                overlap = horizontal_overlap(boxes[i], boxes[j])
-                if overlap > 0.5:
-                    # Also check they're not too far apart vertically
-                    # (should be within 2x the median width vertically)
-                    _, y1, _, h1 = boxes[i]
-                    _, y2, _, h2 = boxes[j]
-                    cy1, cy2 = y1 + h1 // 2, y2 + h2 // 2
-                    vertical_dist = abs(cy1 - cy2)
-
-                    if vertical_dist < median_width * 2:
-                        logger.info(
-                            f"Merging overlapping boxes: {boxes[i]} + {boxes[j]}, "
-                            f"overlap={overlap:.2f}, v_dist={vertical_dist}"
-                        )
-                        union(i, j)
-
-        # Group boxes by their root parent
-        groups = {}
-        for i in range(n):
-            root = find(i)
-            if root not in groups:
-                groups[root] = []
-            groups[root].append(boxes[i])
+        x, y, w, h = np.array(boxes, dtype=np.int64).T
+
+        # Boxes sharing no horizontal extent have no overlap, so only the pairs
+        # found by the sweep are tested
+        i, j = overlapping_pairs(x, x + w)
+        overlap = np.minimum(x[i] + w[i], x[j] + w[j]) - np.maximum(x[i], x[j])
+        min_width = np.minimum(w[i], w[j])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where((overlap > 0) & (min_width > 0), overlap / min_width, 0.0)
+
+        # Significant horizontal overlap (> 50%), and not too far apart
+        # vertically (within 2x the median width)
+        vertical_dist = np.abs((y[i] + h[i] // 2) - (y[j] + h[j] // 2))
+        linked = (ratio > 0.5) & (vertical_dist < median_width * 2)
+        for a, b, r, d in zip(i[linked].tolist(), j[linked].tolist(),
+                              ratio[linked].tolist(), vertical_dist[linked].tolist()):
+            logger.debug(
+                f"Merging overlapping boxes: {boxes[a]} + {boxes[b]}, "
+                f"overlap={r:.2f}, v_dist={d}"
+            )
+
+        # Group linked boxes; groups keep the order of their first box
+        labels = connected_components(len(boxes), i[linked], j[linked])
+        roots, group_of = np.unique(labels, return_inverse=True)
+        x_min = np.full(len(roots), np.iinfo(np.int64).max)
+        y_min = x_min.copy()
+        x_max = np.full(len(roots), np.iinfo(np.int64).min)
+        y_max = x_max.copy()
+        np.minimum.at(x_min, group_of, x)
+        np.minimum.at(y_min, group_of, y)
+        np.maximum.at(x_max, group_of, x + w)
+        np.maximum.at(y_max, group_of, y + h)
+        sizes = np.bincount(group_of)
 
         # Merge each group into a single bounding box
         merged = []
-        for group in groups.values():
-            if len(group) == 1:
-                merged.append(group[0])
+        for g, root in enumerate(roots.tolist()):
+            if sizes[g] == 1:
+                merged.append(boxes[root])
             else:
-                x_min = min(b[0] for b in group)
-                y_min = min(b[1] for b in group)
-                x_max = max(b[0] + b[2] for b in group)
-                y_max = max(b[1] + b[3] for b in group)
-                merged.append((x_min, y_min, x_max - x_min, y_max - y_min))
-                logger.info(f"Merged {len(group)} components into one glyph")
+                merged.append((int(x_min[g]), int(y_min[g]),
+                               int(x_max[g] - x_min[g]), int(y_max[g] - y_min[g])))
+                logger.info(f"Merged {sizes[g]} components into one glyph")
 
         return merged
@@ -15,6 +15,8 @@ import cv2
 import numpy as np
 from PIL import Image
 
+from .bbox_index import overlapping_pairs
+
 logger = logging.getLogger(__name__)
 
 
@@ -803,99 +805,61 @@ class AlphabetSegmenter:
         if len(bboxes) < 2:
             return bboxes
 
-        # Calculate average character dimensions for thresholds
-        avg_width = np.mean([b[2] for b in bboxes])
-        avg_height = np.mean([b[3] for b in bboxes])
-        avg_area = avg_width * avg_height
+        x, y, w, h = np.array([b[:4] for b in bboxes], dtype=np.int64).T
+
+        # Allow vertical gap up to 50% of average height (dots can be far from stems)
+        max_gap = np.mean(h) * 0.5
+
+        # Only components sharing some horizontal extent can pass the alignment
+        # check below, so those are the only pairs tested
+        i, j = overlapping_pairs(x, x + w)
+        x1, y1, w1, h1 = x[i], y[i], w[i], h[i]
+        x2, y2, w2, h2 = x[j], y[j], w[j], h[j]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # One much smaller than the other (like a dot vs stem):
+            # area < 50% of stem OR height < 50% of stem (dots are short)
+            area1, area2 = w1 * h1, w2 * h2
+            size_ratio = np.minimum(area1, area2) / np.maximum(area1, area2)
+            height_ratio = np.minimum(h1, h2) / np.maximum(h1, h2)
+            one_is_small = (size_ratio < 0.5) | (height_ratio < 0.5)
+
+            # Horizontal alignment: 30% overlap relative to the smaller box's
+            # width, OR the smaller component's center within the larger's
+            # bounds (handwritten 'i' and 'j' dots may be offset)
+            overlap_width = np.maximum(
+                0, np.minimum(x1 + w1, x2 + w2) - np.maximum(x1, x2))
+            smaller_width = np.minimum(w1, w2)
+            overlap_ratio = np.where(smaller_width > 0, overlap_width / smaller_width, 0)
+        first_smaller = w1 < w2
+        small_center_x = np.where(first_smaller, x1 + w1 / 2, x2 + w2 / 2)
+        large_x1 = np.where(first_smaller, x2, x1)
+        large_x2 = np.where(first_smaller, x2 + w2, x1 + w1)
+        center_within_bounds = (large_x1 <= small_center_x) & (small_center_x <= large_x2)
+        aligned = (overlap_ratio >= 0.3) | center_within_bounds
+
+        # Vertically separated, not side-by-side (overlapping vertically is ok)
+        v_gap = np.maximum(0, np.maximum(y2 - (y1 + h1), y1 - (y2 + h2)))
+
+        candidates = one_is_small & aligned & (v_gap <= max_gap)
+        partners: Dict[int, List[int]] = {}
+        for a, b in zip(i[candidates].tolist(), j[candidates].tolist()):
+            partners.setdefault(a, []).append(b)
 
         # Track which bboxes have been merged
         merged = [False] * len(bboxes)
         result = []
 
-        for i, (x1, y1, w1, h1, cnt1) in enumerate(bboxes):
+        for i in range(len(bboxes)):
             if merged[i]:
                 continue
 
-            area1 = w1 * h1
             merge_indices = [i]
-            combined_x1, combined_y1 = x1, y1
-            combined_x2, combined_y2 = x1 + w1, y1 + h1
-
-            for j, (x2, y2, w2, h2, cnt2) in enumerate(bboxes):
-                if i == j or merged[j]:
-                    continue
-
-                area2 = w2 * h2
-
-                # Check if one is much smaller than the other (like a dot vs stem)
-                # Use multiple criteria: area ratio OR height ratio (dots are short)
-                size_ratio = min(area1, area2) / max(area1, area2)
-                height_ratio = min(h1, h2) / max(h1, h2)
-
-                # A dot typically has: area < 50% of stem OR height < 50% of stem
-                one_is_small = size_ratio < 0.5 or height_ratio < 0.5
-
-                if not one_is_small:
-                    # Both are similar size AND similar height - don't merge (likely adjacent chars)
-                    logger.debug(f"Merge skipped: size_ratio={size_ratio:.1%}, height_ratio={height_ratio:.1%} (both similar)")
-                    continue
-
-                # Check for horizontal alignment (for dots over stems like 'i', 'j')
-                box1_x1, box1_x2 = x1, x1 + w1
-                box2_x1, box2_x2 = x2, x2 + w2
-
-                # Calculate overlap amount
-                overlap_x1 = max(box1_x1, box2_x1)
-                overlap_x2 = min(box1_x2, box2_x2)
-                overlap_width = max(0, overlap_x2 - overlap_x1)
-
-                # Require some overlap relative to the smaller box's width
-                smaller_width = min(w1, w2)
-                overlap_ratio = overlap_width / smaller_width if smaller_width > 0 else 0
-
-                # Alternative check: is the smaller component's center within the larger's bounds?
-                # This helps with handwritten 'i' and 'j' where dots may be offset
-                if w1 < w2:
-                    small_center_x = x1 + w1 / 2
-                    center_within_bounds = box2_x1 <= small_center_x <= box2_x2
-                else:
-                    small_center_x = x2 + w2 / 2
-                    center_within_bounds = box1_x1 <= small_center_x <= box1_x2
-
-                # Accept if either: 30% overlap OR center is within bounds
-                if overlap_ratio < 0.3 and not center_within_bounds:
-                    logger.debug(f"Dot merge rejected: overlap={overlap_ratio:.1%}, center_in_bounds={center_within_bounds}")
-                    continue
-
-                # Check vertical separation (should NOT be side-by-side)
-                box1_y1, box1_y2 = y1, y1 + h1
-                box2_y1, box2_y2 = y2, y2 + h2
-
-                # Calculate vertical gap
-                if box1_y2 < box2_y1:
-                    v_gap = box2_y1 - box1_y2
-                elif box2_y2 < box1_y1:
-                    v_gap = box1_y1 - box2_y2
-                else:
-                    v_gap = 0  # Overlapping vertically - unusual for dot, but ok
-
-                # Allow vertical gap up to 50% of average height (dots can be far from stems)
-                if v_gap > avg_height * 0.5:
-                    logger.debug(f"Merge rejected: v_gap={v_gap:.0f} > {avg_height * 0.5:.0f} (50% of avg height)")
-                    continue
-
-                logger.debug(f"Merge candidate found: size_ratio={size_ratio:.1%}, overlap={overlap_ratio:.1%}, v_gap={v_gap:.0f}")
-
-                # All criteria met - merge this box
-                merge_indices.append(j)
-                combined_x1 = min(combined_x1, x2)
-                combined_y1 = min(combined_y1, y2)
-                combined_x2 = max(combined_x2, x2 + w2)
-                combined_y2 = max(combined_y2, y2 + h2)
-
-                # Limit to max 2 components per merge (stem + dot)
-                # Prevents over-merging adjacent characters
-                if len(merge_indices) >= 2:
+            # Merge with the first unmerged candidate only, max 2 components
+            # per merge (stem + dot), which prevents over-merging adjacent characters
+            for j in partners.get(i, ()):
+                if not merged[j]:
+                    merge_indices.append(j)
                     break
 
             # Mark all merged boxes
@@ -903,12 +867,14 @@ class AlphabetSegmenter:
                 merged[idx] = True
 
             # Create combined bbox
-            combined_w = combined_x2 - combined_x1
-            combined_h = combined_y2 - combined_y1
+            group = [bboxes[idx] for idx in merge_indices]
+            combined_x1 = min(b[0] for b in group)
+            combined_y1 = min(b[1] for b in group)
+            combined_w = max(b[0] + b[2] for b in group) - combined_x1
+            combined_h = max(b[1] + b[3] for b in group) - combined_y1
 
             # Use the largest contour as the representative
-            largest_cnt = max([bboxes[idx][4] for idx in merge_indices],
-                            key=cv2.contourArea)
+            largest_cnt = max([b[4] for b in group], key=cv2.contourArea)
 
             result.append((combined_x1, combined_y1, combined_w, combined_h, largest_cnt))
 
@@ -8,9 +8,13 @@ suitable for font generation. It handles both outer contours and inner holes
 
 import logging
 import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Tuple, Optional, Union
+from typing import Callable, List, Tuple, Optional, Union
 
 import cv2
 import numpy as np
@@ -18,6 +22,9 @@ from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# Below this many glyphs, starting worker processes costs more than it saves
+PARALLEL_VECTORIZE_THRESHOLD = 16
+
 
 class PathCommand(Enum):
     """SVG-style path commands."""
@@ -413,42 +420,20 @@ class GlyphVectorizer:
         if len(points) < 3:
             return []
 
-        corners = []
-        threshold_rad = math.radians(self.corner_threshold)
-
-        for i in range(1, len(points) - 1):
-            p0 = points[i - 1]
-            p1 = points[i]
-            p2 = points[i + 1]
-
-            # Calculate angle at p1
-            angle = self._angle_between(p0, p1, p2)
-
-            if angle < threshold_rad:
-                corners.append(i)
-
-        return corners
-
-    def _angle_between(
-        self,
-        p0: Tuple[float, float],
-        p1: Tuple[float, float],
-        p2: Tuple[float, float],
-    ) -> float:
-        """Calculate angle at p1 between p0-p1 and p1-p2."""
-        v1 = (p0[0] - p1[0], p0[1] - p1[1])
-        v2 = (p2[0] - p1[0], p2[1] - p1[1])
-
-        len1 = math.sqrt(v1[0] ** 2 + v1[1] ** 2)
-        len2 = math.sqrt(v2[0] ** 2 + v2[1] ** 2)
+        pts = np.asarray(points, dtype=np.float64)
+        # Angle at every interior point between its two neighbours
+        v1 = pts[:-2] - pts[1:-1]
+        v2 = pts[2:] - pts[1:-1]
+        len1 = np.hypot(v1[:, 0], v1[:, 1])
+        len2 = np.hypot(v2[:, 0], v2[:, 1])
+        degenerate = (len1 == 0) | (len2 == 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cos_angle = np.einsum('ij,ij->i', v1, v2) / (len1 * len2)
+        angles = np.arccos(np.clip(cos_angle, -1.0, 1.0))
+        angles[degenerate] = math.pi
 
-        if len1 == 0 or len2 == 0:
-            return math.pi
-
-        dot = v1[0] * v2[0] + v1[1] * v2[1]
-        cos_angle = max(-1, min(1, dot / (len1 * len2)))
-
-        return math.acos(cos_angle)
+        threshold_rad = math.radians(self.corner_threshold)
+        return (np.nonzero(angles < threshold_rad)[0] + 1).tolist()
 
     def _fit_bezier_segment(
         self,
@@ -510,66 +495,43 @@ class GlyphVectorizer:
         if len(points) <= target_count:
             return points
 
-        # Calculate cumulative arc length
-        arc_lengths = [0.0]
-        for i in range(1, len(points)):
-            dx = points[i][0] - points[i-1][0]
-            dy = points[i][1] - points[i-1][1]
-            arc_lengths.append(arc_lengths[-1] + math.sqrt(dx*dx + dy*dy))
+        pts = np.asarray(points, dtype=np.float64)
+        # Cumulative arc length at each point
+        steps = np.diff(pts, axis=0)
+        arc_lengths = np.concatenate(([0.0], np.cumsum(np.hypot(steps[:, 0], steps[:, 1]))))
 
         total_length = arc_lengths[-1]
         if total_length == 0:
             return [points[0], points[-1]]
 
-        # Resample at even intervals
-        resampled = [points[0]]
+        # Resample at even intervals: each target falls on the first point whose
+        # arc length reaches it, interpolated back towards the point before
         step = total_length / (target_count - 1)
+        targets = np.arange(1, target_count - 1) * step
+        j = np.clip(np.searchsorted(arc_lengths, targets, side='left'), 1, len(pts) - 1)
+        t = (targets - arc_lengths[j - 1]) / (arc_lengths[j] - arc_lengths[j - 1])
+        inner = pts[j - 1] + t[:, None] * (pts[j] - pts[j - 1])
 
-        for i in range(1, target_count - 1):
-            target_length = i * step
-            # Find the segment containing this length
-            for j in range(1, len(arc_lengths)):
-                if arc_lengths[j] >= target_length:
-                    # Interpolate between points[j-1] and points[j]
-                    t = (target_length - arc_lengths[j-1]) / (arc_lengths[j] - arc_lengths[j-1])
-                    x = points[j-1][0] + t * (points[j][0] - points[j-1][0])
-                    y = points[j-1][1] + t * (points[j][1] - points[j-1][1])
-                    resampled.append((x, y))
-                    break
-
-        resampled.append(points[-1])
-        return resampled
+        return [points[0]] + [tuple(p) for p in inner.tolist()] + [points[-1]]
 
     def _calculate_tangents(
         self,
         points: List[Tuple[float, float]],
     ) -> List[Tuple[float, float]]:
         """Calculate unit tangent vectors at each point for smooth curve fitting."""
-        n = len(points)
-        tangents = []
-
-        for i in range(n):
-            if i == 0:
-                # Forward difference
-                dx = points[1][0] - points[0][0]
-                dy = points[1][1] - points[0][1]
-            elif i == n - 1:
-                # Backward difference
-                dx = points[-1][0] - points[-2][0]
-                dy = points[-1][1] - points[-2][1]
-            else:
-                # Central difference for smoother tangents
-                dx = points[i+1][0] - points[i-1][0]
-                dy = points[i+1][1] - points[i-1][1]
-
-            # Normalize to unit vector
-            length = math.sqrt(dx*dx + dy*dy)
-            if length > 0:
-                tangents.append((dx/length, dy/length))
-            else:
-                tangents.append((1.0, 0.0))
-
-        return tangents
+        pts = np.asarray(points, dtype=np.float64)
+        d = np.empty_like(pts)
+        d[0] = pts[1] - pts[0]             # Forward difference
+        d[-1] = pts[-1] - pts[-2]          # Backward difference
+        d[1:-1] = pts[2:] - pts[:-2]       # Central difference for smoother tangents
+
+        # Normalize to unit vectors; zero-length differences point along +x
+        length = np.hypot(d[:, 0], d[:, 1])
+        zero = length == 0
+        length[zero] = 1.0
+        d /= length[:, None]
+        d[zero] = (1.0, 0.0)
+        return [tuple(t) for t in d.tolist()]
 
     def _calculate_control_points(
         self,
@@ -620,25 +582,64 @@ class GlyphVectorizer:
     def vectorize_all(
         self,
         characters: List,  # List[CharacterCell] - avoid circular import
+        workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> List[VectorGlyph]:
         """
         Vectorize multiple characters.
 
+        Glyphs are independent, so larger sets are vectorized in a process
+        pool (the vectorizer and each glyph bitmap are pickled to the workers).
+
         Args:
             characters: List of CharacterCell objects from segmentation
+            workers: Worker processes (None = one per CPU, 1 = vectorize in this process)
+            progress_callback: Optional callback(done, total) after each glyph
 
         Returns:
-            List of VectorGlyph objects
+            List of VectorGlyph objects, in the order of ``characters``
         """
-        glyphs = []
-        for char in characters:
-            glyph = self.vectorize(char.image, char.label)
+        total = len(characters)
+        jobs = [(char.image, char.label) for char in characters]
+        workers = workers or os.cpu_count() or 1
+        glyphs: List[VectorGlyph] = []
+
+        if workers > 1 and total >= PARALLEL_VECTORIZE_THRESHOLD:
+            chunk = max(1, total // (workers * 4))
+            try:
+                # Spawned, not forked: callers include the GUI thread, and a
+                # forked child inherits Qt's locks mid-use.
+                with ProcessPoolExecutor(max_workers=min(workers, total),
+                                         mp_context=multiprocessing.get_context("spawn")) as pool:
+                    results = pool.map(_vectorize_job, [self] * total, jobs, chunksize=chunk)
+                    return self._collect(results, glyphs, total, progress_callback)
+            except (BrokenProcessPool, OSError) as e:
+                # Only the pool itself failing falls back; glyphs already
+                # vectorized are kept, and a glyph's own error propagates.
+                logger.warning(f"Process pool failed after {len(glyphs)}/{total} glyphs, "
+                               f"vectorizing the rest serially: {e}")
+
+        remaining = jobs[len(glyphs):]
+        return self._collect((self.vectorize(image, label) for image, label in remaining),
+                             glyphs, total, progress_callback)
+
+    @staticmethod
+    def _collect(results, glyphs: List[VectorGlyph], total: int,
+                 progress_callback: Optional[Callable[[int, int], None]]) -> List[VectorGlyph]:
+        for glyph in results:
             glyphs.append(glyph)
-            logger.info(f"Vectorized '{char.label}': {len(glyph.paths)} paths")
-
+            logger.info(f"Vectorized '{glyph.label}': {len(glyph.paths)} paths")
+            if progress_callback:
+                progress_callback(len(glyphs), total)
         return glyphs
 
 
+def _vectorize_job(vectorizer: GlyphVectorizer, job: Tuple[np.ndarray, str]) -> VectorGlyph:
+    """Vectorize one glyph in a worker process."""
+    image, label = job
+    return vectorizer.vectorize(image, label)
+
+
 def glyphs_to_svg_font(
     glyphs: List[VectorGlyph],
     font_name: str = "CustomFont",
@@ -1,13 +1,96 @@
 """Image processing utilities for ImageAI."""
 
-from typing import Tuple, Optional, List
+from typing import Tuple, Optional
 from PIL import Image
+import numpy as np
 import io
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _line_variance_profile(lines: np.ndarray) -> np.ndarray:
+    """
+    Color variance of every line in a stack of sampled pixel lines.
+
+    Args:
+        lines: Array of shape (n_lines, n_samples, 3)
+
+    Returns:
+        Array of shape (n_lines,) with the summed per-channel variance of each line
+    """
+    if lines.shape[0] == 0 or lines.shape[1] == 0:
+        return np.zeros(lines.shape[0], dtype=np.float64)
+    lines = lines.astype(np.float64)
+    deviation = lines - lines.mean(axis=1, keepdims=True)
+    return (deviation * deviation).sum(axis=2).mean(axis=1)
+
+
+def _last_uniform(positions: range, variances: np.ndarray, threshold: float, default: int) -> int:
+    """
+    Walk inward over ``positions`` and return the last one still uniform.
+
+    Mirrors the scan used by the border detector: stop at the first line whose
+    variance exceeds ``threshold`` and keep the line before it (or ``default``
+    when the very first line already has content).
+    """
+    nonuniform = np.flatnonzero(variances > threshold)
+    if nonuniform.size:
+        first = int(nonuniform[0])
+        return positions[first - 1] if first > 0 else default
+    return positions[-1] if len(positions) else default
+
+
+def detect_solid_borders(img: Image.Image, variance_threshold: float = 5.0) -> Tuple[int, int, int, int]:
+    """
+    Find the content box inside uniform color borders.
+
+    Rows are sampled at ~100 evenly spaced columns and columns at ~100 evenly
+    spaced rows between the detected top and bottom, and each scan is limited
+    to the outer third of the image on its side. All row variances are computed
+    in one array pass, then all column variances in a second.
+
+    Args:
+        img: RGB image
+        variance_threshold: Threshold for color variance to consider a row/column as uniform
+
+    Returns:
+        Tuple of (top, bottom, left, right) inclusive pixel bounds
+    """
+    width, height = img.size
+    pixels = np.asarray(img)
+
+    # Rows: sample columns across the full width
+    x_step = max(1, width // 100)
+    top_rows = range(height // 3)
+    bottom_rows = range(height - 1, 2 * height // 3, -1)
+    sampled = pixels[:, ::x_step]
+    top = _last_uniform(
+        top_rows,
+        _line_variance_profile(sampled[top_rows.start:top_rows.stop]),
+        variance_threshold, 0)
+    bottom = _last_uniform(
+        bottom_rows,
+        _line_variance_profile(sampled[list(bottom_rows)]),
+        variance_threshold, height - 1)
+
+    # Columns: sample rows between the detected top and bottom
+    y_step = max(1, (bottom - top) // 100)
+    band = pixels[top:min(bottom + 1, height):y_step].transpose(1, 0, 2)
+    left_cols = range(width // 3)
+    right_cols = range(width - 1, 2 * width // 3, -1)
+    left = _last_uniform(
+        left_cols,
+        _line_variance_profile(band[left_cols.start:left_cols.stop]),
+        variance_threshold, 0)
+    right = _last_uniform(
+        right_cols,
+        _line_variance_profile(band[list(right_cols)]),
+        variance_threshold, width - 1)
+
+    return top, bottom, left, right
+
+
 def auto_crop_solid_borders(image_data: bytes, variance_threshold: float = 5.0) -> bytes:
     """
     Auto-crop uniform color borders from an image.
@@ -32,67 +115,10 @@ def auto_crop_solid_borders(image_data: bytes, variance_threshold: float = 5.0)
             img = img.convert('RGB')
 
         width, height = img.size
-        pixels = img.load()
-
-        # Helper function to calculate variance of colors in a line
-        def calculate_line_variance(pixels_line: List[Tuple[int, int, int]]) -> float:
-            """Calculate the variance of colors in a line of pixels."""
-            if not pixels_line:
-                return 0.0
-
-            # Calculate mean color
-            r_mean = sum(p[0] for p in pixels_line) / len(pixels_line)
-            g_mean = sum(p[1] for p in pixels_line) / len(pixels_line)
-            b_mean = sum(p[2] for p in pixels_line) / len(pixels_line)
-
-            # Calculate variance
-            variance = sum(
-                (p[0] - r_mean) ** 2 + (p[1] - g_mean) ** 2 + (p[2] - b_mean) ** 2
-                for p in pixels_line
-            ) / len(pixels_line)
-
-            return variance
 
         # Find borders by looking for uniform color areas
         # Start from edges and move inward until we find non-uniform content
-
-        # Check top border - find first non-uniform row
-        top = 0
-        for y in range(height // 3):  # Only check up to 1/3 of image
-            row = [pixels[x, y] for x in range(0, width, max(1, width // 100))]  # Sample pixels
-            variance = calculate_line_variance(row)
-            if variance > variance_threshold:
-                break
-            top = y  # Keep updating until we find non-uniform content
-
-        # Check bottom border - find first non-uniform row from bottom
-        bottom = height - 1
-        for y in range(height - 1, 2 * height // 3, -1):  # Only check bottom 1/3
-            row = [pixels[x, y] for x in range(0, width, max(1, width // 100))]  # Sample pixels
-            variance = calculate_line_variance(row)
-            if variance > variance_threshold:
-                break
-            bottom = y  # Keep updating until we find non-uniform content
-
-        # Check left border - find first non-uniform column
-        left = 0
-        for x in range(width // 3):  # Only check left 1/3
-            col = [pixels[x, y] for y in range(top, min(bottom + 1, height), max(1, (bottom - top) // 100))]
-            if col:
-                variance = calculate_line_variance(col)
-                if variance > variance_threshold:
-                    break
-                left = x  # Keep updating until we find non-uniform content
-
-        # Check right border - find first non-uniform column from right
-        right = width - 1
-        for x in range(width - 1, 2 * width // 3, -1):  # Only check right 1/3
-            col = [pixels[x, y] for y in range(top, min(bottom + 1, height), max(1, (bottom - top) // 100))]
-            if col:
-                variance = calculate_line_variance(col)
-                if variance > variance_threshold:
-                    break
-                right = x  # Keep updating until we find non-uniform content
+        top, bottom, left, right = detect_solid_borders(img, variance_threshold)
 
         # Calculate crop dimensions
         crop_width = right - left + 1
@@ -0,0 +1,174 @@
+"""
+Decoded and fitted image asset cache for layout rendering.
+
+Rendering an image region means decoding the source, converting it, scaling it
+to the region and (for the PIL engine) rounding its corners. The same work is
+repeated on every preview refresh and for every page that reuses an image.
+The cache keeps the finished result keyed on the source file (path, mtime and
+size, so edited files are picked up), the target size and the fit options, and
+evicts least recently used entries once a memory budget is exceeded.
+
+Both the PIL :class:`~core.layout.engine.LayoutEngine` and the Qt renderer use
+the shared instance from :func:`get_layout_asset_cache`; each stores its own
+image type under its own key namespace. Cached images are shared and must not
+be modified in place.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from PIL import Image
+
+from core.logging_config import LogManager
+
+logger = LogManager().get_logger("layout.asset_cache")
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024  # 256 MB
+
+
+def source_key(image_path: str) -> Optional[Tuple[str, int, int]]:
+    """Identity of a source file: (resolved path, mtime_ns, size), or None if missing."""
+    try:
+        path = Path(image_path).resolve()
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def pil_image_bytes(img: Image.Image) -> int:
+    """Approximate memory held by a decoded PIL image."""
+    return img.width * img.height * len(img.getbands())
+
+
+def open_reduced(image_path: str, target_w: int, target_h: int) -> Image.Image:
+    """
+    Open an image, decoding large sources at reduced resolution.
+
+    JPEGs are decoded at a DCT scale via ``draft()``; other formats are
+    box-reduced after decoding. Either way the result stays at least twice
+    the target size so the final LANCZOS resample keeps its quality.
+
+    Args:
+        image_path: Source image path
+        target_w: Width the image will be fitted to
+        target_h: Height the image will be fitted to
+
+    Returns:
+        Loaded PIL Image (original mode)
+    """
+    img = Image.open(image_path)
+    if target_w <= 0 or target_h <= 0:
+        return img
+
+    full_size = img.size
+    img.draft(None, (target_w * 2, target_h * 2))
+    if img.size == full_size:
+        factor = min(img.width // (target_w * 2), img.height // (target_h * 2))
+        if factor >= 2:
+            img = img.reduce(factor)
+    if img.size != full_size:
+        logger.debug(f"Reduced decode of {image_path}: {full_size} -> {img.size}")
+    return img
+
+
+class LayoutAssetCache:
+    """Memory-bounded LRU of rendered image assets."""
+
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        """
+        Initialize the cache.
+
+        Args:
+            memory_budget: Maximum bytes of cached images held in memory
+        """
+        self.memory_budget = memory_budget
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._memory_used = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def memory_used(self) -> int:
+        """Bytes currently held."""
+        return self._memory_used
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a cached asset and mark it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size_bytes: int) -> None:
+        """Store an asset, evicting least recently used entries over budget."""
+        if size_bytes > self.memory_budget:
+            return  # Would evict everything else and still not fit
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._memory_used -= old[1]
+            self._entries[key] = (value, size_bytes)
+            self._memory_used += size_bytes
+            while self._memory_used > self.memory_budget and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._memory_used -= evicted_size
+
+    def get_or_build(
+        self,
+        image_path: str,
+        variant: Tuple,
+        build: Callable[[], Any],
+        size_of: Callable[[Any], int] = pil_image_bytes
+    ) -> Optional[Any]:
+        """
+        Return the asset for a source file and variant, building it on a miss.
+
+        Args:
+            image_path: Source image path
+            variant: Hashable description of the processing (namespace, size, fit, ...)
+            build: Produces the asset; may return None on failure (not cached)
+            size_of: Memory size of a built asset
+
+        Returns:
+            The cached or freshly built asset, or None if the source is missing
+            or the build failed
+        """
+        source = source_key(image_path)
+        if source is None:
+            return None
+        key = (source, variant)
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        value = build()
+        if value is not None:
+            self.put(key, value, size_of(value))
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached assets."""
+        with self._lock:
+            self._entries.clear()
+            self._memory_used = 0
+
+
+_cache: Optional[LayoutAssetCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_layout_asset_cache() -> LayoutAssetCache:
+    """Return the process-wide layout asset cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LayoutAssetCache()
+        return _cache
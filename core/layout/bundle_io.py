@@ -4,20 +4,29 @@ A bundle is a zip a recipient can open without the original assets:
 
     project.iaiproj.json   # the DocumentSpec, with image refs rewritten relative
     bundle.json            # manifest: images map, fonts map, warnings
-    images/...             # every referenced image, deduped
+    images/...             # every referenced image, deduped by content
     fonts/...              # embedded font files (when resolvable; else by-name)
 
+Assets are deduplicated by content (size, then SHA-256 for same-size files,
+hashed on a thread pool), streamed into the zip in chunks, and stored without
+recompression when their format is already compressed. ``import_bundle`` can
+defer extracting assets until they are first used (see :func:`ensure_asset`).
+
 Font resolution is injected (``font_resolver``) so the module stays decoupled
 from ``FontManager`` and fully unit-testable without scanning system fonts.
 """
-import copy
+import hashlib
 import json
 import logging
+import os
 import re
+import shutil
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from core.layout.models import DocumentSpec
 from core.layout import schema
@@ -30,6 +39,12 @@ _MANIFEST_NAME = "bundle.json"
 _IMAGES_DIR = "images"
 _FONTS_DIR = "fonts"
 
+# Formats that are already compressed; deflating them again costs time for ~0 gain.
+_STORED_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp", ".gif", ".avif", ".heic",
+                    ".woff", ".woff2", ".zip"}
+_COPY_CHUNK = 1024 * 1024
+_HASH_WORKERS = 8
+
 # Resolve a priority-ordered family list to a concrete font file (or None).
 FontResolver = Callable[[List[str]], Optional[Path]]
 
@@ -91,98 +106,206 @@ def _collect_font_family_lists(doc: DocumentSpec) -> List[List[str]]:
     return out
 
 
+def _file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_COPY_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _content_keys(paths: Iterable[str]) -> Dict[str, Tuple]:
+    """Map each file to a key equal for identical contents.
+
+    Only files sharing a size can be identical, so only those are hashed
+    (on a thread pool; hashlib releases the GIL on large buffers).
+    """
+    by_size: Dict[int, List[str]] = {}
+    for p in paths:
+        by_size.setdefault(os.path.getsize(p), []).append(p)
+    keys: Dict[str, Tuple] = {}
+    to_hash: List[str] = []
+    for size, group in by_size.items():
+        if len(group) == 1:
+            keys[group[0]] = (size, group[0])
+        else:
+            to_hash.extend(group)
+    if to_hash:
+        with ThreadPoolExecutor(max_workers=min(_HASH_WORKERS, len(to_hash))) as pool:
+            for p, digest in zip(to_hash, pool.map(_file_digest, to_hash)):
+                keys[p] = (os.path.getsize(p), digest)
+    return keys
+
+
+def _write_member(zf: zipfile.ZipFile, src: str, arcname: str) -> None:
+    """Stream a file into the zip, storing already-compressed formats as-is."""
+    info = zipfile.ZipInfo.from_file(src, arcname)
+    stored = Path(src).suffix.lower() in _STORED_SUFFIXES
+    info.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+    with open(src, "rb") as fin, zf.open(info, "w", force_zip64=True) as fout:
+        shutil.copyfileobj(fin, fout, _COPY_CHUNK)
+
+
 def export_bundle(doc: DocumentSpec, path: str,
                   font_resolver: Optional[FontResolver] = None) -> BundleManifest:
     """Write ``doc`` and its assets to a ``.iaibundle`` zip at ``path``.
 
     Returns the :class:`BundleManifest` (also embedded as ``bundle.json``) so the
     caller can surface warnings (missing images, fonts embedded by name only).
-    The live ``doc`` is never mutated — refs are rewritten on a deep copy.
+    The live ``doc`` is never mutated — refs are rewritten in its serialized form.
     """
     manifest = BundleManifest(title=doc.title)
-    doc2 = copy.deepcopy(doc)
+    project = schema.document_to_dict(doc)
     used_names: set = set()
-    # abs source path -> (archive rel path); dedups identical sources.
-    image_archive: Dict[str, str] = {}
-    font_archive: Dict[str, str] = {}  # abs font source -> archive rel path
 
-    # --- images: copy + rewrite refs to relative bundle paths ---
-    for page in doc2.pages:
-        for r in page.regions:
-            if r.kind != "image" or not r.image_ref:
-                continue
-            src = Path(r.image_ref)
-            if not src.is_file():
-                manifest.warnings.append(f"Image not found, left as-is: {r.image_ref}")
-                continue
-            key = str(src.resolve())
-            rel = image_archive.get(key)
-            if rel is None:
-                rel = _unique_member(_IMAGES_DIR, src.name, used_names)
-                image_archive[key] = rel
-                manifest.images[str(src)] = rel
-            r.image_ref = rel  # forward-slash relative path inside the bundle
+    # --- images: find the embeddable sources ---
+    image_regions = [r for page in project["pages"] for r in page["regions"]
+                     if r.get("kind") == "image" and r.get("image_ref")]
+    sources: Dict[str, str] = {}  # image_ref -> resolved source path
+    for r in image_regions:
+        ref = r["image_ref"]
+        if ref in sources:
+            continue
+        ensure_asset(ref)
+        if Path(ref).is_file():
+            sources[ref] = str(Path(ref).resolve())
 
-    # --- fonts: embed resolved files; record unresolved families by name ---
-    for families in _collect_font_family_lists(doc2):
+    # --- fonts: resolve each family list to a file ---
+    font_sources: Dict[str, Optional[str]] = {}  # primary family -> resolved path
+    for families in _collect_font_family_lists(doc):
         primary = families[0]
-        if primary in manifest.fonts:
+        if primary in font_sources:
             continue
         font_path = font_resolver(families) if font_resolver else None
         if font_path and Path(font_path).is_file():
-            key = str(Path(font_path).resolve())
-            rel = font_archive.get(key)
-            if rel is None:
-                rel = _unique_member(_FONTS_DIR, Path(font_path).name, used_names)
-                font_archive[key] = rel
-            manifest.fonts[primary] = rel
+            font_sources[primary] = str(Path(font_path).resolve())
         else:
+            font_sources[primary] = None
+
+    keys = _content_keys(set(sources.values()) | {p for p in font_sources.values() if p})
+
+    # --- images: dedupe by content + rewrite refs to relative bundle paths ---
+    image_archive: Dict[Tuple, Tuple[str, str]] = {}  # content key -> (source, rel)
+    for r in image_regions:
+        ref = r["image_ref"]
+        src = sources.get(ref)
+        if src is None:
+            manifest.warnings.append(f"Image not found, left as-is: {ref}")
+            continue
+        entry = image_archive.get(keys[src])
+        if entry is None:
+            entry = (src, _unique_member(_IMAGES_DIR, Path(ref).name, used_names))
+            image_archive[keys[src]] = entry
+        manifest.images[ref] = entry[1]
+        r["image_ref"] = entry[1]  # forward-slash relative path inside the bundle
+
+    # --- fonts: embed resolved files; record unresolved families by name ---
+    font_archive: Dict[Tuple, Tuple[str, str]] = {}
+    for primary, src in font_sources.items():
+        if src is None:
             manifest.fonts[primary] = "by-name"
             manifest.warnings.append(f"Font embedded by name only (not found): {primary}")
+            continue
+        entry = font_archive.get(keys[src])
+        if entry is None:
+            entry = (src, _unique_member(_FONTS_DIR, Path(src).name, used_names))
+            font_archive[keys[src]] = entry
+        manifest.fonts[primary] = entry[1]
 
     # --- write the zip ---
     out = Path(path)
     out.parent.mkdir(parents=True, exist_ok=True)
-    project_json = json.dumps(schema.document_to_dict(doc2), indent=2)
     with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr(_PROJECT_NAME, project_json)
+        zf.writestr(_PROJECT_NAME, json.dumps(project, indent=2))
         zf.writestr(_MANIFEST_NAME, json.dumps(manifest.to_dict(), indent=2))
-        for src_key, rel in image_archive.items():
-            zf.write(src_key, rel)
-        for src_key, rel in font_archive.items():
-            zf.write(src_key, rel)
+        for src, rel in [*image_archive.values(), *font_archive.values()]:
+            _write_member(zf, src, rel)
     logger.info("Exported bundle %s (%d images, %d fonts, %d warnings)",
                 out, len(image_archive), len(font_archive), len(manifest.warnings))
     return manifest
 
 
-def _safe_extract(zf: zipfile.ZipFile, dest: Path) -> None:
-    """Extract guarding against zip-slip (members escaping ``dest``)."""
-    dest = dest.resolve()
+def _check_members(zf: zipfile.ZipFile, dest: Path) -> None:
+    """Guard against zip-slip (members escaping ``dest``)."""
     for member in zf.infolist():
         target = (dest / member.filename).resolve()
         if target != dest and dest not in target.parents:
             raise ValueError(f"Unsafe path in bundle: {member.filename!r}")
+
+
+def _safe_extract(zf: zipfile.ZipFile, dest: Path) -> None:
+    """Extract guarding against zip-slip (members escaping ``dest``)."""
+    dest = dest.resolve()
+    _check_members(zf, dest)
     zf.extractall(dest)
 
 
-def import_bundle(path: str, dest_dir: str) -> DocumentSpec:
+# Lazily imported assets not extracted yet: target path -> (bundle path, member)
+_lazy_assets: Dict[str, Tuple[str, str]] = {}
+_lazy_lock = threading.Lock()
+
+
+def ensure_asset(path: str) -> bool:
+    """Make sure a file referenced by an imported document exists on disk.
+
+    For assets of a bundle imported with ``lazy=True`` this extracts the
+    member on first access. Returns whether ``path`` exists afterwards.
+    """
+    if os.path.exists(path):
+        return True
+    key = str(Path(path).resolve())
+    with _lazy_lock:
+        pending = _lazy_assets.get(key)
+        if pending is None:
+            return False
+        bundle_path, member = pending
+        target = Path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".part")
+        with zipfile.ZipFile(bundle_path) as zf, zf.open(member) as fin, open(tmp, "wb") as fout:
+            shutil.copyfileobj(fin, fout, _COPY_CHUNK)
+        tmp.replace(target)
+        del _lazy_assets[key]
+    logger.debug("Extracted bundle asset %s on first access", member)
+    return True
+
+
+def import_bundle(path: str, dest_dir: str, lazy: bool = False) -> DocumentSpec:
     """Extract a ``.iaibundle`` into ``dest_dir`` and load its document.
 
     Relative image refs are rewritten back to absolute paths under ``dest_dir``
     so the returned :class:`DocumentSpec` renders without the original assets.
+    With ``lazy=True`` only the project and manifest are extracted up front;
+    each asset is extracted when :func:`ensure_asset` is first called for it
+    (renderers do this before opening an image).
     """
     dest = Path(dest_dir)
     dest.mkdir(parents=True, exist_ok=True)
+    deferred: Dict[str, Tuple[str, str]] = {}
     with zipfile.ZipFile(path) as zf:
-        _safe_extract(zf, dest)
+        if not lazy:
+            _safe_extract(zf, dest)
+        else:
+            dest = dest.resolve()
+            _check_members(zf, dest)
+            for member in zf.infolist():
+                if member.is_dir():
+                    continue
+                if member.filename in (_PROJECT_NAME, _MANIFEST_NAME):
+                    zf.extract(member, dest)
+                    continue
+                target = (dest / member.filename).resolve()
+                target.unlink(missing_ok=True)  # Left over from an earlier import
+                deferred[str(target)] = (str(path), member.filename)
+            with _lazy_lock:
+                _lazy_assets.update(deferred)
     proj_path = dest / _PROJECT_NAME
     doc = schema.document_from_dict(json.loads(proj_path.read_text(encoding="utf-8")))
     for page in doc.pages:
         for r in page.regions:
             if r.kind == "image" and r.image_ref and not Path(r.image_ref).is_absolute():
                 candidate = (dest / r.image_ref)
-                if candidate.exists():
+                if candidate.exists() or str(candidate.resolve()) in deferred:
                     r.image_ref = str(candidate.resolve())
-    logger.info("Imported bundle %s into %s", path, dest)
+    logger.info("Imported bundle %s into %s%s", path, dest, " (lazy)" if lazy else "")
     return doc
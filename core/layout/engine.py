@@ -5,16 +5,21 @@ Handles page rendering to PNG and PDF, text layout, and image placement.
 """
 
 import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional, Union
 from PIL import Image, ImageDraw, ImageFont
 
 try:
     from reportlab.pdfgen import canvas as pdf_canvas
     from reportlab.lib.pagesizes import letter, A4
+    from reportlab.lib.utils import ImageReader
     REPORTLAB_AVAILABLE = True
 except ImportError:
     pdf_canvas = None
+    ImageReader = None
     REPORTLAB_AVAILABLE = False
 
 from core.logging_config import LogManager
@@ -23,7 +28,9 @@ from .models import (
     TextStyle, ImageStyle, Rect
 )
 from .font_manager import FontManager
+from .line_breaking import wrap_words
 from .text_renderer import TextLayoutEngine
+from .bundle_io import ensure_asset
 from .image_processor import ImageProcessor
 from .template_engine import TemplateEngine
 
@@ -44,7 +51,8 @@ class LayoutEngine:
         self,
         font_manager: FontManager,
         use_advanced_text: bool = True,
-        hyphenation_language: str = "en_US"
+        hyphenation_language: str = "en_US",
+        line_breaking: str = "greedy"
     ):
         """
         Initialize the layout engine.
@@ -53,12 +61,15 @@ class LayoutEngine:
             font_manager: FontManager instance for font loading
             use_advanced_text: Whether to use advanced text rendering (Phase 2)
             hyphenation_language: Language for hyphenation (e.g., 'en_US')
+            line_breaking: Advanced-text line breaking, "greedy" or "optimal" (Knuth–Plass)
         """
         self.font_manager = font_manager
         self.use_advanced_text = use_advanced_text
+        self.hyphenation_language = hyphenation_language
+        self.line_breaking = line_breaking
 
         # Phase 2 components
-        self.text_engine = TextLayoutEngine(hyphenation_language) if use_advanced_text else None
+        self.text_engine = TextLayoutEngine(hyphenation_language, line_breaking) if use_advanced_text else None
         self.image_processor = ImageProcessor()
         self.template_engine = TemplateEngine()
 
@@ -148,7 +159,7 @@ class LayoutEngine:
 
     def _render_image_block(self, img: Image.Image, draw: ImageDraw.ImageDraw, block: ImageBlock) -> None:
         """Render an image block onto the page using Phase 2 ImageProcessor."""
-        if not block.image_path or not Path(block.image_path).exists():
+        if not block.image_path or not ensure_asset(block.image_path):
             logger.warning(f"Image path not found for block {block.id}: {block.image_path}")
             return
 
@@ -239,23 +250,7 @@ class LayoutEngine:
 
     def _wrap_to_width(self, draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont, max_w: int) -> List[str]:
         """Wrap text to fit within a maximum width."""
-        words = text.split()
-        lines = []
-        current_line = ""
-
-        for word in words:
-            trial = (current_line + " " + word).strip()
-            if draw.textlength(trial, font=font) <= max_w:
-                current_line = trial
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-
-        if current_line:
-            lines.append(current_line)
-
-        return lines
+        return wrap_words(text, font, max_w)
 
     def _measure_text_height(self, draw: ImageDraw.ImageDraw, lines: List[str], font: ImageFont.FreeTypeFont, line_height: float) -> int:
         """Calculate total height of wrapped text."""
@@ -326,13 +321,22 @@ class LayoutEngine:
             return tuple(int(h[i:i + 2], 16) for i in (0, 2, 4))  # type: ignore
         raise ValueError(f"Only #RRGGBB format supported, got: {hex_color}")
 
-    def render_document_png(self, doc: DocumentSpec, output_dir: Path) -> List[Path]:
+    def render_document_png(
+        self,
+        doc: DocumentSpec,
+        output_dir: Path,
+        workers: int = 1,
+        page_variables: Optional[dict] = None
+    ) -> List[Path]:
         """
         Render all pages of a document to PNG files.
 
         Args:
             doc: DocumentSpec describing the document
             output_dir: Directory to save PNG files
+            workers: Worker processes to render pages in parallel (default 1 renders
+                in this process; None = one per CPU)
+            page_variables: Optional variables for template substitution
 
         Returns:
             List of paths to generated PNG files
@@ -340,30 +344,140 @@ class LayoutEngine:
         logger.info(f"Rendering document '{doc.title}' to PNG pages in {output_dir}")
 
         output_dir.mkdir(parents=True, exist_ok=True)
-        png_paths = []
-
-        for i, page in enumerate(doc.pages, start=1):
-            out_path = output_dir / f"page_{i:03d}.png"
-            self.render_page_png(page, out_path)
-            png_paths.append(out_path)
+        out_paths = [output_dir / f"page_{i:03d}.png" for i in range(1, len(doc.pages) + 1)]
+        png_paths = list(self.iter_rendered_pages(
+            doc.pages, workers=workers, page_variables=page_variables, out_paths=out_paths
+        ))
 
         logger.info(f"Rendered {len(png_paths)} pages to {output_dir}")
         return png_paths
 
-    def save_pdf(self, doc: DocumentSpec, out_pdf: Path, png_pages: List[Path]) -> None:
+    def render_document_pdf(
+        self,
+        doc: DocumentSpec,
+        out_pdf: Path,
+        workers: int = 1,
+        max_in_flight: Optional[int] = None,
+        page_variables: Optional[dict] = None
+    ) -> None:
+        """
+        Render a document straight to PDF, rendering pages in parallel.
+
+        Pages are rendered by a process pool and handed to the PDF writer in
+        page order as they complete, without a PNG round-trip through disk.
+        At most ``max_in_flight`` rendered pages are held in memory.
+
+        Args:
+            doc: DocumentSpec describing the document
+            out_pdf: Output PDF path
+            workers: Worker processes (default 1 renders in this process; None = one per CPU)
+            max_in_flight: Pages rendered ahead of the writer (default: 2 per worker)
+            page_variables: Optional variables for template substitution
+        """
+        if not REPORTLAB_AVAILABLE:
+            raise RuntimeError("ReportLab not installed. Cannot generate PDF.")
+
+        logger.info(f"Rendering document '{doc.title}' to PDF: {out_pdf}")
+
+        out_pdf.parent.mkdir(parents=True, exist_ok=True)
+        c = pdf_canvas.Canvas(str(out_pdf))
+        c.setTitle(doc.title)
+        if doc.author:
+            c.setAuthor(doc.author)
+
+        count = 0
+        for count, img in enumerate(self.iter_rendered_pages(
+            doc.pages, workers=workers, max_in_flight=max_in_flight,
+            page_variables=page_variables
+        ), start=1):
+            logger.debug(f"Adding page {count}/{len(doc.pages)} to PDF")
+            w, h = img.size
+            c.setPageSize((w, h))
+            c.drawImage(ImageReader(img), 0, 0, width=w, height=h)
+            c.showPage()
+            img.close()
+
+        c.save()
+        logger.info(f"PDF saved: {out_pdf} ({count} pages)")
+
+    def iter_rendered_pages(
+        self,
+        pages: List[PageSpec],
+        workers: Optional[int] = 1,
+        max_in_flight: Optional[int] = None,
+        page_variables: Optional[dict] = None,
+        out_paths: Optional[List[Path]] = None
+    ) -> Iterator[Union[Image.Image, Path]]:
+        """
+        Render pages, yielding results in page order.
+
+        Args:
+            pages: Pages to render (PageSpecs are pickled to the workers)
+            workers: Worker processes (default 1 renders in this process; None = one
+                per CPU). Never more workers than pages are started.
+            max_in_flight: Pages submitted ahead of the consumer (default: 2 per worker)
+            page_variables: Optional variables for template substitution
+            out_paths: If given, pages are saved as PNGs and their paths yielded
+                instead of images
+
+        Yields:
+            PIL Images, or output paths when ``out_paths`` is given
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(pages))
+
+        if workers <= 1:
+            for i, page in enumerate(pages):
+                if out_paths:
+                    self.render_page_png(page, out_paths[i], page_variables)
+                    yield out_paths[i]
+                else:
+                    yield self.render_page_to_image(page, page_variables)
+            return
+
+        window = max(1, max_in_flight or workers * 2)
+        logger.info(f"Rendering {len(pages)} pages with {workers} worker processes")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_render_worker,
+            initargs=(self.font_manager, self.use_advanced_text,
+                      self.hyphenation_language, self.line_breaking),
+        ) as pool:
+            pending = deque()
+            next_index = 0
+            while pending or next_index < len(pages):
+                # Keep the window full so workers stay busy while the consumer writes
+                while next_index < len(pages) and len(pending) < window:
+                    out_path = out_paths[next_index] if out_paths else None
+                    pending.append(pool.submit(
+                        _render_page_worker, pages[next_index], page_variables, out_path
+                    ))
+                    next_index += 1
+                yield pending.popleft().result()
+
+    def save_pdf(self, doc: DocumentSpec, out_pdf: Path,
+                 png_pages: Optional[List[Path]] = None, workers: int = 1) -> None:
         """
         Create a PDF from rendered PNG pages.
 
         Args:
             doc: DocumentSpec (for metadata)
             out_pdf: Output PDF path
-            png_pages: List of PNG page images to include
+            png_pages: List of PNG page images to include. If omitted, the
+                document's pages are rendered straight into the PDF by
+                :meth:`render_document_pdf`.
+            workers: Worker processes used when rendering (see :meth:`render_document_pdf`)
 
         Note: Currently uses image-based PDF. Vector text rendering is a future enhancement.
         """
         if not REPORTLAB_AVAILABLE:
             raise RuntimeError("ReportLab not installed. Cannot generate PDF.")
 
+        if png_pages is None:
+            self.render_document_pdf(doc, out_pdf, workers=workers)
+            return
+
         logger.info(f"Creating PDF: {out_pdf}")
 
         c = pdf_canvas.Canvas(str(out_pdf))
@@ -381,6 +495,27 @@ class LayoutEngine:
         logger.info(f"PDF saved: {out_pdf}")
 
 
+# Per-process engine for parallel rendering, built once by the pool initializer
+_worker_engine: Optional[LayoutEngine] = None
+
+
+def _init_render_worker(font_manager: FontManager, use_advanced_text: bool,
+                        hyphenation_language: str, line_breaking: str) -> None:
+    """Build the worker's engine once, reusing the parent's discovered fonts."""
+    global _worker_engine
+    _worker_engine = LayoutEngine(font_manager, use_advanced_text, hyphenation_language,
+                                  line_breaking)
+
+
+def _render_page_worker(page: PageSpec, page_variables: Optional[dict],
+                        out_path: Optional[Path]) -> Union[Image.Image, Path]:
+    """Render one page in a worker process."""
+    if out_path is not None:
+        _worker_engine.render_page_png(page, out_path, page_variables)
+        return out_path
+    return _worker_engine.render_page_to_image(page, page_variables)
+
+
 def load_template_json(path: Path) -> PageSpec:
     """
     Load a page template from a JSON file.
@@ -3,18 +3,63 @@ Font management system for the Layout/Books module.
 
 Handles font discovery from system directories and custom font paths,
 builds font manifests, and provides font loading for rendering.
+
+Discovery results are persisted to a scan cache with per-directory and
+per-file mtime stamps. Later startups only list directories whose mtime
+changed and only parse font files that are new or modified; parsing reads the
+family name from the font's ``name`` table and is spread across a process pool
+when many files need it.
 """
 
 import json
+import os
 import platform
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from PIL import ImageFont
 
+try:
+    from fontTools.ttLib import TTFont
+    FONTTOOLS_AVAILABLE = True
+except ImportError:
+    FONTTOOLS_AVAILABLE = False
+
 from core.logging_config import LogManager
 
 logger = LogManager().get_logger("layout.fonts")
 
+FONT_EXTENSIONS = (".ttf", ".otf")
+SCAN_CACHE_VERSION = 1
+PARALLEL_PARSE_THRESHOLD = 64  # Below this, a process pool costs more than it saves
+
+
+def read_font_family(font_path: str) -> Optional[str]:
+    """
+    Read a font's family name without loading or rasterizing glyphs.
+
+    Args:
+        font_path: Path to a TTF/OTF file
+
+    Returns:
+        The family name, or None if the file is not a usable font
+    """
+    try:
+        if FONTTOOLS_AVAILABLE:
+            # lazy=True parses table directories on demand; only 'name' is read
+            with TTFont(font_path, lazy=True, fontNumber=0) as font:
+                return font["name"].getBestFamilyName() or Path(font_path).stem
+        return ImageFont.truetype(font_path, size=12).getname()[0] or Path(font_path).stem
+    except Exception as e:
+        logger.debug(f"Skipping font {font_path}: {e}")
+        return None
+
+
+def _parse_font_files(paths: List[str]) -> List[Optional[str]]:
+    """Family names for a chunk of files (process pool entry point)."""
+    return [read_font_family(p) for p in paths]
+
 
 class FontManager:
     """
@@ -26,18 +71,33 @@ class FontManager:
     - Custom font directories from config
     """
 
-    def __init__(self, manifest_path: Optional[Path] = None, custom_dirs: Optional[List[Path]] = None):
+    PIL_FONT_CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        manifest_path: Optional[Path] = None,
+        custom_dirs: Optional[List[Path]] = None,
+        scan_cache_path: Optional[Path] = None,
+        workers: Optional[int] = None
+    ):
         """
         Initialize the font manager.
 
         Args:
             manifest_path: Path to fonts_manifest.json (if exists)
             custom_dirs: Additional directories to scan for fonts
+            scan_cache_path: Where discovery results are persisted between runs
+                (default: ~/.imageai/cache/font_scan.json)
+            workers: Processes used to parse changed fonts (None = one per CPU)
         """
         self.manifest_path = manifest_path
         self.custom_dirs = custom_dirs or []
+        self.scan_cache_path = Path(scan_cache_path) if scan_cache_path else \
+            Path.home() / ".imageai" / "cache" / "font_scan.json"
+        self.workers = workers
         self._manifest: Dict[str, Dict] = {}
         self._font_cache: Dict[str, Path] = {}  # Cache for quick lookups
+        self._pil_fonts: "OrderedDict[Tuple[Optional[str], int], Any]" = OrderedDict()
 
         # Load existing manifest if provided
         if manifest_path and manifest_path.exists():
@@ -50,6 +110,12 @@ class FontManager:
             logger.info("No existing font manifest found, will build from system fonts")
             self.discover_fonts()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Loaded PIL fonts may wrap in-memory faces; workers reload on demand
+        state = self.__dict__.copy()
+        state["_pil_fonts"] = OrderedDict()
+        return state
+
     def discover_fonts(self) -> None:
         """Discover fonts from system directories and custom paths."""
         logger.info("Starting font discovery...")
@@ -57,23 +123,113 @@ class FontManager:
         font_dirs = self._get_system_font_dirs()
         font_dirs.extend(self.custom_dirs)
 
-        discovered = 0
+        cache = self._load_scan_cache()
+        dirs: Dict[str, Dict] = {}
+        font_files: List[str] = []
         for font_dir in font_dirs:
-            if not font_dir.exists():
+            font_dir = Path(font_dir)
+            if not font_dir.is_dir():
                 continue
-
             logger.debug(f"Scanning font directory: {font_dir}")
+            self._walk_font_dir(font_dir, cache["dirs"], dirs, font_files)
 
-            # Scan for font files
-            for ext in ["*.ttf", "*.otf", "*.TTF", "*.OTF"]:
-                for font_file in font_dir.rglob(ext):
-                    try:
-                        self._add_font_to_manifest(font_file)
-                        discovered += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to process font {font_file}: {e}")
+        # Reuse parse results for files whose mtime and size are unchanged
+        files: Dict[str, Dict] = {}
+        changed: List[Tuple[str, os.stat_result]] = []
+        for path in font_files:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entry = cache["files"].get(path)
+            if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                files[path] = entry
+            else:
+                changed.append((path, st))
 
-        logger.info(f"Font discovery complete. Found {discovered} fonts across {len(self._manifest)} families.")
+        families = self._parse_fonts([path for path, _ in changed])
+        for (path, st), family in zip(changed, families):
+            files[path] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "family": family}
+
+        discovered = 0
+        for path in sorted(font_files, key=_regular_first):
+            entry = files.get(path)
+            if entry and entry["family"] is not None:
+                self._add_font_entry(Path(path), entry["family"])
+                discovered += 1
+
+        self._save_scan_cache({"version": SCAN_CACHE_VERSION, "dirs": dirs, "files": files})
+        logger.info(f"Font discovery complete. Found {discovered} fonts across {len(self._manifest)} families "
+                    f"({len(changed)} parsed, {len(font_files) - len(changed)} from cache).")
+
+    def _walk_font_dir(self, font_dir: Path, cached_dirs: Dict[str, Dict],
+                       dirs: Dict[str, Dict], font_files: List[str]) -> None:
+        """Collect font files under a directory, listing only directories that changed."""
+        key = str(font_dir)
+        try:
+            mtime_ns = font_dir.stat().st_mtime_ns
+        except OSError:
+            return
+
+        cached = cached_dirs.get(key)
+        if cached and cached["mtime_ns"] == mtime_ns:
+            names, subdirs = cached["files"], cached["subdirs"]
+        else:
+            names, subdirs = [], []
+            try:
+                with os.scandir(font_dir) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.name.lower().endswith(FONT_EXTENSIONS) and entry.is_file():
+                            names.append(entry.name)
+            except OSError as e:
+                logger.warning(f"Failed to scan font directory {font_dir}: {e}")
+            names.sort()
+            subdirs.sort()
+
+        dirs[key] = {"mtime_ns": mtime_ns, "files": names, "subdirs": subdirs}
+        font_files.extend(str(font_dir / name) for name in names)
+        for name in subdirs:
+            self._walk_font_dir(font_dir / name, cached_dirs, dirs, font_files)
+
+    def _parse_fonts(self, paths: List[str]) -> List[Optional[str]]:
+        """Read family names, in a process pool when there are many files."""
+        workers = self.workers or os.cpu_count() or 1
+        if len(paths) < PARALLEL_PARSE_THRESHOLD or workers <= 1:
+            return _parse_font_files(paths)
+
+        chunk = max(16, len(paths) // (workers * 4))
+        chunks = [paths[i:i + chunk] for i in range(0, len(paths), chunk)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return [family for result in pool.map(_parse_font_files, chunks) for family in result]
+        except Exception as e:
+            logger.warning(f"Parallel font parsing failed, parsing serially: {e}")
+            return _parse_font_files(paths)
+
+    def _load_scan_cache(self) -> Dict[str, Dict]:
+        empty = {"version": SCAN_CACHE_VERSION, "dirs": {}, "files": {}}
+        if not self.scan_cache_path.exists():
+            return empty
+        try:
+            data = json.loads(self.scan_cache_path.read_text(encoding="utf-8"))
+            if data.get("version") != SCAN_CACHE_VERSION:
+                return empty
+            return {"version": SCAN_CACHE_VERSION, "dirs": data.get("dirs", {}),
+                    "files": data.get("files", {})}
+        except Exception as e:
+            logger.warning(f"Failed to load font scan cache: {e}")
+            return empty
+
+    def _save_scan_cache(self, data: Dict[str, Any]) -> None:
+        try:
+            self.scan_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.scan_cache_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            tmp_path.replace(self.scan_cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to save font scan cache: {e}")
 
     def _get_system_font_dirs(self) -> List[Path]:
         """Get platform-specific system font directories."""
@@ -98,41 +254,38 @@ class FontManager:
                 Path.home() / ".local/share/fonts"
             ]
 
-    def _add_font_to_manifest(self, font_path: Path) -> None:
+    def _add_font_entry(self, font_path: Path, family: Optional[str] = None) -> None:
         """
         Add a font file to the manifest.
 
-        Attempts to extract font family name and properties.
+        Families are keyed by the file name (FamilyName-Weight.ttf); the family
+        name read from the font itself is also registered for lookups.
         """
-        try:
-            # Try to load the font to get its family name
-            # Note: This is a simplified approach; a full implementation
-            # would use fonttools to extract proper font metadata
-            font = ImageFont.truetype(str(font_path), size=12)
-
-            # Extract family name from font path as fallback
-            # Format is typically: FamilyName-Weight.ttf
-            stem = font_path.stem
-            parts = stem.split("-")
-            family_name = parts[0] if parts else stem
-
-            # Store in manifest
-            if family_name not in self._manifest:
-                self._manifest[family_name] = {
-                    "family": family_name,
-                    "files": []
-                }
-
-            if str(font_path) not in self._manifest[family_name]["files"]:
-                self._manifest[family_name]["files"].append(str(font_path))
-
-            # Add to cache for quick lookup
-            cache_key = f"{family_name.lower()}"
-            self._font_cache[cache_key] = font_path
+        stem = font_path.stem
+        parts = stem.split("-")
+        family_name = parts[0] if parts else stem
+
+        # Store in manifest
+        if family_name not in self._manifest:
+            self._manifest[family_name] = {
+                "family": family_name,
+                "files": []
+            }
+
+        if str(font_path) not in self._manifest[family_name]["files"]:
+            self._manifest[family_name]["files"].append(str(font_path))
+
+        # Add to cache for quick lookup
+        cache_key = f"{family_name.lower()}"
+        self._font_cache[cache_key] = font_path
+        if family:
+            self._font_cache.setdefault(family.lower(), font_path)
 
-        except Exception as e:
-            # If we can't load the font, skip it
-            logger.debug(f"Skipping font {font_path}: {e}")
+    def _add_font_to_manifest(self, font_path: Path) -> None:
+        """Parse a single font file and add it to the manifest (skipped if unusable)."""
+        family = read_font_family(str(font_path))
+        if family is not None:
+            self._add_font_entry(font_path, family)
 
     def save_manifest(self, path: Path) -> None:
         """Save the current font manifest to a JSON file."""
@@ -196,17 +349,36 @@ class FontManager:
             ImageFont.FreeTypeFont instance (falls back to default if no match)
         """
         font_path = self.select_font_file(families, weight, italic)
+        key = (str(font_path) if font_path else None, size_px)
+        font = self._pil_fonts.get(key)
+        if font is not None:
+            self._pil_fonts.move_to_end(key)
+            return font
 
+        font = None
         if font_path and font_path.exists():
             try:
-                return ImageFont.truetype(str(font_path), size_px, layout_engine=ImageFont.LAYOUT_BASIC)
+                font = ImageFont.truetype(str(font_path), size_px, layout_engine=ImageFont.LAYOUT_BASIC)
             except Exception as e:
                 logger.warning(f"Failed to load font {font_path}: {e}")
 
-        # Fallback to default font
-        logger.debug(f"Using default font for families {families}")
-        return ImageFont.load_default()
+        if font is None:
+            # Fallback to default font
+            logger.debug(f"Using default font for families {families}")
+            font = ImageFont.load_default()
+
+        self._pil_fonts[key] = font
+        while len(self._pil_fonts) > self.PIL_FONT_CACHE_SIZE:
+            self._pil_fonts.popitem(last=False)
+        return font
 
     def get_available_families(self) -> List[str]:
         """Get a list of all available font families."""
         return sorted(self._manifest.keys())
+
+
+def _regular_first(path: str) -> Tuple[int, str]:
+    """Sort key putting the plain/regular face of a family first."""
+    stem = Path(path).stem.lower()
+    plain = "-" not in stem or stem.endswith("-regular")
+    return (0 if plain else 1, stem)
@@ -1,7 +1,13 @@
-"""Iteration-history manager for the layout designer."""
+"""Iteration-history manager for the layout designer.
+
+Snapshots share unchanged pages: each serialized page is interned by content
+id, so a snapshot only adds the pages that changed since any earlier one, and
+the project file stores each distinct page once (see schema.document_to_dict).
+"""
+import copy
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from core.layout.models import DocumentSpec, Snapshot
 from core.layout import schema
@@ -17,6 +23,10 @@ class History:
         # so a design that continues from a restored point records the real
         # branch topology rather than re-parenting to the timeline's tail.
         self._current_id: Optional[str] = None
+        self._pages: Dict[str, Dict] = {}  # content id -> shared serialized page
+        for snap in document.history:
+            for ref, page in zip(snap.page_refs, snap.document.get("pages", [])):
+                self._pages.setdefault(ref, page)
 
     def snapshots(self) -> List[Snapshot]:
         return self.document.history
@@ -29,8 +39,17 @@ class History:
 
     def append(self, prompt: str, *, snapshot_id: Optional[str] = None,
                timestamp: Optional[str] = None, parent_id: Optional[str] = None) -> Snapshot:
-        doc_dict = schema.document_to_dict(self.document)
-        doc_dict.pop("history", None)  # never nest history inside a snapshot
+        # Serialize without history: never nest history inside a snapshot
+        doc_dict = schema.document_to_dict(_without_history(self.document))
+        doc_dict.pop("history", None)
+        doc_dict.pop("history_chunks", None)
+        page_refs = []
+        pages = []
+        for page in doc_dict["pages"]:
+            ref = schema.content_id(page)
+            page_refs.append(ref)
+            pages.append(self._pages.setdefault(ref, page))
+        doc_dict["pages"] = pages
         if parent_id is None:
             if self._current_id is not None:
                 parent_id = self._current_id
@@ -42,6 +61,7 @@ class History:
             timestamp=timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             prompt=prompt,
             document=doc_dict,
+            page_refs=page_refs,
         )
         self.document.history.append(snap)
         self._current_id = snap.id  # subsequent appends chain from this snapshot
@@ -53,9 +73,17 @@ class History:
         self._current_id = snapshot_id
 
     def restore(self, snapshot_id: str) -> DocumentSpec:
+        """Rebuild the document of one snapshot (only that snapshot is parsed)."""
         snap = self.get(snapshot_id)
         if snap is None:
             raise KeyError(f"No snapshot {snapshot_id!r}")
         restored = schema.document_from_dict(snap.document)
         restored.history = list(self.document.history)  # keep the timeline
         return restored
+
+
+def _without_history(doc: DocumentSpec) -> DocumentSpec:
+    """Shallow view of ``doc`` with an empty history, so serializing skips it."""
+    view = copy.copy(doc)
+    view.history = []
+    return view
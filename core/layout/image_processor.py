@@ -10,6 +10,8 @@ from typing import Tuple, Optional, Literal
 from PIL import Image, ImageDraw, ImageFilter, ImageEnhance
 
 from core.logging_config import LogManager
+from .asset_cache import get_layout_asset_cache, open_reduced
+from .bundle_io import ensure_asset
 from .models import ImageStyle, Rect
 
 logger = LogManager().get_logger("layout.image")
@@ -31,29 +33,51 @@ class ImageProcessor:
     def load_and_process(
         image_path: str,
         target_rect: Rect,
-        style: ImageStyle
+        style: ImageStyle,
+        use_cache: bool = True
     ) -> Optional[Image.Image]:
         """
         Load and process an image according to style specifications.
 
+        Results are served from the shared layout asset cache, so the returned
+        image must not be modified in place.
+
         Args:
             image_path: Path to source image
             target_rect: Target rectangle (x, y, width, height)
             style: Image style configuration
+            use_cache: Whether to use the shared layout asset cache
 
         Returns:
             Processed PIL Image or None if loading fails
         """
+        _, _, target_w, target_h = target_rect
+        ensure_asset(image_path)  # Lazily imported bundles extract assets on first use
+        if not use_cache:
+            return ImageProcessor._process_uncached(image_path, target_w, target_h, style)
+
+        variant = ("pil", target_w, target_h, style.fit, style.border_radius_px)
+        return get_layout_asset_cache().get_or_build(
+            image_path, variant,
+            lambda: ImageProcessor._process_uncached(image_path, target_w, target_h, style)
+        )
+
+    @staticmethod
+    def _process_uncached(
+        image_path: str,
+        target_w: int,
+        target_h: int,
+        style: ImageStyle
+    ) -> Optional[Image.Image]:
+        """Decode, fit and round one image."""
         try:
-            # Load image
-            img = Image.open(image_path)
+            # Load image, decoding large sources at reduced resolution
+            img = open_reduced(image_path, target_w, target_h)
 
             # Convert to RGBA for alpha channel support
             if img.mode != 'RGBA':
                 img = img.convert('RGBA')
 
-            _, _, target_w, target_h = target_rect
-
             # Apply fit mode
             img = ImageProcessor._apply_fit_mode(img, target_w, target_h, style.fit)
 
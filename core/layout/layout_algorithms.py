@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from PIL import ImageDraw, ImageFont
 
 from core.logging_config import LogManager
+from .line_breaking import wrap_words
 from .models import PageSpec, TextBlock, ImageBlock, Rect, Size, TextStyle
 
 logger = LogManager().get_logger("layout.algorithms")
@@ -106,24 +107,8 @@ class LayoutAlgorithms:
         max_width: int,
         draw: ImageDraw.ImageDraw
     ) -> List[str]:
-        """Simple word wrapping."""
-        words = text.split()
-        lines = []
-        current = ""
-
-        for word in words:
-            trial = (current + " " + word).strip()
-            if draw.textlength(trial, font=font) <= max_width:
-                current = trial
-            else:
-                if current:
-                    lines.append(current)
-                current = word
-
-        if current:
-            lines.append(current)
-
-        return lines
+        """Simple word wrapping (greedy, from cached word widths)."""
+        return wrap_words(text, font, max_width)
 
     @staticmethod
     def _measure_text_height(
@@ -0,0 +1,187 @@
+"""
+Line breaking from cached word widths for the Layout/Books module.
+
+Wrapping used to re-measure the whole growing line for every word, which is
+quadratic in line length, and auto-fit repeated that at every step of its
+font-size search. Here each distinct word is measured once per font and size,
+and lines are built by adding up those widths.
+
+Two strategies are provided:
+- greedy: fill each line as far as possible (the classic first-fit wrap)
+- optimal: Knuth–Plass style total-fit breaking that minimizes the sum of
+  squared slack over all lines but the last, for more even ragged edges
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, List, Tuple
+
+from PIL import ImageFont
+
+LineSpan = Tuple[int, int, float]  # (first word index, end word index, line width)
+
+
+class FontWidths:
+    """Memoized advance widths of words (and the space) for one font at one size."""
+
+    MAX_ENTRIES = 20000  # Cleared when exceeded, so huge texts can't grow it unbounded
+
+    def __init__(self, font: ImageFont.FreeTypeFont):
+        self.font = font
+        self._widths = {}
+        self.space = self.width(" ")
+
+    def width(self, text: str) -> float:
+        """Advance width of ``text`` in pixels."""
+        w = self._widths.get(text)
+        if w is None:
+            if len(self._widths) >= self.MAX_ENTRIES:
+                self._widths.clear()
+            w = self.font.getlength(text)
+            self._widths[text] = w
+        return w
+
+    def words(self, words: List[str]) -> List[float]:
+        """Advance widths of several words."""
+        return [self.width(word) for word in words]
+
+
+_MAX_FONTS = 64
+_font_widths: "OrderedDict[Hashable, FontWidths]" = OrderedDict()
+_font_widths_lock = threading.Lock()
+
+
+def _font_key(font: Any) -> Hashable:
+    path = getattr(font, "path", None)
+    if isinstance(path, (str, bytes)):
+        return (path, getattr(font, "size", None), getattr(font, "index", 0),
+                getattr(font, "layout_engine", None))
+    # In-memory fonts (e.g. Pillow's default font) have no stable identity;
+    # the cached FontWidths holds a reference, so the id can't be reused.
+    return ("id", id(font))
+
+
+def font_widths(font: ImageFont.FreeTypeFont) -> FontWidths:
+    """Return the shared width cache for a font (keyed on file, size and face)."""
+    key = _font_key(font)
+    with _font_widths_lock:
+        widths = _font_widths.get(key)
+        if widths is not None:
+            _font_widths.move_to_end(key)
+            return widths
+    widths = FontWidths(font)
+    with _font_widths_lock:
+        _font_widths[key] = widths
+        while len(_font_widths) > _MAX_FONTS:
+            _font_widths.popitem(last=False)
+    return widths
+
+
+def greedy_breaks(widths: List[float], space: float, max_width: float) -> List[LineSpan]:
+    """
+    First-fit line breaking in one pass.
+
+    A word wider than ``max_width`` gets a line of its own.
+
+    Args:
+        widths: Advance width of each word
+        space: Advance width of the inter-word space
+        max_width: Maximum line width
+
+    Returns:
+        (start, end, width) for each line
+    """
+    lines: List[LineSpan] = []
+    start = 0
+    line_width = 0.0
+    for i, w in enumerate(widths):
+        if i == start:
+            line_width = w
+            continue
+        trial = line_width + space + w
+        if trial <= max_width:
+            line_width = trial
+        else:
+            lines.append((start, i, line_width))
+            start = i
+            line_width = w
+    if widths:
+        lines.append((start, len(widths), line_width))
+    return lines
+
+
+def optimal_breaks(widths: List[float], space: float, max_width: float) -> List[LineSpan]:
+    """
+    Total-fit line breaking (Knuth–Plass minimum raggedness).
+
+    Minimizes the sum of squared unused width over every line except the last,
+    by dynamic programming over break points. Each line end only looks back as
+    far as a line can reach, so the cost is linear in the number of words times
+    the words per line.
+
+    Args:
+        widths: Advance width of each word
+        space: Advance width of the inter-word space
+        max_width: Maximum line width
+
+    Returns:
+        (start, end, width) for each line
+    """
+    n = len(widths)
+    if n == 0:
+        return []
+
+    inf = float("inf")
+    cost = [0.0] + [inf] * n
+    prev = [0] * (n + 1)
+    line_width_to = [0.0] * (n + 1)
+
+    for end in range(1, n + 1):
+        line_width = -space
+        for start in range(end - 1, -1, -1):
+            line_width += widths[start] + space
+            if line_width > max_width and start < end - 1:
+                break  # Longer lines only get wider
+            if end == n or line_width > max_width:
+                badness = 0.0  # Last line, or an overlong word forced onto its own line
+            else:
+                slack = max_width - line_width
+                badness = slack * slack
+            total = cost[start] + badness
+            if total < cost[end]:
+                cost[end] = total
+                prev[end] = start
+                line_width_to[end] = line_width
+
+    lines: List[LineSpan] = []
+    end = n
+    while end > 0:
+        start = prev[end]
+        lines.append((start, end, line_width_to[end]))
+        end = start
+    lines.reverse()
+    return lines
+
+
+def wrap_words(
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    max_width: float,
+    mode: str = "greedy"
+) -> List[str]:
+    """
+    Wrap text into lines using cached word widths.
+
+    Args:
+        text: Text to wrap (whitespace is collapsed)
+        font: Font to measure with
+        max_width: Maximum line width in pixels
+        mode: "greedy" or "optimal"
+
+    Returns:
+        Wrapped lines
+    """
+    words = text.split()
+    fw = font_widths(font)
+    breaker = optimal_breaks if mode == "optimal" else greedy_breaks
+    return [' '.join(words[s:e]) for s, e, _ in breaker(fw.words(words), fw.space, max_width)]
@@ -170,6 +170,9 @@ class Snapshot:
     prompt: str
     document: Dict  # serialized DocumentSpec (without its own history)
     thumbnail: Optional[str] = None
+    # Content ids of document["pages"], aligned by index. Unchanged pages are
+    # shared between snapshots, in memory and in the project file.
+    page_refs: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -4,6 +4,9 @@ When a regions-only redesign replaces the panels, pixel-anchored overlays can be
 left floating over empty space. These helpers detect that (anchor outside every
 region's bbox) and move the anchor onto the nearest region's bbox center.
 Deterministic; never mutates input regions.
+
+Callers with many overlays pass a :class:`~core.layout.spatial_index.RegionIndex`
+so each query touches only nearby regions instead of scanning them all.
 """
 from __future__ import annotations
 
@@ -11,6 +14,7 @@ import logging
 from typing import List, Optional, Tuple
 
 from core.layout.models import Overlay, Region, PageSpec
+from core.layout.spatial_index import RegionIndex, index_for_page
 
 logger = logging.getLogger(__name__)
 
@@ -27,14 +31,20 @@ def _bbox_center(bbox) -> Point:
     return (bx + bw / 2.0, by + bh / 2.0)
 
 
-def overlay_anchor_stranded(ov: Overlay, regions: List[Region]) -> bool:
+def overlay_anchor_stranded(ov: Overlay, regions: List[Region],
+                            index: Optional[RegionIndex] = None) -> bool:
     """True if the overlay's anchor lies outside every region's bbox."""
     ax, ay = ov.anchor
+    if index is not None:
+        return not index.contains_point(ax, ay)
     return not any(_bbox_contains(r.bbox, ax, ay) for r in regions)
 
 
-def nearest_region_center(point: Point, regions: List[Region]) -> Optional[Point]:
+def nearest_region_center(point: Point, regions: List[Region],
+                          index: Optional[RegionIndex] = None) -> Optional[Point]:
     """bbox center of the region whose center is nearest ``point`` (None if empty)."""
+    if index is not None:
+        return index.nearest_center(point)
     if not regions:
         return None
     px, py = point
@@ -58,10 +68,11 @@ def reposition_stranded_overlays(page: PageSpec) -> int:
     regions = list(page.regions)
     if not regions or not page.overlays:
         return 0
+    index = index_for_page(page)
     moved = 0
     for ov in page.overlays:
-        if overlay_anchor_stranded(ov, regions):
-            target = nearest_region_center(ov.anchor, regions)
+        if overlay_anchor_stranded(ov, regions, index):
+            target = nearest_region_center(ov.anchor, regions, index)
             if target is not None:
                 ov.anchor = target
                 moved += 1
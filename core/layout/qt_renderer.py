@@ -1,19 +1,23 @@
-"""Native Qt renderer: PageSpec -> QGraphicsScene -> QImage/PNG (source of truth)."""
+"""Native Qt renderer: PageSpec -> QGraphicsScene (editor) or QPainter -> QImage/PNG/PDF (source of truth)."""
 from PySide6.QtWidgets import (
     QGraphicsScene, QGraphicsRectItem,
     QGraphicsSimpleTextItem, QGraphicsItem, QGraphicsPixmapItem, QGraphicsPathItem,
 )
 from PySide6.QtGui import (
     QColor, QBrush, QPen, QPolygonF, QImage, QPainter, QFont, QPixmap,
-    QPdfWriter, QPageSize, QPageLayout, QPainterPath,
+    QPdfWriter, QPageSize, QPageLayout, QPainterPath, QTextLayout,
 )
 from PySide6.QtCore import QPointF, QRectF, Qt, QSizeF, QMarginsF
 
 import logging
+from typing import NamedTuple, Optional, Tuple
 
+from core.layout.asset_cache import get_layout_asset_cache
+from core.layout.bundle_io import ensure_asset
 from core.layout.models import PageSpec, Region, DocumentSpec
 from core.layout.styles import effective_text_style
 from core.layout.geometry import validate_segments
+from core.layout.spatial_index import mark_page_changed
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +120,7 @@ def _writeback_move(item) -> None:
     region = getattr(item, "_region", None)
     if region is None:
         return
+    mark_page_changed()  # the item knows its region, not its page
     dx, dy = item.x(), item.y()
     bx, by, bw, bh = item._base_bbox
     if region.shape == "path" and getattr(item, "_base_segments", None):
@@ -170,45 +175,93 @@ class _RegionPathItem(_RegionMoveMixin, QGraphicsPathItem):
         return self.path()
 
 
+def _scaled_image(path: str, w: int, h: int, mode) -> "QImage | None":
+    """Decode and smooth-scale an image region's source, via the shared asset cache."""
+    ensure_asset(path)  # Lazily imported bundles extract assets on first use
+
+    def build():
+        src = QImage(path)
+        if src.isNull():
+            return None
+        return src.scaled(w, h, mode, Qt.SmoothTransformation)
+
+    return get_layout_asset_cache().get_or_build(
+        path, ("qt", w, h, int(mode.value)), build, size_of=lambda im: im.sizeInBytes())
+
+
+# Geometry and style shared by the editor scene (build_scene) and scene-free
+# painting (paint_page): each *_look helper resolves everything a region or
+# overlay draws with, so the two output paths only differ in how they emit it.
+
+class _ImageLook(NamedTuple):
+    path: QPainterPath          # frame shape
+    pen: QPen                   # frame stroke
+    brush: QBrush               # frame fill (placeholder grey when empty)
+    image: Optional[QImage]     # fitted source, clipped to the frame
+    image_pos: QPointF
+    label: Optional[str]        # placeholder caption when there is no image
+    label_pos: QPointF
+
+
+def _image_look(r: Region) -> _ImageLook:
+    istyle = r.image_style
+    stroke_px = istyle.stroke_px if istyle else 0
+    stroke_color = istyle.stroke_color if istyle else "#000000"
+    fit = istyle.fit if istyle else "cover"
+    x, y, w, h = r.bbox
+    mode = Qt.KeepAspectRatioByExpanding if fit == "cover" else Qt.KeepAspectRatio
+    scaled = _scaled_image(r.image_ref, int(w), int(h), mode) if r.image_ref else None
+    pen = QPen(QColor(stroke_color), stroke_px) if stroke_px > 0 else QPen(Qt.NoPen)
+    if scaled is not None:
+        # Center the scaled image in the bbox; the frame clip crops the
+        # overflow (cover) or reveals panel bg in the letterbox (contain).
+        return _ImageLook(region_to_painter_path(r), pen, QBrush(Qt.transparent), scaled,
+                          QPointF(x + (w - scaled.width()) / 2.0, y + (h - scaled.height()) / 2.0),
+                          None, QPointF())
+    if stroke_px == 0:
+        # Keep empty image placeholders outlined in the editor even when no
+        # comic-frame stroke is configured.
+        pen = QPen(_PLACEHOLDER_PEN, 1)
+    return _ImageLook(region_to_painter_path(r), pen, QBrush(_PLACEHOLDER_FILL), None, QPointF(),
+                      r.name or "[image]", QPointF(x + 4, y + 4))
+
+
+def _text_look(r: Region, project_style=None) -> Tuple[QFont, QColor, QPointF]:
+    """Font, color and top-left of a text region's text."""
+    x, y, _, _ = r.bbox
+    ts = effective_text_style(r, project_style)
+    font = QFont()
+    color = QColor(Qt.black)
+    if ts:
+        if ts.family:
+            font.setFamily(ts.family[0])
+        font.setBold(ts.weight in ("bold", "black", "semibold"))
+        font.setItalic(ts.italic)
+        color = QColor(ts.color)
+    font.setPixelSize(ts.size_px if ts and ts.size_px else _DEFAULT_TEXT_PX)
+    return font, color, QPointF(x + 2, y + 2)
+
+
 def _add_image_region(scene: QGraphicsScene, r: Region, selectable: bool,
                       *, locked: bool = True) -> None:
     # Image frames are ALWAYS locked in position (only text follows the lock
     # toggle); they stay selectable so the region can be picked.
     movable = False
-    istyle = r.image_style
-    stroke_px = istyle.stroke_px if istyle else 0
-    stroke_color = istyle.stroke_color if istyle else "#000000"
-    fit = istyle.fit if istyle else "cover"
+    look = _image_look(r)
 
-    path = region_to_painter_path(r)
-    frame = _RegionPathItem(path, r)
+    frame = _RegionPathItem(look.path, r)
     frame.setFlag(QGraphicsItem.ItemClipsChildrenToShape, True)
-    frame.setPen(QPen(QColor(stroke_color), stroke_px) if stroke_px > 0 else QPen(Qt.NoPen))
-
-    pix = QPixmap(r.image_ref) if r.image_ref else None
-    filled = pix is not None and not pix.isNull()
+    frame.setPen(look.pen)
+    frame.setBrush(look.brush)
 
-    if filled:
-        frame.setBrush(QBrush(Qt.transparent))
-        x, y, w, h = r.bbox
-        mode = Qt.KeepAspectRatioByExpanding if fit == "cover" else Qt.KeepAspectRatio
-        scaled = pix.scaled(int(w), int(h), mode, Qt.SmoothTransformation)
-        child = _RegionPixmapItem(scaled, r)
-        # Center the scaled pixmap in the bbox; the parent shape clip crops the
-        # overflow (cover) or reveals panel bg in the letterbox (contain).
-        child.setOffset(x + (w - scaled.width()) / 2.0, y + (h - scaled.height()) / 2.0)
+    if look.image is not None:
+        child = _RegionPixmapItem(QPixmap.fromImage(look.image), r)
+        child.setOffset(look.image_pos)
         child.setParentItem(frame)
         _apply_flags(child, selectable, r.id, movable=movable)
     else:
-        frame.setBrush(QBrush(_PLACEHOLDER_FILL))
-        if stroke_px == 0:
-            # Keep empty image placeholders outlined in the editor even when no
-            # comic-frame stroke is configured. A real stroke (stroke_px > 0) was
-            # already applied to the frame above, so only fill the gap for 0.
-            frame.setPen(QPen(_PLACEHOLDER_PEN, 1))
-        lx, ly, _, _ = r.bbox
-        label = QGraphicsSimpleTextItem(r.name or "[image]", frame)
-        label.setPos(lx + 4, ly + 4)
+        label = QGraphicsSimpleTextItem(look.label, frame)
+        label.setPos(look.label_pos)
         label.setBrush(QBrush(QColor("#6C757D")))
 
     _apply_flags(frame, selectable, r.id, movable=movable)
@@ -242,19 +295,12 @@ def _add_text_region(scene: QGraphicsScene, r: Region, selectable: bool, project
     else:
         scene.addItem(clip)
 
+    font, color, pos = _text_look(r, project_style)
     text = QGraphicsSimpleTextItem(r.text or "")
-    ts = effective_text_style(r, project_style)
-    font = QFont()
-    if ts:
-        if ts.family:
-            font.setFamily(ts.family[0])
-        font.setBold(ts.weight in ("bold", "black", "semibold"))
-        font.setItalic(ts.italic)
-        text.setBrush(QBrush(QColor(ts.color)))
-    font.setPixelSize(ts.size_px if ts and ts.size_px else _DEFAULT_TEXT_PX)
+    text.setBrush(QBrush(color))
     text.setFont(font)
     text.setParentItem(clip)
-    text.setPos(x + 2, y + 2)
+    text.setPos(pos)
 
 
 class _OverlayPathItem(QGraphicsPathItem):
@@ -283,16 +329,21 @@ def _overlay_as_styleable(ov, role):
     return _OverlayStyleable(ov.text_style, role)
 
 
-def _add_overlay(scene: QGraphicsScene, ov, project_style, base_z: float) -> None:
-    """Measure wrapped text, build balloon body+tail, add body and text to scene.
+class _OverlayLook(NamedTuple):
+    font: QFont
+    color: Optional[QColor]     # None keeps the text item's default color
+    text_width: float           # wrap width of the measured text
+    text_pos: QPointF           # top-left of the text, page coords (unrotated)
+    body: Optional[QPainterPath]  # balloon/caption shell; None for sfx
+    brush: QBrush
+    pen: QPen
+    anchor: QPointF             # rotation origin
+    rotation: float
 
-    Resolution 2 applied: body is _OverlayPathItem (overrides shape() to filled
-    interior so text children are NOT clipped to a thin stroked ring).
-    SFX overlays have no body (overlay_to_segments returns []) — text added directly.
-    """
-    from PySide6.QtCore import Qt, QRectF
-    from PySide6.QtGui import QFont, QColor, QPen, QBrush, QFontMetricsF
-    from PySide6.QtWidgets import QGraphicsTextItem
+
+def _overlay_look(ov, project_style) -> _OverlayLook:
+    """Measure wrapped text and build the body geometry of an overlay."""
+    from PySide6.QtGui import QFontMetricsF
     from core.layout.balloons import overlay_to_segments
 
     # Resolve role: explicit > kind-default > "dialogue"
@@ -303,7 +354,7 @@ def _add_overlay(scene: QGraphicsScene, ov, project_style, base_z: float) -> Non
     ts = effective_text_style(_overlay_as_styleable(ov, role), project_style)
 
     # Build font from resolved text style — size via setPixelSize (PIXELS),
-    # matching _add_text_region so overlay and region text render at the same scale.
+    # matching text regions so overlay and region text render at the same scale.
     font = QFont()
     font.setFamily(ts.family[0] if ts and ts.family else "DejaVu Sans")
     font.setPixelSize(ts.size_px if ts and ts.size_px else 16)
@@ -313,8 +364,7 @@ def _add_overlay(scene: QGraphicsScene, ov, project_style, base_z: float) -> Non
     # Measure wrapped text to size the body
     fm = QFontMetricsF(font)
     max_w = max(20.0, ov.style.max_width_px)
-    rect = fm.boundingRect(QRectF(0, 0, max_w, 100000),
-                           int(Qt.TextWordWrap), ov.text)
+    rect = fm.boundingRect(QRectF(0, 0, max_w, 100000), int(Qt.TextWordWrap), ov.text)
     text_w, text_h = rect.width(), rect.height()
     pad = ov.style.padding_px
     inner_w = text_w + 2 * pad
@@ -326,52 +376,69 @@ def _add_overlay(scene: QGraphicsScene, ov, project_style, base_z: float) -> Non
         ix, iy = ax - inner_w / 2.0, ay - inner_h / 2.0
     else:
         ix, iy = ax, ay
-    inner = (ix, iy, inner_w, inner_h)
 
+    segs = overlay_to_segments(ov.kind, (ix, iy, inner_w, inner_h), ov.tail_target, ov.style)
+    body = segments_to_painter_path(segs) if segs else None
+    pen = (QPen(QColor(ov.style.stroke_color), ov.style.stroke_px)
+           if ov.style.stroke_px > 0 else QPen(Qt.NoPen))
+    return _OverlayLook(
+        font=font, color=QColor(ts.color) if ts and ts.color else None,
+        text_width=text_w, text_pos=QPointF(ix + pad, iy + pad),
+        body=body, brush=QBrush(QColor(ov.style.fill)), pen=pen,
+        anchor=QPointF(ax, ay), rotation=getattr(ov, "rotation", 0.0) or 0.0,
+    )
+
+
+def _add_overlay(scene: QGraphicsScene, ov, project_style, base_z: float) -> None:
+    """Add an overlay's body and text to the scene.
+
+    Resolution 2 applied: body is _OverlayPathItem (overrides shape() to filled
+    interior so text children are NOT clipped to a thin stroked ring).
+    SFX overlays have no body (overlay_to_segments returns []) — text added directly.
+    """
+    from PySide6.QtWidgets import QGraphicsTextItem
+
+    look = _overlay_look(ov, project_style)
     z = base_z + ov.z
 
-    # Build body geometry via balloons
-    segs = overlay_to_segments(ov.kind, inner, ov.tail_target, ov.style)
     body_item = None
-    if segs:
-        path = segments_to_painter_path(segs)
-        body_item = _OverlayPathItem(path)
-        body_item.setBrush(QBrush(QColor(ov.style.fill)))
-        if ov.style.stroke_px > 0:
-            body_item.setPen(QPen(QColor(ov.style.stroke_color), ov.style.stroke_px))
-        else:
-            body_item.setPen(QPen(Qt.NoPen))
+    if look.body is not None:
+        body_item = _OverlayPathItem(look.body)
+        body_item.setBrush(look.brush)
+        body_item.setPen(look.pen)
         body_item.setZValue(z)
         body_item.setFlag(QGraphicsPathItem.GraphicsItemFlag.ItemClipsChildrenToShape, True)
         scene.addItem(body_item)
 
     # Text item: child of body (clipped) or direct scene item (sfx, no body)
-    text_item = QGraphicsTextItem(ov.text, parent=body_item)
-    text_item.setFont(font)
-    if ts and ts.color:
-        text_item.setDefaultTextColor(QColor(ts.color))
-    text_item.setTextWidth(text_w)
+    text_item = QGraphicsTextItem(ov.text)
+    if body_item is not None:
+        # setParentItem rather than the constructor's parent argument: only the
+        # former hands ownership to the body, otherwise the text item is
+        # collected as soon as this function returns.
+        text_item.setParentItem(body_item)
+    text_item.setFont(look.font)
+    if look.color is not None:
+        text_item.setDefaultTextColor(look.color)
+    text_item.setTextWidth(look.text_width)
     # body item lives at scene origin (path holds page-space verts), so the
     # text's parent-relative pos equals its scene pos.
-    text_item.setPos(ix + pad, iy + pad)
+    text_item.setPos(look.text_pos)
     text_item.setZValue(z + 0.1)
     if body_item is None:  # sfx: no body, add text directly to scene
         scene.addItem(text_item)
 
     # Rotation: spin the body (text rides along as its child) or, for SFX with no
     # body, the text item — both about the overlay anchor (scene coords).
-    rot = getattr(ov, "rotation", 0.0) or 0.0
-    if rot:
-        from PySide6.QtCore import QPointF
+    if look.rotation:
         if body_item is not None:
-            body_item.setTransformOriginPoint(QPointF(ax, ay))  # body sits at scene origin
-            body_item.setRotation(rot)
+            body_item.setTransformOriginPoint(look.anchor)  # body sits at scene origin
+            body_item.setRotation(look.rotation)
         else:
             # sfx text has a non-zero pos, so convert the scene anchor into the
             # text item's local frame before using it as the rotation origin.
-            text_item.setTransformOriginPoint(
-                QPointF(ax - text_item.x(), ay - text_item.y()))
-            text_item.setRotation(rot)
+            text_item.setTransformOriginPoint(look.anchor - text_item.pos())
+            text_item.setRotation(look.rotation)
 
 
 def build_scene(page: PageSpec, *, selectable: bool = False, style=None,
@@ -397,7 +464,124 @@ def build_scene(page: PageSpec, *, selectable: bool = False, style=None,
     return scene
 
 
+# Scene-free painting. QGraphicsScene and QPixmap belong to the GUI thread, but
+# QPainter on a QImage is safe in any thread, so exports and the render service
+# paint pages directly with the same geometry, stacking and clipping as the
+# items build_scene creates for the editor.
+
+def _draw_simple_text(painter: QPainter, text: str, font: QFont, color: QColor,
+                      x: float, y: float) -> None:
+    """Draw text the way QGraphicsSimpleTextItem paints it (top-left at x, y)."""
+    layout = QTextLayout(text.replace("\n", "\u2028"), font)
+    layout.setCacheEnabled(True)
+    layout.beginLayout()
+    while layout.createLine().isValid():
+        pass
+    layout.endLayout()
+    line_y = 0.0
+    for i in range(layout.lineCount()):
+        line = layout.lineAt(i)
+        line.setPosition(QPointF(0, line_y))
+        line_y += line.height()
+    painter.setPen(QPen(color))
+    painter.setBrush(Qt.NoBrush)
+    layout.draw(painter, QPointF(x, y))
+
+
+def _paint_image_region(painter: QPainter, r: Region) -> None:
+    look = _image_look(r)
+    painter.save()
+    # Frame first, then its content clipped to the frame's interior (as the
+    # scene paints a parent item before its ItemClipsChildrenToShape children).
+    painter.setPen(look.pen)
+    painter.setBrush(look.brush)
+    painter.drawPath(look.path)
+    painter.setClipPath(look.path, Qt.IntersectClip)
+    if look.image is not None:
+        painter.drawImage(look.image_pos, look.image)
+    else:
+        _draw_simple_text(painter, look.label, QFont(), QColor("#6C757D"),
+                          look.label_pos.x(), look.label_pos.y())
+    painter.restore()
+
+
+def _paint_text_region(painter: QPainter, r: Region, project_style=None) -> None:
+    font, color, pos = _text_look(r, project_style)
+    painter.save()
+    painter.setClipPath(region_to_painter_path(r), Qt.IntersectClip)
+    _draw_simple_text(painter, r.text or "", font, color, pos.x(), pos.y())
+    painter.restore()
+
+
+def _paint_overlay(painter: QPainter, ov, project_style) -> None:
+    """Painter counterpart of _add_overlay: body, clipped wrapped text, rotation."""
+    from PySide6.QtGui import QTextDocument, QAbstractTextDocumentLayout, QPalette
+
+    look = _overlay_look(ov, project_style)
+    painter.save()
+    if look.rotation:
+        painter.translate(look.anchor)
+        painter.rotate(look.rotation)
+        painter.translate(-look.anchor)
+
+    if look.body is not None:
+        painter.setBrush(look.brush)
+        painter.setPen(look.pen)
+        painter.drawPath(look.body)
+        painter.setClipPath(look.body, Qt.IntersectClip)
+
+    doc = QTextDocument()
+    doc.setDefaultFont(look.font)
+    doc.setPlainText(ov.text)
+    doc.setTextWidth(look.text_width)
+    ctx = QAbstractTextDocumentLayout.PaintContext()
+    if look.color is not None:
+        ctx.palette.setColor(QPalette.Text, look.color)
+    painter.translate(look.text_pos)
+    doc.documentLayout().draw(painter, ctx)
+    painter.restore()
+
+
+def paint_page(painter: QPainter, page: PageSpec, *, style=None, region_filter=None,
+               include_overlays: bool = True) -> None:
+    """Paint a page's regions and overlays in page coordinates (no scene, any thread).
+
+    The caller fills the background and sets the page-to-device transform.
+    """
+    regions = page.regions if region_filter is None else [r for r in page.regions if region_filter(r)]
+    for r in sorted(regions, key=lambda rr: rr.z):
+        if r.kind == "image":
+            _paint_image_region(painter, r)
+        else:
+            _paint_text_region(painter, r, style)
+    if include_overlays and page.overlays:
+        for ov in sorted(page.overlays, key=lambda o: o.z):
+            _paint_overlay(painter, ov, style)
+
+
+def prepare_page_assets(page: PageSpec) -> int:
+    """Decode and fit a page's images into the asset cache ahead of painting.
+
+    Thread-safe; the render service runs it on its workers so that painting on
+    the calling thread (PDF export) only finds cached images.
+
+    Returns:
+        Number of image regions whose source could be loaded
+    """
+    ready = 0
+    for r in page.regions:
+        if r.kind != "image" or not r.image_ref:
+            continue
+        fit = r.image_style.fit if r.image_style else "cover"
+        mode = Qt.KeepAspectRatioByExpanding if fit == "cover" else Qt.KeepAspectRatio
+        _, _, w, h = r.bbox
+        if _scaled_image(r.image_ref, int(w), int(h), mode) is not None:
+            ready += 1
+    return ready
+
+
 def render_page_to_image(page: PageSpec, *, style=None, scale: float = 1.0) -> QImage:
+    """Rasterize a page. Paints without a scene, so worker threads may call it."""
     pw, ph = page.page_size_px
     b = max(0, int(getattr(page, "bleed_px", 0) or 0))
     cw, ch = pw + 2 * b, ph + 2 * b
@@ -407,26 +591,27 @@ def render_page_to_image(page: PageSpec, *, style=None, scale: float = 1.0) -> Q
     painter = QPainter(img)
     painter.setRenderHint(QPainter.Antialiasing, True)
     if b == 0:
-        scene = build_scene(page, style=style)
-        scene.render(painter, QRectF(0, 0, sw, sh), QRectF(0, 0, pw, ph))
+        painter.scale(sw / pw, sh / ph)
+        paint_page(painter, page, style=style)
         painter.end()
         return img
     # Non-bleed regions are clipped to the trim box, offset into the bleed canvas.
     painter.save()
     painter.setClipRect(QRectF(b * scale, b * scale, pw * scale, ph * scale))
-    non_bleed = build_scene(page, style=style, region_filter=lambda r: not r.bleed)
-    non_bleed.render(painter, QRectF(b * scale, b * scale, pw * scale, ph * scale),
-                     QRectF(0, 0, pw, ph))
+    painter.translate(b * scale, b * scale)
+    painter.scale(scale, scale)
+    paint_page(painter, page, style=style, region_filter=lambda r: not r.bleed)
     painter.restore()
     # Bleed regions may extend into the surrounding margin: map the full bleed box
-    # in scene coords onto the whole canvas.  Use a transparent background so the
-    # bleed scene does not paint over the already-rendered trim content.
-    # include_overlays=False: overlays live in trim coords and were already rendered
-    # with the non-bleed scene above (Resolution 1 — avoids double-rendering).
-    bleed_scene = build_scene(page, style=style, region_filter=lambda r: r.bleed,
-                              include_overlays=False)
-    bleed_scene.setBackgroundBrush(Qt.transparent)
-    bleed_scene.render(painter, QRectF(0, 0, sw, sh), QRectF(-b, -b, cw, ch))
+    # onto the whole canvas, over the already-painted trim content.
+    # include_overlays=False: overlays live in trim coords and were already painted
+    # with the trim pass above (Resolution 1 — avoids double-rendering).
+    painter.save()
+    painter.scale(sw / cw, sh / ch)
+    painter.translate(b, b)
+    paint_page(painter, page, style=style, region_filter=lambda r: r.bleed,
+               include_overlays=False)
+    painter.restore()
     painter.end()
     return img
 
@@ -435,12 +620,28 @@ def save_page_png(page: PageSpec, path: str, *, style=None) -> None:
     render_page_to_image(page, style=style).save(path, "PNG")
 
 
-def export_document_pdf(doc: DocumentSpec, path: str, dpi: int = 300) -> None:
+def export_document_pdf(doc: DocumentSpec, path: str, dpi: int = 300, *,
+                        service=None) -> None:
+    """Write the document as a vector PDF.
+
+    QPdfWriter has a single painter, so pages are painted in order on the
+    calling thread while the render service's workers decode and fit the
+    images of every page ahead of it.
+
+    Args:
+        doc: Document to export
+        path: Output PDF path
+        dpi: Resolution mapping page pixels to inches
+        service: PageRenderService preparing the images (the shared one if None)
+    """
+    from core.layout.render_service import get_page_render_service
+    service = service or get_page_render_service()
+    prepared = [service.prepare(page) for page in doc.pages]
     writer = QPdfWriter(path)
     writer.setResolution(dpi)
     painter = QPainter()
     started = False
-    for page in doc.pages:
+    for page, ready in zip(doc.pages, prepared):
         pw, ph = page.page_size_px
         size_inches = QSizeF(pw / dpi, ph / dpi)
         # QPdfWriter contract: set page size/margins BEFORE begin() (first page) or newPage() (subsequent).
@@ -451,8 +652,13 @@ def export_document_pdf(doc: DocumentSpec, path: str, dpi: int = 300) -> None:
             started = True
         else:
             writer.newPage()
-        scene = build_scene(page, style=doc.style)
-        target = painter.viewport()
-        scene.render(painter, QRectF(target), QRectF(0, 0, pw, ph))
+        ready.result()
+        target = QRectF(painter.viewport())
+        painter.save()
+        painter.setClipRect(target)
+        painter.fillRect(target, QColor(_resolve_bg(page)))
+        painter.scale(target.width() / pw, target.height() / ph)
+        paint_page(painter, page, style=doc.style)
+        painter.restore()
     if started:
         painter.end()
@@ -0,0 +1,270 @@
+"""
+Background page rendering for the Layout/Books module.
+
+Page previews and exports used to build a QGraphicsScene per page and paint it
+on the calling thread, one page after another. The service rasterizes pages
+with :func:`core.layout.qt_renderer.render_page_to_image` (QPainter on a
+QImage, which is safe outside the GUI thread) on a shared worker pool, and
+keeps the results in a memory-bounded LRU keyed by the page's content, the
+project style, the scale and the identity of every image source, so an
+unchanged page is never painted twice.
+
+Workers render a snapshot of the page taken at submit time, so the editor can
+keep mutating the live page. :class:`PageThumbnailer` delivers finished
+thumbnails to the GUI thread one by one through a Qt signal. PDF export paints
+on its own thread (QPdfWriter has one painter) and uses the same workers to
+decode and fit each page's images ahead of it.
+"""
+
+import itertools
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Hashable, Iterator, List, Optional, Sequence
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QImage
+
+from core.layout import qt_renderer, schema
+from core.layout.asset_cache import LayoutAssetCache, source_key
+from core.layout.models import PageSpec
+from core.logging_config import LogManager
+
+logger = LogManager().get_logger("layout.render_service")
+
+DEFAULT_MEMORY_BUDGET = 128 * 1024 * 1024  # 128 MB of rendered pages
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _render_key(page: PageSpec, page_dict: Dict, style_dict: Optional[Dict],
+                scale: float) -> Hashable:
+    sources = tuple(source_key(r.image_ref) for r in page.regions
+                    if r.kind == "image" and r.image_ref)
+    style_id = schema.content_id(style_dict) if style_dict else None
+    return (schema.content_id(page_dict), style_id, round(scale, 6), sources)
+
+
+def page_render_key(page: PageSpec, style=None, scale: float = 1.0) -> Hashable:
+    """Cache key of a rendered page: content hash, style hash, scale and image sources."""
+    style_dict = schema.project_style_to_dict(style) if style else None
+    return _render_key(page, schema.page_to_dict(page), style_dict, scale)
+
+
+class PageRenderService:
+    """Shared worker pool and rendered-page cache."""
+
+    def __init__(self, workers: Optional[int] = None,
+                 memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        """
+        Initialize the service.
+
+        Args:
+            workers: Worker threads (default: up to 4)
+            memory_budget: Maximum bytes of rendered pages kept in memory
+        """
+        self.workers = workers or DEFAULT_WORKERS
+        self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                            thread_name_prefix="page-render")
+        self._cache = LayoutAssetCache(memory_budget)
+        self._pending: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self) -> LayoutAssetCache:
+        """The rendered-page cache."""
+        return self._cache
+
+    def cached(self, page: PageSpec, *, style=None, scale: float = 1.0) -> Optional[QImage]:
+        """The rendered page if it is already cached, else None."""
+        return self._cache.get(page_render_key(page, style, scale))
+
+    def submit(self, page: PageSpec, *, style=None, scale: float = 1.0) -> "Future[QImage]":
+        """
+        Render a page on the worker pool.
+
+        Returns a completed future for a cached page, and the running future if
+        the same content is already being rendered.
+        """
+        # The serialized page is both hashed for the key and, on a miss, turned
+        # back into the snapshot the worker renders while the editor carries on.
+        page_dict = schema.page_to_dict(page)
+        style_dict = schema.project_style_to_dict(style) if style else None
+        key = _render_key(page, page_dict, style_dict, scale)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                future: Future = Future()
+                future.set_result(cached)
+                return future
+            future = self._pending.get(key)
+            if future is not None:
+                return future
+            future = self._executor.submit(
+                self._render, key, schema.page_from_dict(page_dict),
+                schema.project_style_from_dict(style_dict) if style_dict else None, scale)
+            self._pending[key] = future
+            return future
+
+    def _render(self, key: Hashable, page: PageSpec, style, scale: float) -> QImage:
+        try:
+            image = qt_renderer.render_page_to_image(page, style=style, scale=scale)
+            self._cache.put(key, image, image.sizeInBytes())
+            return image
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def render_pages(self, pages: Sequence[PageSpec], *, style=None,
+                     scale: float = 1.0) -> Iterator[QImage]:
+        """Render pages concurrently, yielding the images in page order.
+
+        At most two pages per worker are in flight, so exporting a long
+        document at print resolution does not hold every page in memory.
+        """
+        window = 2 * self.workers
+        futures: Deque[Future] = deque()
+        for page in pages:
+            futures.append(self.submit(page, style=style, scale=scale))
+            if len(futures) >= window:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+
+    def prepare(self, page: PageSpec) -> "Future[int]":
+        """Decode and fit a page's images into the asset cache on the worker pool."""
+        snapshot = schema.page_from_dict(schema.page_to_dict(page))
+        return self._executor.submit(qt_renderer.prepare_page_assets, snapshot)
+
+    def clear(self) -> None:
+        """Drop all cached renders."""
+        self._cache.clear()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers (pending renders are cancelled unless already running)."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_service: Optional[PageRenderService] = None
+_service_lock = threading.Lock()
+
+
+def get_page_render_service() -> PageRenderService:
+    """Return the process-wide page render service."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = PageRenderService()
+        return _service
+
+
+class _RenderRelay(QObject):
+    """Hands finished thumbnails from worker threads to the GUI thread.
+
+    Render futures outlive requests (the service caches them) and run their
+    callbacks on worker threads, so they must not hold a thumbnailer: a worker
+    dropping the last reference would destroy the QObject off its thread. They
+    emit on this process-lifetime relay instead, which every thumbnailer
+    listens to, filtering on its own request id.
+    """
+
+    rendered = Signal(int, int, QImage)  # request id, page index, thumbnail
+
+
+_relay: Optional[_RenderRelay] = None
+# Request ids are unique across thumbnailers, which share the relay
+_request_ids = itertools.count(1)
+
+
+def _relay_rendered(request_id: int, index: int, future: Future) -> None:
+    # Runs on a worker thread; the queued signal hands the image over
+    _relay.rendered.emit(request_id, index, PageThumbnailer._result(future))
+
+
+class PageThumbnailer(QObject):
+    """Renders page thumbnails in the background and emits each as it finishes.
+
+    Results are delivered on the thread the thumbnailer lives in (the GUI
+    thread), in completion order. Each :meth:`request` supersedes the previous
+    one: thumbnails still in flight from an older request are dropped.
+    """
+
+    thumbnailReady = Signal(int, QImage)  # page index, thumbnail
+    finished = Signal()  # every thumbnail of the current request was delivered
+
+    def __init__(self, service: Optional[PageRenderService] = None,
+                 max_size: int = 256, parent=None):
+        """
+        Initialize the thumbnailer.
+
+        Args:
+            service: Render service to use (the shared one if None)
+            max_size: Longest side of a thumbnail in pixels
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.service = service or get_page_render_service()
+        self.max_size = max_size
+        self._generation = 0
+        self._remaining = 0
+        global _relay
+        if _relay is None:
+            _relay = _RenderRelay()  # created on the GUI thread, like its listeners
+        _relay.rendered.connect(self._deliver)
+
+    def scale_for(self, page: PageSpec) -> float:
+        """Render scale that fits the page's longest side into ``max_size``."""
+        pw, ph = page.page_size_px
+        b = max(0, int(getattr(page, "bleed_px", 0) or 0))
+        return min(1.0, self.max_size / max(pw + 2 * b, ph + 2 * b, 1))
+
+    def request(self, pages: Sequence[PageSpec], style=None) -> int:
+        """
+        Start rendering thumbnails for ``pages``, replacing any earlier request.
+
+        Cached thumbnails are emitted immediately.
+
+        Returns:
+            Number of thumbnails that are being rendered in the background
+        """
+        self._generation = generation = next(_request_ids)
+        futures: List = []
+        for index, page in enumerate(pages):
+            future = self.service.submit(page, style=style, scale=self.scale_for(page))
+            futures.append((index, future))
+        self._remaining = len(futures)
+        if not futures:
+            self.finished.emit()
+        background = 0
+        for index, future in futures:
+            # One done() check per future: it is either delivered here or by
+            # its callback (which runs at once if it finishes in between)
+            if future.done():
+                self._deliver(generation, index, self._result(future))
+            else:
+                background += 1
+                future.add_done_callback(
+                    lambda f, i=index: _relay_rendered(generation, i, f))
+        return background
+
+    @staticmethod
+    def _result(future: Future) -> QImage:
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning(f"Page thumbnail failed: {e}")
+            return QImage()
+
+    def _deliver(self, generation: int, index: int, image: QImage) -> None:
+        if generation != self._generation:
+            return
+        if not image.isNull():
+            self.thumbnailReady.emit(index, image)
+        self._remaining -= 1
+        if self._remaining == 0:
+            self.finished.emit()
+
+    def cancel(self) -> None:
+        """Drop the thumbnails still in flight."""
+        self._generation = next(_request_ids)
+        self._remaining = 0
@@ -1,6 +1,9 @@
 """Serialization, normalization, and validation for layout documents."""
+import hashlib
+import json
+import logging
 from dataclasses import asdict, replace, fields
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from core.layout.models import (
     Region, PageSpec, DocumentSpec, PageSize, TextStyle, ImageStyle, Snapshot, ProjectStyle,
@@ -8,6 +11,8 @@ from core.layout.models import (
     Overlay, OverlayStyle,
 )
 
+logger = logging.getLogger(__name__)
+
 
 def _filtered(cls, d: Dict) -> Dict:
     """Keep only keys that are real fields of dataclass ``cls``.
@@ -145,18 +150,50 @@ def overlay_from_dict(d: Dict) -> Overlay:
     )
 
 
-def snapshot_to_dict(s: "Snapshot") -> Dict:
-    return {
+def content_id(d: Dict) -> str:
+    """Content address of a JSON-serializable chunk (e.g. a serialized page)."""
+    encoded = json.dumps(d, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:20]
+
+
+def snapshot_to_dict(s: "Snapshot", chunks: Optional[Dict[str, Dict]] = None) -> Dict:
+    """Serialize a snapshot.
+
+    With ``chunks``, the snapshot's pages are written as content ids and the
+    page dicts are added to ``chunks`` (shared by all snapshots of a document).
+    """
+    document = s.document
+    page_refs = None
+    pages = document.get("pages")
+    if chunks is not None and isinstance(pages, list):
+        page_refs = s.page_refs if len(s.page_refs) == len(pages) else [content_id(p) for p in pages]
+        for ref, page in zip(page_refs, pages):
+            chunks.setdefault(ref, page)
+        document = {k: v for k, v in document.items() if k != "pages"}
+    d = {
         "id": s.id, "parent_id": s.parent_id, "timestamp": s.timestamp,
-        "prompt": s.prompt, "document": s.document, "thumbnail": s.thumbnail,
+        "prompt": s.prompt, "document": document, "thumbnail": s.thumbnail,
     }
+    if page_refs is not None:
+        d["page_refs"] = list(page_refs)
+    return d
 
 
-def snapshot_from_dict(d: Dict) -> "Snapshot":
+def snapshot_from_dict(d: Dict, chunks: Optional[Dict[str, Dict]] = None) -> "Snapshot":
+    document = d.get("document", {})
+    page_refs = list(d.get("page_refs") or [])
+    if page_refs and "pages" not in document:
+        # Pages resolve to the shared chunk dicts; nothing is copied or parsed
+        missing = [ref for ref in page_refs if ref not in (chunks or {})]
+        if missing:
+            raise ValueError(f"Snapshot {d.get('id')!r} refers to {len(missing)} page(s) "
+                             f"missing from history_chunks")
+        document = dict(document)
+        document["pages"] = [chunks[ref] for ref in page_refs]
     return Snapshot(
         id=d["id"], parent_id=d.get("parent_id"), timestamp=d.get("timestamp", ""),
-        prompt=d.get("prompt", ""), document=d.get("document", {}),
-        thumbnail=d.get("thumbnail"),
+        prompt=d.get("prompt", ""), document=document,
+        thumbnail=d.get("thumbnail"), page_refs=page_refs,
     )
 
 
@@ -217,14 +254,31 @@ def page_from_dict(d: Dict) -> PageSpec:
 
 
 def document_to_dict(doc: DocumentSpec) -> Dict:
-    return {
+    chunks: Dict[str, Dict] = {}
+    history = [snapshot_to_dict(s, chunks) for s in doc.history]
+    d = {
         "schema_version": doc.schema_version, "title": doc.title, "author": doc.author,
         "content_kind": doc.content_kind, "theme": dict(doc.theme),
         "metadata": dict(doc.metadata), "pages": [page_to_dict(p) for p in doc.pages],
-        "history": [snapshot_to_dict(s) for s in doc.history],
+        "history": history,
         "style": project_style_to_dict(doc.style) if doc.style else None,
         "render_on_top": doc.render_on_top,
     }
+    if chunks:
+        d["history_chunks"] = chunks
+    return d
+
+
+def _history_from_dict(d: Dict) -> List["Snapshot"]:
+    # History is not essential: a snapshot whose pages can't be resolved (a
+    # hand-edited or truncated project) is dropped rather than failing the load
+    history = []
+    for s in d.get("history", []):
+        try:
+            history.append(snapshot_from_dict(s, d.get("history_chunks")))
+        except ValueError as e:
+            logger.warning(f"Dropping unreadable history snapshot: {e}")
+    return history
 
 
 def document_from_dict(d: Dict) -> DocumentSpec:
@@ -234,7 +288,7 @@ def document_from_dict(d: Dict) -> DocumentSpec:
         theme=dict(d.get("theme", {})), metadata=dict(d.get("metadata", {})),
         content_kind=d.get("content_kind", "custom"),
         schema_version=d.get("schema_version", "2.0"),
-        history=[snapshot_from_dict(s) for s in d.get("history", [])],
+        history=_history_from_dict(d),
         style=project_style_from_dict(d["style"]) if d.get("style") else None,
         render_on_top=d.get("render_on_top"),
     )
@@ -0,0 +1,286 @@
+"""Per-page spatial index over region bounding boxes (pure, no Qt).
+
+Overlay anchoring, stranded-overlay repair and canvas hit-testing used to scan
+every region for every query. The index buckets region bboxes (and, separately,
+bbox centers) into a uniform grid sized from the page's regions, so a point
+query only looks at the regions in one cell and a nearest-center query only
+widens ring by ring until nothing closer can exist.
+
+Regions are edited in place (drag write-back, split/merge, redesigns replacing
+``page.regions``), so :meth:`RegionIndex.sync` diffs the current region list
+against what was indexed and re-buckets only regions that were added, removed
+or moved. :func:`index_for_page` keeps one index per live page. Edit paths call
+:func:`mark_page_changed`; queries between edits then cost only the grid lookup,
+and the O(n) diff runs once per edit (or when ``page.regions`` is replaced or
+changes length, which is detected without a mark).
+"""
+from __future__ import annotations
+
+import math
+import weakref
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.layout.models import PageSpec, Region
+from core.layout.region_ops import region_to_polygon
+
+Point = Tuple[float, float]
+Cell = Tuple[int, int]
+
+MIN_CELL_SIZE = 32.0
+# Re-grid when the regions' mean size drifts this far from the cell size
+CELL_DRIFT = 2.0
+
+
+def _center(bbox) -> Point:
+    bx, by, bw, bh = bbox
+    return (bx + bw / 2.0, by + bh / 2.0)
+
+
+def _point_in_polygon(x: float, y: float, poly) -> bool:
+    """Even-odd ray cast; points on an edge may land either way."""
+    inside = False
+    n = len(poly)
+    for i in range(n):
+        x1, y1 = poly[i]
+        x2, y2 = poly[(i + 1) % n]
+        if (y1 > y) != (y2 > y):
+            if x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+    return inside
+
+
+class RegionIndex:
+    """Uniform-grid index of region bboxes and bbox centers."""
+
+    def __init__(self, regions: Iterable[Region] = (), cell_size: Optional[float] = None):
+        """
+        Build the index.
+
+        Args:
+            regions: Regions to index, in page (paint) order
+            cell_size: Grid cell size in page px; derived from the regions if None
+        """
+        regions = list(regions)
+        self.cell_size = float(cell_size) if cell_size else self._auto_cell_size(regions)
+        self._fixed_cell = cell_size is not None
+        # id(region) -> (region, bbox it was bucketed with, list position)
+        self._entries: Dict[int, Tuple[Region, tuple, int]] = {}
+        self._boxes: Dict[Cell, List[int]] = {}
+        self._centers: Dict[Cell, List[int]] = {}
+        self._center_bounds: Optional[Tuple[int, int, int, int]] = None
+        self.sync(regions)
+
+    @staticmethod
+    def _auto_cell_size(regions: List[Region]) -> float:
+        # About one region per cell: the mean bbox side length
+        if not regions:
+            return 256.0
+        area = sum(max(r.bbox[2], 1) * max(r.bbox[3], 1) for r in regions) / len(regions)
+        return max(MIN_CELL_SIZE, math.sqrt(area))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _cell(self, x: float, y: float) -> Cell:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def _box_cells(self, bbox) -> Iterable[Cell]:
+        bx, by, bw, bh = bbox
+        x0, y0 = self._cell(bx, by)
+        x1, y1 = self._cell(bx + bw, by + bh)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield (cx, cy)
+
+    def _insert(self, key: int, bbox) -> None:
+        for cell in self._box_cells(bbox):
+            self._boxes.setdefault(cell, []).append(key)
+        self._centers.setdefault(self._cell(*_center(bbox)), []).append(key)
+
+    def _remove(self, key: int, bbox) -> None:
+        for cell in self._box_cells(bbox):
+            bucket = self._boxes.get(cell)
+            if bucket is not None:
+                bucket.remove(key)
+                if not bucket:
+                    del self._boxes[cell]
+        cell = self._cell(*_center(bbox))
+        bucket = self._centers.get(cell)
+        if bucket is not None:
+            bucket.remove(key)
+            if not bucket:
+                del self._centers[cell]
+
+    def sync(self, regions: Iterable[Region]) -> int:
+        """
+        Bring the index up to date with ``regions`` (the page's current list).
+
+        Only regions that were added, removed or whose bbox changed are
+        re-bucketed.
+
+        Returns:
+            Number of regions re-bucketed
+        """
+        regions = list(regions)
+        if not self._fixed_cell and not self._entries and regions:
+            self.cell_size = self._auto_cell_size(regions)
+        seen: Dict[int, Tuple[Region, tuple, int]] = {}
+        changed = 0
+        for order, region in enumerate(regions):
+            key = id(region)
+            bbox = tuple(region.bbox)
+            old = self._entries.get(key)
+            if old is None or old[0] is not region or old[1] != bbox:
+                if old is not None:
+                    self._remove(key, old[1])
+                self._insert(key, bbox)
+                changed += 1
+            seen[key] = (region, bbox, order)
+        for key, (_, bbox, _) in self._entries.items():
+            if key not in seen:
+                self._remove(key, bbox)
+                changed += 1
+        self._entries = seen
+        if changed and not self._fixed_cell and regions:
+            # Resized regions make the grid too coarse (long buckets) or too
+            # fine (regions spanning many cells): re-grid when it drifts
+            wanted = self._auto_cell_size(regions)
+            if not 1 / CELL_DRIFT <= wanted / self.cell_size <= CELL_DRIFT:
+                self._regrid(wanted)
+        if changed:
+            cells = list(self._centers)
+            self._center_bounds = (
+                min(c[0] for c in cells), min(c[1] for c in cells),
+                max(c[0] for c in cells), max(c[1] for c in cells),
+            ) if cells else None
+        return changed
+
+    def _regrid(self, cell_size: float) -> None:
+        self.cell_size = cell_size
+        self._boxes.clear()
+        self._centers.clear()
+        for key, (_, bbox, _) in self._entries.items():
+            self._insert(key, bbox)
+
+    def regions_at(self, x: float, y: float) -> List[Region]:
+        """Regions whose bbox contains the point, topmost (highest z, then last painted) first."""
+        hits = []
+        for key in self._boxes.get(self._cell(x, y), ()):
+            region, (bx, by, bw, bh), order = self._entries[key]
+            if bx <= x <= bx + bw and by <= y <= by + bh:
+                hits.append((region.z, order, region))
+        hits.sort(key=lambda h: (h[0], h[1]), reverse=True)
+        return [h[2] for h in hits]
+
+    def contains_point(self, x: float, y: float) -> bool:
+        """True if any region's bbox contains the point."""
+        for key in self._boxes.get(self._cell(x, y), ()):
+            bx, by, bw, bh = self._entries[key][1]
+            if bx <= x <= bx + bw and by <= y <= by + bh:
+                return True
+        return False
+
+    def region_at(self, x: float, y: float) -> Optional[Region]:
+        """Topmost region whose shape contains the point (curved paths test their bbox)."""
+        for region in self.regions_at(x, y):
+            poly = region_to_polygon(region)
+            if poly is None or _point_in_polygon(x, y, poly):
+                return region
+        return None
+
+    def nearest_center(self, point: Point) -> Optional[Point]:
+        """bbox center of the region whose center is nearest ``point`` (None if empty).
+
+        Ties go to the region later in page order, as a linear scan with ``<=`` would.
+        """
+        if self._center_bounds is None:
+            return None
+        px, py = point
+        pcx, pcy = self._cell(px, py)
+        min_cx, min_cy, max_cx, max_cy = self._center_bounds
+        # Rings closer than the occupied cell range are empty; start at its edge
+        ring = max(0, min_cx - pcx, pcx - max_cx, min_cy - pcy, pcy - max_cy)
+        last_ring = max(abs(pcx - min_cx), abs(pcx - max_cx), abs(pcy - min_cy), abs(pcy - max_cy))
+        best = None
+        best_rank = None
+        while ring <= last_ring:
+            # Everything in this ring is at least (ring - 1) cells away
+            if best_rank is not None and (ring - 1) * self.cell_size > math.sqrt(best_rank[0]):
+                break
+            for cell in self._ring_cells(pcx, pcy, ring):
+                for key in self._centers.get(cell, ()):
+                    _, bbox, order = self._entries[key]
+                    cx, cy = _center(bbox)
+                    rank = ((cx - px) ** 2 + (cy - py) ** 2, -order)
+                    if best_rank is None or rank <= best_rank:
+                        best_rank = rank
+                        best = (cx, cy)
+            ring += 1
+        return best
+
+    @staticmethod
+    def _ring_cells(cx: int, cy: int, ring: int) -> Iterable[Cell]:
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-ring, ring + 1):
+            yield (cx + dx, cy - ring)
+            yield (cx + dx, cy + ring)
+        for dy in range(-ring + 1, ring):
+            yield (cx - ring, cy + dy)
+            yield (cx + ring, cy + dy)
+
+
+class _PageIndex:
+    """A live page's index plus what is needed to tell whether it is current."""
+
+    __slots__ = ("page_ref", "index", "regions", "count", "stale")
+
+    def __init__(self, page: PageSpec):
+        self.page_ref = weakref.ref(page, _forget_page)
+        self.index = RegionIndex(page.regions)
+        self.regions = page.regions
+        self.count = len(page.regions)
+        self.stale = False
+
+
+# id(page) -> the page's index entry
+_page_indexes: Dict[int, _PageIndex] = {}
+
+
+def index_for_page(page: PageSpec) -> RegionIndex:
+    """Return the page's region index, synced if the page was edited since the last query."""
+    entry = _page_indexes.get(id(page))
+    if entry is None or entry.page_ref() is not page:
+        entry = _PageIndex(page)
+        _page_indexes[id(page)] = entry
+        return entry.index
+    if entry.stale or entry.regions is not page.regions or entry.count != len(page.regions):
+        entry.index.sync(page.regions)
+        entry.regions = page.regions
+        entry.count = len(page.regions)
+        entry.stale = False
+    return entry.index
+
+
+def mark_page_changed(page: Optional[PageSpec] = None) -> None:
+    """
+    Note that regions were edited in place, so the next query re-syncs the index.
+
+    Args:
+        page: The edited page, or None when the caller only has the region
+            (every indexed page is marked)
+    """
+    if page is None:
+        for entry in _page_indexes.values():
+            entry.stale = True
+        return
+    entry = _page_indexes.get(id(page))
+    if entry is not None and entry.page_ref() is page:
+        entry.stale = True
+
+
+def _forget_page(ref: "weakref.ref[PageSpec]") -> None:
+    for key, entry in list(_page_indexes.items()):
+        if entry.page_ref is ref:
+            del _page_indexes[key]
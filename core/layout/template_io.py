@@ -9,6 +9,7 @@ from core.layout import schema
 def export_template(doc: DocumentSpec, path: str) -> None:
     data = schema.document_to_dict(doc)
     data["history"] = []  # templates carry no iteration history
+    data.pop("history_chunks", None)  # ...nor the past pages it refers to
     for page in data.get("pages", []):
         for region in page.get("regions", []):
             region["text"] = ""        # strip text content
@@ -2,12 +2,21 @@
 Template Management System
 
 Handles template discovery, validation, preview generation, and caching.
+
+Discovery keeps a persisted index of every template file's metadata and
+inheritance chain, keyed on the file's mtime and size, so a rescan only parses
+and validates files that changed. Previews are rendered at several sizes by a
+background worker pool instead of on first request.
 """
 
+import copy
 import json
 import hashlib
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
@@ -25,6 +34,9 @@ from core.config import ConfigManager
 
 logger = LogManager().get_logger("layout.templates")
 
+INDEX_VERSION = 1
+PREVIEW_SIZES: Tuple[Tuple[int, int], ...] = ((128, 128), (256, 256), (512, 512))
+
 
 @dataclass
 class TemplateMetadata:
@@ -41,6 +53,47 @@ class TemplateMetadata:
     extends: Optional[str] = None
     block_count: int = 0
     last_modified: Optional[datetime] = None
+    inheritance_chain: List[str] = field(default_factory=list)  # [own key, parent, ..., root]
+
+    def search_text(self) -> str:
+        """Lowercased name, description and tags, for substring search."""
+        return "\0".join([self.name, self.description, *self.tags]).lower()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the template index (thumbnail paths are not stored)."""
+        return {
+            "name": self.name,
+            "filepath": str(self.filepath),
+            "category": self.category,
+            "description": self.description,
+            "tags": list(self.tags),
+            "author": self.author,
+            "schema_version": self.schema_version,
+            "page_size_px": list(self.page_size_px),
+            "extends": self.extends,
+            "block_count": self.block_count,
+            "last_modified": self.last_modified.timestamp() if self.last_modified else None,
+            "inheritance_chain": list(self.inheritance_chain),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TemplateMetadata":
+        """Deserialize an index entry."""
+        modified = data.get("last_modified")
+        return cls(
+            name=data["name"],
+            filepath=Path(data["filepath"]),
+            category=data.get("category", "custom"),
+            description=data.get("description", ""),
+            tags=list(data.get("tags", [])),
+            author=data.get("author", ""),
+            schema_version=data.get("schema_version", "1.0"),
+            page_size_px=tuple(data.get("page_size_px", (2480, 3508))),
+            extends=data.get("extends"),
+            block_count=data.get("block_count", 0),
+            last_modified=datetime.fromtimestamp(modified) if modified is not None else None,
+            inheritance_chain=list(data.get("inheritance_chain", [])),
+        )
 
     def matches_search(self, query: str) -> bool:
         """Check if template matches search query"""
@@ -182,31 +235,56 @@ class TemplateValidator:
 class TemplatePreviewGenerator:
     """Generates preview thumbnails for templates"""
 
-    def __init__(self, cache_dir: Optional[Path] = None):
-        config = ConfigManager()
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        sizes: Tuple[Tuple[int, int], ...] = PREVIEW_SIZES,
+        workers: Optional[int] = None
+    ):
+        """
+        Initialize the preview generator
+
+        Args:
+            cache_dir: Directory for cached preview PNGs
+            sizes: Sizes rendered by background pre-rendering
+            workers: Background worker threads (default: up to 4)
+        """
         if cache_dir is None:
+            config = ConfigManager()
             cache_dir = config.config_dir / "template_cache"
 
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.preview_size = (256, 256)
-
-    def get_cache_path(self, template_path: Path) -> Path:
-        """Get cached preview path for template"""
+        self.sizes = tuple(tuple(size) for size in sizes)
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_cache_path(self, template_path: Path, size: Optional[Tuple[int, int]] = None) -> Path:
+        """Get cached preview path for template at a preview size (default: preview_size)"""
+        w, h = size or self.preview_size
         # Use hash of template path + modification time for cache key
         template_stat = template_path.stat()
-        cache_key = f"{template_path.name}_{template_stat.st_mtime}"
+        cache_key = f"{template_path.name}_{template_stat.st_mtime}_{w}x{h}"
         cache_hash = hashlib.md5(cache_key.encode()).hexdigest()
         return self.cache_dir / f"{cache_hash}.png"
 
-    def get_preview(self, template_path: Path, template_data: Dict[str, Any]) -> Optional[Path]:
+    def get_preview(
+        self,
+        template_path: Path,
+        template_data: Dict[str, Any],
+        size: Optional[Tuple[int, int]] = None
+    ) -> Optional[Path]:
         """
         Get or generate preview for template
 
         Returns:
             Path to preview image, or None if generation failed
         """
-        cache_path = self.get_cache_path(template_path)
+        size = tuple(size or self.preview_size)
+        cache_path = self.get_cache_path(template_path, size)
 
         # Return cached preview if it exists
         if cache_path.exists():
@@ -215,25 +293,115 @@ class TemplatePreviewGenerator:
 
         # Generate new preview
         try:
-            preview_img = self._generate_preview(template_data)
-            preview_img.save(cache_path, "PNG")
+            preview_img = self._generate_preview(template_data, size)
+            # Background workers may race on the same file; publish atomically
+            tmp_path = cache_path.with_name(f"{cache_path.stem}.{threading.get_ident()}.tmp")
+            preview_img.save(tmp_path, "PNG")
+            tmp_path.replace(cache_path)
             logger.info(f"Generated preview for {template_path.name} -> {cache_path}")
             return cache_path
         except Exception as e:
             logger.error(f"Failed to generate preview for {template_path.name}: {e}")
             return None
 
-    def _generate_preview(self, template_data: Dict[str, Any]) -> Image.Image:
+    def prerender(self, template_path: Path, template_data: Optional[Dict[str, Any]] = None) -> Future:
+        """
+        Render all preview sizes for a template on the background pool
+
+        Sizes that are already cached are skipped. Repeated requests for a
+        template that is still queued share one job.
+
+        Args:
+            template_path: Template file
+            template_data: Parsed template, or None to read it in the worker
+
+        Returns:
+            Future resolving to {size: preview path or None}
+        """
+        key = str(template_path)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None and not pending.done():
+                return pending
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="template-preview"
+                )
+            future = self._executor.submit(self._prerender_job, Path(template_path), template_data)
+            self._pending[key] = future
+        future.add_done_callback(lambda f, key=key: self._forget(key, f))
+        return future
+
+    def _forget(self, key: str, future: Future) -> None:
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def _prerender_job(
+        self,
+        template_path: Path,
+        template_data: Optional[Dict[str, Any]]
+    ) -> Dict[Tuple[int, int], Optional[Path]]:
+        results: Dict[Tuple[int, int], Optional[Path]] = {}
+        try:
+            missing = [s for s in self.sizes if not self.get_cache_path(template_path, s).exists()]
+            if missing and template_data is None:
+                with open(template_path, 'r', encoding='utf-8') as f:
+                    template_data = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to prepare previews for {template_path.name}: {e}")
+            return {size: None for size in self.sizes}
+        for size in self.sizes:
+            if size in missing:
+                results[size] = self.get_preview(template_path, template_data, size)
+            else:
+                results[size] = self.get_cache_path(template_path, size)
+        return results
+
+    def has_pending(self) -> bool:
+        """True while background preview jobs are queued or running"""
+        with self._lock:
+            return any(not f.done() for f in self._pending.values())
+
+    def wait_for_pending(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until queued preview jobs finish
+
+        Returns:
+            True if nothing is pending any more
+        """
+        with self._lock:
+            futures = list(self._pending.values())
+        for future in futures:
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                return False
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the background pool (a later prerender starts a new one)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _generate_preview(
+        self,
+        template_data: Dict[str, Any],
+        size: Optional[Tuple[int, int]] = None
+    ) -> Image.Image:
         """Generate preview thumbnail from template data"""
+        preview_size = tuple(size or self.preview_size)
         page_w, page_h = template_data.get("page_size_px", [2480, 3508])
 
         # Calculate scale to fit preview size
-        scale = min(self.preview_size[0] / page_w, self.preview_size[1] / page_h)
+        scale = min(preview_size[0] / page_w, preview_size[1] / page_h)
         preview_w = int(page_w * scale)
         preview_h = int(page_h * scale)
 
         # Create canvas with padding
-        canvas = Image.new("RGB", self.preview_size, "#F8F9FA")
+        canvas = Image.new("RGB", preview_size, "#F8F9FA")
         preview = Image.new("RGB", (preview_w, preview_h), "#FFFFFF")
         draw = ImageDraw.Draw(preview)
 
@@ -268,8 +436,8 @@ class TemplatePreviewGenerator:
                         draw.rectangle([x + 4, y + i + 2, x + w - 4, y + i + 4], fill="#F59E0B")
 
         # Center preview on canvas
-        offset_x = (self.preview_size[0] - preview_w) // 2
-        offset_y = (self.preview_size[1] - preview_h) // 2
+        offset_x = (preview_size[0] - preview_w) // 2
+        offset_y = (preview_size[1] - preview_h) // 2
         canvas.paste(preview, (offset_x, offset_y))
 
         # Draw border
@@ -285,28 +453,65 @@ class TemplatePreviewGenerator:
     def clear_cache(self, template_path: Optional[Path] = None):
         """Clear preview cache (all or specific template)"""
         if template_path:
-            cache_path = self.get_cache_path(template_path)
-            if cache_path.exists():
-                cache_path.unlink()
-                logger.info(f"Cleared cache for {template_path.name}")
+            for size in {self.preview_size, *self.sizes}:
+                cache_path = self.get_cache_path(template_path, size)
+                if cache_path.exists():
+                    cache_path.unlink()
+            logger.info(f"Cleared cache for {template_path.name}")
         else:
             for cache_file in self.cache_dir.glob("*.png"):
                 cache_file.unlink()
             logger.info("Cleared all preview cache")
 
 
+def merge_template_data(parent_data: Dict[str, Any], child_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply a child template on top of its (already resolved) parent
+
+    Blocks are merged by ID and variables are merged; every other child
+    property replaces the parent's.
+    """
+    merged = copy.deepcopy(parent_data)
+
+    # Override with child properties
+    for key, value in child_data.items():
+        if key == "extends":
+            continue  # Don't copy extends field
+        elif key == "blocks":
+            # Merge blocks by ID
+            parent_blocks = {b["id"]: b for b in merged.get("blocks", []) if "id" in b}
+            child_blocks = {b["id"]: b for b in value if "id" in b}
+            parent_blocks.update(child_blocks)
+            merged["blocks"] = list(parent_blocks.values())
+        elif key == "variables":
+            # Merge variables
+            merged.setdefault("variables", {}).update(value)
+        else:
+            merged[key] = value
+
+    return merged
+
+
 class TemplateManager:
     """
     Manages template discovery, loading, validation, and caching
     """
 
-    def __init__(self, template_dirs: Optional[List[Path]] = None):
+    def __init__(
+        self,
+        template_dirs: Optional[List[Path]] = None,
+        cache_dir: Optional[Path] = None,
+        preview_workers: Optional[int] = None
+    ):
         """
         Initialize template manager
 
         Args:
             template_dirs: List of directories to search for templates
                           If None, uses ConfigManager.get_templates_dir()
+            cache_dir: Directory for the template index and previews
+                       If None, uses <config dir>/template_cache
+            preview_workers: Threads pre-rendering previews in the background
         """
         config = ConfigManager()
 
@@ -316,20 +521,28 @@ class TemplateManager:
 
         self.template_dirs = [Path(d) for d in template_dirs]
         self.validator = TemplateValidator()
-        self.preview_generator = TemplatePreviewGenerator()
+        self.preview_generator = TemplatePreviewGenerator(cache_dir, workers=preview_workers)
+        self.index_path = self.preview_generator.cache_dir / "template_index.json"
 
         # Template registry
         self._templates: Dict[str, TemplateMetadata] = {}
         self._template_data_cache: Dict[str, Dict[str, Any]] = {}
+        # In-memory search index: key -> lowercased searchable text
+        self._search_text: Dict[str, str] = {}
+        self._by_category: Dict[str, List[str]] = {}
 
         logger.info(f"Initialized TemplateManager with directories: {self.template_dirs}")
 
-    def discover_templates(self, rescan: bool = False) -> List[TemplateMetadata]:
+    def discover_templates(self, rescan: bool = False, prerender: bool = True) -> List[TemplateMetadata]:
         """
         Discover all templates in configured directories
 
+        Files whose mtime and size match the persisted index are not parsed
+        again. Missing previews are queued on the background pool.
+
         Args:
             rescan: If True, force rescan even if templates are cached
+            prerender: If True, queue preview rendering for discovered templates
 
         Returns:
             List of template metadata
@@ -338,6 +551,10 @@ class TemplateManager:
             return list(self._templates.values())
 
         self._templates.clear()
+        index = self._load_index()
+        new_index: Dict[str, Dict[str, Any]] = {}
+        found: List[Tuple[str, TemplateMetadata]] = []
+        parsed = 0
 
         for template_dir in self.template_dirs:
             if not template_dir.exists():
@@ -347,16 +564,46 @@ class TemplateManager:
             # Find all .json files
             for json_file in template_dir.rglob("*.json"):
                 try:
-                    metadata = self._load_template_metadata(json_file)
-                    if metadata:
-                        # Use filename without extension as key
-                        key = json_file.stem
-                        self._templates[key] = metadata
-                        logger.debug(f"Discovered template: {key} ({metadata.name})")
-                except Exception as e:
+                    stat = json_file.stat()
+                except OSError as e:
                     logger.error(f"Failed to load template {json_file}: {e}")
-
-        logger.info(f"Discovered {len(self._templates)} templates")
+                    continue
+
+                entry = index.get(str(json_file))
+                if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+                    raw = entry.get("metadata")
+                    metadata = TemplateMetadata.from_dict(raw) if raw else None
+                else:
+                    parsed += 1
+                    metadata = self._load_template_metadata(json_file)
+                new_index[str(json_file)] = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "metadata": None,  # Invalid files are remembered too
+                }
+
+                if metadata:
+                    found.append((str(json_file), metadata))
+                    # Use filename without extension as key
+                    key = json_file.stem
+                    self._templates[key] = metadata
+                    logger.debug(f"Discovered template: {key} ({metadata.name})")
+
+        self._resolve_chains()
+        for path, metadata in found:
+            metadata.thumbnail_path = self.preview_generator.get_cache_path(metadata.filepath)
+            new_index[path]["metadata"] = metadata.to_dict()
+
+        if parsed or new_index != index:
+            self._save_index(new_index)
+            self._template_data_cache.clear()
+        self._build_search_index()
+
+        if prerender:
+            for metadata in self._templates.values():
+                self.preview_generator.prerender(metadata.filepath)
+
+        logger.info(f"Discovered {len(self._templates)} templates ({parsed} parsed)")
         return list(self._templates.values())
 
     def _load_template_metadata(self, filepath: Path) -> Optional[TemplateMetadata]:
@@ -378,7 +625,7 @@ class TemplateManager:
             stat = filepath.stat()
             page_size = tuple(data.get("page_size_px", [2480, 3508]))
 
-            metadata = TemplateMetadata(
+            return TemplateMetadata(
                 name=data.get("name", filepath.stem),
                 filepath=filepath,
                 category=data.get("category", "custom"),
@@ -392,12 +639,6 @@ class TemplateManager:
                 last_modified=datetime.fromtimestamp(stat.st_mtime)
             )
 
-            # Generate preview
-            preview_path = self.preview_generator.get_preview(filepath, data)
-            metadata.thumbnail_path = preview_path
-
-            return metadata
-
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in {filepath}: {e}")
             return None
@@ -405,6 +646,52 @@ class TemplateManager:
             logger.error(f"Failed to load metadata from {filepath}: {e}")
             return None
 
+    def _resolve_chains(self):
+        """Set each template's inheritance chain (own key first, then ancestors)"""
+        for key, metadata in self._templates.items():
+            chain = [key]
+            parent = metadata.extends
+            while parent:
+                if parent in chain:
+                    logger.warning(f"Template inheritance cycle: {' -> '.join(chain + [parent])}")
+                    break
+                parent_meta = self._templates.get(parent)
+                if parent_meta is None:
+                    logger.warning(f"Base template not found: {parent}")
+                    break
+                chain.append(parent)
+                parent = parent_meta.extends
+            metadata.inheritance_chain = chain
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"Failed to load template index: {e}")
+            return {}
+        # Validation results depend on whether jsonschema is available
+        if data.get("version") != INDEX_VERSION or data.get("jsonschema") != HAS_JSONSCHEMA:
+            return {}
+        return data.get("templates", {})
+
+    def _save_index(self, templates: Dict[str, Dict[str, Any]]):
+        payload = {"version": INDEX_VERSION, "jsonschema": HAS_JSONSCHEMA, "templates": templates}
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+            tmp_path.replace(self.index_path)
+        except OSError as e:
+            logger.warning(f"Failed to save template index: {e}")
+
+    def _build_search_index(self):
+        self._search_text = {key: t.search_text() for key, t in self._templates.items()}
+        self._by_category = {}
+        for key, template in self._templates.items():
+            self._by_category.setdefault(template.category, []).append(key)
+
     def get_template(self, template_key: str) -> Optional[TemplateMetadata]:
         """Get template metadata by key (filename without extension)"""
         if not self._templates:
@@ -431,52 +718,29 @@ class TemplateManager:
             logger.error(f"Template not found: {template_key}")
             return None
 
-        # Load JSON
+        # Start from the nearest ancestor that is already resolved
+        chain = metadata.inheritance_chain or [template_key]
+        merged: Optional[Dict[str, Any]] = None
+        unresolved = chain
+        for i, key in enumerate(chain[1:], start=1):
+            if key in self._template_data_cache:
+                merged = self._template_data_cache[key]
+                unresolved = chain[:i]
+                break
+
+        # Load JSON from the root down, caching each resolved level
         try:
-            with open(metadata.filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Resolve inheritance if needed
-            if metadata.extends:
-                data = self._resolve_inheritance(data, metadata.extends)
-
-            # Cache and return
-            self._template_data_cache[template_key] = data
-            return data
+            for key in reversed(unresolved):
+                with open(self._templates[key].filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                merged = data if merged is None else merge_template_data(merged, data)
+                self._template_data_cache[key] = merged
+            return merged
 
         except Exception as e:
             logger.error(f"Failed to load template data for {template_key}: {e}")
             return None
 
-    def _resolve_inheritance(self, child_data: Dict[str, Any], parent_key: str) -> Dict[str, Any]:
-        """Resolve template inheritance"""
-        parent_data = self.load_template_data(parent_key)
-        if not parent_data:
-            logger.warning(f"Base template not found: {parent_key}")
-            return child_data
-
-        # Deep copy parent data
-        import copy
-        merged = copy.deepcopy(parent_data)
-
-        # Override with child properties
-        for key, value in child_data.items():
-            if key == "extends":
-                continue  # Don't copy extends field
-            elif key == "blocks":
-                # Merge blocks by ID
-                parent_blocks = {b["id"]: b for b in merged.get("blocks", []) if "id" in b}
-                child_blocks = {b["id"]: b for b in value if "id" in b}
-                parent_blocks.update(child_blocks)
-                merged["blocks"] = list(parent_blocks.values())
-            elif key == "variables":
-                # Merge variables
-                merged.setdefault("variables", {}).update(value)
-            else:
-                merged[key] = value
-
-        return merged
-
     def search_templates(
         self,
         query: Optional[str] = None,
@@ -486,6 +750,8 @@ class TemplateManager:
         """
         Search templates by query, category, and tags
 
+        Runs against the in-memory index built by discover_templates.
+
         Args:
             query: Text search in name/description/tags
             category: Filter by category
@@ -497,22 +763,23 @@ class TemplateManager:
         if not self._templates:
             self.discover_templates()
 
-        results = list(self._templates.values())
+        # Filter by category
+        if category:
+            keys = self._by_category.get(category, [])
+        else:
+            keys = list(self._templates)
 
         # Filter by query
         if query:
-            results = [t for t in results if t.matches_search(query)]
+            query_lower = query.lower()
+            keys = [k for k in keys if query_lower in self._search_text[k]]
 
-        # Filter by category
-        if category:
-            results = [t for t in results if t.category == category]
+        results = [self._templates[k] for k in keys]
 
         # Filter by tags
         if tags:
-            results = [
-                t for t in results
-                if any(tag in t.tags for tag in tags)
-            ]
+            wanted = set(tags)
+            results = [t for t in results if not wanted.isdisjoint(t.tags)]
 
         return results
 
@@ -17,6 +17,7 @@ except ImportError:
     HYPHENATION_AVAILABLE = False
 
 from core.logging_config import LogManager
+from .line_breaking import FontWidths, font_widths, optimal_breaks
 from .models import TextStyle
 
 logger = LogManager().get_logger("layout.text")
@@ -47,16 +48,20 @@ class TextLayoutEngine:
     - Widow/orphan control
     - Multi-paragraph handling
     - Letter spacing adjustment
+    - Greedy or optimal (Knuth–Plass) line breaking
     """
 
-    def __init__(self, language: str = "en_US"):
+    def __init__(self, language: str = "en_US", line_breaking: str = "greedy"):
         """
         Initialize the text layout engine.
 
         Args:
             language: Language code for hyphenation (e.g., 'en_US', 'en_GB')
+            line_breaking: "greedy" (first fit, with hyphenation) or "optimal"
+                (total-fit, evens out line lengths; no hyphenation)
         """
         self.language = language
+        self.line_breaking = line_breaking
         self.hyphenator = None
 
         if HYPHENATION_AVAILABLE:
@@ -163,17 +168,24 @@ class TextLayoutEngine:
         style: TextStyle,
         draw: ImageDraw.ImageDraw
     ) -> List[LayoutLine]:
-        """Wrap a single paragraph into lines."""
+        """Wrap a single paragraph into lines using cached word widths."""
         words = text.split()
+        fw = font_widths(font)
+        widths = fw.words(words)
+
+        if self.line_breaking == "optimal":
+            return [
+                LayoutLine(text=' '.join(words[start:end]), width=width, word_count=end - start)
+                for start, end, width in optimal_breaks(widths, fw.space, max_width)
+            ]
+
         lines = []
         current_line = []
-        current_width = 0
+        current_width = 0.0
 
-        for word in words:
+        for word, word_width in zip(words, widths):
             # Try adding this word to current line
-            test_line = current_line + [word]
-            test_text = ' '.join(test_line)
-            test_width = draw.textlength(test_text, font=font)
+            test_width = current_width + fw.space + word_width if current_line else word_width
 
             if test_width <= max_width or not current_line:
                 # Word fits or it's the first word
@@ -184,13 +196,12 @@ class TextLayoutEngine:
                 if self.hyphenator and style.wrap == "word" and len(word) > 6:
                     # Try to hyphenate and fit part of the word
                     hyphenated = self._try_hyphenate(
-                        word, current_line, font, max_width, draw
+                        word, current_line, current_width, fw, max_width
                     )
 
                     if hyphenated:
                         # Successfully hyphenated
-                        line_text, remaining = hyphenated
-                        line_width = draw.textlength(line_text, font=font)
+                        line_text, line_width, remaining = hyphenated
                         lines.append(LayoutLine(
                             text=line_text,
                             width=line_width,
@@ -199,7 +210,7 @@ class TextLayoutEngine:
                         ))
                         # Start new line with remaining part
                         current_line = [remaining]
-                        current_width = draw.textlength(remaining, font=font)
+                        current_width = fw.width(remaining)
                         continue
 
                 # Hyphenation didn't work, finish current line
@@ -212,7 +223,7 @@ class TextLayoutEngine:
 
                 # Start new line with current word
                 current_line = [word]
-                current_width = draw.textlength(word, font=font)
+                current_width = word_width
 
         # Add remaining line
         if current_line:
@@ -229,15 +240,15 @@ class TextLayoutEngine:
         self,
         word: str,
         current_line: List[str],
-        font: ImageFont.FreeTypeFont,
-        max_width: int,
-        draw: ImageDraw.ImageDraw
-    ) -> Optional[Tuple[str, str]]:
+        current_width: float,
+        widths: FontWidths,
+        max_width: int
+    ) -> Optional[Tuple[str, float, str]]:
         """
         Try to hyphenate a word to fit on the current line.
 
         Returns:
-            Tuple of (line_with_hyphen, remaining_text) or None if can't hyphenate
+            Tuple of (line_with_hyphen, its_width, remaining_text) or None if can't hyphenate
         """
         if not self.hyphenator:
             return None
@@ -252,12 +263,9 @@ class TextLayoutEngine:
             remaining = '-'.join(parts[i:])
 
             # Test if this fits
-            test_line = current_line + [prefix]
-            test_text = ' '.join(test_line)
-            test_width = draw.textlength(test_text, font=font)
-
+            test_width = current_width + widths.space + widths.width(prefix)
             if test_width <= max_width:
-                return (test_text, remaining)
+                return (' '.join(current_line + [prefix]), test_width, remaining)
 
         return None
 
@@ -367,16 +375,15 @@ class TextLayoutEngine:
         # Draw words with adjusted spacing
         x, y = origin
         color = self._hex_to_rgb(style.color)
+        fw = font_widths(font)
 
         for i, word in enumerate(words):
             draw.text((x, y), word, fill=color, font=font)
-            word_width = draw.textlength(word, font=font)
-            x += word_width
+            x += fw.width(word)
 
             if i < len(words) - 1:
                 # Add space plus extra for justification
-                space_width = draw.textlength(' ', font=font)
-                x += space_width + space_per_gap
+                x += fw.space + space_per_gap
 
     def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color to RGB tuple."""
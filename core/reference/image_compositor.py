@@ -6,11 +6,14 @@ image generation models that have multi-person/character limitations.
 """
 
 import logging
+from io import BytesIO
 from pathlib import Path
 from typing import List, Tuple, Optional
 from PIL import Image, ImageDraw, ImageFont
 import math
 
+from .reference_cache import ReferenceCache, get_reference_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,14 +29,17 @@ class ReferenceImageCompositor:
     BACKGROUND_COLOR = (255, 255, 255, 0)  # Transparent white
     PADDING = 20  # Padding between images and edges
 
-    def __init__(self, canvas_size: int = DEFAULT_CANVAS_SIZE):
+    def __init__(self, canvas_size: int = DEFAULT_CANVAS_SIZE,
+                 cache: Optional[ReferenceCache] = None):
         """
         Initialize compositor.
 
         Args:
             canvas_size: Size of square canvas (width = height)
+            cache: Reference cache for sources and composites (defaults to the shared cache)
         """
         self.canvas_size = canvas_size
+        self.cache = cache or get_reference_cache()
         self.logger = logging.getLogger(__name__)
 
     def composite_images(
@@ -58,53 +64,29 @@ class ReferenceImageCompositor:
             return None
 
         try:
-            # Load all images
-            images = []
+            valid_paths = []
             for img_path in image_paths:
                 if not img_path.exists():
                     self.logger.warning(f"Image not found: {img_path}")
                     continue
+                valid_paths.append(img_path)
 
-                img = Image.open(img_path)
-                # Convert to RGBA for transparency support
-                if img.mode != 'RGBA':
-                    img = img.convert('RGBA')
-                images.append(img)
-
-            if not images:
+            if not valid_paths:
                 self.logger.error("No valid images loaded")
                 return None
 
-            self.logger.info(
-                f"Compositing {len(images)} images into {self.canvas_size}x{self.canvas_size} canvas"
+            # The composite only depends on the source contents and layout
+            # settings, so identical requests reuse the cached encoded canvas.
+            is_jpeg = output_path.suffix.lower() in ['.jpg', '.jpeg']
+            variant = f"composite:{self.canvas_size}:{arrangement}:{'jpeg' if is_jpeg else 'png'}"
+            source_hashes = [self.cache.source_hash(p) for p in valid_paths]
+            data = self.cache.get_or_build(
+                source_hashes, variant,
+                lambda: self._render_composite(valid_paths, arrangement, is_jpeg)
             )
 
-            # Create transparent square canvas
-            canvas = Image.new('RGBA', (self.canvas_size, self.canvas_size), self.BACKGROUND_COLOR)
-
-            # Arrange images based on layout
-            if arrangement == "grid":
-                self._arrange_grid(canvas, images)
-            elif arrangement == "horizontal":
-                self._arrange_horizontal(canvas, images)
-            elif arrangement == "vertical":
-                self._arrange_vertical(canvas, images)
-            else:
-                self.logger.warning(f"Unknown arrangement: {arrangement}, using grid")
-                self._arrange_grid(canvas, images)
-
-            # Save composite
             output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Convert to RGB if saving as JPEG
-            if output_path.suffix.lower() in ['.jpg', '.jpeg']:
-                # Create white background for JPEG
-                rgb_canvas = Image.new('RGB', canvas.size, (255, 255, 255))
-                rgb_canvas.paste(canvas, mask=canvas.split()[3] if canvas.mode == 'RGBA' else None)
-                rgb_canvas.save(output_path, quality=95)
-            else:
-                # Save as PNG with transparency
-                canvas.save(output_path)
+            output_path.write_bytes(data)
 
             self.logger.info(f"✓ Composite saved: {output_path}")
             return output_path
@@ -113,6 +95,56 @@ class ReferenceImageCompositor:
             self.logger.error(f"Failed to composite images: {e}", exc_info=True)
             return None
 
+    def _render_composite(self, image_paths: List[Path], arrangement: str, is_jpeg: bool) -> bytes:
+        """
+        Render the composite canvas and encode it.
+
+        Args:
+            image_paths: Existing image paths to composite
+            arrangement: Layout arrangement ("grid", "horizontal", "vertical")
+            is_jpeg: Encode as JPEG on white instead of transparent PNG
+
+        Returns:
+            Encoded image bytes
+        """
+        # Load all images
+        images = []
+        for img_path in image_paths:
+            img = Image.open(BytesIO(self.cache.source_bytes(img_path)))
+            # Convert to RGBA for transparency support
+            if img.mode != 'RGBA':
+                img = img.convert('RGBA')
+            images.append(img)
+
+        self.logger.info(
+            f"Compositing {len(images)} images into {self.canvas_size}x{self.canvas_size} canvas"
+        )
+
+        # Create transparent square canvas
+        canvas = Image.new('RGBA', (self.canvas_size, self.canvas_size), self.BACKGROUND_COLOR)
+
+        # Arrange images based on layout
+        if arrangement == "grid":
+            self._arrange_grid(canvas, images)
+        elif arrangement == "horizontal":
+            self._arrange_horizontal(canvas, images)
+        elif arrangement == "vertical":
+            self._arrange_vertical(canvas, images)
+        else:
+            self.logger.warning(f"Unknown arrangement: {arrangement}, using grid")
+            self._arrange_grid(canvas, images)
+
+        output = BytesIO()
+        if is_jpeg:
+            # Create white background for JPEG
+            rgb_canvas = Image.new('RGB', canvas.size, (255, 255, 255))
+            rgb_canvas.paste(canvas, mask=canvas.split()[3] if canvas.mode == 'RGBA' else None)
+            rgb_canvas.save(output, format='JPEG', quality=95)
+        else:
+            # Save as PNG with transparency
+            canvas.save(output, format='PNG')
+        return output.getvalue()
+
     def _arrange_grid(self, canvas: Image.Image, images: List[Image.Image]):
         """
         Arrange images in a grid layout.
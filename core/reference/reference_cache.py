@@ -0,0 +1,465 @@
+"""
+Content-addressed cache for normalized reference image payloads.
+
+Reference images are re-sent with every generation request: the same three
+character sheets go to every scene of a video project, and the same source
+photo goes to every edit. Reading, resizing, padding and re-encoding them each
+time is wasted work, so the normalized bytes are cached here keyed by the
+SHA-256 of the source content plus a variant string describing the target
+provider, size and format.
+
+Entries live in an in-memory LRU bounded by a byte budget. Entries evicted
+from memory are spilled to disk and promoted back on the next hit; the spill
+directory is itself an LRU bounded by a second, larger byte budget.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+ImageSource = Union[bytes, bytearray, str, Path]
+
+
+def content_hash(data: bytes) -> str:
+    """Return the SHA-256 hex digest of ``data``."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def parse_aspect_ratio(aspect_ratio: str, default: float = 16 / 9) -> float:
+    """Convert an ``"W:H"`` string to a float ratio, or ``default`` if malformed."""
+    if aspect_ratio and ':' in aspect_ratio:
+        try:
+            w, h = aspect_ratio.split(':')
+            return float(w) / float(h)
+        except (ValueError, ZeroDivisionError):
+            pass
+    return default
+
+
+def pad_to_aspect(img: Image.Image, expected_aspect: float) -> Image.Image:
+    """
+    Center an image on a transparent canvas with the expected aspect ratio.
+
+    The canvas is sized from the reference's largest dimension and grown if
+    needed so the reference always fits without scaling.
+
+    Args:
+        img: Reference image
+        expected_aspect: Target width / height
+
+    Returns:
+        RGBA canvas containing the centered reference
+    """
+    ref_width, ref_height = img.size
+    max_ref_dim = max(ref_width, ref_height)
+
+    if expected_aspect >= 1.0:  # Landscape or square
+        canvas_width = max_ref_dim
+        canvas_height = int(max_ref_dim / expected_aspect)
+    else:  # Portrait
+        canvas_height = max_ref_dim
+        canvas_width = int(max_ref_dim * expected_aspect)
+
+    # Make sure canvas is large enough to contain the reference image
+    if canvas_width < ref_width:
+        canvas_width = ref_width
+        canvas_height = int(ref_width / expected_aspect)
+    if canvas_height < ref_height:
+        canvas_height = ref_height
+        canvas_width = int(ref_height * expected_aspect)
+
+    canvas = Image.new('RGBA', (canvas_width, canvas_height), (0, 0, 0, 0))
+    x_offset = (canvas_width - ref_width) // 2
+    y_offset = (canvas_height - ref_height) // 2
+    img_rgba = img if img.mode == 'RGBA' else img.convert('RGBA')
+    canvas.paste(img_rgba, (x_offset, y_offset), img_rgba)
+    return canvas
+
+
+def needs_aspect_padding(size: Tuple[int, int], expected_aspect: float, tolerance: float = 0.1) -> bool:
+    """True when ``size`` differs from ``expected_aspect`` by more than ``tolerance``."""
+    width, height = size
+    return abs(width / height - expected_aspect) > tolerance
+
+
+class ReferenceCache:
+    """
+    Two-tier (memory LRU + disk spill) cache of normalized reference payloads.
+
+    Keys are derived from the content hashes of the source images plus a
+    variant string, so the same file referenced under different paths shares
+    an entry, and an edited file gets a new one automatically.
+    """
+
+    CACHE_VERSION = "v1"
+    DEFAULT_MEMORY_BUDGET = 128 * 1024 * 1024  # 128 MB
+    DEFAULT_DISK_BUDGET = 1024 * 1024 * 1024  # 1 GB
+
+    def __init__(self, cache_dir: Optional[Path] = None,
+                 memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                 disk_budget: int = DEFAULT_DISK_BUDGET):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for spilled entries
+            memory_budget: Maximum bytes held in memory before spilling
+            disk_budget: Maximum bytes kept in the spill directory before the
+                least recently used files are deleted
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".imageai" / "cache" / "references"
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_used = 0
+        # Spilled key -> file size in LRU order, loaded from the directory
+        # (oldest mtime first) on first use
+        self._disk_entries: Optional["OrderedDict[str, int]"] = None
+        self._disk_used = 0
+        # (resolved path, mtime_ns, size) -> content hash, so unchanged files
+        # are hashed once per session
+        self._file_hashes: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------ sources
+
+    def read_source(self, source: ImageSource) -> Tuple[bytes, str]:
+        """
+        Load a reference source and return ``(bytes, content_hash)``.
+
+        Args:
+            source: Raw image bytes or a path to an image file
+
+        Raises:
+            FileNotFoundError: If a path does not exist
+            TypeError: For unsupported source types
+        """
+        if isinstance(source, (bytes, bytearray)):
+            data = bytes(source)
+            return data, content_hash(data)
+        if isinstance(source, (str, Path)):
+            path = Path(source)
+            if not path.exists():
+                raise FileNotFoundError(f"Reference image not found: {path}")
+            data = path.read_bytes()
+            return data, self._remember_file_hash(path, data)
+        raise TypeError(f"Unsupported image input type: {type(source).__name__}")
+
+    def source_hash(self, source: ImageSource) -> str:
+        """Content hash of a source, reading the file only if its stat changed."""
+        if isinstance(source, (str, Path)):
+            cached = self._known_file_hash(Path(source))
+            if cached:
+                return cached
+        return self.read_source(source)[1]
+
+    def source_bytes(self, source: ImageSource) -> bytes:
+        """
+        Raw bytes of a source, served from the cache for unchanged files.
+
+        Args:
+            source: Raw image bytes or a path to an image file
+        """
+        if isinstance(source, (bytes, bytearray)):
+            return bytes(source)
+        path = Path(source)
+        digest = self._known_file_hash(path)
+        if digest:
+            data = self.get(self.make_key([digest], "raw"))
+            if data is not None:
+                self.hits += 1
+                return data
+        data, digest = self.read_source(path)
+        self.misses += 1
+        self.put(self.make_key([digest], "raw"), data)
+        return data
+
+    def _load(self, source: ImageSource) -> Tuple[str, Callable[[], bytes]]:
+        """Return a source's content hash and a loader for its bytes."""
+        if isinstance(source, (str, Path)):
+            return self.source_hash(source), lambda: self.source_bytes(source)
+        data, digest = self.read_source(source)
+        return digest, lambda: data
+
+    def _known_file_hash(self, path: Path) -> Optional[str]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        stamp = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            return self._file_hashes.get(stamp)
+
+    def _remember_file_hash(self, path: Path, data: bytes) -> str:
+        digest = content_hash(data)
+        try:
+            stat = path.stat()
+            stamp = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+            with self._lock:
+                self._file_hashes[stamp] = digest
+        except OSError:
+            pass
+        return digest
+
+    # ------------------------------------------------------------------ entries
+
+    def make_key(self, source_hashes: Iterable[str], variant: str) -> str:
+        """Build the cache key for a set of sources and a target variant."""
+        parts = [self.CACHE_VERSION, variant, *source_hashes]
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached bytes for ``key`` from memory or disk, or None."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                return data
+
+        spill_path = self.cache_dir / f"{key}.bin"
+        if spill_path.exists():
+            try:
+                data = spill_path.read_bytes()
+            except OSError as e:
+                logger.warning(f"Failed to read spilled reference entry: {e}")
+                return None
+            self._touch_disk_entry(key, spill_path)
+            self._store(key, data)
+            return data
+        return None
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key``, spilling older entries past the budget."""
+        self._store(key, data)
+
+    def get_or_build(self, source_hashes: Iterable[str], variant: str,
+                     build: Callable[[], bytes]) -> bytes:
+        """
+        Return the cached payload for the given sources and variant, building it on a miss.
+
+        Args:
+            source_hashes: Content hashes of every input that affects the payload
+            variant: Target description, e.g. ``"veo:pad=1.778:png"``
+            build: Callable producing the payload bytes
+
+        Returns:
+            Payload bytes
+        """
+        key = self.make_key(source_hashes, variant)
+        data = self.get(key)
+        if data is not None:
+            self.hits += 1
+            logger.debug(f"Reference cache hit for {variant}")
+            return data
+        self.misses += 1
+        data = build()
+        self.put(key, data)
+        return data
+
+    def clear(self) -> None:
+        """Drop all memory and disk entries."""
+        with self._lock:
+            self._entries.clear()
+            self._memory_used = 0
+            self._file_hashes.clear()
+            self._disk_entries = None
+            self._disk_used = 0
+        if self.cache_dir.exists():
+            for spill_file in self.cache_dir.glob("*.bin"):
+                try:
+                    spill_file.unlink()
+                except OSError:
+                    pass
+
+    @property
+    def memory_used(self) -> int:
+        """Bytes currently held in memory."""
+        return self._memory_used
+
+    @property
+    def disk_used(self) -> int:
+        """Bytes currently held in the spill directory."""
+        with self._lock:
+            self._load_disk_entries()
+            return self._disk_used
+
+    def _store(self, key: str, data: bytes) -> None:
+        spilled = []
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._memory_used -= len(previous)
+            self._entries[key] = data
+            self._memory_used += len(data)
+            while self._memory_used > self.memory_budget and len(self._entries) > 1:
+                old_key, old_data = self._entries.popitem(last=False)
+                self._memory_used -= len(old_data)
+                spilled.append((old_key, old_data))
+        for old_key, old_data in spilled:
+            self._spill(old_key, old_data)
+
+    def _spill(self, key: str, data: bytes) -> None:
+        spill_path = self.cache_dir / f"{key}.bin"
+        if spill_path.exists():
+            self._touch_disk_entry(key, spill_path)
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = spill_path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(spill_path)
+        except OSError as e:
+            logger.warning(f"Failed to spill reference entry to disk: {e}")
+            return
+        with self._lock:
+            self._load_disk_entries()
+            self._disk_used -= self._disk_entries.pop(key, 0)
+            self._disk_entries[key] = len(data)
+            self._disk_used += len(data)
+        self._prune_disk()
+
+    def _load_disk_entries(self) -> None:
+        """Index the spill directory by mtime the first time it is needed (lock held)."""
+        if self._disk_entries is not None:
+            return
+        found = []
+        if self.cache_dir.exists():
+            for spill_file in self.cache_dir.glob("*.bin"):
+                try:
+                    stat = spill_file.stat()
+                except OSError:
+                    continue
+                found.append((stat.st_mtime_ns, spill_file.stem, stat.st_size))
+        found.sort()
+        self._disk_entries = OrderedDict((key, size) for _, key, size in found)
+        self._disk_used = sum(size for _, _, size in found)
+
+    def _touch_disk_entry(self, key: str, spill_path: Path) -> None:
+        """Mark a spilled entry as recently used, in the index and on disk."""
+        with self._lock:
+            self._load_disk_entries()
+            if key in self._disk_entries:
+                self._disk_entries.move_to_end(key)
+        try:
+            os.utime(spill_path)
+        except OSError:
+            pass
+
+    def _prune_disk(self) -> None:
+        """Delete least recently used spill files until under the disk budget."""
+        doomed = []
+        with self._lock:
+            while self._disk_used > self.disk_budget and len(self._disk_entries) > 1:
+                old_key, size = self._disk_entries.popitem(last=False)
+                self._disk_used -= size
+                doomed.append(old_key)
+        for old_key in doomed:
+            try:
+                (self.cache_dir / f"{old_key}.bin").unlink()
+            except OSError:
+                pass
+
+    # --------------------------------------------------------------- payloads
+
+    def padded_reference(self, source: ImageSource, expected_aspect: float,
+                         variant_prefix: str, tolerance: float = 0.1,
+                         on_padded: Optional[Callable[[Image.Image], None]] = None,
+                         passthrough: bool = False) -> bytes:
+        """
+        PNG bytes of a reference centered on a canvas of the expected aspect ratio.
+
+        References already within ``tolerance`` of the target aspect are
+        re-encoded as PNG without padding, unless ``passthrough`` is set, in
+        which case their original bytes (in their original format) are returned.
+
+        Args:
+            source: Raw image bytes or path
+            expected_aspect: Target width / height
+            variant_prefix: Provider tag included in the cache key
+            tolerance: Aspect difference below which no padding is applied
+            on_padded: Optional hook called with the canvas when padding is built
+            passthrough: Return unpadded references unchanged instead of as PNG
+
+        Returns:
+            Image bytes (always PNG unless ``passthrough`` returned the original)
+        """
+        digest, load = self._load(source)
+
+        if passthrough:
+            original = load()
+            # Image.open only parses the header here; no pixels are decoded
+            with Image.open(BytesIO(original)) as probe:
+                size = probe.size
+            if not needs_aspect_padding(size, expected_aspect, tolerance):
+                return original
+
+        def build() -> bytes:
+            img = Image.open(BytesIO(load()))
+            if needs_aspect_padding(img.size, expected_aspect, tolerance):
+                logger.info(f"Aspect ratio adjustment: Reference image is {img.width}x{img.height} "
+                            f"(aspect {img.width / img.height:.2f}), padding to aspect {expected_aspect:.2f}")
+                img = pad_to_aspect(img, expected_aspect)
+                if on_padded is not None:
+                    on_padded(img)
+            out = BytesIO()
+            img.save(out, format='PNG')
+            return out.getvalue()
+
+        variant = f"{variant_prefix}:pad={expected_aspect:.4f}:tol={tolerance}:png"
+        return self.get_or_build([digest], variant, build)
+
+    def fitted_reference(self, source: ImageSource, max_size: int, variant_prefix: str,
+                         mode: str = 'RGB', fmt: str = 'PNG') -> bytes:
+        """
+        Encoded bytes of a reference converted to ``mode`` and shrunk to ``max_size``.
+
+        Args:
+            source: Raw image bytes or path
+            max_size: Maximum length of the longest side
+            variant_prefix: Provider tag included in the cache key
+            mode: PIL mode to convert to
+            fmt: Output format
+
+        Returns:
+            Encoded image bytes
+        """
+        digest, load = self._load(source)
+
+        def build() -> bytes:
+            img = Image.open(BytesIO(load()))
+            if img.mode != mode:
+                img = img.convert(mode)
+            width, height = img.size
+            if max(width, height) > max_size:
+                ratio = max_size / max(width, height)
+                img = img.resize((int(width * ratio), int(height * ratio)), Image.Resampling.LANCZOS)
+            out = BytesIO()
+            img.save(out, format=fmt)
+            return out.getvalue()
+
+        variant = f"{variant_prefix}:fit={max_size}:{mode}:{fmt.lower()}"
+        return self.get_or_build([digest], variant, build)
+
+
+_reference_cache: Optional[ReferenceCache] = None
+_reference_cache_lock = threading.Lock()
+
+
+def get_reference_cache() -> ReferenceCache:
+    """Return the process-wide reference cache."""
+    global _reference_cache
+    with _reference_cache_lock:
+        if _reference_cache is None:
+            _reference_cache = ReferenceCache()
+        return _reference_cache
@@ -0,0 +1,368 @@
+"""
+Shared poller for long-running video generation operations.
+
+Veo operations and Omni interactions used to each run their own fixed
+10-second polling loop. With many clips in flight that is a lot of status
+calls that mostly answer "not yet", while short clips wait up to a full
+interval after finishing.
+
+The poller multiplexes every in-flight operation on an event loop onto a
+single driver task. The next check for each operation is scheduled from the
+completion times observed for that model (persisted across sessions): wait
+until the fastest completions are due, then check more often around the
+typical completion time, and back off once past every observed completion.
+Delays get random jitter so operations submitted together don't poll in
+lockstep, and a token bucket caps status calls across all operations.
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+def _quantile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank quantile of an already sorted list."""
+    index = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+class CompletionStats:
+    """Observed completion times per model, used to schedule status checks."""
+
+    MAX_SAMPLES = 50
+    MIN_SAMPLES = 3  # Below this, fall back to the caller's base interval
+    MIN_FACTOR = 0.2  # Adaptive delays stay within [base * MIN_FACTOR, base * MAX_FACTOR]
+    MAX_FACTOR = 3.0
+
+    def __init__(self, stats_path: Optional[Path] = None):
+        """
+        Initialize the stats store.
+
+        Args:
+            stats_path: JSON file to persist samples to, or None for in-memory only
+        """
+        self.stats_path = Path(stats_path) if stats_path else None
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def record(self, model: str, seconds: float) -> None:
+        """Record how long an operation for ``model`` took to complete."""
+        with self._lock:
+            samples = self._samples.setdefault(model, deque(maxlen=self.MAX_SAMPLES))
+            samples.append(float(seconds))
+        self._save()
+
+    def samples(self, model: str) -> List[float]:
+        """Observed completion times for ``model``, sorted."""
+        with self._lock:
+            return sorted(self._samples.get(model, ()))
+
+    def next_delay(self, model: str, elapsed: float, base_interval: float) -> float:
+        """
+        Seconds to wait before the next status check.
+
+        Args:
+            model: Model the operation runs on
+            elapsed: Seconds since the operation was submitted
+            base_interval: Interval to use without enough history
+
+        Returns:
+            Delay in seconds, before jitter
+        """
+        samples = self.samples(model)
+        if len(samples) < self.MIN_SAMPLES:
+            return base_interval
+
+        low = base_interval * self.MIN_FACTOR
+        high = base_interval * self.MAX_FACTOR
+        earliest = _quantile(samples, 0.1)
+        if elapsed < earliest:
+            # Nothing of this model has finished this early; skip ahead
+            delay = earliest - elapsed
+        else:
+            later = [s for s in samples if s > elapsed]
+            if later:
+                # Check twice before the typical remaining completion time
+                delay = (_quantile(later, 0.5) - elapsed) / 2
+            else:
+                delay = high  # Slower than everything seen so far
+        return min(high, max(low, delay))
+
+    def _load(self) -> None:
+        if not self.stats_path or not self.stats_path.exists():
+            return
+        try:
+            data = json.loads(self.stats_path.read_text(encoding="utf-8"))
+            for model, values in data.get("models", {}).items():
+                self._samples[model] = deque((float(v) for v in values), maxlen=self.MAX_SAMPLES)
+        except Exception as e:
+            logger.warning(f"Failed to load operation timing stats: {e}")
+
+    def _save(self) -> None:
+        if not self.stats_path:
+            return
+        with self._lock:
+            payload = {"models": {m: list(v) for m, v in self._samples.items()}}
+        try:
+            self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.stats_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+            tmp_path.replace(self.stats_path)
+        except OSError as e:
+            logger.warning(f"Failed to save operation timing stats: {e}")
+
+
+class RequestBudget:
+    """Token bucket limiting status requests across all operations."""
+
+    def __init__(self, requests_per_minute: float = 60, burst: int = 10):
+        """
+        Initialize the budget.
+
+        Args:
+            requests_per_minute: Sustained status-call rate
+            burst: Calls that may be made back to back
+        """
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token if one is available.
+
+        Returns:
+            0.0 if the request may go ahead now, otherwise the seconds until a
+            token will be available (no token is taken in that case)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            if self.rate <= 0:
+                return float("inf")
+            return (1.0 - self._tokens) / self.rate
+
+
+@dataclass
+class _PollEntry:
+    refresh: Callable[[Any], Any]
+    is_done: Callable[[Any], bool]
+    current: Any
+    model: str
+    label: str
+    started: float
+    deadline: float
+    base_interval: float
+    max_errors: Optional[int]
+    future: "asyncio.Future"
+    errors: int = 0
+    checks: int = 0
+    task: Optional["asyncio.Task"] = None
+
+
+class LROPoller:
+    """Multiplexes status polling for all in-flight operations on one event loop."""
+
+    def __init__(self, stats: Optional[CompletionStats] = None,
+                 budget: Optional[RequestBudget] = None, jitter: float = 0.2):
+        """
+        Initialize the poller.
+
+        Args:
+            stats: Completion-time history used for adaptive intervals
+            budget: Shared limit on status calls
+            jitter: Relative random spread applied to each delay
+        """
+        self.stats = stats or CompletionStats()
+        self.budget = budget or RequestBudget()
+        self.jitter = jitter
+        self._heap: List[Any] = []
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.Future] = None
+        self._driver: Optional[asyncio.Task] = None
+        self._checks: Set[asyncio.Task] = set()
+        self.status_calls = 0
+
+    async def wait(self, refresh: Callable[[Any], Any], is_done: Callable[[Any], bool],
+                   initial: Any, model: str, timeout: float, base_interval: float = 10.0,
+                   label: str = "", max_errors: Optional[int] = 3,
+                   started: Optional[float] = None) -> Any:
+        """
+        Poll an operation until it is done or ``timeout`` elapses.
+
+        Args:
+            refresh: Blocking call taking the current state and returning a fresh one
+                (run in a worker thread)
+            is_done: Predicate on a state object
+            initial: State returned when the operation was submitted
+            model: Model key for timing statistics
+            timeout: Maximum seconds to wait
+            base_interval: Poll interval used until the model has timing history
+            label: Name used in log messages
+            max_errors: Consecutive refresh failures before giving up (None = never)
+            started: When the operation was submitted (defaults to now)
+
+        Returns:
+            The last observed state; callers check ``is_done`` on it to tell
+            completion from timeout
+
+        Raises:
+            Exception: The last refresh error once ``max_errors`` is reached
+        """
+        if is_done(initial):
+            return initial
+        loop = asyncio.get_running_loop()
+        now = time.time()
+        entry = _PollEntry(
+            refresh=refresh, is_done=is_done, current=initial, model=model, label=label,
+            started=started if started is not None else now, deadline=now + timeout,
+            base_interval=base_interval, max_errors=max_errors, future=loop.create_future(),
+        )
+        self._schedule(entry, self._delay_for(entry))
+        try:
+            return await entry.future
+        finally:
+            # Cancelled or timed out from outside: stop polling this operation
+            if not entry.future.done():
+                entry.future.cancel()
+            if entry.future.cancelled():
+                self._discard(entry)
+
+    def _delay_for(self, entry: _PollEntry) -> float:
+        elapsed = time.time() - entry.started
+        delay = self.stats.next_delay(entry.model, elapsed, entry.base_interval)
+        if self.jitter and delay > 0:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        # Never sleep past the deadline; the final check happens at the deadline
+        return max(0.0, min(delay, entry.deadline - time.time()))
+
+    def _schedule(self, entry: _PollEntry, delay: float) -> None:
+        heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), entry))
+        self._wake()
+        if self._driver is None or self._driver.done():
+            self._driver = asyncio.ensure_future(self._drive())
+
+    def _discard(self, entry: _PollEntry) -> None:
+        """Drop ``entry``'s pending check, if any, and any check in flight."""
+        remaining = [item for item in self._heap if item[2] is not entry]
+        if len(remaining) != len(self._heap):
+            heapq.heapify(remaining)
+            self._heap = remaining
+            self._wake()
+        if entry.task is not None and not entry.task.done():
+            entry.task.cancel()
+
+    def _wake(self) -> None:
+        """Make the driver re-read the heap now."""
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    async def _drive(self) -> None:
+        """Single task that sleeps until the next operation is due and dispatches its check."""
+        while self._heap:
+            due, _, entry = self._heap[0]
+            if entry.future.done():
+                heapq.heappop(self._heap)  # Waiter already left
+                continue
+            wait = due - time.monotonic()
+            if wait > 0:
+                # A bare future rather than wait_for(Event.wait()): waking the
+                # driver must not take extra tasks, or a loop closed right after
+                # its last waiter leaves would find the driver still pending.
+                loop = asyncio.get_running_loop()
+                self._wakeup = loop.create_future()
+                timer = loop.call_later(wait, self._wake)
+                try:
+                    await self._wakeup
+                finally:
+                    timer.cancel()
+                    self._wakeup = None
+                continue  # Re-read the heap head; something earlier may have been added
+            heapq.heappop(self._heap)
+            budget_wait = self.budget.reserve()
+            if budget_wait > 0:
+                heapq.heappush(self._heap, (time.monotonic() + budget_wait, next(self._seq), entry))
+                continue
+            entry.task = asyncio.ensure_future(self._check(entry))
+            self._checks.add(entry.task)
+            entry.task.add_done_callback(self._checks.discard)
+
+    async def _check(self, entry: _PollEntry) -> None:
+        entry.checks += 1
+        self.status_calls += 1
+        try:
+            state = await asyncio.to_thread(entry.refresh, entry.current)
+        except Exception as e:
+            entry.errors += 1
+            logger.warning(f"Status check failed for {entry.label or entry.model}: {e}")
+            if entry.max_errors is not None and entry.errors >= entry.max_errors:
+                if not entry.future.done():
+                    entry.future.set_exception(e)
+                return
+            if time.time() >= entry.deadline:
+                if not entry.future.done():
+                    entry.future.set_result(entry.current)
+                return
+            self._schedule(entry, self._delay_for(entry))
+            return
+
+        entry.errors = 0
+        entry.current = state
+        if entry.future.done():
+            return
+        if entry.is_done(state):
+            elapsed = time.time() - entry.started
+            self.stats.record(entry.model, elapsed)
+            logger.info(f"Operation {entry.label or entry.model} done after {elapsed:.1f}s "
+                        f"({entry.checks} status checks)")
+            entry.future.set_result(state)
+        elif time.time() >= entry.deadline:
+            entry.future.set_result(state)
+        else:
+            self._schedule(entry, self._delay_for(entry))
+
+
+_shared_stats: Optional[CompletionStats] = None
+_shared_budget: Optional[RequestBudget] = None
+_pollers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LROPoller]" = weakref.WeakKeyDictionary()
+_pollers_lock = threading.Lock()
+
+
+def get_lro_poller() -> LROPoller:
+    """
+    Return the poller for the running event loop.
+
+    Pollers are per loop (their driver task lives on it), but all of them share
+    one set of timing statistics and one request budget.
+    """
+    global _shared_stats, _shared_budget
+    loop = asyncio.get_running_loop()
+    with _pollers_lock:
+        if _shared_stats is None:
+            _shared_stats = CompletionStats(Path.home() / ".imageai" / "cache" / "lro_timings.json")
+        if _shared_budget is None:
+            _shared_budget = RequestBudget()
+        poller = _pollers.get(loop)
+        if poller is None:
+            poller = LROPoller(_shared_stats, _shared_budget)
+            _pollers[loop] = poller
+        return poller
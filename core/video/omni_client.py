@@ -31,6 +31,15 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from core.llm_models import resolve_model
+from core.reference.reference_cache import get_reference_cache
+from core.video.lro_poller import get_lro_poller
+from core.video.remote_files import (
+    RemoteFileHandle,
+    RemoteFileRegistry,
+    account_scope,
+    file_sha256,
+    get_remote_file_registry,
+)
 
 # Check if google.genai (with the Interactions API) is available.
 try:
@@ -162,7 +171,8 @@ class OmniGenerationConfig:
             # Uploaded video to edit — documented as a "document" item by URI.
             content.append({"type": "document", "uri": video_uri})
         for ref in self.reference_images:
-            image_bytes = Path(ref).read_bytes()
+            # Unchanged reference files are served from the content-hash cache
+            image_bytes = get_reference_cache().source_bytes(ref)
             b64 = base64.b64encode(image_bytes).decode("ascii")
             mime = _IMAGE_MIME_BY_SUFFIX.get(Path(ref).suffix.lower(), "image/png")
             content.append({"type": "image", "data": b64, "mime_type": mime})
@@ -220,7 +230,8 @@ class OmniClient:
     }
 
     def __init__(self, api_key: Optional[str] = None,
-                 polling_interval: int = 10, timeout: int = 600):
+                 polling_interval: int = 10, timeout: int = 600,
+                 file_registry: Optional[RemoteFileRegistry] = None):
         """Initialize the Omni client.
 
         Args:
@@ -228,6 +239,7 @@ class OmniClient:
                 (same key path as the existing Gemini image provider).
             polling_interval: Seconds between status polls for long generations.
             timeout: Maximum seconds to wait for a generation to finish.
+            file_registry: Registry of prior Files-API uploads (shared by default).
         """
         if not GENAI_AVAILABLE:
             raise ImportError(
@@ -237,6 +249,7 @@ class OmniClient:
         self.api_key = api_key
         self.polling_interval = polling_interval
         self.timeout = timeout
+        self.file_registry = file_registry or get_remote_file_registry()
         self.logger = logging.getLogger(__name__)
         self.client = genai.Client(api_key=api_key) if api_key else None
 
@@ -306,7 +319,7 @@ class OmniClient:
                 self.client.interactions.create, **kwargs
             )
 
-            interaction = await self._await_terminal(interaction)
+            interaction = await self._await_terminal(interaction, config.model)
             result.interaction_id = getattr(interaction, "id", None)
             status = getattr(interaction, "status", None)
             self.logger.info(f"Omni interaction {result.interaction_id} status={status}")
@@ -375,7 +388,7 @@ class OmniClient:
         finally:
             loop.close()
 
-    async def _await_terminal(self, interaction: Any) -> Any:
+    async def _await_terminal(self, interaction: Any, model: Optional[str] = None) -> Any:
         """Poll ``interactions.get`` until the interaction reaches a terminal state."""
         status = getattr(interaction, "status", None)
         if status in _TERMINAL_STATUSES:
@@ -385,48 +398,81 @@ class OmniClient:
         if not interaction_id:
             return interaction
 
-        deadline = time.time() + self.timeout
-        while time.time() < deadline:
-            await asyncio.sleep(self.polling_interval)
-            try:
-                interaction = await asyncio.to_thread(
-                    self.client.interactions.get, interaction_id
-                )
-            except Exception as e:
-                self.logger.warning(f"Polling interactions.get failed: {e}")
-                continue
-            status = getattr(interaction, "status", None)
-            self.logger.debug(f"Omni interaction {interaction_id} status={status}")
-            if status in _TERMINAL_STATUSES:
-                return interaction
-
-        self.logger.warning(
-            f"Omni interaction {interaction_id} did not finish within {self.timeout}s"
+        # Status errors are retried until the deadline, as before
+        interaction = await get_lro_poller().wait(
+            refresh=lambda _current: self.client.interactions.get(interaction_id),
+            is_done=lambda i: getattr(i, "status", None) in _TERMINAL_STATUSES,
+            initial=interaction,
+            model=model or "omni",
+            timeout=self.timeout,
+            base_interval=self.polling_interval,
+            label=f"Omni interaction {interaction_id}",
+            max_errors=None,
         )
+        status = getattr(interaction, "status", None)
+        self.logger.debug(f"Omni interaction {interaction_id} status={status}")
+        if status not in _TERMINAL_STATUSES:
+            self.logger.warning(
+                f"Omni interaction {interaction_id} did not finish within {self.timeout}s"
+            )
         return interaction
 
     async def _upload_video(self, path: Path) -> str:
         """Upload a video via the Files API and wait until it is ACTIVE.
 
+        Uploads are deduplicated by content hash: if the same clip was uploaded
+        earlier (by this account) and the remote file is still ACTIVE, its URI is
+        reused instead of uploading again.
+
         Returns the file URI to reference as a ``document`` input item.
         Raises RuntimeError if processing fails or times out.
         """
+        scope = account_scope(self.api_key)
+        content_hash = await asyncio.to_thread(file_sha256, path)
+        handle = self.file_registry.lookup(content_hash, scope)
+        if handle is not None:
+            uri = await self._reuse_upload(handle)
+            if uri:
+                self.logger.info(f"Reusing uploaded video for Omni edit: {path} -> {uri}")
+                return uri
+            self.file_registry.forget(content_hash, scope)
+
         self.logger.info(f"Uploading video for Omni edit: {path}")
+        # Passing the path (not bytes) lets the SDK stream a resumable upload.
         video_file = await asyncio.to_thread(self.client.files.upload, file=str(path))
-        deadline = time.time() + self.timeout
-        while _file_state(video_file) == "PROCESSING" and time.time() < deadline:
-            await asyncio.sleep(self.polling_interval)
-            video_file = await asyncio.to_thread(
-                self.client.files.get, name=video_file.name
-            )
+        video_file = await self._wait_while_processing(video_file)
         state = _file_state(video_file)
         if state != "ACTIVE":
             raise RuntimeError(
                 f"Files API upload of {path} did not become ACTIVE (state={state})."
             )
+        self.file_registry.record(content_hash, scope, video_file,
+                                  size_bytes=path.stat().st_size)
         self.logger.info(f"Omni edit video uploaded: {video_file.uri}")
         return video_file.uri
 
+    async def _reuse_upload(self, handle: RemoteFileHandle) -> Optional[str]:
+        """Return the URI of a registered upload if the server still has it ACTIVE."""
+        try:
+            remote = await asyncio.to_thread(self.client.files.get, name=handle.name)
+        except Exception as e:
+            self.logger.info(f"Registered upload {handle.name} is no longer available: {e}")
+            return None
+        remote = await self._wait_while_processing(remote)
+        if _file_state(remote) != "ACTIVE":
+            return None
+        return getattr(remote, "uri", None) or handle.uri
+
+    async def _wait_while_processing(self, video_file: Any) -> Any:
+        """Poll ``files.get`` while the file is PROCESSING (bounded by the timeout)."""
+        deadline = time.time() + self.timeout
+        while _file_state(video_file) == "PROCESSING" and time.time() < deadline:
+            await asyncio.sleep(self.polling_interval)
+            video_file = await asyncio.to_thread(
+                self.client.files.get, name=video_file.name
+            )
+        return video_file
+
     @classmethod
     def _extract_video(cls, interaction: Any) -> Tuple[Optional[bytes], Optional[str], Optional[str]]:
         """Return (video_bytes, uri, mime_type) for a completed interaction.
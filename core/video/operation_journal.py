@@ -0,0 +1,120 @@
+"""
+Persistent journal of in-flight video generation operations.
+
+Veo generations are billed when they are submitted, not when they are
+downloaded. If the app crashes or is closed while clips are still rendering,
+the operation IDs are the only way to collect the paid-for results. The
+journal records each operation as soon as it is submitted, keyed by a
+fingerprint of the request, and removes it once the result has been collected.
+A later batch with the same request resumes polling the recorded operation
+instead of generating again.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def request_fingerprint(payload: Dict[str, Any]) -> str:
+    """Stable hash of a JSON-serializable request description."""
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class PendingOperation:
+    """A submitted operation whose result has not been collected yet."""
+
+    fingerprint: str
+    operation_name: str
+    model: str
+    prompt: str = ""
+    submitted_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PendingOperation":
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__ if k in data})
+
+
+class OperationJournal:
+    """JSON-backed map of request fingerprint to pending operation."""
+
+    RETENTION_SECONDS = 2 * 24 * 3600  # Generated videos are kept for 2 days
+
+    def __init__(self, journal_path: Optional[Path] = None):
+        """
+        Initialize the journal.
+
+        Args:
+            journal_path: JSON file the journal is persisted to
+        """
+        self.journal_path = Path(journal_path) if journal_path else \
+            Path.home() / ".imageai" / "cache" / "veo_operations.json"
+        self._pending: Dict[str, PendingOperation] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def get(self, fingerprint: str) -> Optional[PendingOperation]:
+        """Return the pending operation for a request, if any."""
+        with self._lock:
+            return self._pending.get(fingerprint)
+
+    def pending(self) -> List[PendingOperation]:
+        """All pending operations, oldest first."""
+        with self._lock:
+            return sorted(self._pending.values(), key=lambda p: p.submitted_at)
+
+    def record(self, fingerprint: str, operation_name: str, model: str, prompt: str = "") -> None:
+        """Record a freshly submitted operation."""
+        entry = PendingOperation(
+            fingerprint=fingerprint,
+            operation_name=operation_name,
+            model=model,
+            prompt=prompt,
+            submitted_at=time.time(),
+        )
+        with self._lock:
+            self._pending[fingerprint] = entry
+        self._save()
+
+    def complete(self, fingerprint: str) -> None:
+        """Forget an operation once its result was collected (or definitively failed)."""
+        with self._lock:
+            removed = self._pending.pop(fingerprint, None)
+        if removed is not None:
+            self._save()
+
+    def _load(self) -> None:
+        if not self.journal_path.exists():
+            return
+        try:
+            data = json.loads(self.journal_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"Failed to load operation journal: {e}")
+            return
+        cutoff = time.time() - self.RETENTION_SECONDS
+        for entry in data.get("operations", []):
+            op = PendingOperation.from_dict(entry)
+            if op.submitted_at >= cutoff:
+                self._pending[op.fingerprint] = op
+
+    def _save(self) -> None:
+        with self._lock:
+            payload = {"operations": [op.to_dict() for op in self._pending.values()]}
+        try:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.journal_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            tmp_path.replace(self.journal_path)
+        except OSError as e:
+            logger.warning(f"Failed to save operation journal: {e}")
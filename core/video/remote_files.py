@@ -0,0 +1,193 @@
+"""
+Registry of Gemini Files-API uploads keyed by content hash.
+
+Uploaded files stay on the server for a limited time (48 hours on the Gemini
+API), so re-uploading the same clip for every conversational edit wastes
+bandwidth and adds processing latency. The registry remembers, per account,
+which content hash maps to which remote file and when it expires; callers check
+the remote state and reuse the handle while it is still ACTIVE.
+
+Hashing streams the file in chunks, and uploads are made by path so the SDK's
+resumable upload reads the file in chunks instead of buffering it in memory.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB
+
+
+def file_sha256(path: Path, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """SHA-256 of a file, read in chunks so large media never sits in memory."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def account_scope(api_key: Optional[str]) -> str:
+    """Stable, non-reversible identifier for the account that owns uploads."""
+    if not api_key:
+        return "default"
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class RemoteFileHandle:
+    """A file previously uploaded to the Files API."""
+
+    content_hash: str
+    scope: str
+    name: str  # e.g. "files/abc123"
+    uri: str
+    mime_type: Optional[str] = None
+    size_bytes: int = 0
+    uploaded_at: float = 0.0
+    expires_at: float = 0.0  # Epoch seconds
+
+    def is_expired(self, margin: float = 0.0, now: Optional[float] = None) -> bool:
+        """True if the handle expires within ``margin`` seconds."""
+        now = time.time() if now is None else now
+        return self.expires_at <= now + margin
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RemoteFileHandle":
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__ if k in data})
+
+
+class RemoteFileRegistry:
+    """Persisted map of (account, content hash) to remote file handles."""
+
+    DEFAULT_TTL = 48 * 3600  # Files API retention
+    EXPIRY_MARGIN = 15 * 60  # Don't hand out handles about to expire mid-request
+
+    def __init__(self, registry_path: Optional[Path] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            registry_path: JSON file the registry is persisted to
+        """
+        self.registry_path = Path(registry_path) if registry_path else \
+            Path.home() / ".imageai" / "cache" / "remote_files.json"
+        self._handles: Dict[str, RemoteFileHandle] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _key(scope: str, content_hash: str) -> str:
+        return f"{scope}:{content_hash}"
+
+    def lookup(self, content_hash: str, scope: str) -> Optional[RemoteFileHandle]:
+        """Return an unexpired handle for the content, or None."""
+        with self._lock:
+            handle = self._handles.get(self._key(scope, content_hash))
+        if handle is None:
+            return None
+        if handle.is_expired(self.EXPIRY_MARGIN):
+            self.forget(content_hash, scope)
+            return None
+        return handle
+
+    def record(self, content_hash: str, scope: str, remote_file: Any,
+               size_bytes: int = 0) -> RemoteFileHandle:
+        """
+        Remember an uploaded file.
+
+        Args:
+            content_hash: SHA-256 of the uploaded content
+            scope: Account scope from :func:`account_scope`
+            remote_file: The SDK ``File`` object returned by upload/get
+            size_bytes: Size of the uploaded content
+
+        Returns:
+            The stored handle
+        """
+        now = time.time()
+        handle = RemoteFileHandle(
+            content_hash=content_hash,
+            scope=scope,
+            name=getattr(remote_file, "name", "") or "",
+            uri=getattr(remote_file, "uri", "") or "",
+            mime_type=getattr(remote_file, "mime_type", None),
+            size_bytes=size_bytes,
+            uploaded_at=now,
+            expires_at=self._expiry_of(remote_file, now),
+        )
+        with self._lock:
+            self._handles[self._key(scope, content_hash)] = handle
+        self._save()
+        return handle
+
+    def forget(self, content_hash: str, scope: str) -> None:
+        """Drop a handle (e.g. after the server reports it missing or FAILED)."""
+        with self._lock:
+            removed = self._handles.pop(self._key(scope, content_hash), None)
+        if removed is not None:
+            self._save()
+
+    def prune(self) -> int:
+        """Remove expired handles. Returns the number removed."""
+        now = time.time()
+        with self._lock:
+            expired = [k for k, h in self._handles.items() if h.is_expired(now=now)]
+            for key in expired:
+                del self._handles[key]
+        if expired:
+            self._save()
+        return len(expired)
+
+    def _expiry_of(self, remote_file: Any, uploaded_at: float) -> float:
+        expiration = getattr(remote_file, "expiration_time", None)
+        if isinstance(expiration, datetime):
+            return expiration.timestamp()
+        return uploaded_at + self.DEFAULT_TTL
+
+    def _load(self) -> None:
+        if not self.registry_path.exists():
+            return
+        try:
+            data = json.loads(self.registry_path.read_text(encoding="utf-8"))
+            for entry in data.get("files", []):
+                handle = RemoteFileHandle.from_dict(entry)
+                if not handle.is_expired():
+                    self._handles[self._key(handle.scope, handle.content_hash)] = handle
+        except Exception as e:
+            logger.warning(f"Failed to load remote file registry: {e}")
+
+    def _save(self) -> None:
+        with self._lock:
+            payload = {"files": [h.to_dict() for h in self._handles.values()]}
+        try:
+            self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.registry_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            tmp_path.replace(self.registry_path)
+        except OSError as e:
+            logger.warning(f"Failed to save remote file registry: {e}")
+
+
+_registry: Optional[RemoteFileRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_remote_file_registry() -> RemoteFileRegistry:
+    """Return the process-wide remote file registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = RemoteFileRegistry()
+        return _registry
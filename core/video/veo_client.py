@@ -8,16 +8,19 @@ the Gemini API with support for various configurations and regional restrictions
 import asyncio
 import json
 import logging
+import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import hashlib
 import requests
-from io import BytesIO
-from PIL import Image
+
+from core.reference.reference_cache import get_reference_cache, parse_aspect_ratio
+from core.video.lro_poller import get_lro_poller
+from core.video.operation_journal import OperationJournal, request_fingerprint
 
 # Check if google.genai is available
 try:
@@ -133,6 +136,24 @@ class VeoGenerationConfig:
 
         return config
 
+    def fingerprint(self) -> str:
+        """Stable identity of this request, used to resume in-flight operations."""
+        payload = self.to_dict()
+        payload["model"] = self.model.value
+        payload["image"] = _image_identity(self.image) if self.image else None
+        payload["last_frame"] = _image_identity(self.last_frame) if self.last_frame else None
+        payload["reference_images"] = [_image_identity(p) for p in (self.reference_images or [])]
+        return request_fingerprint(payload)
+
+
+def _image_identity(path: Path) -> str:
+    """Content hash of an input image, so an image edited in place is a new request."""
+    try:
+        return get_reference_cache().source_hash(path)
+    except (OSError, TypeError):
+        # Missing files are skipped at submission; the path is all there is
+        return str(path)
+
 
 @dataclass
 class VeoGenerationResult:
@@ -199,6 +220,7 @@ class VeoClient:
         self.region = region or self._detect_region()
         self.logger = logging.getLogger(__name__)
         self.client = None
+        self.polling_interval = 10  # Google docs recommend 10 second intervals
 
         # Initialize client based on auth mode
         if auth_mode == "gcloud":
@@ -322,12 +344,20 @@ class VeoClient:
         
         return True, None
     
-    async def generate_video_async(self, config: VeoGenerationConfig) -> VeoGenerationResult:
+    async def generate_video_async(self, config: VeoGenerationConfig,
+                                   resume_operation: Optional[str] = None,
+                                   on_submitted: Optional[Callable[[str], None]] = None,
+                                   submitted_at: Optional[float] = None) -> VeoGenerationResult:
         """
         Generate video asynchronously using Veo API.
         
         Args:
             config: Generation configuration
+            resume_operation: Name of an already-submitted operation to poll instead
+                of submitting a new (billed) generation
+            on_submitted: Called with the operation name as soon as it is submitted
+            submitted_at: When ``resume_operation`` was submitted (epoch seconds), so
+                polling and timing statistics count from the original submission
             
         Returns:
             Generation result
@@ -347,216 +377,14 @@ class VeoClient:
             if not self.client:
                 raise ValueError("No client configured. API key required for video generation.")
 
-            # Load start frame (seed image) if provided
-            seed_image = None
-            if config.image and config.image.exists():
-                try:
-                    # Load image bytes
-                    with open(config.image, 'rb') as f:
-                        image_bytes = f.read()
-
-                    # Create Image object for Veo API
-                    # Must be a dict with imageBytes and mimeType
-                    seed_image = {
-                        'imageBytes': image_bytes,
-                        'mimeType': 'image/png'
-                    }
-                    self.logger.info(f"Loaded start frame (seed image): {config.image} ({len(image_bytes)} bytes)")
-                except Exception as e:
-                    self.logger.warning(f"Failed to load start frame: {e}, proceeding without it")
-
-            # Load end frame (last_frame) if provided for Veo 3.1 interpolation
-            last_frame_image = None
-            if config.last_frame and config.last_frame.exists():
-                try:
-                    # Load image bytes
-                    with open(config.last_frame, 'rb') as f:
-                        last_frame_bytes = f.read()
-
-                    # Create Image object for Veo API
-                    last_frame_image = {
-                        'imageBytes': last_frame_bytes,
-                        'mimeType': 'image/png'
-                    }
-                    self.logger.info(f"Loaded end frame (last_frame): {config.last_frame} ({len(last_frame_bytes)} bytes)")
-                    self.logger.info("Using Veo 3.1 frame-to-frame interpolation mode")
-                except Exception as e:
-                    self.logger.warning(f"Failed to load end frame: {e}, proceeding without it")
-
-            # Load reference images if provided for Veo 3 style/character/environment consistency (max 3)
-            reference_image_list = []
-            if config.reference_images:
-                for idx, ref_path in enumerate(config.reference_images[:3]):  # Max 3
-                    if ref_path and ref_path.exists():
-                        try:
-                            # Load image bytes manually (same approach as start frame)
-                            with open(ref_path, 'rb') as f:
-                                ref_image_bytes = f.read()
-
-                            # Load image with PIL to check and fix aspect ratio if needed
-                            img = Image.open(BytesIO(ref_image_bytes))
-                            ref_width, ref_height = img.size
-                            ref_aspect = ref_width / ref_height
-
-                            # Parse target aspect ratio (e.g., "16:9" -> 16/9 = 1.777...)
-                            if ':' in config.aspect_ratio:
-                                ar_parts = config.aspect_ratio.split(':')
-                                expected_aspect = int(ar_parts[0]) / int(ar_parts[1])
-                            else:
-                                # Fallback to 16:9 if invalid format
-                                self.logger.warning(f"Invalid aspect ratio format: {config.aspect_ratio}, using 16:9")
-                                expected_aspect = 16/9
-
-                            # Check if aspect ratios match (within tolerance)
-                            if abs(ref_aspect - expected_aspect) > 0.1:
-                                self.logger.info(f"Aspect ratio adjustment: Reference image {idx+1} is {ref_width}x{ref_height} "
-                                               f"(aspect {ref_aspect:.2f}) but requesting {config.aspect_ratio} "
-                                               f"(aspect {expected_aspect:.2f}). Applying canvas centering fix...")
-
-                                # Create a transparent canvas with the target aspect ratio
-                                # Calculate canvas dimensions based on reference image max dimension
-                                max_ref_dim = max(ref_width, ref_height)
-
-                                # Calculate canvas dimensions maintaining target aspect ratio
-                                if expected_aspect >= 1.0:  # Landscape or square
-                                    canvas_width = max_ref_dim
-                                    canvas_height = int(max_ref_dim / expected_aspect)
-                                else:  # Portrait
-                                    canvas_height = max_ref_dim
-                                    canvas_width = int(max_ref_dim * expected_aspect)
-
-                                # Make sure canvas is large enough to contain the reference image
-                                if canvas_width < ref_width:
-                                    canvas_width = ref_width
-                                    canvas_height = int(ref_width / expected_aspect)
-                                if canvas_height < ref_height:
-                                    canvas_height = ref_height
-                                    canvas_width = int(ref_height * expected_aspect)
-
-                                self.logger.info(f"Creating transparent canvas: {canvas_width}x{canvas_height} (aspect {expected_aspect:.2f})")
-                                self.logger.info(f"Reference image will be centered: {ref_width}x{ref_height}")
-
-                                # Create transparent canvas
-                                canvas = Image.new('RGBA', (canvas_width, canvas_height), (0, 0, 0, 0))
-
-                                # Calculate position to center the reference image
-                                x_offset = (canvas_width - ref_width) // 2
-                                y_offset = (canvas_height - ref_height) // 2
-
-                                # Convert reference image to RGBA if needed
-                                if img.mode != 'RGBA':
-                                    img_rgba = img.convert('RGBA')
-                                else:
-                                    img_rgba = img
-
-                                # Paste the reference image centered on the canvas
-                                canvas.paste(img_rgba, (x_offset, y_offset), img_rgba)
-
-                                # Save the composed canvas for debugging
-                                timestamp = int(time.time())
-                                debug_filename = f"DEBUG_VEO_REF_CANVAS_{idx+1}_{timestamp}.png"
-                                # Get output directory from config
-                                from core.config import ConfigManager
-                                config_mgr = ConfigManager()
-                                output_dir = Path(config_mgr.get('output_dir', Path.home() / 'AppData' / 'Roaming' / 'ImageAI' / 'generated'))
-                                debug_path = output_dir / debug_filename
-                                canvas.save(debug_path, 'PNG')
-                                self.logger.info(f"Saved composed canvas for debugging: {debug_path}")
-
-                                # Convert canvas to bytes
-                                img = canvas
-                                self.logger.info(f"Using composed canvas ({canvas_width}x{canvas_height}) instead of original reference image")
-
-                            # Convert image to bytes
-                            output_buffer = BytesIO()
-                            img.save(output_buffer, format='PNG')
-                            ref_image_bytes = output_buffer.getvalue()
-
-                            # Create reference image dict with bytes and MIME type
-                            ref_image_dict = {
-                                'imageBytes': ref_image_bytes,
-                                'mimeType': 'image/png'
-                            }
-
-                            # Create VideoGenerationReferenceImage with the image dict
-                            ref_image = types.VideoGenerationReferenceImage(
-                                image=ref_image_dict,
-                                reference_type="asset"  # "asset" for character/object consistency
-                            )
-                            reference_image_list.append(ref_image)
-                            self.logger.info(f"Loaded reference image {idx+1}: {ref_path} ({len(ref_image_bytes)} bytes)")
-                        except Exception as e:
-                            self.logger.warning(f"Failed to load reference image {idx+1} ({ref_path}): {e}, skipping")
-
-                if reference_image_list:
-                    self.logger.info(f"Using {len(reference_image_list)} reference image(s) for visual consistency")
-
-            # Create GenerateVideosConfig for additional parameters
-            # Note: Resolution is determined automatically by the model based on aspect_ratio
-            # Veo 3 supports duration_seconds parameter (4, 6, or 8 seconds)
-            video_config_params = {
-                "aspect_ratio": config.aspect_ratio,
-                "duration_seconds": config.duration,  # int, not string
-            }
-
-            # Add optional parameters if set
-            # Note: Only send person_generation if explicitly enabled
-            # The API doesn't support "dont_allow" - omit parameter to disable
-            if config.person_generation:
-                video_config_params["person_generation"] = "allow_adult"
-
-            if config.seed is not None:
-                video_config_params["seed"] = config.seed
-
-            # Add last_frame for Veo 3.1 interpolation (must be used with image/start frame)
-            if last_frame_image:
-                video_config_params["last_frame"] = last_frame_image
-                self.logger.info("Added last_frame to GenerateVideosConfig for frame-to-frame interpolation")
-
-            # Add reference images for Veo 3 visual consistency (max 3)
-            if reference_image_list:
-                video_config_params["reference_images"] = reference_image_list
-                self.logger.info(f"Added {len(reference_image_list)} reference image(s) to GenerateVideosConfig for visual consistency")
-
-            video_config = types.GenerateVideosConfig(**video_config_params)
-
-            # Start generation (returns operation ID for polling)
-            self.logger.info(f"Starting Veo generation with {config.model.value}")
-            self.logger.info(f"Config: {config.aspect_ratio}, duration={config.duration}s")
-            self.logger.info(f"Note: Resolution determined automatically by model (typically 720p)")
-
-            # Log generation mode
-            if seed_image and last_frame_image:
-                self.logger.info("Mode: Frame-to-Frame Interpolation (Veo 3.1)")
-                self.logger.info("  - Start frame provided")
-                self.logger.info("  - End frame provided")
-                self.logger.info("  - Veo will generate smooth transition between frames")
-            elif seed_image:
-                self.logger.info("Mode: Image-to-Video")
-                self.logger.info("  - Start frame provided")
+            if resume_operation:
+                # Re-attach to an operation submitted by an earlier session
+                self.logger.info(f"Resuming polling for operation: {resume_operation}")
+                response = self._operation_handle(resume_operation)
+                result.metadata["resumed"] = True
             else:
-                self.logger.info("Mode: Text-to-Video")
+                response = await self._submit_generation(config, on_submitted)
 
-            # Log reference images if provided
-            if reference_image_list:
-                self.logger.info(f"Visual Consistency: {len(reference_image_list)} reference image(s) for style/character/environment guidance")
-
-            self.logger.info(f"Full Prompt:\n{config.prompt}")
-
-            if seed_image:
-                response = self.client.models.generate_videos(
-                    model=config.model.value,
-                    prompt=config.prompt,
-                    config=video_config,
-                    image=seed_image
-                )
-            else:
-                response = self.client.models.generate_videos(
-                    model=config.model.value,
-                    prompt=config.prompt,
-                    config=video_config
-                )
-            
             # Store operation ID for polling
             result.operation_id = response.name
             result.metadata["model"] = config.model.value
@@ -568,7 +396,22 @@ class VeoClient:
             constraints = self.MODEL_CONSTRAINTS[config.model]
             max_wait = 480  # 8 minutes
 
-            video_result = await self._poll_for_completion(response, max_wait)
+            video_result = None
+            try:
+                operation = await self._wait_for_operation(
+                    response, max_wait, config.model.value,
+                    started=submitted_at if resume_operation else None)
+            except Exception as e:
+                # The operation may still finish server-side (and is billed)
+                self.logger.error(f"Error polling for completion: {e}", exc_info=True)
+                result.metadata["poll_failed"] = True
+                result.metadata["resumable"] = True
+            else:
+                if operation.done:
+                    video_result = self._extract_video(operation)
+                else:
+                    result.metadata["timed_out"] = True
+                    result.metadata["resumable"] = True
 
             if video_result:
                 # Handle both URL (str) and raw bytes (bytes) responses
@@ -608,6 +451,185 @@ class VeoClient:
         
         return result
     
+    async def _submit_generation(self, config: VeoGenerationConfig,
+                                 on_submitted: Optional[Callable[[str], None]] = None) -> Any:
+        """
+        Load frames and reference images, then submit a generation request.
+
+        Args:
+            config: Generation configuration
+            on_submitted: Called with the operation name once it is submitted,
+                even if the caller is cancelled while the request is in flight
+
+        Returns:
+            The long-running operation returned by ``generate_videos``
+        """
+        # Load start frame (seed image) if provided
+        seed_image = None
+        if config.image and config.image.exists():
+            try:
+                # Load image bytes
+                with open(config.image, 'rb') as f:
+                    image_bytes = f.read()
+
+                # Create Image object for Veo API
+                # Must be a dict with imageBytes and mimeType
+                seed_image = {
+                    'imageBytes': image_bytes,
+                    'mimeType': 'image/png'
+                }
+                self.logger.info(f"Loaded start frame (seed image): {config.image} ({len(image_bytes)} bytes)")
+            except Exception as e:
+                self.logger.warning(f"Failed to load start frame: {e}, proceeding without it")
+
+        # Load end frame (last_frame) if provided for Veo 3.1 interpolation
+        last_frame_image = None
+        if config.last_frame and config.last_frame.exists():
+            try:
+                # Load image bytes
+                with open(config.last_frame, 'rb') as f:
+                    last_frame_bytes = f.read()
+
+                # Create Image object for Veo API
+                last_frame_image = {
+                    'imageBytes': last_frame_bytes,
+                    'mimeType': 'image/png'
+                }
+                self.logger.info(f"Loaded end frame (last_frame): {config.last_frame} ({len(last_frame_bytes)} bytes)")
+                self.logger.info("Using Veo 3.1 frame-to-frame interpolation mode")
+            except Exception as e:
+                self.logger.warning(f"Failed to load end frame: {e}, proceeding without it")
+
+        # Load reference images if provided for Veo 3 style/character/environment consistency (max 3)
+        reference_image_list = []
+        if config.reference_images:
+            for idx, ref_path in enumerate(config.reference_images[:3]):  # Max 3
+                if ref_path and ref_path.exists():
+                    try:
+                        # Normalized (aspect-padded, PNG-encoded) payloads are cached by
+                        # content hash, so the same character references sent with every
+                        # scene are only read and padded once per session.
+                        if ':' not in config.aspect_ratio:
+                            self.logger.warning(f"Invalid aspect ratio format: {config.aspect_ratio}, using 16:9")
+                        expected_aspect = parse_aspect_ratio(config.aspect_ratio)
+
+                        def save_debug_canvas(canvas, idx=idx):
+                            # Save the composed canvas for debugging
+                            timestamp = int(time.time())
+                            debug_filename = f"DEBUG_VEO_REF_CANVAS_{idx+1}_{timestamp}.png"
+                            # Get output directory from config
+                            from core.config import ConfigManager
+                            config_mgr = ConfigManager()
+                            output_dir = Path(config_mgr.get('output_dir', Path.home() / 'AppData' / 'Roaming' / 'ImageAI' / 'generated'))
+                            debug_path = output_dir / debug_filename
+                            canvas.save(debug_path, 'PNG')
+                            self.logger.info(f"Saved composed canvas for debugging: {debug_path}")
+
+                        ref_image_bytes = get_reference_cache().padded_reference(
+                            ref_path, expected_aspect, "veo", on_padded=save_debug_canvas
+                        )
+
+                        # Create reference image dict with bytes and MIME type
+                        ref_image_dict = {
+                            'imageBytes': ref_image_bytes,
+                            'mimeType': 'image/png'
+                        }
+
+                        # Create VideoGenerationReferenceImage with the image dict
+                        ref_image = types.VideoGenerationReferenceImage(
+                            image=ref_image_dict,
+                            reference_type="asset"  # "asset" for character/object consistency
+                        )
+                        reference_image_list.append(ref_image)
+                        self.logger.info(f"Loaded reference image {idx+1}: {ref_path} ({len(ref_image_bytes)} bytes)")
+                    except Exception as e:
+                        self.logger.warning(f"Failed to load reference image {idx+1} ({ref_path}): {e}, skipping")
+
+            if reference_image_list:
+                self.logger.info(f"Using {len(reference_image_list)} reference image(s) for visual consistency")
+
+        # Create GenerateVideosConfig for additional parameters
+        # Note: Resolution is determined automatically by the model based on aspect_ratio
+        # Veo 3 supports duration_seconds parameter (4, 6, or 8 seconds)
+        video_config_params = {
+            "aspect_ratio": config.aspect_ratio,
+            "duration_seconds": config.duration,  # int, not string
+        }
+
+        # Add optional parameters if set
+        # Note: Only send person_generation if explicitly enabled
+        # The API doesn't support "dont_allow" - omit parameter to disable
+        if config.person_generation:
+            video_config_params["person_generation"] = "allow_adult"
+
+        if config.seed is not None:
+            video_config_params["seed"] = config.seed
+
+        # Add last_frame for Veo 3.1 interpolation (must be used with image/start frame)
+        if last_frame_image:
+            video_config_params["last_frame"] = last_frame_image
+            self.logger.info("Added last_frame to GenerateVideosConfig for frame-to-frame interpolation")
+
+        # Add reference images for Veo 3 visual consistency (max 3)
+        if reference_image_list:
+            video_config_params["reference_images"] = reference_image_list
+            self.logger.info(f"Added {len(reference_image_list)} reference image(s) to GenerateVideosConfig for visual consistency")
+
+        video_config = types.GenerateVideosConfig(**video_config_params)
+
+        # Start generation (returns operation ID for polling)
+        self.logger.info(f"Starting Veo generation with {config.model.value}")
+        self.logger.info(f"Config: {config.aspect_ratio}, duration={config.duration}s")
+        self.logger.info(f"Note: Resolution determined automatically by model (typically 720p)")
+
+        # Log generation mode
+        if seed_image and last_frame_image:
+            self.logger.info("Mode: Frame-to-Frame Interpolation (Veo 3.1)")
+            self.logger.info("  - Start frame provided")
+            self.logger.info("  - End frame provided")
+            self.logger.info("  - Veo will generate smooth transition between frames")
+        elif seed_image:
+            self.logger.info("Mode: Image-to-Video")
+            self.logger.info("  - Start frame provided")
+        else:
+            self.logger.info("Mode: Text-to-Video")
+
+        # Log reference images if provided
+        if reference_image_list:
+            self.logger.info(f"Visual Consistency: {len(reference_image_list)} reference image(s) for style/character/environment guidance")
+
+        self.logger.info(f"Full Prompt:\n{config.prompt}")
+
+        # Submit off the event loop so concurrent generations keep polling
+        submit_kwargs = {"image": seed_image} if seed_image else {}
+        submission = asyncio.ensure_future(asyncio.to_thread(
+            self.client.models.generate_videos,
+            model=config.model.value,
+            prompt=config.prompt,
+            config=video_config,
+            **submit_kwargs
+        ))
+        try:
+            operation = await asyncio.shield(submission)
+        except asyncio.CancelledError:
+            # The worker thread cannot be stopped and the generation is billed
+            # once it lands, so wait for its name and report it before giving up
+            try:
+                operation = await submission
+            except Exception:
+                pass
+            else:
+                if on_submitted:
+                    on_submitted(operation.name)
+            raise
+        if on_submitted:
+            on_submitted(operation.name)
+        return operation
+
+    def _operation_handle(self, operation_name: str) -> Any:
+        """Operation object for a previously submitted generation, suitable for polling."""
+        return types.GenerateVideosOperation(name=operation_name)
+
     def generate_video(self, config: VeoGenerationConfig) -> VeoGenerationResult:
         """
         Generate video synchronously (blocking).
@@ -731,7 +753,7 @@ class VeoClient:
 
             # Poll for completion
             max_wait = 480  # 8 minutes
-            video_result = await self._poll_for_completion(response, max_wait)
+            video_result = await self._poll_for_completion(response, max_wait, config.model.value)
 
             if video_result:
                 if isinstance(video_result, bytes):
@@ -789,118 +811,137 @@ class VeoClient:
         finally:
             loop.close()
 
-    async def _poll_for_completion(self, operation: Any, max_wait: int) -> Optional[Union[str, bytes]]:
+    async def _poll_for_completion(self, operation: Any, max_wait: int,
+                                   model: Optional[str] = None,
+                                   started: Optional[float] = None) -> Optional[Union[str, bytes]]:
         """
-        Poll for video generation completion using official Google API pattern.
+        Wait for video generation completion via the shared operation poller.
 
         Args:
             operation: Generation operation (LRO - Long Running Operation)
             max_wait: Maximum wait time in seconds
+            model: Model ID, used to adapt the polling schedule to its typical duration
+            started: When the operation was submitted (epoch seconds; defaults to now)
 
         Returns:
             Video URL if successful, None otherwise
         """
-        start_time = time.time()
-        poll_interval = 10  # Google docs recommend 10 second intervals
-        poll_count = 0
+        try:
+            operation = await self._wait_for_operation(operation, max_wait, model, started)
+        except Exception as e:
+            self.logger.error(f"Error polling for completion: {e}", exc_info=True)
+            return None
+        if not operation.done:
+            return None
+        return self._extract_video(operation)
 
-        self.logger.info(f"Starting to poll for completion (max wait: {max_wait}s)")
-        self.logger.info(f"Operation ID: {operation.name}")
+    async def _wait_for_operation(self, operation: Any, max_wait: int,
+                                  model: Optional[str] = None,
+                                  started: Optional[float] = None) -> Any:
+        """
+        Poll an operation via the shared operation poller until it is done or ``max_wait`` passes.
 
-        while time.time() - start_time < max_wait:
-            try:
-                elapsed = time.time() - start_time
-                poll_count += 1
+        Args:
+            operation: Generation operation (LRO - Long Running Operation)
+            max_wait: Maximum wait time in seconds
+            model: Model ID, used to adapt the polling schedule to its typical duration
+            started: When the operation was submitted (epoch seconds; defaults to now)
 
-                # Log every poll attempt for first 5, then every 4th attempt
-                if poll_count <= 5 or poll_count % 4 == 0:
-                    self.logger.info(f"Poll #{poll_count}: Checking operation.done... ({elapsed:.0f}s elapsed, {max_wait - elapsed:.0f}s remaining)")
+        Returns:
+            The last observed operation; ``operation.done`` is False on timeout
 
-                # Check if operation is done (official Google pattern)
-                if operation.done:
-                    # Operation completed
-                    elapsed_total = time.time() - start_time
-                    self.logger.info(f"✅ Operation completed after {elapsed_total:.1f} seconds ({poll_count} polls)")
+        Raises:
+            Exception: The last status-check error once the poller gives up
+        """
+        start_time = time.time()
+        self.logger.info(f"Starting to poll for completion (max wait: {max_wait}s)")
+        self.logger.info(f"Operation ID: {operation.name}")
 
-                    # Check for errors first
-                    if hasattr(operation, 'error') and operation.error:
-                        self.logger.error(f"❌ Operation failed with error: {operation.error}")
-                        return None
+        # Refresh operation status (official Google pattern) on the poller's schedule
+        operation = await get_lro_poller().wait(
+            refresh=self.client.operations.get,
+            is_done=lambda op: bool(op.done),
+            initial=operation,
+            model=model or "veo",
+            timeout=max_wait,
+            base_interval=self.polling_interval,
+            label=operation.name,
+            started=started,
+        )
+
+        elapsed_total = time.time() - start_time
+        if operation.done:
+            self.logger.info(f"✅ Operation completed after {elapsed_total:.1f} seconds")
+        else:
+            self.logger.warning(f"❌ Generation timed out after {elapsed_total:.1f} seconds (max: {max_wait}s)")
+        return operation
+
+    def _extract_video(self, operation: Any) -> Optional[Union[str, bytes]]:
+        """Return the video URI or raw bytes from a completed operation, or None on failure."""
+        # Check for errors first
+        if hasattr(operation, 'error') and operation.error:
+            self.logger.error(f"❌ Operation failed with error: {operation.error}")
+            return None
 
-                    # Extract video from response (official structure from docs)
-                    try:
-                        if hasattr(operation, 'response') and hasattr(operation.response, 'generated_videos'):
-                            generated_videos = operation.response.generated_videos
-                            if generated_videos and len(generated_videos) > 0:
-                                video = generated_videos[0].video
-
-                                # Try URI first (cloud storage URL)
-                                if hasattr(video, 'uri') and video.uri:
-                                    video_url = video.uri
-                                    self.logger.info(f"Retrieved video URL: {video_url[:80] if len(video_url) > 80 else video_url}")
-
-                                    # Parse and log video metadata if available
-                                    if hasattr(video, 'metadata'):
-                                        metadata = video.metadata
-                                        self.logger.info(f"Video metadata: {metadata}")
-
-                                    return video_url
-
-                                # If no URI, check for video_bytes (raw video data)
-                                elif hasattr(video, 'video_bytes') and video.video_bytes:
-                                    video_bytes = video.video_bytes
-                                    self.logger.info(f"Retrieved video as raw bytes ({len(video_bytes)} bytes)")
-
-                                    # Parse and log video metadata if available
-                                    if hasattr(video, 'metadata'):
-                                        metadata = video.metadata
-                                        self.logger.info(f"Video metadata: {metadata}")
-
-                                    # Return the raw bytes - caller will need to save them
-                                    return video_bytes
-
-                                else:
-                                    # Neither URI nor bytes available
-                                    self.logger.error(f"Video object has neither 'uri' nor 'video_bytes'.")
-                                    self.logger.error(f"  - has 'uri' attr: {hasattr(video, 'uri')}, value: {getattr(video, 'uri', '<no attr>')}")
-                                    self.logger.error(f"  - has 'video_bytes' attr: {hasattr(video, 'video_bytes')}, value length: {len(getattr(video, 'video_bytes', b'')) if hasattr(video, 'video_bytes') else 0}")
-                                    self.logger.error(f"  - video type: {type(video)}")
-                                    return None
-                            else:
-                                self.logger.error("No generated_videos in response")
-                                return None
-                        else:
-                            # Log detailed diagnostic information
-                            self.logger.error(f"Unexpected response structure. Operation attributes: {dir(operation)}")
-                            if hasattr(operation, 'response'):
-                                self.logger.error(f"Response attributes: {dir(operation.response)}")
-                                # Try to log the actual response value
-                                try:
-                                    self.logger.error(f"Response value: {operation.response}")
-                                    self.logger.error(f"Response type: {type(operation.response)}")
-                                except Exception as log_err:
-                                    self.logger.error(f"Could not log response value: {log_err}")
-                            if hasattr(operation, 'metadata'):
-                                self.logger.error(f"Operation metadata: {operation.metadata}")
-                            return None
-                    except Exception as e:
-                        self.logger.error(f"Error extracting video URL from completed operation: {e}", exc_info=True)
+        # Extract video from response (official structure from docs)
+        try:
+            if hasattr(operation, 'response') and hasattr(operation.response, 'generated_videos'):
+                generated_videos = operation.response.generated_videos
+                if generated_videos and len(generated_videos) > 0:
+                    video = generated_videos[0].video
+
+                    # Try URI first (cloud storage URL)
+                    if hasattr(video, 'uri') and video.uri:
+                        video_url = video.uri
+                        self.logger.info(f"Retrieved video URL: {video_url[:80] if len(video_url) > 80 else video_url}")
+
+                        # Parse and log video metadata if available
+                        if hasattr(video, 'metadata'):
+                            metadata = video.metadata
+                            self.logger.info(f"Video metadata: {metadata}")
+
+                        return video_url
+
+                    # If no URI, check for video_bytes (raw video data)
+                    elif hasattr(video, 'video_bytes') and video.video_bytes:
+                        video_bytes = video.video_bytes
+                        self.logger.info(f"Retrieved video as raw bytes ({len(video_bytes)} bytes)")
+
+                        # Parse and log video metadata if available
+                        if hasattr(video, 'metadata'):
+                            metadata = video.metadata
+                            self.logger.info(f"Video metadata: {metadata}")
+
+                        # Return the raw bytes - caller will need to save them
+                        return video_bytes
+
+                    else:
+                        # Neither URI nor bytes available
+                        self.logger.error(f"Video object has neither 'uri' nor 'video_bytes'.")
+                        self.logger.error(f"  - has 'uri' attr: {hasattr(video, 'uri')}, value: {getattr(video, 'uri', '<no attr>')}")
+                        self.logger.error(f"  - has 'video_bytes' attr: {hasattr(video, 'video_bytes')}, value length: {len(getattr(video, 'video_bytes', b'')) if hasattr(video, 'video_bytes') else 0}")
+                        self.logger.error(f"  - video type: {type(video)}")
                         return None
-
-                # Not done yet - wait and refresh operation status
-                self.logger.debug(f"Poll #{poll_count}: Operation not done yet, waiting {poll_interval}s...")
-                await asyncio.sleep(poll_interval)
-
-                # Refresh operation status (official Google pattern)
-                operation = self.client.operations.get(operation)
-
-            except Exception as e:
-                self.logger.error(f"Error polling for completion: {e}", exc_info=True)
+                else:
+                    self.logger.error("No generated_videos in response")
+                    return None
+            else:
+                # Log detailed diagnostic information
+                self.logger.error(f"Unexpected response structure. Operation attributes: {dir(operation)}")
+                if hasattr(operation, 'response'):
+                    self.logger.error(f"Response attributes: {dir(operation.response)}")
+                    # Try to log the actual response value
+                    try:
+                        self.logger.error(f"Response value: {operation.response}")
+                        self.logger.error(f"Response type: {type(operation.response)}")
+                    except Exception as log_err:
+                        self.logger.error(f"Could not log response value: {log_err}")
+                if hasattr(operation, 'metadata'):
+                    self.logger.error(f"Operation metadata: {operation.metadata}")
                 return None
-
-        total_elapsed = time.time() - start_time
-        self.logger.warning(f"❌ Generation timed out after {total_elapsed:.1f} seconds ({poll_count} polls, max: {max_wait}s)")
-        return None
+        except Exception as e:
+            self.logger.error(f"Error extracting video URL from completed operation: {e}", exc_info=True)
+            return None
     
     async def _download_video(self, video_url: str) -> Optional[Path]:
         """
@@ -1019,35 +1060,136 @@ class VeoClient:
 
     def generate_batch(self,
                       configs: List[VeoGenerationConfig],
-                      max_concurrent: int = 3) -> List[VeoGenerationResult]:
+                      max_concurrent: int = 3,
+                      on_result: Optional[Callable[[int, VeoGenerationResult], None]] = None,
+                      cancel_event: Optional[threading.Event] = None,
+                      journal: Optional[OperationJournal] = None,
+                      resume: bool = True) -> List[VeoGenerationResult]:
         """
         Generate multiple videos in batch with concurrency control.
+
+        Runs :meth:`generate_batch_async` on a single event loop.
         
         Args:
             configs: List of generation configurations
             max_concurrent: Maximum concurrent generations
+            on_result: Called with (index, result) as each clip finishes
+            cancel_event: Set from any thread to cancel the remaining work
+            journal: Journal of in-flight operations (defaults to the user cache)
+            resume: Re-attach to operations left in the journal by a previous session
             
         Returns:
-            List of generation results
+            List of generation results, in the same order as ``configs``
         """
-        results = []
-        
-        # Process in batches to respect concurrency limit
-        for i in range(0, len(configs), max_concurrent):
-            batch = configs[i:i + max_concurrent]
-            
-            # Create async tasks for batch
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            return loop.run_until_complete(self.generate_batch_async(
+                configs, max_concurrent, on_result=on_result, cancel_event=cancel_event,
+                journal=journal, resume=resume,
+            ))
+        finally:
+            loop.close()
+
+    async def generate_batch_async(self,
+                                   configs: List[VeoGenerationConfig],
+                                   max_concurrent: int = 3,
+                                   on_result: Optional[Callable[[int, VeoGenerationResult], None]] = None,
+                                   cancel_event: Optional[threading.Event] = None,
+                                   journal: Optional[OperationJournal] = None,
+                                   resume: bool = True) -> List[VeoGenerationResult]:
+        """
+        Generate multiple videos with a sliding window of concurrent slots.
+
+        A new generation starts as soon as any slot frees up, so one slow clip
+        never holds back the others. Each submitted operation is recorded in
+        the journal until its result is collected; with ``resume`` enabled, a
+        config whose operation is still in the journal (e.g. after a crash) is
+        polled again instead of being regenerated and billed twice.
+
+        Args:
+            configs: List of generation configurations
+            max_concurrent: Maximum concurrent generations
+            on_result: Called with (index, result) as each clip finishes
+            cancel_event: Set from any thread to cancel the remaining work
+            journal: Journal of in-flight operations (defaults to the user cache)
+            resume: Re-attach to operations left in the journal by a previous session
+
+        Returns:
+            List of generation results, in the same order as ``configs``
+        """
+        journal = journal or OperationJournal()
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        results: List[Optional[VeoGenerationResult]] = [None] * len(configs)
+
+        # Identical configs in one batch get distinct fingerprints so each
+        # maps to its own operation
+        fingerprints = []
+        occurrences: Dict[str, int] = {}
+        for config in configs:
+            base = config.fingerprint()
+            occurrences[base] = occurrences.get(base, 0) + 1
+            fingerprints.append(f"{base}#{occurrences[base]}")
+
+        def finish(index: int, result: VeoGenerationResult):
+            results[index] = result
+            if on_result:
+                try:
+                    on_result(index, result)
+                except Exception as e:
+                    self.logger.error(f"Batch result callback failed for clip {index + 1}: {e}")
+
+        async def run(index: int, config: VeoGenerationConfig):
+            fingerprint = fingerprints[index]
             try:
-                tasks = [self.generate_video_async(config) for config in batch]
-                batch_results = loop.run_until_complete(asyncio.gather(*tasks))
-                results.extend(batch_results)
-            finally:
-                loop.close()
-        
-        return results
+                async with semaphore:
+                    if cancel_event is not None and cancel_event.is_set():
+                        finish(index, self._cancelled_result())
+                        return
+                    pending = journal.get(fingerprint) if resume else None
+                    self.logger.info(f"Batch clip {index + 1}/{len(configs)} started")
+                    result = await self.generate_video_async(
+                        config,
+                        resume_operation=pending.operation_name if pending else None,
+                        submitted_at=pending.submitted_at if pending else None,
+                        on_submitted=lambda name: journal.record(
+                            fingerprint, name, config.model.value, config.prompt),
+                    )
+                # Keep operations that may still finish (timed out, or status
+                # checks failed) so a later run can still collect them
+                if not result.metadata.get("resumable"):
+                    journal.complete(fingerprint)
+                finish(index, result)
+            except asyncio.CancelledError:
+                # Submitted operations stay in the journal for resumption
+                finish(index, self._cancelled_result())
+
+        tasks = [asyncio.ensure_future(run(i, c)) for i, c in enumerate(configs)]
+        watcher = None
+        if cancel_event is not None:
+            watcher = asyncio.ensure_future(self._cancel_when_set(cancel_event, tasks))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            if watcher:
+                watcher.cancel()
+
+        return [r if r is not None else self._cancelled_result() for r in results]
+
+    @staticmethod
+    async def _cancel_when_set(cancel_event: threading.Event, tasks: List["asyncio.Future"],
+                               check_interval: float = 0.25):
+        """Cancel ``tasks`` once ``cancel_event`` is set."""
+        while not all(t.done() for t in tasks):
+            if cancel_event.is_set():
+                for task in tasks:
+                    task.cancel()
+                return
+            await asyncio.sleep(check_interval)
+
+    @staticmethod
+    def _cancelled_result() -> VeoGenerationResult:
+        return VeoGenerationResult(success=False, error="Cancelled")
     
     def concatenate_clips(self,
                          video_paths: List[Path],
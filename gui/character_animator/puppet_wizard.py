@@ -35,6 +35,7 @@ from core.character_animator.availability import (
 from core.character_animator.models import (
     PuppetStructure, ExportFormat, VisemeSet, EyeBlinkSet,
 )
+from core.character_animator.constants import SVG_SETTINGS
 from core.constants import get_user_data_dir
 from .install_dialog import PuppetInstallConfirmDialog, PuppetInstallProgressDialog
 from core.discord_rpc import discord_rpc, ActivityState
@@ -861,6 +862,14 @@ class ExportPage(QWizardPage):
         format_info.setStyleSheet("color: #888;")
         format_layout.addWidget(format_info)
 
+        self.trace_svg_cb = QCheckBox("Trace SVG layers into vector paths (much smaller files)")
+        self.trace_svg_cb.setToolTip(
+            "Flat-fill each layer with a few traced colors instead of embedding PNGs.\n"
+            "Best for flat/cartoon art; gradients and photo detail are lost."
+        )
+        self.trace_svg_cb.setChecked(SVG_SETTINGS["trace_alpha"])
+        format_layout.addWidget(self.trace_svg_cb)
+
         layout.addWidget(format_group)
 
         # Output location
@@ -907,7 +916,14 @@ class ExportPage(QWizardPage):
         # Connect to save settings on change
         self.name_edit.textChanged.connect(self._save_settings)
         self.format_combo.currentIndexChanged.connect(self._save_settings)
+        self.format_combo.currentIndexChanged.connect(self._update_trace_enabled)
+        self.trace_svg_cb.toggled.connect(self._save_settings)
         self.output_edit.textChanged.connect(self._save_settings)
+        self._update_trace_enabled()
+
+    def _update_trace_enabled(self):
+        """Tracing only applies when an SVG is exported."""
+        self.trace_svg_cb.setEnabled(self.format_combo.currentIndex() in [1, 2])
 
     def _load_settings(self):
         """Load saved export settings."""
@@ -921,6 +937,9 @@ class ExportPage(QWizardPage):
         if 0 <= saved_format <= 2:
             self.format_combo.setCurrentIndex(saved_format)
 
+        self.trace_svg_cb.setChecked(
+            self.settings.value("export_trace_svg", SVG_SETTINGS["trace_alpha"], type=bool))
+
         # Load output path (default to user data dir if no saved path)
         saved_output = self.settings.value("export_output_path", "")
         if saved_output and Path(saved_output).exists():
@@ -935,6 +954,7 @@ class ExportPage(QWizardPage):
         """Save current export settings."""
         self.settings.setValue("export_puppet_name", self.name_edit.text())
         self.settings.setValue("export_format", self.format_combo.currentIndex())
+        self.settings.setValue("export_trace_svg", self.trace_svg_cb.isChecked())
         self.settings.setValue("export_output_path", self.output_edit.text())
 
     def browse_output(self):
@@ -1033,12 +1053,15 @@ class ExportPage(QWizardPage):
 
             if export_svg:
                 logger.info("Starting SVG export...")
-                svg_exporter = SVGExporter(puppet)
+                svg_exporter = SVGExporter(puppet, trace_alpha=self.trace_svg_cb.isChecked())
                 svg_path = output_path / f"{name}.svg"
                 logger.info(f"Exporting SVG to: {svg_path}")
                 if svg_exporter.export(svg_path):
                     logger.info("SVG export successful!")
-                    success_messages.append(f"SVG: {svg_path}")
+                    message = f"SVG: {svg_path}"
+                    if svg_exporter.trace_alpha:
+                        message += f" (traced, {svg_path.stat().st_size / 1024:.0f} KB)"
+                    success_messages.append(message)
                 else:
                     logger.error("SVG export returned False")
 
@@ -1077,14 +1100,12 @@ class DetectionThread(QThread):
 
     def run(self):
         try:
-            from core.character_animator.segmenter import BodyPartSegmenter
+            from core.character_animator.segmenter import get_shared_segmenter
 
+            # Models stay loaded until the wizard closes, and results for an
+            # image that was already detected come from the cache
             self.progress.emit("Initializing segmenter...", 10)
-
-            segmenter = BodyPartSegmenter()
-            if not segmenter.initialize():
-                self.finished.emit(False, None)
-                return
+            segmenter = get_shared_segmenter()
 
             self.progress.emit("Loading image...", 20)
             image = Image.open(self.image_path)
@@ -1096,7 +1117,6 @@ class DetectionThread(QThread):
             result = segmenter.segment_body_parts(image)
 
             self.progress.emit("Detection complete", 100)
-            segmenter.cleanup()
 
             self.finished.emit(True, result)
 
@@ -1136,7 +1156,10 @@ class GenerationThread(QThread):
 
     def run(self):
         try:
-            from core.character_animator.face_generator import FaceVariantGenerator
+            from core.character_animator.face_generator import (
+                DEFAULT_EYEBROW_EXPRESSIONS,
+                FaceVariantGenerator,
+            )
 
             self.progress.emit("Initializing cloud AI generator...", 5)
             self.progress.emit(f"Using {self.provider.upper()} / {self.model}", 5)
@@ -1155,20 +1178,27 @@ class GenerationThread(QThread):
             visemes = None
             blinks = None
 
-            if self.gen_visemes:
+            if self.gen_visemes or self.gen_blinks or self.gen_eyebrows:
                 cache_msg = " (cache enabled)" if self.use_cache else " (FORCE REGENERATE)"
-                self.progress.emit(f"Generating 14 mouth visemes via cloud AI...{cache_msg}", 10)
+                self.progress.emit(f"Generating puppet assets via cloud AI...{cache_msg}", 10)
 
-                def on_viseme_progress(name, idx, total):
-                    pct = 10 + int((idx / total) * 70)
-                    self.progress.emit(f"Viseme {idx+1}/{total}: {name}", pct)
+                def on_asset_progress(name, idx, total):
+                    pct = 10 + int(((idx + 1) / total) * 85)
+                    self.progress.emit(f"Asset {idx+1}/{total}: {name}", pct)
                     self.viseme_complete.emit(name)
 
                 try:
-                    visemes = generator.generate_all_visemes(
-                        image, self.segmentation, on_viseme_progress,
+                    # All edits run concurrently; see PuppetAssetScheduler
+                    viseme_set, blink_set, _ = generator.generate_puppet_assets(
+                        image, self.segmentation,
+                        visemes=self.gen_visemes,
+                        blinks=self.gen_blinks,
+                        expressions=DEFAULT_EYEBROW_EXPRESSIONS if self.gen_eyebrows else None,
+                        progress_callback=on_asset_progress,
                         use_cache=self.use_cache,
                     )
+                    visemes = viseme_set if self.gen_visemes else None
+                    blinks = blink_set if self.gen_blinks else None
                 except Exception as e:
                     error_msg = str(e)
                     if "rate" in error_msg.lower() or "429" in error_msg:
@@ -1181,29 +1211,6 @@ class GenerationThread(QThread):
                         self.error.emit("Generation Error", error_msg)
                     raise
 
-            if self.gen_blinks:
-                self.progress.emit("Generating eye blink states...", 85)
-                try:
-                    blinks = generator.generate_blink_states(
-                        image, self.segmentation,
-                        use_cache=self.use_cache,
-                    )
-                except Exception as e:
-                    self.error.emit("Blink Generation Error", str(e))
-                    # Continue with partial results
-
-            if self.gen_eyebrows:
-                self.progress.emit("Generating eyebrow variants...", 92)
-                try:
-                    # Eyebrow generation (optional feature)
-                    generator.generate_eyebrow_variants(
-                        image, self.segmentation,
-                        use_cache=self.use_cache,
-                    )
-                except Exception as e:
-                    self.error.emit("Eyebrow Generation Error", str(e))
-                    # Continue with partial results
-
             self.progress.emit("Cloud AI generation complete!", 100)
             generator.cleanup()
 
@@ -1326,6 +1333,12 @@ class PuppetWizard(QWizard):
 
         super().reject()
 
+    def done(self, result):
+        """Release the detection models once the wizard is closed."""
+        from core.character_animator.segmenter import release_shared_segmenter
+        release_shared_segmenter()
+        super().done(result)
+
     def showEvent(self, event):
         """Handle show event - update Discord presence."""
         super().showEvent(event)
@@ -1757,6 +1757,7 @@ class ExportPage(QWizardPage):
         self._temp_font_path: Optional[Path] = None
         self._temp_font_id: int = -1  # Qt font database ID
         self._preview_font_family: Optional[str] = None
+        self._builder: Optional[FontBuilder] = None  # Builds the preview, reused for export
         self.init_ui()
 
     def init_ui(self):
@@ -1878,14 +1879,14 @@ class ExportPage(QWizardPage):
             # Vectorize each character
             chars = page2.result.characters
             self.glyphs = []
+            self._builder = None
             self.char_cells = list(chars)  # Store original character cells for preview
 
-            for i, char in enumerate(chars):
-                glyph = vectorizer.vectorize(char.image, char.label)
-                self.glyphs.append(glyph)
-
-                progress = int((i + 1) / len(chars) * 80)  # 0-80% for vectorization
-                self.progress_bar.setValue(progress)
+            self.glyphs = vectorizer.vectorize_all(
+                chars,
+                progress_callback=lambda done, total: self.progress_bar.setValue(
+                    int(done / total * 80)),  # 0-80% for vectorization
+            )
 
             self.status_label.setText(f"Vectorized {len(self.glyphs)} characters")
             logger.info(f"Vectorized {len(self.glyphs)} glyphs")
@@ -1919,10 +1920,11 @@ class ExportPage(QWizardPage):
             temp_dir.mkdir(parents=True, exist_ok=True)
             self._temp_font_path = temp_dir / f"{font_info.postscript_name}_preview.ttf"
 
-            # Build the font
-            builder = FontBuilder(info=font_info)
-            builder.add_glyphs(self.glyphs)
-            builder.build(self._temp_font_path)
+            # Build the font (outlines unchanged since the last preview are
+            # not converted again)
+            self._builder = FontBuilder(info=font_info)
+            self._builder.add_glyphs(self.glyphs)
+            self._builder.build(self._temp_font_path)
 
             self.progress_bar.setValue(95)
 
@@ -2269,9 +2271,12 @@ class ExportPage(QWizardPage):
             self.status_label.setText("Building font...")
             self.progress_bar.setValue(25)
 
-            # Build font
-            builder = FontBuilder(info=font_info)
-            builder.add_glyphs(self.glyphs)
+            # Build font, reusing the metrics and outlines of the preview font
+            builder = self._builder
+            if builder is None:
+                builder = FontBuilder(info=font_info)
+                builder.add_glyphs(self.glyphs)
+            builder.info = font_info
 
             exported_paths = []
             file_path = Path(file_path)
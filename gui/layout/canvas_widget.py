@@ -7,6 +7,7 @@ from PySide6.QtCore import Signal, Qt
 
 from core.layout.models import PageSpec
 from core.layout import qt_renderer
+from core.layout.spatial_index import index_for_page, mark_page_changed
 
 
 class CanvasWidget(QGraphicsView):
@@ -33,6 +34,8 @@ class CanvasWidget(QGraphicsView):
                 pass
             old.deleteLater()  # don't let replaced scenes accumulate as children
         self._page = page
+        # Every edit path ends in a reload, so hit-tests re-sync once per edit
+        mark_page_changed(page)
         scene = qt_renderer.build_scene(page, selectable=True, style=style, locked=locked)
         scene.setParent(self)
         scene.selectionChanged.connect(self._on_selection_changed)
@@ -67,6 +70,9 @@ class CanvasWidget(QGraphicsView):
         return (x1, y1, x, y)
 
     def _region_id_at(self, scene_pt):
+        if self._page is not None:
+            region = index_for_page(self._page).region_at(scene_pt.x(), scene_pt.y())
+            return region.id if region is not None else None
         for it in self.scene().items(scene_pt):
             rid = it.data(0)
             if rid:
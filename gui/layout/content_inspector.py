@@ -35,7 +35,6 @@ class ContentInspector(QWidget):
         super().__init__(parent)
         self._config = config
         self._region: Optional[Region] = None
-        self._font_loader = None  # keep a ref so the QThread isn't GC'd mid-run
         self._build()
         self._start_font_load()
         self.set_region(None)
@@ -130,14 +129,16 @@ class ContentInspector(QWidget):
 
     # --- system fonts (loaded in the background) ---
     def _start_font_load(self):
-        from gui.layout.font_loader import cached_families, FontLoader
+        from gui.layout.font_loader import cached_families, shared_loader
         cached = cached_families()
         if cached:
             self._populate_fonts(cached)
             return
-        self._font_loader = FontLoader(self)
-        self._font_loader.loaded.connect(self._populate_fonts)
-        self._font_loader.start()
+        shared_loader().loaded.connect(self._populate_fonts)
+        # The loader may have finished between the cache check and the connect
+        cached = cached_families()
+        if cached:
+            self._populate_fonts(cached)
 
     def _populate_fonts(self, families: List[str]):
         if not families:
@@ -68,14 +68,19 @@ class ExportWorker(QThread):
             self.error.emit(f"Export failed: {e}")
 
     def _export_png(self, output_path: Path, pages_to_export: List[int], num_pages: int):
-        """Export to PNG sequence via the Qt renderer (comic geometry + overlays)."""
-        from core.layout import qt_renderer
-        for idx, page_num in enumerate(pages_to_export):
-            page = self.document.pages[page_num]
+        """Export to PNG sequence via the Qt renderer (comic geometry + overlays).
+
+        Pages are rasterized concurrently on the shared render service (which
+        paints with qt_renderer); they are saved in order as they complete.
+        """
+        from core.layout.render_service import get_page_render_service
+        pages = [self.document.pages[i] for i in pages_to_export]
+        self.progress.emit(0, f"Rendering page {pages_to_export[0] + 1}..." if pages else "")
+        images = get_page_render_service().render_pages(
+            pages, style=self.document.style, scale=self.dpi / 72.0)
+        for idx, (page_num, image) in enumerate(zip(pages_to_export, images)):
             progress_pct = int((idx / num_pages) * 100)
-            self.progress.emit(progress_pct, f"Rendering page {page_num + 1}...")
-            image = qt_renderer.render_page_to_image(page, style=self.document.style,
-                                                      scale=self.dpi / 72.0)
+            self.progress.emit(progress_pct, f"Saving page {page_num + 1}...")
             if num_pages > 1:
                 page_output = output_path.parent / f"{output_path.stem}_page{page_num + 1:03d}.png"
             else:
@@ -4,6 +4,10 @@ Enumerating system fonts can stall the GUI thread on first access, so the
 Layout tab pulls the family list off-thread via :class:`FontLoader` and caches
 it for the rest of the process. The payload is plain strings, so handing the
 result back to the GUI thread is safe.
+
+Widgets share one unparented loader (:func:`shared_loader`) held by this
+module: a loader parented to a widget is destroyed with it, and destroying a
+QThread that is still running aborts the process.
 """
 import logging
 from typing import List, Optional
@@ -14,6 +18,7 @@ logger = logging.getLogger("imageai.layout.fonts")
 
 # Process-wide cache: enumerate once, reuse for every widget that needs it.
 _CACHE: Optional[List[str]] = None
+_LOADER: Optional["FontLoader"] = None
 
 
 def cached_families() -> Optional[List[str]]:
@@ -46,3 +51,22 @@ class FontLoader(QThread):
         if families:
             _CACHE = families
         self.loaded.emit(families)
+
+
+def shared_loader() -> FontLoader:
+    """Return the process-wide loader, starting it on first use.
+
+    A loader that finished without a family list (empty or failed scan) is
+    started again, so a later widget still gets fonts.
+
+    Connect to ``loaded`` before the event loop next runs; the signal is
+    queued to the GUI thread, so a connection made right after this call
+    still sees it.
+    """
+    global _LOADER
+    if _LOADER is None:
+        _LOADER = FontLoader()
+        _LOADER.start()
+    elif _CACHE is None and _LOADER.isFinished():
+        _LOADER.start()
+    return _LOADER
@@ -120,10 +120,9 @@ class OverlayEditor:
             return
         # Tail snaps to the nearest region center within the snap radius.
         if ov.tail_target is not None:
-            from core.layout.overlay_ops import nearest_region_center
+            from core.layout.spatial_index import index_for_page
             page = self._tab._current_page()
-            regions = list(page.regions) if page is not None else []
-            center = nearest_region_center(ov.tail_target, regions)
+            center = index_for_page(page).nearest_center(ov.tail_target) if page is not None else None
             if center is not None:
                 dx = center[0] - ov.tail_target[0]
                 dy = center[1] - ov.tail_target[1]
@@ -3,6 +3,7 @@
 Emits intent signals only; ``LayoutTab`` owns all model mutation (same split as
 Geometry/Content inspectors).
 """
+from functools import partial
 from typing import Optional
 
 from PySide6.QtWidgets import (
@@ -48,7 +49,7 @@ class OverlayInspector(QWidget):
                           (self.add_thought_btn, "thought"),
                           (self.add_caption_btn, "caption"),
                           (self.add_sfx_btn, "sfx")):
-            btn.clicked.connect(lambda _checked=False, k=kind: self.addRequested.emit(k))
+            btn.clicked.connect(partial(self.addRequested.emit, kind))
             add_row.addWidget(btn)
         root.addLayout(add_row)
 
@@ -9,7 +9,7 @@ from PySide6.QtWidgets import (
     QLineEdit, QComboBox, QLabel, QPushButton, QScrollArea, QGridLayout,
     QSizePolicy, QToolButton, QButtonGroup
 )
-from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtCore import Qt, Signal, QSize, QTimer
 from PySide6.QtGui import QPixmap, QIcon
 
 from core.layout import TemplateManager, TemplateMetadata
@@ -49,19 +49,7 @@ class TemplateCard(QWidget):
         """)
 
         # Load thumbnail if available
-        if self.thumbnail_path and self.thumbnail_path.exists():
-            pixmap = QPixmap(str(self.thumbnail_path))
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(
-                    124, 124,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.thumbnail_label.setPixmap(scaled_pixmap)
-            else:
-                self.thumbnail_label.setText("No Preview")
-        else:
-            self.thumbnail_label.setText("No Preview")
+        self.set_thumbnail(self.thumbnail_path)
 
         layout.addWidget(self.thumbnail_label)
 
@@ -86,6 +74,24 @@ class TemplateCard(QWidget):
         # Set stylesheet for hover effect
         self.update_style()
 
+    def set_thumbnail(self, thumbnail_path: Optional[Path]) -> bool:
+        """Show a thumbnail image; returns False (and shows a placeholder) if unavailable."""
+        self.thumbnail_path = thumbnail_path
+        self.has_thumbnail = False
+        if thumbnail_path and thumbnail_path.exists():
+            pixmap = QPixmap(str(thumbnail_path))
+            if not pixmap.isNull():
+                scaled_pixmap = pixmap.scaled(
+                    124, 124,
+                    Qt.KeepAspectRatio,
+                    Qt.SmoothTransformation
+                )
+                self.thumbnail_label.setPixmap(scaled_pixmap)
+                self.has_thumbnail = True
+                return True
+        self.thumbnail_label.setText("No Preview")
+        return False
+
     def update_style(self):
         """Update the card style based on selection state."""
         if self.is_selected:
@@ -136,6 +142,11 @@ class TemplateSelectorWidget(QWidget):
         self.template_cards: Dict[str, TemplateCard] = {}  # path -> card
         self.selected_template_path: Optional[str] = None
 
+        # Previews render on a background pool; pick them up as they land
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setInterval(250)
+        self._preview_timer.timeout.connect(self._refresh_pending_previews)
+
         self.init_ui()
 
         if self.template_manager:
@@ -268,19 +279,8 @@ class TemplateSelectorWidget(QWidget):
         max_cols = 2  # 2 columns in grid view
 
         for template in templates:
-            # Get preview thumbnail
-            thumbnail_path = None
-            if self.template_manager:
-                preview_gen = self.template_manager.preview_generator
-                if preview_gen:
-                    # Get cached preview path
-                    cache_path = preview_gen.get_cache_path(template.filepath)
-                    # Only use if it exists (previews are generated on demand)
-                    if cache_path.exists():
-                        thumbnail_path = cache_path
-
-            # Create card
-            card = TemplateCard(template, thumbnail_path)
+            # Create card (the thumbnail may still be rendering in the background)
+            card = TemplateCard(template, template.thumbnail_path)
             card.clicked.connect(self.on_template_clicked)
 
             # Update selection state
@@ -298,6 +298,23 @@ class TemplateSelectorWidget(QWidget):
                 col = 0
                 row += 1
 
+        if any(not card.has_thumbnail for card in self.template_cards.values()):
+            self._preview_timer.start()
+
+    def _refresh_pending_previews(self):
+        """Load thumbnails that the background preview pool has finished."""
+        # Checked before loading, so a job finishing meanwhile still gets one more pass
+        in_flight = self._previews_in_flight()
+        pending = [card for card in self.template_cards.values() if not card.has_thumbnail]
+        for card in pending:
+            card.set_thumbnail(card.metadata.thumbnail_path)
+        if all(card.has_thumbnail for card in pending) or not in_flight:
+            self._preview_timer.stop()
+
+    def _previews_in_flight(self) -> bool:
+        generator = self.template_manager.preview_generator if self.template_manager else None
+        return bool(generator and generator.has_pending())
+
     def on_template_clicked(self, template_path: str):
         """Handle template card click."""
         logger.info(f"Template selected: {template_path}")
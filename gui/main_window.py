@@ -7886,7 +7886,9 @@ For more detailed information, please refer to the full documentation.
             # Step 6: Replace placeholder tab
             self.logger.info("STEP 6: Replacing placeholder tab...")
             self.logger.info(f"STEP 6a: Removing placeholder tab at index {video_index}")
+            placeholder = self.tabs.widget(video_index)
             self.tabs.removeTab(video_index)
+            placeholder.deleteLater()  # removeTab keeps it parented
             self.logger.info(f"STEP 6b: Inserting real video tab at index {video_index}")
             self.tabs.insertTab(video_index, real_video_tab, "🎬 Video")
             self.logger.info(f"STEP 6c: Setting current index to {video_index}")
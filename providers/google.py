@@ -41,6 +41,16 @@ except ImportError:
         auto_crop_solid_borders = None
         crop_to_aspect_ratio = None
 
+# Import reference payload cache
+try:
+    from ..core.reference.reference_cache import (
+        get_reference_cache, needs_aspect_padding, pad_to_aspect, parse_aspect_ratio,
+    )
+except ImportError:
+    from core.reference.reference_cache import (
+        get_reference_cache, needs_aspect_padding, pad_to_aspect, parse_aspect_ratio,
+    )
+
 
 # =============================================================================
 # MODEL-SPECIFIC AUTHENTICATION REQUIREMENTS
@@ -881,74 +891,28 @@ class GoogleProvider(ImageProvider):
                 from PIL import Image
                 import io
 
-                # Convert bytes to PIL Image if needed
-                if isinstance(reference_image, bytes):
-                    img = Image.open(io.BytesIO(reference_image))
+                # Calculate expected aspect ratio
+                expected_aspect = 1.0
+                if aspect_ratio and ':' in aspect_ratio:
+                    expected_aspect = parse_aspect_ratio(aspect_ratio, default=1.0)
+                elif width and height:
+                    expected_aspect = width / height
+
+                if isinstance(reference_image, (bytes, bytearray, str, Path)):
+                    # Padded payloads are cached by content hash, so re-using the same
+                    # reference across generations skips the decode/pad/encode work.
+                    # References that need no padding are passed through as-is.
+                    img = Image.open(io.BytesIO(
+                        get_reference_cache().padded_reference(
+                            reference_image, expected_aspect, "gemini", passthrough=True)
+                    ))
                 else:
                     img = reference_image
-
-                # Check for aspect ratio mismatch with reference image
-                if hasattr(img, 'size'):
-                    ref_width, ref_height = img.size
-                    ref_aspect = ref_width / ref_height
-
-                    # Calculate expected aspect ratio
-                    expected_aspect = 1.0
-                    if aspect_ratio and ':' in aspect_ratio:
-                        ar_parts = aspect_ratio.split(':')
-                        expected_aspect = float(ar_parts[0]) / float(ar_parts[1])
-                    elif width and height:
-                        expected_aspect = width / height
-
-                    # Check if there's a significant mismatch (more than 10% difference)
-                    if abs(ref_aspect - expected_aspect) > 0.1:
-                        ar_display = aspect_ratio if aspect_ratio else f"{width}:{height}"
-                        logger.info(f"Aspect ratio adjustment: Reference image is {ref_width}x{ref_height} "
-                                    f"(aspect {ref_aspect:.2f}) but requesting {ar_display} "
-                                    f"(aspect {expected_aspect:.2f}). Applying canvas centering fix...")
-
-                        # Create a transparent canvas with the target aspect ratio
-                        # Calculate canvas dimensions based on reference image max dimension
-                        max_ref_dim = max(ref_width, ref_height)
-
-                        # Calculate canvas dimensions maintaining target aspect ratio
-                        if expected_aspect >= 1.0:  # Landscape or square
-                            canvas_width = max_ref_dim
-                            canvas_height = int(max_ref_dim / expected_aspect)
-                        else:  # Portrait
-                            canvas_height = max_ref_dim
-                            canvas_width = int(max_ref_dim * expected_aspect)
-
-                        # Make sure canvas is large enough to contain the reference image
-                        if canvas_width < ref_width:
-                            canvas_width = ref_width
-                            canvas_height = int(ref_width / expected_aspect)
-                        if canvas_height < ref_height:
-                            canvas_height = ref_height
-                            canvas_width = int(ref_height * expected_aspect)
-
-                        logger.info(f"Creating transparent canvas: {canvas_width}x{canvas_height} (aspect {expected_aspect:.2f})")
-                        logger.info(f"Reference image will be centered: {ref_width}x{ref_height}")
-
-                        # Create transparent canvas
-                        canvas = Image.new('RGBA', (canvas_width, canvas_height), (0, 0, 0, 0))
-
-                        # Calculate position to center the reference image
-                        x_offset = (canvas_width - ref_width) // 2
-                        y_offset = (canvas_height - ref_height) // 2
-
-                        # Convert reference image to RGBA if needed
-                        if img.mode != 'RGBA':
-                            img_rgba = img.convert('RGBA')
-                        else:
-                            img_rgba = img
-
-                        # Paste the reference image centered on the canvas
-                        canvas.paste(img_rgba, (x_offset, y_offset), img_rgba)
-
-                        # Use the composed canvas instead of original image
-                        img = canvas
-                        logger.info(f"Using composed canvas ({canvas_width}x{canvas_height}) instead of original reference image")
+                    # Check for aspect ratio mismatch with reference image
+                    if hasattr(img, 'size') and needs_aspect_padding(img.size, expected_aspect):
+                        logger.info(f"Aspect ratio adjustment: Reference image is {img.width}x{img.height} "
+                                    f"but requesting aspect {expected_aspect:.2f}. Applying canvas centering fix...")
+                        img = pad_to_aspect(img, expected_aspect)
 
                 # Create content list: prompt first, then image (per Google docs)
                 contents = [prompt, img]
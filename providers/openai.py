@@ -13,6 +13,12 @@ try:
 except ImportError:
     from core.security import rate_limiter
 
+# Import reference payload cache
+try:
+    from ..core.reference.reference_cache import get_reference_cache
+except ImportError:
+    from core.reference.reference_cache import get_reference_cache
+
 # Check if openai is available but don't import yet
 try:
     import importlib.util
@@ -870,7 +876,8 @@ class OpenAIProvider(ImageProvider):
                 p = Path(item)
                 if not p.exists():
                     raise FileNotFoundError(f"Reference image not found: {p}")
-                buf = BytesIO(p.read_bytes())
+                # Unchanged reference files are served from the content-hash cache
+                buf = BytesIO(get_reference_cache().source_bytes(p))
                 buf.name = p.name
                 prepared.append(buf)
             else:
@@ -891,7 +898,7 @@ class OpenAIProvider(ImageProvider):
         if mask is not None:
             if not caps["supports_mask"]:
                 raise _UnsupportedParam(f"{model} does not support mask inpainting.")
-            mask_buf = BytesIO(mask if isinstance(mask, (bytes, bytearray)) else Path(mask).read_bytes())
+            mask_buf = BytesIO(get_reference_cache().source_bytes(mask))
             mask_buf.name = "mask.png"
             edit_kwargs["mask"] = mask_buf
 
@@ -10,6 +10,12 @@ from PIL import Image
 
 from .base import ImageProvider
 
+# Import reference payload cache
+try:
+    from ..core.reference.reference_cache import get_reference_cache
+except ImportError:
+    from core.reference.reference_cache import get_reference_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -270,31 +276,22 @@ class StabilityProvider(ImageProvider):
             raise RuntimeError("Stability AI API key not provided")
         
         try:
-            # Load and prepare image
-            input_image = Image.open(io.BytesIO(image))
-            if input_image.mode != 'RGB':
-                input_image = input_image.convert('RGB')
-            
             # Get model
             selected_model = model or self.model
-            
+
             # Resize if needed
-            width, height = input_image.size
             if selected_model.startswith("stable-diffusion-xl"):
                 max_size = 1024
             else:
                 max_size = 512
-            
-            if max(width, height) > max_size:
-                ratio = max_size / max(width, height)
-                width = int(width * ratio)
-                height = int(height * ratio)
-                input_image = input_image.resize((width, height), Image.Resampling.LANCZOS)
-            
+
+            # RGB conversion, resize and PNG encode are cached by content hash
+            png_bytes = get_reference_cache().fitted_reference(image, max_size, "stability")
+            input_image = Image.open(io.BytesIO(png_bytes))
+            width, height = input_image.size
+
             # Convert to base64
-            img_buffer = io.BytesIO()
-            input_image.save(img_buffer, format='PNG')
-            init_image_base64 = base64.b64encode(img_buffer.getvalue()).decode('utf-8')
+            init_image_base64 = base64.b64encode(png_bytes).decode('utf-8')
             
             # Parameters
             strength = kwargs.get("strength", 0.5)
@@ -0,0 +1,60 @@
+"""Benchmark vectorized vs. per-pixel border detection for auto-crop.
+
+Usage:
+    python -m tests.benchmarks.bench_auto_crop [--repeat N]
+"""
+
+import argparse
+import io
+import random
+import time
+
+from PIL import Image
+
+from core.image_utils import auto_crop_solid_borders, detect_solid_borders
+from tests.test_image_utils import legacy_detect_borders, make_padded_image
+
+SIZES = [(1024, 1024), (1920, 1080), (3840, 2160)]
+
+
+def _letterboxed(width, height):
+    """Worst case for the scan: solid pads reaching close to the 1/3 limit."""
+    img = Image.new("RGB", (width, height), (20, 20, 24))
+    content = Image.effect_noise((width * 2 // 5, height * 2 // 5), 60).convert("RGB")
+    img.paste(content, (width * 3 // 10, height * 3 // 10))
+    return img
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'image':>15}  {'legacy ms':>10}  {'vector ms':>10}  {'speedup':>8}  {'auto_crop ms':>12}")
+    cases = [(f"{w}x{h}", make_padded_image(rng, w, h)) for w, h in SIZES]
+    cases += [(f"{w}x{h} lb", _letterboxed(w, h)) for w, h in SIZES]
+    for label, img in cases:
+        assert detect_solid_borders(img) == legacy_detect_borders(img)
+        buf = io.BytesIO()
+        img.save(buf, format="PNG")
+        data = buf.getvalue()
+
+        legacy = _best_of(lambda: legacy_detect_borders(img), args.repeat)
+        vector = _best_of(lambda: detect_solid_borders(img), args.repeat)
+        full = _best_of(lambda: auto_crop_solid_borders(data), args.repeat)
+        print(f"{label:>15}  {legacy * 1000:>10.1f}  {vector * 1000:>10.1f}  "
+              f"{legacy / vector:>7.1f}x  {full * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
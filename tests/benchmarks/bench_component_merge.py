@@ -0,0 +1,193 @@
+"""Benchmark component merging on dense alphabet sheets.
+
+Renders alphabet sheets full of multi-part glyphs (i, j, %, :, ", ...) and
+sprinkles them with noise specks, as scanned specimen sheets look before the
+size filter. Then it times
+
+- ``AlphabetSegmenter._merge_component_bboxes`` (dots onto stems), and
+- ``RowColumnSegmenter._merge_diagonal_components`` (parts of '%'),
+
+each against the pairwise loop it replaced.
+
+Usage:
+    python -m tests.benchmarks.bench_component_merge [--noise N] [--size PX] [--repeat N]
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw
+
+from core.font_generator.row_column_segmenter import RowColumnSegmenter
+from core.font_generator.segmentation import AlphabetSegmenter
+from tests.benchmarks.bench_vectorize import _font
+
+SHEET_TEXT = ["ABCDEFGHIJKLM", "abcdefghijklm", "nopqrstuvwxyz", "ij%:;!?\"'=ÄÖü", "0123456789%&$"]
+
+
+def alphabet_sheet(size=48, noise=0, seed=0):
+    """A binarized alphabet sheet with ``noise`` random specks added."""
+    font = _font(size)
+    width, height = int(size * 12), int(size * 1.8 * len(SHEET_TEXT) + size)
+    img = Image.new("L", (width, height), 255)
+    draw = ImageDraw.Draw(img)
+    for row, text in enumerate(SHEET_TEXT):
+        draw.text((size * 0.5, size * 0.5 + row * size * 1.8), " ".join(text), fill=0, font=font)
+    rng = np.random.default_rng(seed)
+    for _ in range(noise):
+        x, y = rng.integers(0, width - 4), rng.integers(0, height - 4)
+        r = int(rng.integers(1, 4))
+        draw.ellipse((x, y, x + r, y + r), fill=0)
+    return 255 - np.array(img)
+
+
+def sheet_components(binary):
+    """(x, y, w, h, contour) per external contour, as the segmenter collects them."""
+    contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    return [(*cv2.boundingRect(cnt), cnt) for cnt in contours]
+
+
+# The pairwise loops the sweep versions replaced, kept here as the baseline
+
+def pairwise_merge_component_bboxes(bboxes):
+    if len(bboxes) < 2:
+        return bboxes
+    avg_height = np.mean([b[3] for b in bboxes])
+    merged = [False] * len(bboxes)
+    result = []
+    for i, (x1, y1, w1, h1, cnt1) in enumerate(bboxes):
+        if merged[i]:
+            continue
+        area1 = w1 * h1
+        merge_indices = [i]
+        combined_x1, combined_y1 = x1, y1
+        combined_x2, combined_y2 = x1 + w1, y1 + h1
+        for j, (x2, y2, w2, h2, cnt2) in enumerate(bboxes):
+            if i == j or merged[j]:
+                continue
+            area2 = w2 * h2
+            size_ratio = min(area1, area2) / max(area1, area2)
+            height_ratio = min(h1, h2) / max(h1, h2)
+            if not (size_ratio < 0.5 or height_ratio < 0.5):
+                continue
+            overlap_width = max(0, min(x1 + w1, x2 + w2) - max(x1, x2))
+            smaller_width = min(w1, w2)
+            overlap_ratio = overlap_width / smaller_width if smaller_width > 0 else 0
+            if w1 < w2:
+                small_center_x = x1 + w1 / 2
+                center_within_bounds = x2 <= small_center_x <= x2 + w2
+            else:
+                small_center_x = x2 + w2 / 2
+                center_within_bounds = x1 <= small_center_x <= x1 + w1
+            if overlap_ratio < 0.3 and not center_within_bounds:
+                continue
+            if y1 + h1 < y2:
+                v_gap = y2 - (y1 + h1)
+            elif y2 + h2 < y1:
+                v_gap = y1 - (y2 + h2)
+            else:
+                v_gap = 0
+            if v_gap > avg_height * 0.5:
+                continue
+            merge_indices.append(j)
+            combined_x1 = min(combined_x1, x2)
+            combined_y1 = min(combined_y1, y2)
+            combined_x2 = max(combined_x2, x2 + w2)
+            combined_y2 = max(combined_y2, y2 + h2)
+            if len(merge_indices) >= 2:
+                break
+        for idx in merge_indices:
+            merged[idx] = True
+        largest_cnt = max([bboxes[idx][4] for idx in merge_indices], key=cv2.contourArea)
+        result.append((combined_x1, combined_y1, combined_x2 - combined_x1,
+                       combined_y2 - combined_y1, largest_cnt))
+    return result
+
+
+def pairwise_merge_diagonal_components(boxes):
+    if len(boxes) < 2:
+        return list(boxes)
+    widths = [w for _, _, w, _ in boxes]
+    median_width = sorted(widths)[len(widths) // 2]
+
+    def horizontal_overlap(box1, box2):
+        start, end = max(box1[0], box2[0]), min(box1[0] + box1[2], box2[0] + box2[2])
+        if end <= start:
+            return 0.0
+        min_width = min(box1[2], box2[2])
+        return (end - start) / min_width if min_width > 0 else 0.0
+
+    n = len(boxes)
+    parent = list(range(n))
+
+    def find(i):
+        if parent[i] != i:
+            parent[i] = find(parent[i])
+        return parent[i]
+
+    for i in range(n):
+        for j in range(i + 1, n):
+            if horizontal_overlap(boxes[i], boxes[j]) > 0.5:
+                _, y1, _, h1 = boxes[i]
+                _, y2, _, h2 = boxes[j]
+                if abs((y1 + h1 // 2) - (y2 + h2 // 2)) < median_width * 2:
+                    pi, pj = find(i), find(j)
+                    if pi != pj:
+                        parent[pi] = pj
+
+    groups = {}
+    for i in range(n):
+        groups.setdefault(find(i), []).append(boxes[i])
+    merged = []
+    for group in groups.values():
+        if len(group) == 1:
+            merged.append(group[0])
+        else:
+            x_min = min(b[0] for b in group)
+            y_min = min(b[1] for b in group)
+            x_max = max(b[0] + b[2] for b in group)
+            y_max = max(b[1] + b[3] for b in group)
+            merged.append((x_min, y_min, x_max - x_min, y_max - y_min))
+    return merged
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _row(name, before, after):
+    print(f"{name:>22}  {before * 1000:>10.1f}  {after * 1000:>10.1f}  {before / after:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=48, help="glyph height in px")
+    parser.add_argument("--noise", type=int, default=3000, help="noise specks on the sheet")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    binary = alphabet_sheet(args.size, noise=args.noise)
+    components = sheet_components(binary)
+    boxes = [c[:4] for c in components]
+    print(f"{len(components)} components on a {binary.shape[1]}x{binary.shape[0]} sheet")
+    print(f"{'operation':>22}  {'before ms':>10}  {'after ms':>10}  {'speedup':>8}")
+
+    segmenter = AlphabetSegmenter()
+    _row("dot merge",
+         _best_of(lambda: pairwise_merge_component_bboxes(components), args.repeat),
+         _best_of(lambda: segmenter._merge_component_bboxes(components, binary), args.repeat))
+    row_segmenter = RowColumnSegmenter()
+    _row("diagonal merge",
+         _best_of(lambda: pairwise_merge_diagonal_components(boxes), args.repeat),
+         _best_of(lambda: row_segmenter._merge_diagonal_components(boxes), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
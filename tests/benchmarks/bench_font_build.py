@@ -0,0 +1,73 @@
+"""Benchmark rebuilding a font after one glyph was redrawn.
+
+Vectorizes the printable ASCII set once, then times ``FontBuilder.build``
+for TrueType and CFF
+
+- cold: the outline cache is empty, every glyph is converted,
+- redrawn: one glyph differs from the previous build, and
+- unchanged: the same glyphs again (a second preview with other settings),
+
+each with a new builder, as the font wizard does for its preview font.
+
+Usage:
+    python -m tests.benchmarks.bench_font_build [--size PX] [--repeat N]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from core.font_generator.font_builder import FontBuilder, FontInfo, clear_outline_cache
+from core.font_generator.vectorizer import GlyphVectorizer, PathSegment, VectorGlyph, VectorPath
+from tests.benchmarks.bench_vectorize import glyph_sheet
+
+
+def stretched(glyph, factor):
+    """A copy of ``glyph`` stretched horizontally (same height, so same metrics)."""
+    paths = [VectorPath(segments=[PathSegment(seg.command, [(x * factor, y) for x, y in seg.points])
+                                  for seg in path.segments], is_hole=path.is_hole)
+             for path in glyph.paths]
+    return VectorGlyph(label=glyph.label, paths=paths, width=glyph.width * factor,
+                       height=glyph.height, advance_width=glyph.advance_width * factor)
+
+
+def build(glyphs, path):
+    builder = FontBuilder(info=FontInfo(family_name="Bench"))
+    builder.add_glyphs(glyphs)
+    builder.build(path)
+
+
+def _time(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=128, help="glyph height in px")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    glyphs = GlyphVectorizer().vectorize_all(glyph_sheet(args.size))
+    index = next(i for i, g in enumerate(glyphs) if g.label == "e")
+    print(f"{len(glyphs)} glyphs, redrawing '{glyphs[index].label}'")
+    print(f"{'format':>8}  {'cold ms':>9}  {'redrawn ms':>11}  {'unchanged ms':>13}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for ext in (".ttf", ".otf"):
+            path = Path(tmp) / f"bench{ext}"
+            cold = redrawn = unchanged = float("inf")
+            for i in range(args.repeat):
+                clear_outline_cache()
+                cold = min(cold, _time(lambda: build(glyphs, path)))
+                edited = list(glyphs)
+                edited[index] = stretched(glyphs[index], 1.0 + (i + 1) / 100)
+                redrawn = min(redrawn, _time(lambda: build(edited, path)))
+                unchanged = min(unchanged, _time(lambda: build(edited, path)))
+            print(f"{ext:>8}  {cold * 1000:>9.1f}  {redrawn * 1000:>11.1f}  {unchanged * 1000:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
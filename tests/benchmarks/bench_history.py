@@ -0,0 +1,72 @@
+"""Benchmark project size and save time against design-session length.
+
+Compares the chunked history format (each distinct page stored once) with
+the previous format, where every snapshot embedded a full document copy.
+
+Usage:
+    python -m tests.benchmarks.bench_history [--pages N]
+"""
+
+import argparse
+import json
+import time
+
+from core.layout import schema
+from core.layout.history import History
+from core.layout.models import DocumentSpec, PageSpec, Region
+
+SESSION_LENGTHS = [10, 50, 200]
+
+
+def _document(n_pages):
+    return DocumentSpec(title="Bench", pages=[
+        PageSpec(page_size_px=(2550, 3300), regions=[
+            Region(id=f"p{p}r{r}", kind="text" if r % 3 == 0 else "image",
+                   bbox=(r * 100, r * 120, 800, 600), text="Caption text " * 8,
+                   prompt="a detailed panel description " * 4)
+            for r in range(9)])
+        for p in range(n_pages)])
+
+
+def _legacy_dump(doc):
+    """The previous format: every snapshot carries its full document."""
+    data = schema.document_to_dict(doc)
+    data.pop("history_chunks")
+    data["history"] = [
+        {"id": s.id, "parent_id": s.parent_id, "timestamp": s.timestamp,
+         "prompt": s.prompt, "document": s.document, "thumbnail": s.thumbnail}
+        for s in doc.history]
+    return json.dumps(data, indent=2)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=24)
+    args = parser.parse_args()
+
+    print(f"{'snapshots':>9}  {'legacy MB':>9}  {'chunked MB':>10}  {'legacy save ms':>14}  "
+          f"{'chunked save ms':>15}  {'append ms':>9}")
+    for length in SESSION_LENGTHS:
+        doc = _document(args.pages)
+        history = History(doc)
+        start = time.perf_counter()
+        for i in range(length):
+            # Typical iteration: one region on one page changes
+            doc.pages[i % args.pages].regions[i % 9].text = f"revision {i}"
+            history.append(f"step {i}")
+        append_ms = (time.perf_counter() - start) * 1000 / length
+
+        legacy, legacy_t = _timed(lambda: _legacy_dump(doc))
+        chunked, chunked_t = _timed(lambda: json.dumps(schema.document_to_dict(doc), indent=2))
+        print(f"{length:>9}  {len(legacy) / 1e6:>9.2f}  {len(chunked) / 1e6:>10.2f}  "
+              f"{legacy_t * 1000:>14.1f}  {chunked_t * 1000:>15.1f}  {append_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
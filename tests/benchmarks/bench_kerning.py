@@ -0,0 +1,110 @@
+"""Benchmark kerning on a full 94-glyph sheet.
+
+Compares the previous heuristic, which classified the edge of each glyph
+point by point for every entry of a fixed list of 51 pairs, with the profile
+engine, which kerns all 94 x 94 pairs.
+
+Usage:
+    python -m tests.benchmarks.bench_kerning [--size PX] [--repeat N]
+"""
+
+import argparse
+import time
+
+from core.font_generator.kerning import KerningEngine
+from core.font_generator.metrics import FontMetricsCalculator
+from core.font_generator.vectorizer import GlyphVectorizer
+from tests.benchmarks.bench_vectorize import glyph_sheet
+
+# The pair list the previous heuristic covered
+LEGACY_PAIRS = [
+    ("A", "v"), ("A", "w"), ("A", "y"),
+    ("F", "a"), ("F", "e"), ("F", "o"),
+    ("L", "T"), ("L", "V"), ("L", "W"), ("L", "Y"),
+    ("P", "a"), ("P", "e"), ("P", "o"),
+    ("T", "a"), ("T", "e"), ("T", "o"), ("T", "r"), ("T", "y"),
+    ("V", "a"), ("V", "e"), ("V", "o"),
+    ("W", "a"), ("W", "e"), ("W", "o"),
+    ("Y", "a"), ("Y", "e"), ("Y", "o"),
+    ("A", "T"), ("A", "V"), ("A", "W"), ("A", "Y"),
+    ("L", "A"),
+    ("f", "f"), ("f", "i"), ("f", "l"),
+    ("r", "a"), ("r", "e"), ("r", "o"),
+    ("v", "a"), ("v", "e"), ("v", "o"),
+    ("w", "a"), ("w", "e"), ("w", "o"),
+    ("y", "a"), ("y", "e"), ("y", "o"),
+    (".", "'"), (",", "'"),
+    ("A", "'"), ("T", "'"),
+]
+
+
+def legacy_edge(glyph, side):
+    """Edge classification of the previous heuristic, one Python pass per call."""
+    bbox = glyph.bounds
+    width = bbox[2] - bbox[0]
+    xs = []
+    for path in glyph.paths:
+        if path.is_hole:
+            continue
+        for seg in path.segments:
+            for x, _ in seg.points:
+                if side == "right" and x > bbox[2] - width * 0.2:
+                    xs.append(x)
+                elif side == "left" and x < bbox[0] + width * 0.2:
+                    xs.append(x)
+    if not xs or width == 0:
+        return "straight"
+    variation = (max(xs) - min(xs)) / width
+    return "straight" if variation < 0.1 else "round" if variation < 0.3 else "diagonal"
+
+
+def legacy_kerning(glyph_map, units_per_em=1000):
+    base = -units_per_em * 0.05
+    kerning = {}
+    for left, right in LEGACY_PAIRS:
+        if left not in glyph_map or right not in glyph_map:
+            continue
+        edges = (legacy_edge(glyph_map[left], "right"), legacy_edge(glyph_map[right], "left"))
+        kern = base * 2 if edges == ("diagonal", "diagonal") else \
+            base if "diagonal" in edges else base * 0.5 if "open" in edges else 0.0
+        kerning[(left, right)] = kern
+    return kerning
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=128, help="glyph height in px")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    calculator = FontMetricsCalculator()
+    calculator.calculate(GlyphVectorizer().vectorize_all(glyph_sheet(args.size)))
+    glyphs = calculator.get_normalized_glyphs()
+    glyph_map = {g.label: g for g in glyphs}
+    engine = KerningEngine(side_bearing=calculator.default_side_bearing)
+
+    legacy = _best_of(lambda: legacy_kerning(glyph_map), args.repeat)
+    profile = _best_of(lambda: engine.calculate(glyphs), args.repeat)
+    result = engine.calculate(glyphs)
+
+    pairs = len(legacy_kerning(glyph_map))
+    print(f"{len(glyphs)} glyphs")
+    print(f"{'engine':>10}  {'pairs':>7}  {'ms':>8}  {'us/pair':>8}")
+    print(f"{'legacy':>10}  {pairs:>7}  {legacy * 1000:>8.1f}  {legacy * 1e6 / pairs:>8.1f}")
+    n = len(glyphs) ** 2
+    print(f"{'profiles':>10}  {n:>7}  {profile * 1000:>8.1f}  {profile * 1e6 / n:>8.1f}")
+    print(f"{len(result.left_classes)} left x {len(result.right_classes)} right classes, "
+          f"{len(result.values)} class pairs ({len(result.pairs())} kerned glyph pairs)")
+
+
+if __name__ == "__main__":
+    main()
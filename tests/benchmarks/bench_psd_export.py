@@ -0,0 +1,143 @@
+"""Benchmark PSD export of a full puppet at 2K.
+
+Builds a puppet with a body and head, the 14 visemes and both blinks, every
+layer a full-canvas RGBA image as the AI editors return them, and writes it
+
+- the previous way: raw channel data for every full layer, buffered in memory
+  before anything is written, and
+- with ``PSDExporter._create_psd_manual``: layers cropped to their opaque
+  pixels, PackBits channel data, streamed to the file.
+
+Reports time, file size and peak traced memory of each.
+
+Usage:
+    python -m tests.benchmarks.bench_psd_export [--size PX] [--repeat N]
+"""
+
+import argparse
+import io
+import struct
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from core.character_animator.models import EyeBlinkSet, PuppetLayer, PuppetStructure, VisemeSet
+from core.character_animator.psd_exporter import PSDExporter
+
+VISEMES = ["neutral", "ah", "d", "ee", "f", "l", "m", "oh", "r", "s", "uh", "w_oo", "smile",
+           "surprised"]
+
+
+def puppet_exporter(size):
+    """A PSDExporter for a puppet with body, head, 14 visemes and 2 blinks."""
+    rng = np.random.default_rng(0)
+    canvas = (size, size)
+    body = Image.new("RGBA", canvas, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(body)
+    draw.rectangle((size // 4, size // 2, 3 * size // 4, size), fill=(60, 90, 160, 255))
+    draw.ellipse((size // 3, size // 8, 2 * size // 3, size // 2), fill=(225, 180, 150, 255))
+    # Some texture, so not everything is a flat run
+    shade = rng.integers(0, 12, (size, size), dtype=np.uint8)
+    body_px = np.array(body)
+    body_px[..., :3] -= np.where(body_px[..., 3:] > 0, shade[..., None], 0).astype(np.uint8)
+    body = Image.fromarray(body_px)
+
+    root = PuppetLayer(name="Puppet")
+    root.add_child(PuppetLayer(name="Body", image=body))
+    puppet = PuppetStructure(name="Bench", root_layer=root, visemes=VisemeSet(),
+                             eye_blinks=EyeBlinkSet(), width=size, height=size)
+    exporter = PSDExporter(puppet)
+
+    mouths = {}
+    for i, name in enumerate(VISEMES):
+        mouth = Image.new("RGBA", canvas, (0, 0, 0, 0))
+        opening = size // 200 * (i % 5 + 1)
+        ImageDraw.Draw(mouth).ellipse(
+            (int(size * 0.44), int(size * 0.38) - opening, int(size * 0.56), int(size * 0.40) + opening),
+            fill=(170, 60, 70, 255))
+        mouths[name] = mouth
+    exporter.populate_from_visemes(VisemeSet(**mouths))
+
+    blinks = {}
+    for side, x in (("left_blink", 0.42), ("right_blink", 0.58)):
+        blink = Image.new("RGBA", canvas, (0, 0, 0, 0))
+        ImageDraw.Draw(blink).line((int(size * (x - 0.04)), int(size * 0.28),
+                                    int(size * (x + 0.04)), int(size * 0.28)),
+                                   fill=(40, 30, 30, 255), width=max(2, size // 300))
+        blinks[side] = blink
+    exporter.populate_from_blinks(EyeBlinkSet(**blinks))
+    return exporter
+
+
+def legacy_export(exporter, path):
+    """The previous writer: raw full-layer channels, built in memory first."""
+    layers = exporter._flatten_layers_for_export()
+    width, height = exporter.puppet.width, exporter.puppet.height
+    info = io.BytesIO()
+    info.write(struct.pack('>h', -len(layers)))
+    for layer in layers:
+        img = layer["image"]
+        x, y = layer["position"]
+        info.write(struct.pack('>iiiiH', y, x, y + img.height, x + img.width, 4))
+        for ch in range(4):
+            info.write(struct.pack('>hI', ch - 1, img.width * img.height + 2))
+        info.write(b'8BIMnorm' + struct.pack('BBBB', int(layer["opacity"] * 255), 0, 0, 0))
+        extra = exporter._build_layer_extra_data(layer["name"])
+        info.write(struct.pack('>I', len(extra)) + extra)
+    for layer in layers:
+        img_array = np.array(layer["image"])
+        for ch_idx in (3, 0, 1, 2):
+            info.write(struct.pack('>H', 0))
+            info.write(img_array[:, :, ch_idx].tobytes())
+    section = io.BytesIO()
+    info_data = info.getvalue()
+    section.write(struct.pack('>I', len(info_data)) + info_data + struct.pack('>I', 0))
+    section_data = section.getvalue()
+    with open(path, 'wb') as f:
+        f.write(b'8BPS' + struct.pack('>H', 1) + b'\x00' * 6)
+        f.write(struct.pack('>HIIHH', 4, height, width, 8, 3) + struct.pack('>II', 0, 0))
+        f.write(struct.pack('>I', len(section_data)) + section_data)
+        composite = exporter._create_composite_image(layers, width, height)
+        f.write(struct.pack('>H', 0))
+        for channel in range(4):
+            f.write(composite[:, :, channel].tobytes())
+
+
+def _measure(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=2048, help="canvas size in px")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    exporter = puppet_exporter(args.size)
+    count = len(exporter._flatten_layers_for_export())
+    print(f"{count} layers on a {args.size}x{args.size} canvas")
+    print(f"{'writer':>10}  {'ms':>8}  {'file MB':>8}  {'peak MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, write in (("raw", legacy_export),
+                            ("rle", lambda e, p: e._create_psd_manual(p))):
+            path = Path(tmp) / f"{name}.psd"
+            seconds, peak = _measure(lambda: write(exporter, path), args.repeat)
+            print(f"{name:>10}  {seconds * 1000:>8.0f}  {path.stat().st_size / 2**20:>8.1f}  "
+                  f"{peak / 2**20:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark SVG puppet export: embedded rasters vs traced alpha paths.
+
+Builds a flat-shaded cartoon puppet (body, head, the 14 visemes with a few
+identical ones, both blinks) with full-canvas RGBA layers and exports it
+
+- raster: the default, every layer an embedded base64 PNG,
+- vectorize: the luminance contour mode, and
+- traced: ``trace_alpha=True`` at the given Douglas-Peucker tolerance.
+
+Reports export time, file size and load time. Load time is what a
+downstream tool pays to read the file: parsing the XML and decoding every
+embedded PNG, or every path's coordinates.
+
+Usage:
+    python -m tests.benchmarks.bench_svg_export [--size PX] [--tolerance PX] [--repeat N]
+"""
+
+import argparse
+import base64
+import io
+import re
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from core.character_animator.models import EyeBlinkSet, PuppetLayer, PuppetStructure, VisemeSet
+from core.character_animator.svg_exporter import SVGExporter
+
+VISEMES = ["neutral", "ah", "d", "ee", "f", "l", "m", "oh", "r", "s", "uh", "w_oo", "smile",
+           "surprised"]
+XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def cartoon_puppet(size):
+    """A flat-shaded puppet; M, S and Uh are identical to other visemes."""
+    canvas = (size, size)
+    s = size / 100
+
+    body = Image.new("RGBA", canvas, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(body)
+    draw.rounded_rectangle((25 * s, 50 * s, 75 * s, 100 * s), radius=8 * s, fill=(60, 90, 160, 255))
+    draw.rectangle((45 * s, 50 * s, 55 * s, 70 * s), fill=(240, 240, 240, 255))
+    head = Image.new("RGBA", canvas, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(head)
+    draw.ellipse((30 * s, 10 * s, 70 * s, 52 * s), fill=(30, 25, 25, 255))
+    draw.ellipse((31 * s, 11 * s, 69 * s, 51 * s), fill=(235, 190, 160, 255))
+    draw.chord((30 * s, 8 * s, 70 * s, 35 * s), 180, 360, fill=(110, 60, 30, 255))
+    for x in (42, 58):
+        draw.ellipse(((x - 4) * s, 26 * s, (x + 4) * s, 32 * s), fill=(255, 255, 255, 255))
+        draw.ellipse(((x - 2) * s, 27 * s, (x + 2) * s, 31 * s), fill=(40, 30, 30, 255))
+
+    root = PuppetLayer(name="Puppet")
+    root.add_child(PuppetLayer(name="Body", image=body))
+    root.add_child(PuppetLayer(name="Head", children=[PuppetLayer(name="Face", image=head)]))
+    puppet = PuppetStructure(name="Bench", root_layer=root, visemes=VisemeSet(),
+                             eye_blinks=EyeBlinkSet(), width=size, height=size)
+    exporter = SVGExporter(puppet)
+
+    mouths = {}
+    for i, name in enumerate(VISEMES):
+        mouth = Image.new("RGBA", canvas, (0, 0, 0, 0))
+        opening = (i % 5 + 1) * 0.6
+        draw = ImageDraw.Draw(mouth)
+        draw.ellipse((43 * s, (41 - opening) * s, 57 * s, (43 + opening) * s), fill=(120, 30, 40, 255))
+        draw.rectangle((45 * s, (41 - opening) * s, 55 * s, (41.5 - opening / 2) * s),
+                       fill=(250, 250, 250, 255))
+        mouths[name] = mouth
+    for copy, source in (("m", "neutral"), ("s", "ee"), ("uh", "ah")):
+        mouths[copy] = mouths[source].copy()
+    exporter.populate_from_visemes(VisemeSet(**mouths))
+
+    blinks = {}
+    for side, x in (("left_blink", 42), ("right_blink", 58)):
+        blink = Image.new("RGBA", canvas, (0, 0, 0, 0))
+        ImageDraw.Draw(blink).line(((x - 4) * s, 29 * s, (x + 4) * s, 29 * s),
+                                   fill=(40, 30, 30, 255), width=max(2, int(0.6 * s)))
+        blinks[side] = blink
+    exporter.populate_from_blinks(EyeBlinkSet(**blinks))
+    return puppet
+
+
+def load(path):
+    """Parse the SVG and decode what a renderer needs from it."""
+    root = ET.parse(path).getroot()
+    decoded = 0
+    for element in root.iter():
+        href = element.get(XLINK_HREF)
+        if href and href.startswith("data:image/png;base64,"):
+            with Image.open(io.BytesIO(base64.b64decode(href.split(",", 1)[1]))) as image:
+                image.load()
+            decoded += 1
+        path_data = element.get("d")
+        if path_data:
+            np.array(NUMBER.findall(path_data), dtype=float)
+            decoded += 1
+    return decoded
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=2048, help="canvas size in px")
+    parser.add_argument("--tolerance", type=float, default=1.0, help="Douglas-Peucker tolerance in px")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    puppet = cartoon_puppet(args.size)
+    modes = {
+        "raster": {},
+        "vectorize": {"vectorize": True},
+        "traced": {"trace_alpha": True, "simplify_tolerance": args.tolerance},
+    }
+    print(f"{args.size}x{args.size} puppet, tolerance {args.tolerance} px")
+    print(f"{'mode':>10}  {'export ms':>10}  {'file KB':>9}  {'load ms':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode, options in modes.items():
+            path = Path(tmp) / f"{mode}.svg"
+            export_s = _best(lambda: SVGExporter(puppet, **options).export(path), args.repeat)
+            load_s = _best(lambda: load(path), args.repeat)
+            print(f"{mode:>10}  {export_s * 1000:>10.0f}  {path.stat().st_size / 1024:>9.1f}  "
+                  f"{load_s * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark cached-width wrapping against the legacy re-measuring wrap.
+
+Usage:
+    python -m tests.benchmarks.bench_text_wrap [--repeat N]
+"""
+
+import argparse
+import random
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+
+from core.layout import line_breaking
+from core.layout.layout_algorithms import LayoutAlgorithms
+from core.layout.models import TextStyle
+from tests.layout.test_line_breaking import legacy_auto_fit, make_caption
+
+CAPTION_WORDS = [50, 200, 800]
+
+
+def _font_loader(_families, size):
+    return ImageFont.load_default(size=size)
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    draw = ImageDraw.Draw(Image.new("RGB", (10, 10)))
+    style = TextStyle(family=["Default"], size_px=96)
+    rect = (0, 0, 900, 1200)
+    print(f"{'words':>6}  {'legacy ms':>10}  {'cold ms':>9}  {'warm ms':>9}  {'cold x':>7}  {'warm x':>7}")
+    for n_words in CAPTION_WORDS:
+        text = make_caption(rng, n_words)
+
+        def cold():
+            line_breaking._font_widths.clear()
+            LayoutAlgorithms.auto_fit_text(text, rect, style, _font_loader, draw)
+
+        legacy = _best_of(lambda: legacy_auto_fit(text, rect, style, _font_loader, draw), args.repeat)
+        cold_t = _best_of(cold, args.repeat)
+        warm_t = _best_of(
+            lambda: LayoutAlgorithms.auto_fit_text(text, rect, style, _font_loader, draw), args.repeat)
+        print(f"{n_words:>6}  {legacy * 1000:>10.1f}  {cold_t * 1000:>9.1f}  {warm_t * 1000:>9.1f}  "
+              f"{legacy / cold_t:>6.1f}x  {legacy / warm_t:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""Benchmark the tiling engine and panel polygon operations as pages grow.
+
+Generates random slice trees of 1-500 panels (with merge groups) and random
+split/merge sequences like the geometry editor produces, and reports time
+and allocations per operation. With ``--check`` the run fails when an
+operation exceeds its budget or grows faster than its scaling target, so the
+numbers double as a regression baseline. The same check is in the test
+suite as tests/layout/test_tiling_benchmark.py, marked ``slow`` and so only
+run with ``pytest -m slow``.
+
+Usage:
+    python -m tests.benchmarks.bench_tiling [--repeat N] [--seed N] [--check]
+"""
+
+import argparse
+import logging
+import math
+import random
+import sys
+import time
+import tracemalloc
+
+from core.layout import region_ops
+from core.layout.polygon import clip_halfplane, inset_polygon, union_polygons
+from core.layout.tiling import Leaf, Split, tile
+
+PANEL_COUNTS = [1, 10, 50, 100, 250, 500]
+PAGE = (0, 0, 2550, 3300)
+EDIT_OPS = 200
+
+# Budgets in ms per call at the largest size: about 5x the baseline measured
+# when the suite was added, as headroom for slower machines.
+BUDGET_MS = {
+    "tile": 100.0,           # 500 panels
+    "clip_halfplane": 1.0,   # 256 vertices
+    "inset_polygon": 8.0,    # 256 vertices
+    "union_polygons": 250.0, # 128 cells in one merge group
+    "edit_op": 1.0,          # one split or merge on a 500-panel page
+}
+# Largest allowed growth exponent between the smallest and largest measured size
+# (time ~ n ** exponent). Tiling and clipping should stay about linear, an
+# editor operation should not depend on how many other panels the page has,
+# and union_polygons is knowingly quadratic in edge count.
+SCALING_EXPONENT = {
+    "tile": 1.3,
+    "clip_halfplane": 1.3,
+    "inset_polygon": 1.6,
+    "union_polygons": 2.0,
+    "edit_op": 0.5,
+}
+
+
+def random_tree(n_panels, rng, merge_fraction=0.1):
+    """Random slice tree with ``n_panels`` leaves, some sibling pairs merged."""
+    leaves = [Leaf(id="p0")]
+    root = leaves[0]
+    parents = {id(root): None}
+    while len(leaves) < n_panels:
+        # Split the shallowest-ish leaves first so cells stay roughly balanced
+        target = leaves.pop(rng.randrange(len(leaves)) if rng.random() < 0.3 else 0)
+        a, b = Leaf(id=f"p{len(parents)}"), Leaf(id=f"p{len(parents) + 1}")
+        split = Split(axis=rng.choice("xy"), at=rng.uniform(0.3, 0.7), a=a, b=b,
+                      skew=rng.choice([0.0, 0.0, 0.0, rng.uniform(-0.3, 0.3)]))
+        parent = parents[id(target)]
+        if parent is None:
+            root = split
+        elif parent.a is target:
+            parent.a = split
+        else:
+            parent.b = split
+        parents[id(split)] = parent
+        parents[id(a)] = parents[id(b)] = split
+        leaves.extend([a, b])
+    for split in {id(p): p for p in parents.values() if p is not None}.values():
+        if isinstance(split.a, Leaf) and isinstance(split.b, Leaf) and rng.random() < merge_fraction:
+            split.a.merge = split.b.merge = f"m{split.a.id}"
+    return root
+
+
+def random_polygon(n_vertices, rng, cx=1000.0, cy=1000.0, r=800.0):
+    """Convex polygon with ``n_vertices`` points, positively oriented."""
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(n_vertices))
+    return [(cx + r * math.cos(a), cy + r * math.sin(a)) for a in angles]
+
+
+def strip_cells(n_cells):
+    """A row of edge-sharing rectangles, the worst case for a merge group."""
+    w = PAGE[2] / n_cells
+    return [[(i * w, 0.0), ((i + 1) * w, 0.0), ((i + 1) * w, 400.0), (i * w, 400.0)]
+            for i in range(n_cells)]
+
+
+def edit_sequence(regions, n_ops, rng):
+    """Random editor session: split a random panel or merge a split pair back."""
+    regions = {r.id: r for r in regions}
+    pairs = []
+    ops = []
+    for _ in range(n_ops):
+        if pairs and rng.random() < 0.4:
+            a_id, b_id = pairs.pop(rng.randrange(len(pairs)))
+            if a_id in regions and b_id in regions:
+                ops.append(("merge", a_id, b_id))
+                merged = region_ops.merge_regions(regions[a_id], regions[b_id])
+                if merged is not None:
+                    del regions[b_id]
+                    regions[a_id] = merged
+                continue
+        rid = rng.choice(list(regions))
+        x, y, w, h = regions[rid].bbox
+        cx, cy = x + w / 2, y + h / 2
+        angle = rng.uniform(0, math.pi)
+        a = (cx - math.cos(angle) * w, cy - math.sin(angle) * h)
+        b = (cx + math.cos(angle) * w, cy + math.sin(angle) * h)
+        ops.append(("split", rid, a, b))
+        halves = region_ops.split_region(regions[rid], a, b)
+        if halves is not None:
+            del regions[rid]
+            regions[halves[0].id] = halves[0]
+            regions[halves[1].id] = halves[1]
+            pairs.append((halves[0].id, halves[1].id))
+    return ops
+
+
+def replay(regions, ops):
+    """Apply a recorded edit sequence (so timing excludes the random choices)."""
+    regions = {r.id: r for r in regions}
+    for op in ops:
+        if op[0] == "split":
+            _, rid, a, b = op
+            halves = region_ops.split_region(regions[rid], a, b) if rid in regions else None
+            if halves is not None:
+                del regions[rid]
+                regions[halves[0].id] = halves[0]
+                regions[halves[1].id] = halves[1]
+        else:
+            _, a_id, b_id = op
+            if a_id in regions and b_id in regions:
+                merged = region_ops.merge_regions(regions[a_id], regions[b_id])
+                if merged is not None:
+                    del regions[b_id]
+                    regions[a_id] = merged
+    return regions
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _allocated(fn):
+    """(peak bytes, bytes still held) allocated while running ``fn``."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    result = fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak - before, current - before
+
+
+def _measure(name, size, fn, calls, repeat, results, report):
+    seconds = _best_of(fn, repeat) / calls
+    peak, held = _allocated(fn)
+    results.setdefault(name, []).append((size, seconds))
+    report(f"{name:>15}  {size:>6}  {seconds * 1000:>10.3f}  {peak / calls / 1024:>10.1f}  "
+           f"{held / calls / 1024:>10.1f}")
+
+
+def check_budgets(results):
+    """Budget and scaling-target violations in ``results``, as messages."""
+    failures = []
+    for name, points in results.items():
+        size, seconds = max(points)
+        if seconds * 1000 > BUDGET_MS[name]:
+            failures.append(f"{name}: {seconds * 1000:.2f} ms at n={size} "
+                            f"exceeds budget {BUDGET_MS[name]} ms")
+        limit = SCALING_EXPONENT.get(name)
+        (n0, t0), (n1, t1) = min(p for p in points if p[0] > 1), max(points)
+        if limit and n1 > n0 and t0 > 0:
+            exponent = math.log(t1 / t0) / math.log(n1 / n0)
+            if exponent > limit:
+                failures.append(f"{name}: grows as n^{exponent:.2f} "
+                                f"between n={n0} and n={n1} (target <= n^{limit})")
+    return failures
+
+
+def run_benchmarks(repeat=3, seed=0, report=print):
+    """
+    Measure every operation at every size.
+
+    Returns:
+        ``{operation: [(n, seconds per call), ...]}``
+    """
+    rng = random.Random(seed)
+    results = {}
+    report(f"{'operation':>15}  {'n':>6}  {'ms/op':>10}  {'peak KB/op':>10}  {'held KB/op':>10}")
+
+    for n in PANEL_COUNTS:
+        tree = random_tree(n, rng)
+        _measure("tile", n, lambda: tile(tree, PAGE, gutter=24, margin=64), 1,
+                 repeat, results, report)
+
+    for n in [4, 16, 64, 256]:
+        polys = [random_polygon(n, rng) for _ in range(50)]
+        lines = [((rng.uniform(0, 2000), 0.0), (rng.uniform(0, 2000), 2000.0)) for _ in polys]
+        _measure("clip_halfplane", n,
+                 lambda: [clip_halfplane(p, a, b) for p, (a, b) in zip(polys, lines)],
+                 len(polys), repeat, results, report)
+        _measure("inset_polygon", n,
+                 lambda: [inset_polygon(p, [12.0] * len(p)) for p in polys],
+                 len(polys), repeat, results, report)
+
+    for n in [2, 8, 32, 128]:
+        cells = strip_cells(n)
+        _measure("union_polygons", n, lambda: union_polygons(cells), 1, repeat, results, report)
+
+    for n in [10, 100, 500]:
+        page = tile(random_tree(n, rng), PAGE, gutter=24, margin=64)
+        ops = edit_sequence(page, EDIT_OPS, rng)
+        _measure("edit_op", n, lambda: replay(page, ops), len(ops), repeat, results, report)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--check", action="store_true",
+                        help="exit non-zero when a budget or scaling target is missed")
+    args = parser.parse_args()
+    # Random trees at 500 panels include a few slivers the tiler drops with a warning
+    logging.disable(logging.WARNING)
+
+    results = run_benchmarks(args.repeat, args.seed)
+
+    if args.check:
+        failures = check_budgets(results)
+        for failure in failures:
+            print(f"FAIL {failure}")
+        if failures:
+            sys.exit(1)
+        print("All budgets and scaling targets met")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Benchmark glyph vectorization on a full 94-glyph sheet.
+
+Renders the printable ASCII set with a TrueType font at sheet resolution,
+then times
+
+- the contour helpers (resampling, tangents, corner detection) against the
+  per-point Python loops they replaced, on the contours of the sheet, and
+- ``GlyphVectorizer.vectorize_all`` in this process versus the process pool.
+
+Usage:
+    python -m tests.benchmarks.bench_vectorize [--size PX] [--workers N] [--repeat N]
+"""
+
+import argparse
+import math
+import os
+import string
+import time
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from core.font_generator.segmentation import CharacterCell
+from core.font_generator.vectorizer import GlyphVectorizer, SmoothingLevel
+
+SHEET_CHARS = [c for c in string.printable if not c.isspace()]  # 94 glyphs
+
+
+def _font(size):
+    for name in ("DejaVuSans.ttf", "DejaVuSerif.ttf", "LiberationSans-Regular.ttf", "Arial.ttf"):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+def glyph_sheet(size):
+    """One CharacterCell per printable ASCII glyph, rendered at ``size`` px."""
+    font = _font(size)
+    cells = []
+    for char in SHEET_CHARS:
+        img = Image.new("L", (int(size * 1.4), int(size * 1.4)), 255)
+        ImageDraw.Draw(img).text((size * 0.2, size * 0.1), char, fill=0, font=font)
+        cells.append(CharacterCell(label=char, bbox=(0, 0, img.width, img.height),
+                                   image=np.array(img)))
+    return cells
+
+
+def sheet_contours(cells, vectorizer):
+    """Contour point lists as _fit_bezier_path receives them (before corner splits)."""
+    contours = []
+    for cell in cells:
+        binary = vectorizer._prepare_binary(cell.image)
+        found, _ = cv2.findContours(binary, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_NONE)
+        for cnt in found:
+            points = cnt.squeeze()
+            if points.ndim == 2 and len(points) >= 3:
+                contours.append([(float(x), float(y)) for x, y in points])
+    return contours
+
+
+# The per-point loops the NumPy versions replaced, kept here as the baseline
+
+def loop_resample(points, target_count):
+    arc = [0.0]
+    for i in range(1, len(points)):
+        dx = points[i][0] - points[i - 1][0]
+        dy = points[i][1] - points[i - 1][1]
+        arc.append(arc[-1] + math.sqrt(dx * dx + dy * dy))
+    step = arc[-1] / (target_count - 1)
+    out = [points[0]]
+    for i in range(1, target_count - 1):
+        target = i * step
+        for j in range(1, len(arc)):
+            if arc[j] >= target:
+                t = (target - arc[j - 1]) / (arc[j] - arc[j - 1])
+                out.append((points[j - 1][0] + t * (points[j][0] - points[j - 1][0]),
+                            points[j - 1][1] + t * (points[j][1] - points[j - 1][1])))
+                break
+    out.append(points[-1])
+    return out
+
+
+def loop_tangents(points):
+    n = len(points)
+    out = []
+    for i in range(n):
+        if i == 0:
+            dx, dy = points[1][0] - points[0][0], points[1][1] - points[0][1]
+        elif i == n - 1:
+            dx, dy = points[-1][0] - points[-2][0], points[-1][1] - points[-2][1]
+        else:
+            dx, dy = points[i + 1][0] - points[i - 1][0], points[i + 1][1] - points[i - 1][1]
+        length = math.sqrt(dx * dx + dy * dy)
+        out.append((dx / length, dy / length) if length > 0 else (1.0, 0.0))
+    return out
+
+
+def loop_corners(points, threshold_deg):
+    threshold = math.radians(threshold_deg)
+    corners = []
+    for i in range(1, len(points) - 1):
+        (x0, y0), (x1, y1), (x2, y2) = points[i - 1], points[i], points[i + 1]
+        v1, v2 = (x0 - x1, y0 - y1), (x2 - x1, y2 - y1)
+        l1, l2 = math.hypot(*v1), math.hypot(*v2)
+        angle = math.pi if l1 == 0 or l2 == 0 else math.acos(
+            max(-1, min(1, (v1[0] * v2[0] + v1[1] * v2[1]) / (l1 * l2))))
+        if angle < threshold:
+            corners.append(i)
+    return corners
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _row(name, before, after):
+    print(f"{name:>22}  {before * 1000:>10.1f}  {after * 1000:>10.1f}  {before / after:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=256, help="glyph height in px")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    vectorizer = GlyphVectorizer(smoothing=SmoothingLevel.LOW)
+    cells = glyph_sheet(args.size)
+    contours = sheet_contours(cells, vectorizer)
+    points = sum(len(c) for c in contours)
+    print(f"{len(cells)} glyphs, {len(contours)} contours, {points} contour points")
+    print(f"{'operation':>22}  {'before ms':>10}  {'after ms':>10}  {'speedup':>8}")
+
+    # Same target count as _fit_bezier_segment uses
+    _row("resample",
+         _best_of(lambda: [loop_resample(c, max(8, len(c) // 3)) for c in contours], args.repeat),
+         _best_of(lambda: [vectorizer._resample_points(c, max(8, len(c) // 3))
+                           for c in contours], args.repeat))
+    _row("tangents",
+         _best_of(lambda: [loop_tangents(c) for c in contours], args.repeat),
+         _best_of(lambda: [vectorizer._calculate_tangents(c) for c in contours], args.repeat))
+    _row("corners",
+         _best_of(lambda: [loop_corners(c, vectorizer.corner_threshold) for c in contours],
+                  args.repeat),
+         _best_of(lambda: [vectorizer._detect_corners(c) for c in contours], args.repeat))
+
+    serial = _best_of(lambda: vectorizer.vectorize_all(cells, workers=1), args.repeat)
+    pooled = _best_of(lambda: vectorizer.vectorize_all(cells, workers=args.workers), args.repeat)
+    _row(f"vectorize_all x{args.workers}", serial, pooled)
+
+
+if __name__ == "__main__":
+    main()
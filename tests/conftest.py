@@ -1,11 +1,38 @@
+import ctypes
 import os
+import sys
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 import pytest
 
 
+if sys.version_info < (3, 12):
+    # shiboken6 6.12 returns None from void methods without a new reference.
+    # None is immortal from Python 3.12 on; before that, the thousands of Qt
+    # calls a run makes drain its count and the interpreter aborts on exit
+    # ("none_dealloc"). Top it up once so the suite can finish.
+    ctypes.c_ssize_t.from_address(id(None)).value += 1 << 32
+
+
 @pytest.fixture(scope="session")
 def qapp():
     from PySide6.QtWidgets import QApplication
     app = QApplication.instance() or QApplication([])
     yield app
+
+
+@pytest.fixture(autouse=True)
+def _delete_dropped_widgets(request):
+    # GUI tests drop top-level widgets (often in reference cycles) without
+    # closing them. Delete them here, on the GUI thread, as the app does with
+    # deleteLater: left to the cyclic collector they would be torn down on
+    # whichever thread allocates next, e.g. a render worker, which crashes.
+    yield
+    if "qapp" not in request.fixturenames:
+        return
+    from PySide6.QtCore import QCoreApplication, QEvent
+    from PySide6.QtWidgets import QApplication
+    for widget in QApplication.topLevelWidgets():
+        widget.close()
+        widget.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
@@ -0,0 +1,104 @@
+"""Tests for the shared layout image asset cache."""
+
+import os
+
+import pytest
+from PIL import Image, ImageChops, ImageStat
+
+from core.layout import asset_cache
+from core.layout.asset_cache import LayoutAssetCache, open_reduced
+from core.layout.image_processor import ImageProcessor
+from core.layout.models import ImageStyle
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    cache = LayoutAssetCache()
+    monkeypatch.setattr(asset_cache, "_cache", cache)
+    return cache
+
+
+def _gradient(path, size=(400, 300)):
+    img = Image.linear_gradient("L").resize(size).convert("RGB")
+    img.save(path)
+    return path
+
+
+def test_load_and_process_hits_cache(tmp_path, fresh_cache):
+    src = _gradient(tmp_path / "a.png")
+    style = ImageStyle(fit="cover", border_radius_px=8)
+
+    first = ImageProcessor.load_and_process(str(src), (0, 0, 120, 80), style)
+    second = ImageProcessor.load_and_process(str(src), (50, 50, 120, 80), style)
+
+    assert first is second  # page position doesn't matter, only size
+    assert (fresh_cache.hits, fresh_cache.misses) == (1, 1)
+    assert first.size == (120, 80)
+
+    ImageProcessor.load_and_process(str(src), (0, 0, 120, 80), ImageStyle(fit="contain"))
+    assert fresh_cache.misses == 2
+
+
+def test_modified_source_is_reloaded(tmp_path):
+    src = tmp_path / "a.png"
+    Image.new("RGB", (40, 40), (255, 0, 0)).save(src)
+    style = ImageStyle(fit="fill")
+    red = ImageProcessor.load_and_process(str(src), (0, 0, 20, 20), style)
+
+    Image.new("RGB", (40, 40), (0, 0, 255)).save(src)
+    stat = os.stat(src)
+    os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    blue = ImageProcessor.load_and_process(str(src), (0, 0, 20, 20), style)
+
+    assert red.getpixel((10, 10))[:3] == (255, 0, 0)
+    assert blue.getpixel((10, 10))[:3] == (0, 0, 255)
+
+
+def test_lru_eviction_respects_budget(tmp_path):
+    cache = LayoutAssetCache(memory_budget=3 * 100 * 100 * 4)
+    src = _gradient(tmp_path / "a.png")
+    for size in (100, 101, 102, 103):
+        cache.get_or_build(str(src), ("pil", size),
+                           lambda: Image.new("RGBA", (100, 100)))
+    assert cache.memory_used <= cache.memory_budget
+    assert cache.get_or_build(str(src), ("pil", 103), lambda: None) is not None
+    assert cache.get_or_build(str(src), ("pil", 100), lambda: None) is None  # evicted
+
+
+def test_missing_source_returns_none(tmp_path):
+    assert ImageProcessor.load_and_process(
+        str(tmp_path / "missing.png"), (0, 0, 10, 10), ImageStyle()) is None
+
+
+@pytest.mark.parametrize("fmt", ["JPEG", "PNG"])
+def test_large_sources_decode_reduced(tmp_path, fmt):
+    src = tmp_path / f"big.{fmt.lower()}"
+    _gradient(src, size=(2400, 1600))
+
+    reduced = open_reduced(str(src), 200, 100)
+    assert reduced.width < 2400
+    assert reduced.width >= 400 and reduced.height >= 200
+
+    style = ImageStyle(fit="cover")
+    cached = ImageProcessor.load_and_process(str(src), (0, 0, 200, 100), style)
+    full = ImageProcessor.load_and_process(str(src), (0, 0, 200, 100), style, use_cache=False)
+    reference = Image.open(src).convert("RGBA")
+    reference = ImageProcessor._apply_fit_mode(reference, 200, 100, "cover")
+
+    assert cached.size == full.size == (200, 100)
+    diff = ImageStat.Stat(ImageChops.difference(cached.convert("RGB"),
+                                                reference.convert("RGB"))).mean
+    assert max(diff) < 2.0
+
+
+def test_qt_renderer_shares_cache(qapp, tmp_path, fresh_cache):
+    from core.layout import qt_renderer
+    from core.layout.models import PageSpec, Region
+
+    src = _gradient(tmp_path / "a.png")
+    page = PageSpec(page_size_px=(200, 150), regions=[
+        Region(id="r", kind="image", bbox=(0, 0, 100, 100), image_ref=str(src))])
+
+    qt_renderer.render_page_to_image(page)
+    qt_renderer.render_page_to_image(page)
+    assert (fresh_cache.hits, fresh_cache.misses) == (1, 1)
@@ -108,3 +108,75 @@ def test_import_rejects_zip_slip(tmp_path):
     import pytest
     with pytest.raises(ValueError):
         bundle_io.import_bundle(str(evil), str(tmp_path / "dest"))
+
+
+def test_identical_content_at_different_paths_is_embedded_once(tmp_path):
+    a = tmp_path / "a.png"; a.write_bytes(b"SAME-BYTES")
+    b = tmp_path / "copy" / "b.png"; b.parent.mkdir(); b.write_bytes(b"SAME-BYTES")
+    c = tmp_path / "c.png"; c.write_bytes(b"DIFF-BYTES")  # same size, other content
+    doc = _doc([
+        Region(id="i1", kind="image", bbox=(0, 0, 100, 100), image_ref=str(a)),
+        Region(id="i2", kind="image", bbox=(0, 100, 100, 100), image_ref=str(b)),
+        Region(id="i3", kind="image", bbox=(0, 200, 100, 100), image_ref=str(c)),
+    ])
+    out = tmp_path / "b.iaibundle"
+    manifest = bundle_io.export_bundle(doc, str(out))
+    assert manifest.images[str(a)] == manifest.images[str(b)] != manifest.images[str(c)]
+    with zipfile.ZipFile(out) as zf:
+        assert len([n for n in zf.namelist() if n.startswith("images/")]) == 2
+
+
+def test_compressed_formats_are_stored_not_deflated(tmp_path):
+    img = tmp_path / "pic.png"; img.write_bytes(b"P" * 4096)
+    font_file = tmp_path / "MyFont.ttf"; font_file.write_bytes(b"T" * 4096)
+    doc = _doc([
+        Region(id="i1", kind="image", bbox=(0, 0, 100, 100), image_ref=str(img)),
+        Region(id="t1", kind="text", bbox=(0, 110, 100, 40), text="x", role="title"),
+    ])
+    out = tmp_path / "b.iaibundle"
+    bundle_io.export_bundle(doc, str(out), font_resolver=lambda families: font_file)
+    with zipfile.ZipFile(out) as zf:
+        kinds = {Path(i.filename).suffix: i.compress_type for i in zf.infolist()}
+        assert zf.read("images/pic.png") == b"P" * 4096
+    assert kinds[".png"] == zipfile.ZIP_STORED
+    assert kinds[".ttf"] == zipfile.ZIP_DEFLATED
+
+
+def test_lazy_import_extracts_assets_on_first_access(tmp_path):
+    img = tmp_path / "pic.png"; img.write_bytes(b"DATA")
+    doc = _doc([Region(id="i1", kind="image", bbox=(0, 0, 100, 100), image_ref=str(img))])
+    out = tmp_path / "b.iaibundle"
+    bundle_io.export_bundle(doc, str(out))
+
+    dest = tmp_path / "extracted"
+    doc2 = bundle_io.import_bundle(str(out), str(dest), lazy=True)
+    ref = doc2.pages[0].regions[0].image_ref
+    assert Path(ref).is_absolute() and not Path(ref).exists()
+    assert bundle_io.ensure_asset(ref)
+    assert Path(ref).read_bytes() == b"DATA"
+    assert not bundle_io.ensure_asset(str(dest / "images" / "unknown.png"))
+
+
+def test_lazy_import_renders_through_the_pil_engine(tmp_path):
+    from PIL import Image
+    from core.layout.engine import LayoutEngine
+    from core.layout.font_manager import FontManager
+    from core.layout.image_processor import ImageProcessor
+    from core.layout.models import ImageBlock, ImageStyle, PageSpec
+    img = tmp_path / "pic.png"
+    Image.new("RGB", (40, 40), (200, 30, 30)).save(img)
+    doc = _doc([Region(id="i1", kind="image", bbox=(0, 0, 100, 100), image_ref=str(img))])
+    out = tmp_path / "b.iaibundle"
+    bundle_io.export_bundle(doc, str(out))
+
+    ref = bundle_io.import_bundle(str(out), str(tmp_path / "x"), lazy=True).pages[0].regions[0].image_ref
+    processed = ImageProcessor.load_and_process(ref, (0, 0, 20, 20), ImageStyle(), use_cache=False)
+    assert processed is not None and processed.size == (20, 20)
+
+    ref = bundle_io.import_bundle(str(out), str(tmp_path / "y"), lazy=True).pages[0].regions[0].image_ref
+    page = PageSpec(page_size_px=(60, 60), margin_px=0, background="#FFFFFF",
+                    blocks=[ImageBlock(id="b", rect=(0, 0, 60, 60), image_path=ref)])
+    manifest = tmp_path / "fonts.json"
+    manifest.write_text("{}", encoding="utf-8")  # skip system font discovery
+    engine = LayoutEngine(FontManager(manifest_path=manifest))
+    assert engine.render_page_to_image(page).getpixel((30, 30))[:3] == (200, 30, 30)
@@ -48,3 +48,15 @@ def test_export_bad_extension(tmp_path):
     p = _project(tmp_path)
     rc = layout_cli.run_export_cmd(_args(p, tmp_path / "out.gif"), _StubConfig())
     assert rc == 2
+
+
+def test_export_png_multipage_numbers_pages(tmp_path):
+    doc = DocumentSpec(title="t", pages=[
+        PageSpec(page_size_px=(120 + 10 * i, 100), background="#FFFFFF") for i in range(3)])
+    p = tmp_path / "proj.json"
+    project_io.save_project(doc, str(p))
+    rc = layout_cli.run_export_cmd(_args(p, tmp_path / "out.png"), _StubConfig())
+    assert rc == 0
+    from PIL import Image
+    sizes = [Image.open(tmp_path / f"out-{i:03d}.png").size for i in (1, 2, 3)]
+    assert sizes == [(120, 100), (130, 100), (140, 100)]
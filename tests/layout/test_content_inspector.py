@@ -149,3 +149,26 @@ def test_set_prompt_text_only_updates_current_region(qapp):
     assert insp.prompt_edit.toPlainText() == ""
     insp.set_prompt_text("i1", "applied")
     assert insp.prompt_edit.toPlainText() == "applied"
+
+
+def test_font_load_is_retried_after_an_empty_scan(qapp, monkeypatch):
+    from gui.layout import font_loader
+
+    scans = [[], ["Alpha", "Beta"]]
+    monkeypatch.setattr(font_loader, "_CACHE", None)
+    monkeypatch.setattr(font_loader, "_LOADER", None)
+    monkeypatch.setattr(font_loader, "_enumerate", lambda: scans.pop(0))
+
+    def settle():
+        assert font_loader._LOADER.wait(10_000)
+        qapp.processEvents()
+
+    first = ContentInspector()
+    settle()
+    assert font_loader.cached_families() is None
+    assert first.font_combo.findText("Alpha") < 0
+
+    second = ContentInspector()
+    settle()
+    assert font_loader.cached_families() == ["Alpha", "Beta"]
+    assert second.font_combo.findText("Alpha") >= 0
@@ -0,0 +1,85 @@
+"""Tests for page-parallel document rendering in LayoutEngine."""
+
+import pytest
+from PIL import Image, ImageChops
+
+from core.layout.engine import REPORTLAB_AVAILABLE, LayoutEngine
+from core.layout.font_manager import FontManager
+from core.layout.models import DocumentSpec, ImageBlock, ImageStyle, PageSpec, TextBlock, TextStyle
+
+
+@pytest.fixture
+def engine(tmp_path):
+    manifest = tmp_path / "fonts.json"
+    manifest.write_text("{}", encoding="utf-8")  # skip system font discovery
+    return LayoutEngine(FontManager(manifest_path=manifest))
+
+
+def _doc(tmp_path, pages=5):
+    src = tmp_path / "art.png"
+    Image.new("RGB", (64, 48), (200, 40, 40)).save(src)
+    specs = []
+    for i in range(pages):
+        specs.append(PageSpec(
+            page_size_px=(240, 320),
+            background="#FFFFFF" if i % 2 else "#EEEEEE",
+            blocks=[
+                ImageBlock(id="img", rect=(10, 10, 120 + i * 10, 90),
+                           image_path=str(src), style=ImageStyle(fit="contain")),
+                TextBlock(id="txt", rect=(10, 120, 220, 150), text=f"Page {i + 1} text " * 5,
+                          style=TextStyle(family=["DejaVu Sans"], size_px=14)),
+            ],
+        ))
+    return DocumentSpec(title="Parallel", author="Tester", pages=specs)
+
+
+def test_iter_rendered_pages_matches_sequential_order(engine, tmp_path):
+    doc = _doc(tmp_path)
+    sequential = list(engine.iter_rendered_pages(doc.pages, workers=1))
+    parallel = list(engine.iter_rendered_pages(doc.pages, workers=2, max_in_flight=2))
+
+    assert len(parallel) == len(sequential) == 5
+    for a, b in zip(sequential, parallel):
+        assert a.size == b.size
+        assert ImageChops.difference(a, b).getbbox() is None
+
+
+def test_render_document_png_parallel(engine, tmp_path):
+    doc = _doc(tmp_path, pages=3)
+    paths = engine.render_document_png(doc, tmp_path / "out", workers=2)
+
+    assert [p.name for p in paths] == ["page_001.png", "page_002.png", "page_003.png"]
+    assert all(p.exists() for p in paths)
+
+
+@pytest.mark.skipif(not REPORTLAB_AVAILABLE, reason="ReportLab not installed")
+def test_render_document_pdf_writes_pages_in_order(engine, tmp_path):
+    doc = _doc(tmp_path, pages=4)
+    out = tmp_path / "book.pdf"
+    engine.render_document_pdf(doc, out, workers=2, max_in_flight=2)
+
+    data = out.read_bytes()
+    assert data.startswith(b"%PDF")
+    assert data.count(b"/Type /Page\n") == 4
+    assert not list(tmp_path.glob("**/page_*.png"))  # no PNG round-trip
+
+
+def test_rendering_stays_in_process_by_default(engine, tmp_path, monkeypatch):
+    import core.layout.engine as engine_module
+
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("a process pool was started without workers > 1")
+
+    monkeypatch.setattr(engine_module, "ProcessPoolExecutor", _no_pool)
+    doc = _doc(tmp_path, pages=3)
+    assert len(engine.render_document_png(doc, tmp_path / "out")) == 3
+
+
+@pytest.mark.skipif(not REPORTLAB_AVAILABLE, reason="ReportLab not installed")
+def test_save_pdf_without_pngs_renders_directly(engine, tmp_path):
+    doc = _doc(tmp_path, pages=2)
+    out = tmp_path / "book.pdf"
+    engine.save_pdf(doc, out, workers=2)
+
+    assert out.read_bytes().count(b"/Type /Page\n") == 2
+    assert not list(tmp_path.glob("**/page_*.png"))
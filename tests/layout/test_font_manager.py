@@ -0,0 +1,111 @@
+"""Tests for font discovery with the persistent scan cache."""
+
+import os
+
+import pytest
+
+pytest.importorskip("fontTools")
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+from core.layout import font_manager as fm_module
+from core.layout.font_manager import FontManager
+
+
+def make_font(path, family, style="Regular"):
+    """Write a minimal TrueType font with the given family name."""
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder([".notdef", "A"])
+    fb.setupCharacterMap({0x41: "A"})
+    pen = TTGlyphPen(None)
+    pen.moveTo((100, 0))
+    pen.lineTo((500, 700))
+    pen.lineTo((900, 0))
+    pen.closePath()
+    glyph = pen.glyph()
+    fb.setupGlyf({".notdef": glyph, "A": glyph})
+    fb.setupHorizontalMetrics({".notdef": (1000, 100), "A": (1000, 100)})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": family, "styleName": style})
+    fb.setupOS2()
+    fb.setupPost()
+    fb.save(str(path))
+    return path
+
+
+@pytest.fixture
+def font_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(FontManager, "_get_system_font_dirs", lambda self: [])
+    fonts = tmp_path / "fonts"
+    (fonts / "sub").mkdir(parents=True)
+    make_font(fonts / "Comic-Bold.ttf", "Comic Hand", "Bold")
+    make_font(fonts / "Comic.ttf", "Comic Hand")
+    make_font(fonts / "sub" / "Serif.otf", "Book Serif")
+    (fonts / "notes.txt").write_text("not a font")
+    (fonts / "Broken.ttf").write_bytes(b"garbage")
+    return fonts
+
+
+def _manager(tmp_path, font_dir, **kwargs):
+    return FontManager(custom_dirs=[font_dir], scan_cache_path=tmp_path / "scan.json", **kwargs)
+
+
+def _count_parses(monkeypatch):
+    calls = []
+    original = fm_module.read_font_family
+
+    def counting(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(fm_module, "read_font_family", counting)
+    return calls
+
+
+def test_discovery_reads_family_names(tmp_path, font_dir):
+    fm = _manager(tmp_path, font_dir)
+
+    assert fm.get_available_families() == ["Comic", "Serif"]
+    assert fm._manifest["Comic"]["files"][0].endswith("Comic.ttf")  # regular face first
+    assert fm.select_font_file(["Comic Hand"]).name == "Comic.ttf"
+    assert fm.select_font_file(["Book Serif"]).name == "Serif.otf"
+
+
+def test_rescan_only_parses_changed_files(tmp_path, font_dir, monkeypatch):
+    _manager(tmp_path, font_dir)
+    calls = _count_parses(monkeypatch)
+
+    _manager(tmp_path, font_dir)
+    assert calls == []
+
+    make_font(font_dir / "sub" / "Serif.otf", "Book Serif Two")
+    st = os.stat(font_dir / "sub" / "Serif.otf")
+    os.utime(font_dir / "sub" / "Serif.otf", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    make_font(font_dir / "Extra.ttf", "Extra Face")
+    fm = _manager(tmp_path, font_dir)
+
+    assert sorted(os.path.basename(p) for p in calls) == ["Extra.ttf", "Serif.otf"]
+    assert fm.select_font_file(["Book Serif Two"]).name == "Serif.otf"
+    assert "Extra" in fm.get_available_families()
+
+
+def test_removed_files_drop_out(tmp_path, font_dir):
+    _manager(tmp_path, font_dir)
+    (font_dir / "sub" / "Serif.otf").unlink()
+    assert _manager(tmp_path, font_dir).get_available_families() == ["Comic"]
+
+
+def test_parallel_parse_matches_serial(tmp_path, font_dir, monkeypatch):
+    for i in range(6):
+        make_font(font_dir / f"Face{i}.ttf", f"Face {i}")
+    serial = _manager(tmp_path / "a", font_dir, workers=1)
+    monkeypatch.setattr(fm_module, "PARALLEL_PARSE_THRESHOLD", 2)
+    parallel = _manager(tmp_path / "b", font_dir, workers=2)
+    assert parallel._manifest == serial._manifest
+
+
+def test_pil_fonts_cached_per_path_and_size(tmp_path, font_dir):
+    fm = _manager(tmp_path, font_dir)
+    a = fm.pil_font(["Comic"], 24)
+    assert fm.pil_font(["Comic Hand"], 24) is a
+    assert fm.pil_font(["Comic"], 32) is not a
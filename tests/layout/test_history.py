@@ -80,3 +80,79 @@ def test_branch_from_records_real_branch_topology():
     # and the next append chains from s3, not s1 again
     s4 = h2.append("fourth", snapshot_id="s4", timestamp="t4")
     assert s4.parent_id == "s3"
+
+
+def _multi_page_doc(n_pages=3):
+    from core.layout.models import DocumentSpec, PageSpec, Region
+    return DocumentSpec(title="D", pages=[
+        PageSpec(page_size_px=(100, 100), regions=[Region(id=f"r{i}", kind="text", text=f"p{i}")])
+        for i in range(n_pages)])
+
+
+def test_unchanged_pages_are_shared_between_snapshots():
+    from core.layout.history import History
+    doc = _multi_page_doc()
+    h = History(doc)
+    s1 = h.append("first")
+    doc.pages[1].regions[0].text = "edited"
+    s2 = h.append("second")
+
+    assert s1.page_refs[0] == s2.page_refs[0] and s1.page_refs[1] != s2.page_refs[1]
+    assert s2.document["pages"][0] is s1.document["pages"][0]
+    assert s2.document["pages"][2] is s1.document["pages"][2]
+    assert s2.document["pages"][1]["regions"][0]["text"] == "edited"
+
+
+def test_project_file_stores_each_page_once(tmp_path):
+    import json
+    from core.layout.history import History
+    from core.layout.project_io import load_project, save_project
+    doc = _multi_page_doc()
+    h = History(doc)
+    for i in range(5):
+        doc.pages[0].regions[0].text = f"v{i}"
+        h.append(f"step {i}")
+
+    path = tmp_path / "p.iaiproj.json"
+    save_project(doc, str(path))
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert len(data["history_chunks"]) == 5 + 2  # 5 versions of page 0, pages 1-2 once
+    assert all("pages" not in s["document"] for s in data["history"])
+
+    loaded = load_project(str(path))
+    h2 = History(loaded)
+    assert h2.restore(loaded.history[2].id).pages[0].regions[0].text == "v2"
+    assert loaded.history[0].document["pages"][1] is loaded.history[4].document["pages"][1]
+    # a new snapshot after reload reuses the loaded chunks
+    s = h2.append("after reload")
+    assert s.document["pages"][1] is loaded.history[0].document["pages"][1]
+
+
+def test_legacy_full_snapshots_still_load_and_are_deduplicated_on_save():
+    doc_dict = schema.document_to_dict(_doc_with_text("v1"))
+    legacy_snapshot = {"id": "old", "parent_id": None, "timestamp": "t", "prompt": "p",
+                       "document": {k: v for k, v in doc_dict.items() if k != "history"}}
+    doc_dict["history"] = [legacy_snapshot, dict(legacy_snapshot, id="old2")]
+    doc_dict.pop("history_chunks", None)  # only written when there is history
+
+    doc = schema.document_from_dict(doc_dict)
+    from core.layout.history import History
+    assert History(doc).restore("old").pages[0].regions[0].text == "v1"
+    again = schema.document_to_dict(doc)
+    assert len(again["history_chunks"]) == 1
+
+
+def test_snapshot_with_missing_page_chunk_is_dropped_on_load(caplog):
+    from core.layout.history import History
+    doc = _doc_with_text("v1")
+    h = History(doc)
+    h.append("first")
+    doc.pages[0].regions[0].text = "v2"
+    h.append("second")
+    data = schema.document_to_dict(doc)
+    data["history_chunks"].pop(data["history"][0]["page_refs"][0])
+
+    loaded = schema.document_from_dict(data)
+    assert [s.prompt for s in loaded.history] == ["second"]
+    assert loaded.pages[0].regions[0].text == "v2"
+    assert "missing from history_chunks" in caplog.text
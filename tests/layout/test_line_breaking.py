@@ -0,0 +1,131 @@
+"""Tests for cached-width line breaking."""
+
+import random
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from core.layout.layout_algorithms import LayoutAlgorithms
+from core.layout.line_breaking import (
+    font_widths, greedy_breaks, optimal_breaks, wrap_words,
+)
+from core.layout.models import TextStyle
+from core.layout.text_renderer import TextLayoutEngine
+
+WORDS = ("the quick brown fox jumps over a lazy dog while seven extraordinary "
+         "balloons drift past an astonished lighthouse keeper").split()
+
+
+def legacy_wrap(text, font, max_width, draw):
+    """The original wrap: re-measures the whole growing line for every word."""
+    lines, current = [], ""
+    for word in text.split():
+        trial = (current + " " + word).strip()
+        if draw.textlength(trial, font=font) <= max_width:
+            current = trial
+        else:
+            if current:
+                lines.append(current)
+            current = word
+    if current:
+        lines.append(current)
+    return lines
+
+
+def legacy_auto_fit(text, rect, style, font_loader, draw, min_size=8):
+    """The original auto-fit binary search over legacy_wrap."""
+    _, _, w, h = rect
+    low, high, best = min_size, style.size_px, min_size
+    while low <= high:
+        mid = (low + high) // 2
+        font = font_loader(style.family, mid)
+        ascent, descent = font.getmetrics()
+        lines = legacy_wrap(text, font, w, draw)
+        if int((ascent + descent) * style.line_height) * len(lines) <= h:
+            best, low = mid, mid + 1
+        else:
+            high = mid - 1
+    return best
+
+
+def make_caption(rng, n_words):
+    return " ".join(rng.choice(WORDS) for _ in range(n_words))
+
+
+def font_loader(_families, size):
+    return ImageFont.load_default(size=size)
+
+
+@pytest.fixture
+def draw():
+    return ImageDraw.Draw(Image.new("RGB", (10, 10)))
+
+
+def test_greedy_breaks_spans():
+    assert greedy_breaks([10, 10, 10, 10], 2, 22) == [(0, 2, 22), (2, 4, 22)]
+    # A word wider than the line gets its own line
+    assert greedy_breaks([5, 50, 5], 1, 20) == [(0, 1, 5), (1, 2, 50), (2, 3, 5)]
+    assert greedy_breaks([], 1, 20) == []
+
+
+def test_optimal_breaks_evens_out_lines():
+    widths, space, max_width = [3, 2, 2, 5], 1, 6
+    greedy = greedy_breaks(widths, space, max_width)
+    optimal = optimal_breaks(widths, space, max_width)
+
+    def raggedness(spans):
+        return sum((max_width - w) ** 2 for _, _, w in spans[:-1])
+
+    assert [(s, e) for s, e, _ in greedy] == [(0, 2), (2, 3), (3, 4)]
+    assert [(s, e) for s, e, _ in optimal] == [(0, 1), (1, 3), (3, 4)]
+    assert raggedness(optimal) == 10 < raggedness(greedy) == 16
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_wrap_matches_legacy_line_count(draw, seed):
+    rng = random.Random(seed)
+    text = make_caption(rng, 80)
+    font = ImageFont.load_default(size=20)
+    for width in (120, 240, 400):
+        legacy = legacy_wrap(text, font, width, draw)
+        wrapped = wrap_words(text, font, width)
+        assert " ".join(wrapped) == " ".join(legacy)
+        # Summed word widths ignore cross-word kerning; allow one line of drift
+        assert abs(len(wrapped) - len(legacy)) <= 1
+
+
+def test_widths_are_cached_per_font_and_size():
+    a = ImageFont.load_default(size=18)
+    fw = font_widths(a)
+    assert font_widths(a) is fw
+    fw.width("balloons")
+    assert "balloons" in fw._widths
+    assert font_widths(ImageFont.load_default(size=24)) is not fw
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_auto_fit_matches_legacy(draw, seed):
+    rng = random.Random(seed)
+    text = make_caption(rng, 120)
+    style = TextStyle(family=["Default"], size_px=48)
+    rect = (0, 0, 300, 400)
+    result = LayoutAlgorithms.auto_fit_text(text, rect, style, font_loader, draw)
+    assert result.fits
+    assert abs(result.font_size - legacy_auto_fit(text, rect, style, font_loader, draw)) <= 1
+
+
+def test_text_engine_optimal_mode(draw):
+    text = make_caption(random.Random(7), 60)
+    font = ImageFont.load_default(size=16)
+    style = TextStyle(family=["Default"], size_px=16)
+    greedy = TextLayoutEngine(line_breaking="greedy")
+    greedy.hyphenator = None
+    optimal = TextLayoutEngine(line_breaking="optimal")
+
+    g = greedy._wrap_paragraph(text, font, 200, style, draw)
+    o = optimal._wrap_paragraph(text, font, 200, style, draw)
+
+    assert " ".join(line.text for line in o) == " ".join(text.split())
+    assert all(line.width <= 200 for line in o)
+    spread = lambda lines: max(l.width for l in lines[:-1]) - min(l.width for l in lines[:-1])
+    assert spread(o) <= spread(g)
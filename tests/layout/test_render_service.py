@@ -0,0 +1,257 @@
+"""Tests for scene-free page painting and the background page render service."""
+
+import os
+import threading
+import time
+
+import pytest
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QColor, QImage, QPainter
+
+from core.layout import qt_renderer
+from core.layout.models import (
+    ImageStyle, Overlay, OverlayStyle, PageSpec, PathSegment, ProjectStyle, Region, TextStyle,
+)
+from core.layout.render_service import PageRenderService, PageThumbnailer
+
+
+def _write_image(path, color):
+    img = QImage(60, 40, QImage.Format_RGB32)
+    img.fill(QColor(color))
+    assert img.save(str(path), "PNG")
+    return str(path)
+
+
+def _page(image_ref=None, text="Hello"):
+    return PageSpec(page_size_px=(240, 180), background="#1144CC", regions=[
+        Region(id="img", kind="image", bbox=(10, 10, 120, 90), image_ref=image_ref),
+        Region(id="tri", kind="image", shape="polygon", bbox=(140, 10, 90, 90),
+               points=[(140, 10), (230, 10), (185, 100)], name="empty"),
+        Region(id="txt", kind="text", bbox=(10, 110, 220, 60), text=text + "\nsecond line",
+               text_style=TextStyle(family=["DejaVu Sans"], size_px=18, color="#FFEE00")),
+    ], overlays=[
+        Overlay(id="b", kind="speech", text="Hi there, friend", anchor=(170.0, 130.0),
+                tail_target=(200.0, 175.0), rotation=-10,
+                style=OverlayStyle(fill="#FFFFFF", stroke_px=2.0)),
+        Overlay(id="s", kind="sfx", text="BAM", anchor=(60.0, 60.0)),
+    ])
+
+
+_REGION_CASES = {
+    "cover": lambda img: Region(id="r", kind="image", bbox=(20, 20, 120, 60), image_ref=img,
+                                image_style=ImageStyle(fit="cover", stroke_px=3)),
+    "contain": lambda img: Region(id="r", kind="image", bbox=(20, 20, 150, 150), image_ref=img,
+                                  image_style=ImageStyle(fit="contain")),
+    "placeholder": lambda img: Region(id="r", kind="image", bbox=(20, 20, 150, 100), name="empty"),
+    "placeholder-stroked": lambda img: Region(
+        id="r", kind="image", bbox=(20, 20, 150, 100),
+        image_style=ImageStyle(stroke_px=4, stroke_color="#AA0000")),
+    "polygon": lambda img: Region(id="r", kind="image", shape="polygon", bbox=(20, 20, 160, 140),
+                                  points=[(20, 20), (180, 40), (90, 160)], image_ref=img),
+    "path": lambda img: Region(id="r", kind="image", shape="path", bbox=(20, 20, 160, 140),
+                               image_ref=img, segments=[
+                                   PathSegment("move", [(20, 20)]),
+                                   PathSegment("cubic", [(120, 0), (200, 80), (180, 160)]),
+                                   PathSegment("line", [(20, 160)]),
+                                   PathSegment("close")]),
+    "text": lambda img: Region(id="r", kind="text", bbox=(20, 20, 160, 80), text="Bold\nwords",
+                               text_style=TextStyle(family=["DejaVu Sans"], size_px=20,
+                                                    weight="bold", italic=True, color="#00AA00")),
+    "text-role": lambda img: Region(id="r", kind="text", bbox=(20, 20, 160, 80),
+                                    text="Role styled", role="title"),
+    "text-clipped": lambda img: Region(id="r", kind="text", shape="polygon", bbox=(20, 20, 100, 60),
+                                       points=[(20, 20), (120, 20), (20, 80)],
+                                       text="This line overflows its triangle"),
+}
+
+_STYLE = ProjectStyle(font_roles={
+    "title": TextStyle(family=["DejaVu Serif"], size_px=26, color="#884400"),
+    "caption": TextStyle(family=["DejaVu Sans"], size_px=14, color="#FFFFFF"),
+})
+
+
+def _overlay_case(kind, rotation):
+    return Overlay(id="o", kind=kind, text="Wrap this overlay text please", anchor=(100.0, 90.0),
+                   tail_target=(40.0, 170.0) if kind in ("speech", "thought") else None,
+                   rotation=rotation,
+                   style=OverlayStyle(fill="#FFFFFF", stroke_px=2.0, max_width_px=120))
+
+
+def _scene_render(page, style=None):
+    pw, ph = page.page_size_px
+    img = QImage(pw, ph, QImage.Format_ARGB32)
+    img.fill(QColor(qt_renderer._resolve_bg(page)))
+    painter = QPainter(img)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    qt_renderer.build_scene(page, style=style).render(painter, QRectF(0, 0, pw, ph), QRectF(0, 0, pw, ph))
+    painter.end()
+    return img
+
+
+def test_painter_render_matches_editor_scene(qapp, tmp_path):
+    page = _page(_write_image(tmp_path / "a.png", "#CC2020"))
+    assert qt_renderer.render_page_to_image(page) == _scene_render(page)
+
+
+@pytest.mark.parametrize("case", sorted(_REGION_CASES))
+def test_painter_matches_scene_for_region_kind(qapp, tmp_path, case):
+    region = _REGION_CASES[case](_write_image(tmp_path / "a.png", "#CC2020"))
+    page = PageSpec(page_size_px=(200, 180), background="#1144CC", regions=[region])
+    assert qt_renderer.render_page_to_image(page, style=_STYLE) == _scene_render(page, _STYLE)
+
+
+@pytest.mark.parametrize("rotation", [0.0, 25.0])
+@pytest.mark.parametrize("kind", ["speech", "thought", "caption", "sfx"])
+def test_painter_matches_scene_for_overlay_kind(qapp, kind, rotation):
+    page = PageSpec(page_size_px=(200, 180), background="#1144CC",
+                    overlays=[_overlay_case(kind, rotation)])
+    assert qt_renderer.render_page_to_image(page, style=_STYLE) == _scene_render(page, _STYLE)
+
+
+def test_worker_thread_render_matches_main_thread(qapp, tmp_path):
+    page = _page(_write_image(tmp_path / "a.png", "#CC2020"))
+    expected = qt_renderer.render_page_to_image(page, scale=0.5)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(
+        qt_renderer.render_page_to_image(page, scale=0.5))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(results) == 4 and all(img == expected for img in results)
+
+
+def test_cache_keys_on_page_content_scale_and_image_source(qapp, tmp_path):
+    image = _write_image(tmp_path / "a.png", "#CC2020")
+    page = _page(image)
+    service = PageRenderService(workers=2)
+    try:
+        first = service.submit(page, scale=0.5).result(timeout=30)
+        assert service.submit(page, scale=0.5).result(timeout=30) is first
+        assert service.cached(_page(image), scale=0.5) is first  # equal content, new object
+
+        assert service.submit(page, scale=0.25).result(timeout=30) is not first
+        page.regions[2].text = "Changed"
+        assert service.cached(page, scale=0.5) is None
+        page.regions[2].text = "Hello\nsecond line"
+
+        _write_image(tmp_path / "a.png", "#20CC20")
+        stat = os.stat(image)
+        os.utime(image, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert service.cached(page, scale=0.5) is None
+        recolored = service.submit(page, scale=0.5).result(timeout=30)
+        assert recolored.pixelColor(35, 30) == QColor("#20CC20")
+    finally:
+        service.shutdown()
+
+
+def test_render_pages_keeps_page_order(qapp):
+    service = PageRenderService(workers=3)
+    try:
+        pages = [_page(text=f"Page {i}") for i in range(7)]
+        for i, page in enumerate(pages):
+            page.page_size_px = (100 + i, 80)
+        sizes = [img.width() for img in service.render_pages(pages)]
+        assert sizes == [100 + i for i in range(7)]
+    finally:
+        service.shutdown()
+
+
+def test_thumbnails_arrive_progressively_and_stale_requests_are_dropped(qapp):
+    service = PageRenderService(workers=2)
+    thumbnailer = PageThumbnailer(service, max_size=64)
+    received = []
+    done = []
+    thumbnailer.thumbnailReady.connect(lambda i, img: received.append((i, img.size())))
+    thumbnailer.finished.connect(lambda: done.append(True))
+    try:
+        stale = [_page(text=f"Old {i}") for i in range(3)]
+        for page in stale:
+            page.page_size_px = (180, 240)  # portrait, unlike the current pages
+        pages = [_page(text=f"Page {i}") for i in range(4)]
+        thumbnailer.request(stale)
+        assert thumbnailer.request(pages) == 4
+        deadline = time.monotonic() + 30
+        while not done and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+        assert sorted(i for i, _ in received) == [0, 1, 2, 3]
+        assert all((size.width(), size.height()) == (64, 48) for _, size in received)
+
+        # Everything is cached now: a repeat request is answered synchronously
+        received.clear()
+        assert thumbnailer.request(pages) == 0
+        assert sorted(i for i, _ in received) == [0, 1, 2, 3]
+    finally:
+        service.shutdown()
+
+
+def test_thumbnail_finishing_during_request_is_delivered_once(qapp):
+    from concurrent.futures import Future
+
+    class FinishesOnFirstCheck(Future):
+        # Pending when first asked, finished right after: the window between
+        # submitting a page and attaching its callback
+        def done(self):
+            if not super().done():
+                self.set_result(QImage(8, 8, QImage.Format_ARGB32))
+                return False
+            return True
+
+    class Service:
+        def submit(self, page, style=None, scale=1.0):
+            return FinishesOnFirstCheck()
+
+    thumbnailer = PageThumbnailer(Service(), max_size=64)
+    received, done = [], []
+    thumbnailer.thumbnailReady.connect(lambda i, img: received.append(i))
+    thumbnailer.finished.connect(lambda: done.append(len(received)))
+    thumbnailer.request([_page(text=f"Page {i}") for i in range(3)])
+    qapp.processEvents()
+    assert sorted(received) == [0, 1, 2]
+    assert done == [3]
+    assert thumbnailer._remaining == 0
+
+
+def test_pending_renders_do_not_keep_a_dropped_thumbnailer_alive(qapp):
+    import weakref
+    from concurrent.futures import Future
+
+    pending = []
+
+    class Service:
+        def submit(self, page, style=None, scale=1.0):
+            pending.append(Future())
+            return pending[-1]
+
+    thumbnailer = PageThumbnailer(Service(), max_size=64)
+    thumbnailer.request([_page(text=f"Page {i}") for i in range(3)])
+    ref = weakref.ref(thumbnailer)
+    del thumbnailer
+    # Freed here, on this thread, not later by whichever worker finishes last
+    assert ref() is None
+    for future in pending:
+        future.set_result(QImage(8, 8, QImage.Format_ARGB32))
+
+
+def test_pdf_export_prepares_images_on_service_workers(qapp, tmp_path):
+    from core.layout.models import DocumentSpec
+
+    class RecordingService(PageRenderService):
+        prepared = []
+
+        def prepare(self, page):
+            self.prepared.append(page.regions[0].image_ref)
+            return super().prepare(page)
+
+    images = [_write_image(tmp_path / f"{i}.png", "#CC2020") for i in range(3)]
+    doc = DocumentSpec(title="t", pages=[_page(image) for image in images])
+    service = RecordingService(workers=2)
+    out = tmp_path / "doc.pdf"
+    try:
+        qt_renderer.export_document_pdf(doc, str(out), dpi=72, service=service)
+    finally:
+        service.shutdown()
+    assert service.prepared == images
+    data = out.read_bytes()
+    assert data.count(b"/Type /Page") - data.count(b"/Type /Pages") == 3
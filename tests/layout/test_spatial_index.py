@@ -0,0 +1,105 @@
+"""Tests for the per-page region spatial index."""
+
+import random
+
+from core.layout.models import Overlay, PageSpec, Region
+from core.layout.overlay_ops import (
+    nearest_region_center, overlay_anchor_stranded, reposition_stranded_overlays,
+)
+from core.layout.spatial_index import RegionIndex, index_for_page, mark_page_changed
+
+
+def _random_regions(rng, n):
+    return [Region(id=f"r{i}", kind="image",
+                   bbox=(rng.randrange(0, 2400), rng.randrange(0, 3200),
+                         rng.randrange(20, 600), rng.randrange(20, 600)),
+                   z=rng.randrange(3))
+            for i in range(n)]
+
+
+def test_queries_match_linear_scan():
+    rng = random.Random(7)
+    regions = _random_regions(rng, 300)
+    index = RegionIndex(regions)
+    for _ in range(500):
+        point = (rng.uniform(-500, 3000), rng.uniform(-500, 3800))
+        ov = Overlay(id="o", kind="sfx", text="x", anchor=point)
+        assert overlay_anchor_stranded(ov, regions, index) == overlay_anchor_stranded(ov, regions)
+        assert nearest_region_center(point, regions, index) == nearest_region_center(point, regions)
+
+
+def test_sync_rebuckets_only_edited_regions():
+    regions = [Region(id="a", kind="image", bbox=(0, 0, 100, 100)),
+               Region(id="b", kind="image", bbox=(200, 0, 100, 100))]
+    index = RegionIndex(regions)
+    assert index.sync(regions) == 0
+    assert index.contains_point(250, 50)
+
+    regions[1].bbox = (200, 300, 100, 100)  # moved
+    regions.append(Region(id="c", kind="text", bbox=(500, 500, 50, 50)))
+    del regions[0]
+    assert index.sync(regions) == 3
+    assert len(index) == 2
+    assert not index.contains_point(50, 50)
+    assert not index.contains_point(250, 50)
+    assert [r.id for r in index.regions_at(250, 350)] == ["b"]
+    assert index.nearest_center((0, 0)) == (250.0, 350.0)
+
+
+def test_region_at_uses_shape_and_stacking():
+    # Two triangles sharing a diagonal: their bboxes overlap completely
+    upper = Region(id="upper", kind="image", shape="polygon", bbox=(0, 0, 100, 100),
+                   points=[(0, 0), (100, 0), (0, 100)])
+    lower = Region(id="lower", kind="image", shape="polygon", bbox=(0, 0, 100, 100),
+                   points=[(100, 0), (100, 100), (0, 100)])
+    top = Region(id="top", kind="text", bbox=(10, 10, 20, 20), z=1)
+    index = RegionIndex([upper, lower, top])
+    assert index.region_at(20, 70).id == "upper"
+    assert index.region_at(80, 70).id == "lower"
+    assert index.region_at(15, 15).id == "top"
+    assert index.region_at(500, 500) is None
+
+
+def test_page_index_follows_region_edits():
+    page = PageSpec(page_size_px=(400, 400), regions=[
+        Region(id="a", kind="image", bbox=(0, 0, 100, 100))])
+    index = index_for_page(page)
+    assert index_for_page(page) is index
+    page.regions = [Region(id="b", kind="image", bbox=(200, 200, 100, 100))]
+    page.overlays = [Overlay(id="o", kind="sfx", text="x", anchor=(50.0, 50.0))]
+    assert reposition_stranded_overlays(page) == 1
+    assert page.overlays[0].anchor == (250.0, 250.0)
+
+
+def test_page_index_skips_sync_until_marked(monkeypatch):
+    page = PageSpec(page_size_px=(400, 400), regions=[
+        Region(id="a", kind="image", bbox=(0, 0, 100, 100)),
+        Region(id="b", kind="image", bbox=(200, 0, 100, 100))])
+    index = index_for_page(page)
+    syncs = []
+    original = RegionIndex.sync
+    monkeypatch.setattr(RegionIndex, "sync",
+                        lambda self, regions: syncs.append(1) or original(self, regions))
+
+    for _ in range(10):
+        assert index_for_page(page) is index
+        index.contains_point(50, 50)
+    assert syncs == []
+
+    page.regions[0].bbox = (0, 300, 100, 100)  # moved in place: needs a mark
+    mark_page_changed(page)
+    assert not index_for_page(page).contains_point(50, 50)
+    page.regions.append(Region(id="c", kind="text", bbox=(50, 50, 10, 10)))  # length change
+    assert index_for_page(page).contains_point(55, 55)
+    assert len(syncs) == 2
+
+
+def test_grid_follows_resized_regions():
+    regions = [Region(id=f"r{i}", kind="image", bbox=(i * 50, 0, 40, 40)) for i in range(20)]
+    index = RegionIndex(regions)
+    small = index.cell_size
+    for i, region in enumerate(regions):
+        region.bbox = (i * 500, 0, 400, 400)
+    index.sync(regions)
+    assert index.cell_size > 4 * small
+    assert [r.id for r in index.regions_at(5 * 500 + 10, 10)] == ["r5"]
@@ -31,3 +31,16 @@ def test_export_strips_content_keeps_structure(tmp_path):
     # content_kind preserved, history dropped
     assert loaded.content_kind == "comic"
     assert loaded.history == []
+
+
+def test_export_drops_history_and_its_page_content(tmp_path):
+    from core.layout.history import History
+    doc = _doc()
+    doc.pages[0].regions[1].text = "Secret draft"
+    History(doc).append("draft")
+    p = tmp_path / "t.iailayout.json"
+    template_io.export_template(doc, str(p))
+    raw = p.read_text(encoding="utf-8")
+    assert "Secret draft" not in raw and "My Title" not in raw
+    assert "/a.png" not in raw
+    assert "history_chunks" not in raw
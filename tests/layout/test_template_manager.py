@@ -0,0 +1,128 @@
+"""Tests for template discovery, the persisted template index and background previews."""
+
+import json
+import os
+
+import pytest
+
+from core.layout.template_manager import PREVIEW_SIZES, TemplateManager
+
+
+def write_template(path, name, extends=None, blocks=None, **extra):
+    data = {
+        "name": name,
+        "page_size_px": [800, 1000],
+        "blocks": blocks or [{"id": "b1", "type": "text", "rect": [10, 10, 100, 50]}],
+        **extra,
+    }
+    if extends:
+        data["extends"] = extends
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    return templates, tmp_path / "cache"
+
+
+def make_manager(dirs):
+    templates, cache = dirs
+    return TemplateManager(template_dirs=[templates], cache_dir=cache, preview_workers=2)
+
+
+def test_rescan_reuses_index_and_reparses_changed_files(dirs, monkeypatch):
+    templates, _ = dirs
+    write_template(templates / "a.json", "Alpha", tags=["kids"])
+    write_template(templates / "b.json", "Beta")
+    (templates / "broken.json").write_text("{not json", encoding="utf-8")
+    make_manager(dirs).discover_templates(prerender=False)
+
+    manager = make_manager(dirs)
+    parsed = []
+    original = manager._load_template_metadata
+    monkeypatch.setattr(manager, "_load_template_metadata",
+                        lambda p: parsed.append(p.name) or original(p))
+    found = manager.discover_templates(prerender=False)
+    assert parsed == []  # Valid and invalid files both come from the index
+    assert sorted(t.name for t in found) == ["Alpha", "Beta"]
+    assert manager.get_template("a").tags == ["kids"]
+
+    path = templates / "b.json"
+    write_template(path, "Beta Two")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    found = manager.discover_templates(rescan=True, prerender=False)
+    assert parsed == ["b.json"]
+    assert sorted(t.name for t in found) == ["Alpha", "Beta Two"]
+
+
+def test_inheritance_chain_is_indexed_and_used_for_loading(dirs):
+    templates, _ = dirs
+    write_template(templates / "base.json", "Base", background="#EEEEEE",
+                   blocks=[{"id": "title", "type": "text", "rect": [0, 0, 10, 10]},
+                           {"id": "art", "type": "image", "rect": [0, 20, 10, 10]}])
+    write_template(templates / "mid.json", "Mid", extends="base",
+                   blocks=[{"id": "title", "type": "text", "rect": [5, 5, 10, 10]}])
+    write_template(templates / "leaf.json", "Leaf", extends="mid", background="#000000",
+                   blocks=[{"id": "caption", "type": "text", "rect": [0, 40, 10, 10]}])
+    write_template(templates / "loop_a.json", "Loop A", extends="loop_b")
+    write_template(templates / "loop_b.json", "Loop B", extends="loop_a")
+    make_manager(dirs).discover_templates(prerender=False)
+
+    manager = make_manager(dirs)
+    manager.discover_templates(prerender=False)
+    assert manager.get_template("leaf").inheritance_chain == ["leaf", "mid", "base"]
+    assert manager.get_template("loop_a").inheritance_chain == ["loop_a", "loop_b"]
+    index = json.loads(manager.index_path.read_text(encoding="utf-8"))
+    entry = index["templates"][str(templates / "leaf.json")]
+    assert entry["metadata"]["inheritance_chain"] == ["leaf", "mid", "base"]
+
+    data = manager.load_template_data("leaf")
+    blocks = {b["id"]: b["rect"] for b in data["blocks"]}
+    assert blocks == {"title": [5, 5, 10, 10], "art": [0, 20, 10, 10], "caption": [0, 40, 10, 10]}
+    assert data["background"] == "#000000"
+    assert "extends" not in data
+    # Ancestors were resolved on the way and cached
+    assert {b["id"] for b in manager.load_template_data("mid")["blocks"]} == {"title", "art"}
+    assert manager.load_template_data("loop_a") is not None
+
+
+def test_search_runs_on_in_memory_index(dirs, monkeypatch):
+    templates, _ = dirs
+    write_template(templates / "story.json", "Bedtime Story", category="children",
+                   description="Soft pastel pages", tags=["kids", "picture"])
+    write_template(templates / "comic.json", "Action Comic", category="comic", tags=["panels"])
+    manager = make_manager(dirs)
+    manager.discover_templates(prerender=False)
+    monkeypatch.setattr(manager, "_load_template_metadata",
+                        lambda p: pytest.fail("search must not touch the files"))
+
+    assert [t.name for t in manager.search_templates(query="PASTEL")] == ["Bedtime Story"]
+    assert [t.name for t in manager.search_templates(query="panel")] == ["Action Comic"]
+    assert [t.name for t in manager.search_templates(category="comic")] == ["Action Comic"]
+    assert manager.search_templates(query="story", category="comic") == []
+    assert [t.name for t in manager.search_templates(tags=["kids"])] == ["Bedtime Story"]
+
+
+def test_previews_are_prerendered_in_background_at_every_size(dirs):
+    templates, _ = dirs
+    write_template(templates / "a.json", "Alpha")
+    write_template(templates / "b.json", "Beta")
+    manager = make_manager(dirs)
+    try:
+        found = manager.discover_templates()
+        assert manager.preview_generator.wait_for_pending(timeout=30)
+        generator = manager.preview_generator
+        for template in found:
+            for size in PREVIEW_SIZES:
+                assert generator.get_cache_path(template.filepath, size).exists()
+            assert template.thumbnail_path == generator.get_cache_path(template.filepath)
+
+        result = generator.prerender(found[0].filepath).result(timeout=30)
+        assert set(result) == set(PREVIEW_SIZES)
+        assert all(path is not None and path.exists() for path in result.values())
+    finally:
+        manager.preview_generator.shutdown()
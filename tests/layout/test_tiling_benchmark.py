@@ -0,0 +1,18 @@
+"""Enforce the tiling/polygon benchmark budgets and scaling targets."""
+
+import logging
+
+import pytest
+
+from tests.benchmarks.bench_tiling import check_budgets, run_benchmarks
+
+
+@pytest.mark.slow
+def test_tiling_benchmarks_meet_budgets_and_scaling_targets():
+    # Random trees at 500 panels include a few slivers the tiler drops with a warning
+    logging.disable(logging.WARNING)
+    try:
+        results = run_benchmarks(repeat=3, seed=0, report=lambda line: None)
+    finally:
+        logging.disable(logging.NOTSET)
+    assert check_budgets(results) == []
@@ -0,0 +1,175 @@
+"""Tests for concurrent puppet asset generation."""
+
+import io
+import threading
+import time
+from base64 import b64encode
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from core.character_animator.ai_face_editor import AIFaceEditor
+from core.character_animator.constants import AI_VISEME_PROMPTS, REQUIRED_VISEMES
+from core.character_animator.face_generator import FaceVariantGenerator
+from core.character_animator.models import FacialRegion, SegmentationResult
+from core.security import RateLimiter
+
+
+class FakeImagesAPI:
+    """Stands in for ``openai.OpenAI().images``: paints the masked region."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = []
+        self.payloads = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def edit(self, image, mask, prompt, **kwargs):
+        with self._lock:
+            self.calls.append(prompt)
+            self.payloads.append((image.getvalue(), mask.getvalue()))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        edited = Image.open(io.BytesIO(image.getvalue())).convert("RGBA")
+        keep = np.array(Image.open(io.BytesIO(mask.getvalue())))[..., 3] > 0
+        px = np.array(edited)
+        px[~keep] = (len(prompt) % 200, 20, 200, 255)
+        buffer = io.BytesIO()
+        Image.fromarray(px).save(buffer, format="PNG")
+        return SimpleNamespace(data=[SimpleNamespace(b64_json=b64encode(buffer.getvalue()))])
+
+
+class CountingRateLimiter(RateLimiter):
+    def __init__(self):
+        super().__init__()
+        self.checks = []
+
+    def check_rate_limit(self, provider, wait=True):
+        self.checks.append(provider)
+        return super().check_rate_limit(provider, wait)
+
+
+def _editor(tmp_path, api):
+    editor = AIFaceEditor(provider="openai", cache_dir=tmp_path, rate_limiter=CountingRateLimiter())
+    editor._client = SimpleNamespace(images=api)
+    editor._initialized = True
+    return editor
+
+
+def _face():
+    image = Image.new("RGBA", (256, 256), (240, 200, 170, 255))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((80, 70, 110, 90), fill=(40, 40, 40, 255))
+    draw.ellipse((146, 70, 176, 90), fill=(40, 40, 40, 255))
+    draw.rectangle((100, 170, 156, 185), fill=(160, 50, 60, 255))
+    segmentation = SegmentationResult(
+        original_image=image,
+        left_eye_region=FacialRegion("left_eye", (80, 70, 30, 20)),
+        right_eye_region=FacialRegion("right_eye", (146, 70, 30, 20)),
+        mouth_region=FacialRegion("mouth", (100, 170, 56, 15)),
+        left_eyebrow_region=FacialRegion("left_eyebrow", (80, 55, 30, 8)),
+        right_eyebrow_region=FacialRegion("right_eyebrow", (146, 55, 30, 8)),
+    )
+    return image, segmentation
+
+
+def _generator(editor, max_concurrent=4):
+    generator = FaceVariantGenerator(cache_dir=editor.cache_dir, provider="openai",
+                                     max_concurrent=max_concurrent)
+    generator._ai_editor = editor
+    generator._initialized = True
+    return generator
+
+
+def test_puppet_assets_are_edited_concurrently(tmp_path):
+    api = FakeImagesAPI(delay=0.1)
+    editor = _editor(tmp_path, api)
+    image, segmentation = _face()
+    progress = []
+    visemes, blinks, eyebrows = _generator(editor).generate_puppet_assets(
+        image, segmentation, expressions=["raised", "lowered"],
+        progress_callback=lambda *a: progress.append(a))
+
+    total = len(REQUIRED_VISEMES) + 2 + 2
+    assert len(api.calls) == total
+    # Overlapping edits, bounded by the pool; wall-clock bounds flake on busy machines
+    assert 1 < api.max_active <= 4
+    assert [index for _, index, _ in progress] == list(range(total))
+    assert {name for name, _, _ in progress} >= {"viseme_Ah", "eye_left_blink", "expression_raised"}
+    assert visemes.ah is not None and visemes.ah is not image
+    assert blinks.left_blink is not None and blinks.right_open is not None
+    assert sorted(eyebrows) == ["lowered", "raised"]
+    assert editor.rate_limiter.checks == ["openai"] * total
+
+
+def test_base_image_and_masks_are_encoded_once_per_session(tmp_path, monkeypatch):
+    encoded, masks = [], []
+    image_to_bytes, create_mask = AIFaceEditor._image_to_bytes, AIFaceEditor._create_alpha_mask
+    monkeypatch.setattr(AIFaceEditor, "_image_to_bytes",
+                        lambda self, img: encoded.append(img.size) or image_to_bytes(self, img))
+    monkeypatch.setattr(AIFaceEditor, "_create_alpha_mask",
+                        lambda self, size, bbox, **kw: masks.append(bbox) or create_mask(self, size, bbox, **kw))
+    api = FakeImagesAPI(delay=0)
+    image, segmentation = _face()
+    _generator(_editor(tmp_path, api)).generate_puppet_assets(image, segmentation)
+
+    # One encoding of the base image (the masks are encoded by their own helper)
+    assert encoded.count(image.size) == 1 + len(masks)
+    assert len(masks) == len(set(masks)) == 3  # mouth, left eye, right eye
+    assert len({png for png, _ in api.payloads}) == 1
+
+
+def test_cached_assets_are_served_before_any_edit(tmp_path):
+    api = FakeImagesAPI(delay=0)
+    image, segmentation = _face()
+    first, _, _ = _generator(_editor(tmp_path, api)).generate_puppet_assets(image, segmentation)
+    assert len(api.calls) == len(REQUIRED_VISEMES) + 2
+
+    # A new editor (new session), a cache with one viseme missing
+    missing = next(tmp_path.glob("*viseme_Oh.png"))
+    missing.unlink()
+    api.calls.clear()
+    editor = _editor(tmp_path, api)
+    progress = []
+    again, _, _ = _generator(editor).generate_puppet_assets(
+        image, segmentation, progress_callback=lambda *a: progress.append(a[0]))
+    assert len(api.calls) == 1
+    assert progress[-1] == "viseme_Oh"  # cached assets are reported first
+    assert np.array_equal(np.array(again.ah), np.array(first.ah))
+
+
+@pytest.mark.parametrize("max_concurrent", [1, 3])
+def test_max_concurrent_bounds_edits_in_flight(tmp_path, max_concurrent):
+    api = FakeImagesAPI(delay=0.02)
+    image, segmentation = _face()
+    visemes = _generator(_editor(tmp_path, api), max_concurrent).generate_all_visemes(
+        image, segmentation, use_cache=False)
+    assert api.max_active <= max_concurrent
+    assert len(api.calls) == len(REQUIRED_VISEMES)
+    assert not list(tmp_path.glob("*.png"))
+    assert visemes.w_oo is not None
+
+
+def test_failed_viseme_falls_back_to_the_original_image(tmp_path):
+    api = FakeImagesAPI(delay=0)
+    editor = _editor(tmp_path, api)
+    editor.max_retries = 1
+    edit = api.edit
+    api.edit = lambda image, mask, prompt, **kw: (
+        SimpleNamespace(data=[]) if AI_VISEME_PROMPTS["Ah"] in prompt else edit(image, mask, prompt, **kw))
+    image, segmentation = _face()
+
+    results = editor.generate_all_visemes(image, segmentation.mouth_region.bbox)
+    assert list(results) == REQUIRED_VISEMES
+    assert [name for name, r in results.items() if not r.success] == ["Ah"]
+
+    visemes = _generator(editor).generate_all_visemes(image, segmentation)
+    assert visemes.ah is image
+    assert visemes.oh is not image
@@ -0,0 +1,52 @@
+"""Tests for sweep-based merging of segmentation components."""
+
+import numpy as np
+import pytest
+
+from core.font_generator.bbox_index import connected_components, overlapping_pairs
+from core.font_generator.row_column_segmenter import RowColumnSegmenter
+from core.font_generator.segmentation import AlphabetSegmenter
+from tests.benchmarks.bench_component_merge import (
+    alphabet_sheet,
+    pairwise_merge_component_bboxes,
+    pairwise_merge_diagonal_components,
+    sheet_components,
+)
+
+CORPUS = [(32, 0, 0), (48, 0, 0), (48, 400, 1), (64, 1500, 2), (24, 2500, 3)]
+
+
+def test_sweep_finds_exactly_the_intersecting_intervals():
+    rng = np.random.default_rng(7)
+    start = rng.integers(0, 500, 300)
+    end = start + rng.integers(0, 30, 300)
+    i, j = overlapping_pairs(start, end)
+    expected = [(a, b) for a in range(300) for b in range(a + 1, 300)
+                if start[a] <= end[b] and start[b] <= end[a]]
+    assert list(zip(i.tolist(), j.tolist())) == expected
+
+
+def test_connected_components_label_by_smallest_member():
+    i, j = np.array([5, 3, 8, 1]), np.array([3, 7, 9, 9])
+    assert connected_components(10, i, j).tolist() == [0, 1, 2, 3, 4, 3, 6, 3, 1, 1]
+
+
+@pytest.mark.parametrize("size,noise,seed", CORPUS)
+def test_dot_merge_matches_pairwise(size, noise, seed):
+    binary = alphabet_sheet(size, noise=noise, seed=seed)
+    components = sheet_components(binary)
+    expected = pairwise_merge_component_bboxes(components)
+    merged = AlphabetSegmenter()._merge_component_bboxes(components, binary)
+    assert [m[:4] for m in merged] == [e[:4] for e in expected]
+    assert all(m[4] is e[4] for m, e in zip(merged, expected))
+    if not noise:
+        assert len(merged) < len(components)  # dots, umlauts, colons
+
+
+@pytest.mark.parametrize("size,noise,seed", CORPUS)
+def test_diagonal_merge_matches_pairwise(size, noise, seed):
+    boxes = [c[:4] for c in sheet_components(alphabet_sheet(size, noise=noise, seed=seed))]
+    expected = pairwise_merge_diagonal_components(boxes)
+    merged = RowColumnSegmenter()._merge_diagonal_components(boxes)
+    assert merged == expected
+    assert len(merged) < len(boxes)
@@ -0,0 +1,90 @@
+"""Tests for cached glyph outlines and incremental font rebuilds."""
+
+import pytest
+from fontTools.ttLib import TTFont
+
+from core.font_generator import font_builder
+from core.font_generator.font_builder import FontBuilder, FontInfo, clear_outline_cache
+from core.font_generator.metrics import FontMetricsCalculator
+from core.font_generator.vectorizer import GlyphVectorizer
+from tests.benchmarks.bench_font_build import stretched
+from tests.benchmarks.bench_vectorize import glyph_sheet
+
+
+@pytest.fixture(scope="module")
+def glyphs():
+    cells = [c for c in glyph_sheet(48) if c.label in "AHOTVaeno"]
+    return GlyphVectorizer().vectorize_all(cells, workers=1)
+
+
+@pytest.fixture
+def conversions(monkeypatch):
+    """Labels of the glyphs whose outlines were converted, per format."""
+    converted = {"ttf": [], "otf": []}
+    draw_tt, to_charstring = FontBuilder._draw_glyph_tt, FontBuilder._glyph_to_charstring
+    monkeypatch.setattr(FontBuilder, "_draw_glyph_tt",
+                        lambda self, g: converted["ttf"].append(g.label) or draw_tt(self, g))
+    monkeypatch.setattr(FontBuilder, "_glyph_to_charstring",
+                        lambda self, g, w: converted["otf"].append(g.label) or to_charstring(self, g, w))
+    clear_outline_cache()
+    yield converted
+    clear_outline_cache()
+
+
+def _build(glyphs, path):
+    builder = FontBuilder(info=FontInfo(family_name="Rebuild"))
+    builder.add_glyphs(glyphs)
+    return TTFont(builder.build(path))
+
+
+def _tables(font):
+    # head differs only in its timestamps and checksum
+    return {tag: font.getTableData(tag) for tag in font.keys() if tag not in ("GlyphOrder", "head")}
+
+
+@pytest.mark.parametrize("ext", [".ttf", ".otf"])
+def test_rebuild_converts_only_the_redrawn_glyph(glyphs, conversions, tmp_path, ext):
+    converted = conversions[ext[1:]]
+    _build(glyphs, tmp_path / f"first{ext}")
+    assert sorted(converted) == sorted(g.label for g in glyphs)
+
+    redrawn = [stretched(g, 1.05) if g.label == "e" else g for g in glyphs]
+    converted.clear()
+    rebuilt = _build(redrawn, tmp_path / f"rebuilt{ext}")
+    assert converted == ["e"]
+
+    clear_outline_cache()
+    fresh = _build(redrawn, tmp_path / f"fresh{ext}")
+    assert _tables(rebuilt) == _tables(fresh)
+    assert rebuilt["head"].xMax == fresh["head"].xMax
+
+
+def test_one_builder_saves_every_format_from_one_metrics_pass(glyphs, conversions, tmp_path,
+                                                             monkeypatch):
+    calls = []
+    calculate = FontMetricsCalculator.calculate
+    monkeypatch.setattr(FontMetricsCalculator, "calculate",
+                        lambda self, g: calls.append(len(g)) or calculate(self, g))
+    builder = FontBuilder(info=FontInfo(family_name="Rebuild"))
+    builder.add_glyphs(glyphs)
+    ttf = TTFont(builder.build(tmp_path / "font.ttf"))
+    otf = TTFont(builder.build(tmp_path / "font.otf"))
+    assert calls == [len(glyphs)]
+
+    # Same outlines as separate builds: the glyphs are normalized only once
+    assert _tables(ttf) == _tables(_build(glyphs, tmp_path / "alone.ttf"))
+    assert _tables(otf) == _tables(_build(glyphs, tmp_path / "alone.otf"))
+
+    builder.add_glyph(stretched(glyphs[0], 1.1))
+    builder.build(tmp_path / "font.ttf")
+    assert len(calls) == 4  # two separate builds, then the changed glyph set
+
+
+def test_outline_hash_sees_points_holes_and_commands(glyphs):
+    glyph = next(g for g in glyphs if g.label == "e")
+    key = font_builder.outline_hash(glyph)
+    assert font_builder.outline_hash(stretched(glyph, 1.0)) == key
+    assert font_builder.outline_hash(stretched(glyph, 1.001)) != key
+    holed = stretched(glyph, 1.0)
+    holed.paths[0].is_hole = not holed.paths[0].is_hole
+    assert font_builder.outline_hash(holed) != key
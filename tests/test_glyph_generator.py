@@ -0,0 +1,143 @@
+"""Tests for concurrent missing-glyph generation."""
+
+import io
+import threading
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from core.font_generator.glyph_generator import GlyphGenerator
+from core.font_generator.segmentation import CharacterCell
+
+
+def _glyph_png():
+    img = Image.new("L", (100, 100), 255)
+    ImageDraw.Draw(img).polygon([(20, 90), (40, 90), (80, 10), (60, 10)], fill=0)  # a slash
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class FakeProvider:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.prompts = []
+        self.reference_sets = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, model, **kwargs):
+        with self._lock:
+            self.prompts.append(prompt)
+            self.reference_sets.append(kwargs.get("reference_images"))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return [], [_glyph_png()]
+
+
+def _references(labels="AaBbmM0gWe"):
+    return [CharacterCell(label=c, bbox=(0, 0, 20, 30),
+                          image=np.full((30, 20), 255 - i, dtype=np.uint8))
+            for i, c in enumerate(labels)]
+
+
+def _generator(provider, max_workers=4):
+    generator = GlyphGenerator("google", "model", "key", max_workers=max_workers)
+    generator._provider = provider
+    return generator
+
+
+def test_glyphs_are_generated_concurrently_in_request_order():
+    provider = FakeProvider()
+    chars = list("CDEFGHIJ")
+    progress = []
+    results = _generator(provider).generate_multiple(
+        chars, _references(), 40, progress_callback=lambda *a: progress.append(a))
+    assert [r.character for r in results] == chars
+    assert all(r.success and r.cell.image.shape[0] == 40 for r in results)
+    assert 1 < provider.max_active <= 4
+    assert sorted(p[0] for p in progress[:-1]) == list(range(len(chars)))
+    assert progress[-1] == (len(chars), len(chars), "")
+
+
+def test_reference_images_are_encoded_once(monkeypatch):
+    encoded = []
+    original = CharacterCell.to_pil
+    monkeypatch.setattr(CharacterCell, "to_pil",
+                        lambda self: encoded.append(self.label) or original(self))
+    references = _references()
+    provider = FakeProvider(delay=0)
+    _generator(provider).generate_multiple(list("CDEFGH"), references, 40)
+    assert len(encoded) == len(set(encoded))
+    # Same reference, same payload object in every request
+    payloads = {}
+    for refs in provider.reference_sets:
+        for png in refs:
+            payloads.setdefault(png, set()).add(id(png))
+    assert all(len(ids) == 1 for ids in payloads.values())
+
+
+def test_reference_cache_is_keyed_by_image_content(monkeypatch):
+    encoded = []
+    original = CharacterCell.to_pil
+    monkeypatch.setattr(CharacterCell, "to_pil",
+                        lambda self: encoded.append(self.label) or original(self))
+    generator = _generator(FakeProvider(delay=0))
+    first = generator._prepare_reference_images(_references("AB"))
+    again = generator._prepare_reference_images(_references("AB"))  # new cells, same pixels
+    assert encoded == ["A", "B"]
+    assert first == again
+
+
+def test_slow_reference_encode_does_not_block_other_references(monkeypatch):
+    release = threading.Event()
+    original = CharacterCell.to_pil
+
+    def to_pil(self):
+        if self.label == "A":
+            assert release.wait(5)
+        return original(self)
+
+    monkeypatch.setattr(CharacterCell, "to_pil", to_pil)
+    generator = _generator(FakeProvider(delay=0))
+    slow_a, fast_b = _references("AB")
+    waiting = threading.Thread(target=generator._prepare_reference_images, args=([slow_a],))
+    waiting.start()
+    try:
+        assert len(generator._prepare_reference_images([fast_b])) == 1
+    finally:
+        release.set()
+        waiting.join()
+
+
+def test_failed_reference_encode_is_retried(monkeypatch):
+    original = CharacterCell.to_pil
+    calls = []
+
+    def to_pil(self):
+        calls.append(self.label)
+        if len(calls) == 1:
+            raise OSError("disk hiccup")
+        return original(self)
+
+    monkeypatch.setattr(CharacterCell, "to_pil", to_pil)
+    generator = _generator(FakeProvider(delay=0))
+    references = _references("A")
+    assert generator._prepare_reference_images(references) == []
+    assert len(generator._prepare_reference_images(references)) == 1
+    assert calls == ["A", "A"]
+
+
+def test_mirror_targets_are_derived_from_generated_sources():
+    provider = FakeProvider()
+    results = _generator(provider).generate_multiple(["\\", "x", "/"], _references(), 40)
+    assert [r.character for r in results] == ["\\", "x", "/"]
+    assert len(provider.prompts) == 2  # '/' and 'x'; the backslash is a mirror
+    backslash, slash = results[0].cell, results[2].cell
+    assert backslash.confidence == 1.0
+    assert np.array_equal(backslash.image, slash.image[:, ::-1])
@@ -0,0 +1,121 @@
+"""Tests for cached, concurrent batch glyph identification."""
+
+import re
+import threading
+import time
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from core.font_generator import glyph_identifier
+from core.font_generator.glyph_identifier import AIGlyphIdentifier, glyph_hash
+
+
+def _glyph(shape, margin=10, size=40):
+    img = Image.new("L", (size + 2 * margin, size + 2 * margin), 255)
+    draw = ImageDraw.Draw(img)
+    box = (margin, margin, margin + size, margin + size)
+    if shape == "box":
+        draw.rectangle(box, fill=0)
+    elif shape == "bar":
+        draw.rectangle((margin, margin, margin + 6, margin + size), fill=0)
+    elif shape == "ring":
+        draw.ellipse(box, outline=0, width=5)
+    else:  # a letter
+        draw.text((margin, margin), shape, fill=0, font=ImageFont.load_default(size=size))
+    return np.array(img)
+
+
+class FakeModels:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.counts = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, model, contents, config):
+        count = int(re.search(r"analyzing (\d+) numbered", contents[1]).group(1))
+        with self._lock:
+            self.counts.append(count)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        text = "\n".join(f"{i + 1}. X (90%)" for i in range(count))
+        return type("Response", (), {"text": text})()
+
+
+@pytest.fixture
+def identifier(monkeypatch):
+    glyph_identifier.clear_identification_cache()
+    ident = AIGlyphIdentifier(provider="gemini", model="test-model")
+    ident._client = type("Client", (), {"models": FakeModels()})()
+    monkeypatch.setattr(ident, "_ensure_client", lambda: True)
+    monkeypatch.setattr(AIGlyphIdentifier, "REQUESTS_PER_MINUTE", 6000)
+    yield ident
+    glyph_identifier.clear_identification_cache()
+
+
+def test_hash_ignores_margins_and_antialiasing_but_not_shape():
+    box = Image.fromarray(_glyph("box"))
+    assert glyph_hash(box) == glyph_hash(Image.fromarray(_glyph("box", margin=3)))
+    soft = np.clip(_glyph("box").astype(int) + 30, 0, 255).astype(np.uint8)
+    assert glyph_hash(box) == glyph_hash(Image.fromarray(soft))
+    assert len({glyph_hash(Image.fromarray(_glyph(s))) for s in ("box", "bar", "ring")}) == 3
+
+
+def test_glyphs_that_differ_in_size_hash_differently():
+    font = ImageFont.truetype("DejaVuSans.ttf", 48)
+
+    def cell(char):
+        img = Image.new("L", (80, 80), 255)
+        ImageDraw.Draw(img).text((10, 5), char, fill=0, font=font)
+        return img
+
+    assert len({glyph_hash(cell(c)) for c in "lI|"}) == 3
+    assert glyph_hash(Image.fromarray(_glyph("box", size=40))) != glyph_hash(
+        Image.fromarray(_glyph("box", size=30)))
+
+
+def test_same_shape_glyphs_of_different_size_are_sent_separately(identifier):
+    identifier.batch_identify([_glyph("box", size=40), _glyph("box", size=24)])
+    assert identifier._client.models.counts == [2]
+
+
+def test_batches_are_dispatched_concurrently(identifier):
+    glyphs = [_glyph(c) for c in "ABCDEFGHJKLMNPRSTUWY"]
+    assert len({glyph_hash(Image.fromarray(g)) for g in glyphs}) == len(glyphs)
+    results = identifier.batch_identify(glyphs, max_per_request=5)
+    assert [r.identified_char for r in results] == ["X"] * len(glyphs)
+    models = identifier._client.models
+    assert sorted(models.counts) == [5, 5, 5, 5]
+    assert models.max_active > 1
+
+
+def test_resegmented_sheet_only_sends_changed_glyphs(identifier):
+    identifier.batch_identify([_glyph("box"), _glyph("bar"), _glyph("ring")])
+    models = identifier._client.models
+    assert models.counts == [3]
+
+    # New identifier, glyphs re-cropped with other margins, one genuinely new glyph
+    again = AIGlyphIdentifier(provider="gemini", model="test-model")
+    again._client = identifier._client
+    again._ensure_client = lambda: True
+    results = again.batch_identify([_glyph("bar", margin=4), _glyph("Q"), _glyph("box", margin=2),
+                                    _glyph("Q")])
+    assert models.counts == [3, 1]  # only the new glyph, once
+    assert [r.identified_char for r in results] == ["X"] * 4
+
+    assert again.batch_identify([_glyph("ring")], expected_chars="O")[0].identified_char == "X"
+    assert models.counts == [3, 1, 1]  # different expected set: not a cache hit
+
+
+def test_rate_budget_spaces_request_starts():
+    budget = glyph_identifier._RateBudget(per_minute=1200)  # one per 50 ms
+    start = time.monotonic()
+    for _ in range(4):
+        budget.acquire()
+    assert time.monotonic() - start >= 0.14
@@ -0,0 +1,129 @@
+"""Tests for core.image_utils border detection.
+
+The vectorized detector must make exactly the same crop decisions as the
+original per-pixel scanner, which is kept here as ``legacy_detect_borders``.
+"""
+
+import io
+import random
+
+import pytest
+from PIL import Image, ImageDraw
+
+from core.image_utils import auto_crop_solid_borders, detect_solid_borders
+
+
+def legacy_detect_borders(img, variance_threshold=5.0):
+    """Original pure-Python border scan from auto_crop_solid_borders."""
+    width, height = img.size
+    pixels = img.load()
+
+    def calculate_line_variance(pixels_line):
+        if not pixels_line:
+            return 0.0
+        r_mean = sum(p[0] for p in pixels_line) / len(pixels_line)
+        g_mean = sum(p[1] for p in pixels_line) / len(pixels_line)
+        b_mean = sum(p[2] for p in pixels_line) / len(pixels_line)
+        return sum(
+            (p[0] - r_mean) ** 2 + (p[1] - g_mean) ** 2 + (p[2] - b_mean) ** 2
+            for p in pixels_line
+        ) / len(pixels_line)
+
+    top = 0
+    for y in range(height // 3):
+        row = [pixels[x, y] for x in range(0, width, max(1, width // 100))]
+        if calculate_line_variance(row) > variance_threshold:
+            break
+        top = y
+
+    bottom = height - 1
+    for y in range(height - 1, 2 * height // 3, -1):
+        row = [pixels[x, y] for x in range(0, width, max(1, width // 100))]
+        if calculate_line_variance(row) > variance_threshold:
+            break
+        bottom = y
+
+    left = 0
+    for x in range(width // 3):
+        col = [pixels[x, y] for y in range(top, min(bottom + 1, height), max(1, (bottom - top) // 100))]
+        if col:
+            if calculate_line_variance(col) > variance_threshold:
+                break
+            left = x
+
+    right = width - 1
+    for x in range(width - 1, 2 * width // 3, -1):
+        col = [pixels[x, y] for y in range(top, min(bottom + 1, height), max(1, (bottom - top) // 100))]
+        if col:
+            if calculate_line_variance(col) > variance_threshold:
+                break
+            right = x
+
+    return top, bottom, left, right
+
+
+def make_padded_image(rng, width, height):
+    """Noisy content block on a solid pad, with a random pad size per side."""
+    pad_color = tuple(rng.randrange(256) for _ in range(3))
+    img = Image.new("RGB", (width, height), pad_color)
+    left = rng.randrange(0, width // 3)
+    right = width - rng.randrange(0, width // 3)
+    top = rng.randrange(0, height // 3)
+    bottom = height - rng.randrange(0, height // 3)
+    content = Image.effect_noise((max(1, right - left), max(1, bottom - top)), rng.choice([4, 30, 80]))
+    img.paste(content.convert("RGB"), (left, top))
+    if rng.random() < 0.5:
+        # Add a few shapes so content isn't pure noise
+        draw = ImageDraw.Draw(img)
+        for _ in range(3):
+            x0 = rng.randrange(left, max(left + 1, right))
+            y0 = rng.randrange(top, max(top + 1, bottom))
+            draw.ellipse((x0, y0, x0 + 20, y0 + 20), fill=tuple(rng.randrange(256) for _ in range(3)))
+    if rng.random() < 0.3:
+        # Faint gradient in the pad, hovering around the variance threshold
+        draw = ImageDraw.Draw(img)
+        for x in range(0, width, 7):
+            shade = tuple(min(255, c + (x % 3)) for c in pad_color)
+            draw.point((x, 0), fill=shade)
+            draw.point((x, height - 1), fill=shade)
+    return img
+
+
+def padded_corpus(count=60, seed=1234):
+    rng = random.Random(seed)
+    sizes = [(64, 64), (97, 211), (300, 120), (512, 512), (1024, 576), (1, 1), (3, 7), (150, 1)]
+    for i in range(count):
+        w, h = sizes[i % len(sizes)]
+        if w < 8 or h < 8:
+            yield Image.new("RGB", (w, h), (rng.randrange(256), 0, 0))
+        else:
+            yield make_padded_image(rng, w, h)
+
+
+def _png_bytes(img):
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize("threshold", [0.0, 5.0, 50.0])
+def test_vectorized_borders_match_legacy_scan(threshold):
+    for img in padded_corpus():
+        assert detect_solid_borders(img, threshold) == legacy_detect_borders(img, threshold), img.size
+
+
+def test_auto_crop_removes_letterbox_padding():
+    img = Image.new("RGB", (400, 400), (12, 34, 56))
+    img.paste(Image.effect_noise((400, 220), 60).convert("RGB"), (0, 90))
+    out = Image.open(io.BytesIO(auto_crop_solid_borders(_png_bytes(img))))
+    # The scan keeps the last uniform row on each side
+    assert out.size == (400, 222)
+
+
+def test_auto_crop_returns_original_without_borders():
+    data = _png_bytes(Image.effect_noise((120, 80), 60).convert("RGB"))
+    assert auto_crop_solid_borders(data) is data
+
+
+def test_auto_crop_returns_original_on_garbage():
+    assert auto_crop_solid_borders(b"not an image") == b"not an image"
@@ -0,0 +1,101 @@
+"""Tests for profile-based, class-based kerning."""
+
+import numpy as np
+import pytest
+
+from core.font_generator.font_builder import FontBuilder, FontInfo
+from core.font_generator.kerning import KerningEngine, side_profiles
+from core.font_generator.metrics import FontMetricsCalculator
+from core.font_generator.vectorizer import PathCommand, PathSegment, VectorGlyph, VectorPath
+
+
+def _polygon_glyph(label, *polygons):
+    paths = []
+    for points in polygons:
+        segments = [PathSegment(PathCommand.MOVE, [points[0]])]
+        segments += [PathSegment(PathCommand.LINE, [p]) for p in points[1:]]
+        segments.append(PathSegment(PathCommand.CLOSE))
+        paths.append(VectorPath(segments=segments))
+    return VectorGlyph(label=label, paths=paths, width=600, height=700)
+
+
+GLYPHS = [
+    _polygon_glyph("H", [(0, 0), (100, 0), (100, 700), (0, 700)],
+                   [(400, 0), (500, 0), (500, 700), (400, 700)],
+                   [(100, 300), (400, 300), (400, 400), (100, 400)]),
+    _polygon_glyph("I", [(0, 0), (100, 0), (100, 700), (0, 700)]),
+    _polygon_glyph("A", [(0, 0), (100, 0), (250, 600), (400, 0), (500, 0), (300, 700), (200, 700)]),
+    _polygon_glyph("V", [(200, 0), (300, 0), (500, 700), (400, 700), (250, 100), (100, 700),
+                         (0, 700)]),
+    _polygon_glyph("T", [(0, 600), (500, 600), (500, 700), (0, 700)],
+                   [(200, 0), (300, 0), (300, 600), (200, 600)]),
+    _polygon_glyph("o", [(0, 150), (150, 0), (350, 0), (500, 150), (500, 350), (350, 500),
+                         (150, 500), (0, 350)]),
+    _polygon_glyph(".", [(0, 0), (100, 0), (100, 100), (0, 100)]),
+    _polygon_glyph("'", [(0, 500), (100, 500), (100, 700), (0, 700)]),
+]
+
+
+def test_side_profiles_measure_ink_from_the_advance():
+    heights = np.array([-50.0, 50.0, 350.0, 650.0])
+    left, right = side_profiles(GLYPHS[3], heights, side_bearing=30)  # V
+    assert np.isnan(left[0]) and np.isnan(right[0])  # below the glyph
+    assert left[1] == pytest.approx(30 + 200 - 50 * 200 / 700)  # on the (0,700)-(200,0) edge
+    assert left[3] < left[2] < left[1]  # the left stroke leans outwards going up
+    assert right[3] < right[2] < right[1]
+    h_left, h_right = side_profiles(GLYPHS[0], heights[1:], side_bearing=30)
+    assert np.allclose(h_left, 30) and np.allclose(h_right, 30)
+
+
+def test_full_matrix_tightens_open_pairs_and_leaves_flat_ones():
+    engine = KerningEngine(side_bearing=30)
+    matrix = engine.kerning_matrix(GLYPHS)
+    index = {g.label: i for i, g in enumerate(GLYPHS)}
+
+    def kern(pair):
+        return matrix[index[pair[0]], index[pair[1]]]
+
+    assert kern("HH") == kern("HI") == kern("IH") == 0
+    for pair in ("AV", "VA", "To", "TA", "Vo"):
+        assert kern(pair) < -20, pair
+    assert kern("AV") < kern("Ho")
+    assert kern(".'") == 0  # no shared heights: left alone
+
+    # Never closer than one side bearing
+    lefts, rights = engine.profiles(GLYPHS)
+    gaps = rights[:, None, :] + lefts[None, :, :]
+    closest = np.nanmin(np.where(np.isnan(gaps), np.inf, gaps), axis=2)
+    assert np.all((closest + matrix >= 30) | np.isinf(closest))
+
+
+def test_classes_reproduce_the_matrix_within_tolerance():
+    engine = KerningEngine(side_bearing=30, class_tolerance=0.01)
+    glyphs = GLYPHS + [_polygon_glyph("l", [(0, 0), (100, 0), (100, 700), (0, 700)])]
+    result = engine.calculate(glyphs)
+    assert ["H", "I", "l"] in result.left_classes  # same flat sides, same class
+    matrix = engine.kerning_matrix(glyphs)
+    pairs = result.pairs()
+    for i, left in enumerate(glyphs):
+        for j, right in enumerate(glyphs):
+            assert abs(pairs.get((left.label, right.label), 0) - matrix[i, j]) <= 20
+
+
+def test_built_font_carries_class_kerning(tmp_path):
+    calculator = FontMetricsCalculator()
+    metrics = calculator.calculate(GLYPHS)
+    assert metrics.kerning[("A", "V")] < 0
+    assert metrics.kerning == metrics.kerning_classes.pairs()
+
+    builder = FontBuilder(info=FontInfo(family_name="KernTest"), metrics=metrics)
+    builder.add_glyphs(calculator.get_normalized_glyphs())
+    from fontTools.ttLib import TTFont
+    font = TTFont(str(builder.build(tmp_path / "kern.ttf")))
+    gpos = font["GPOS"].table
+    assert gpos.FeatureList.FeatureRecord[0].FeatureTag == "kern"
+    subtable = gpos.LookupList.Lookup[0].SubTable[0]
+    assert subtable.Format == 2
+    c1 = subtable.ClassDef1.classDefs.get("A", 0)
+    c2 = subtable.ClassDef2.classDefs.get("V", 0)
+    value = subtable.Class1Record[c1].Class2Record[c2].Value1.XAdvance
+    assert value == int(metrics.kerning[("A", "V")])
+    assert "kern" not in font
@@ -0,0 +1,134 @@
+"""Tests for the streaming, RLE-compressed PSD writer."""
+
+import struct
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from core.character_animator.models import EyeBlinkSet, PuppetLayer, PuppetStructure, VisemeSet
+from core.character_animator.psd_exporter import PSDExporter, packbits_rows
+
+
+def _unpack_rows(data, counts, width):
+    rows, pos = [], 0
+    for count in counts:
+        rows.append(np.array(Image.frombytes("L", (width, 1), data[pos:pos + count], "packbits", "L")))
+        pos += count
+    return np.vstack(rows) if rows else np.zeros((0, width), np.uint8)
+
+
+def read_psd_layers(path):
+    """(name, (top, left, bottom, right), RGBA array) per layer, in file order."""
+    with open(path, "rb") as f:
+        data = f.read()
+    pos = 26
+    for _ in range(2):  # color mode data, image resources
+        pos += 4 + struct.unpack_from(">I", data, pos)[0]
+    section_len, info_len = struct.unpack_from(">II", data, pos)
+    assert info_len % 2 == 0
+    assert struct.unpack_from(">I", data, pos + 8 + info_len)[0] == 0  # global mask
+    assert pos + 4 + section_len == pos + 12 + info_len
+    pos += 8
+    (count,) = struct.unpack_from(">h", data, pos)
+    pos += 2
+    records = []
+    for _ in range(-count):
+        bounds = struct.unpack_from(">iiii", data, pos)
+        pos += 18
+        channels = [struct.unpack_from(">hI", data, pos + 6 * i) for i in range(4)]
+        pos += 24 + 12
+        (extra_len,) = struct.unpack_from(">I", data, pos)
+        name_len = data[pos + 12]
+        name = data[pos + 13:pos + 13 + name_len].decode("latin-1")
+        pos += 4 + extra_len
+        records.append((name, bounds, channels))
+
+    layers = []
+    for name, (top, left, bottom, right), channels in records:
+        height, width = bottom - top, right - left
+        planes = {}
+        for channel_id, length in channels:
+            (compression,) = struct.unpack_from(">H", data, pos)
+            if compression == 1:
+                counts = struct.unpack_from(f">{height}H", data, pos + 2)
+                start = pos + 2 + 2 * height
+                assert start + sum(counts) == pos + length
+                planes[channel_id] = _unpack_rows(data[start:pos + length], counts, width)
+            else:
+                assert compression == 0 and length == 2 + width * height
+                planes[channel_id] = np.frombuffer(
+                    data[pos + 2:pos + length], np.uint8).reshape(height, width)
+            pos += length
+        rgba = np.dstack([planes[0], planes[1], planes[2], planes[-1]])
+        layers.append((name, (top, left, bottom, right), rgba))
+    return layers
+
+
+def _puppet(size=(160, 120)):
+    body = Image.new("RGBA", size, (0, 0, 0, 0))
+    ImageDraw.Draw(body).ellipse((20, 10, 140, 115), fill=(200, 150, 120, 255))
+    root = PuppetLayer(name="Puppet")
+    root.add_child(PuppetLayer(name="Body", image=body))
+    root.add_child(PuppetLayer(name="Head", position=(5, -3)))
+    puppet = PuppetStructure(name="Test", root_layer=root, visemes=VisemeSet(),
+                             eye_blinks=EyeBlinkSet(), width=size[0], height=size[1])
+    exporter = PSDExporter(puppet)
+
+    mouths = {}
+    for i, name in enumerate(["neutral", "ah", "oh", "m"]):
+        mouth = Image.new("RGBA", size, (0, 0, 0, 0))
+        ImageDraw.Draw(mouth).rectangle((60, 70 + i, 100 + 3 * i, 80 + 2 * i), fill=(150 + i, 40, 60, 255))
+        mouths[name] = mouth
+    exporter.populate_from_visemes(VisemeSet(**mouths))
+    blink = Image.new("RGBA", size, (0, 0, 0, 0))
+    ImageDraw.Draw(blink).line((40, 50, 70, 50), fill=(30, 30, 30, 200), width=3)
+    exporter.populate_from_blinks(EyeBlinkSet(left_blink=blink))
+    exporter.add_layer("Empty", Image.new("RGBA", size, (0, 0, 0, 0)), parent_path=["Head"])
+    return exporter
+
+
+@pytest.mark.parametrize("width", [1, 2, 3, 127, 128, 129, 300])
+def test_packbits_rows_round_trip(width):
+    rng = np.random.default_rng(width)
+    plane = np.repeat(rng.integers(0, 4, (6, width // 5 + 1)), 5, axis=1)[:, :width].astype(np.uint8)
+    plane[1] = rng.integers(0, 256, width)  # incompressible row
+    plane[2] = 7  # one long run
+    counts, data = packbits_rows(plane)
+    assert counts.sum() == len(data)
+    assert np.array_equal(_unpack_rows(data, counts, width), plane)
+    if width % 128 in (0, 1) or width % 128 >= 3:
+        assert counts[2] == 2 * -(-width // 128)  # repeat packets only
+
+
+def test_layers_are_cropped_and_compressed(tmp_path):
+    exporter = _puppet()
+    path = tmp_path / "puppet.psd"
+    assert exporter._create_psd_manual(path)
+    expected = exporter._flatten_layers_for_export()
+    layers = read_psd_layers(path)
+    assert [name for name, _, _ in layers] == [layer["name"] for layer in expected]
+
+    for (name, (top, left, bottom, right), rgba), layer in zip(layers, expected):
+        x, y = layer["position"]
+        source = np.array(layer["image"])
+        bbox = layer["image"].getchannel("A").getbbox()
+        if bbox is None:
+            assert rgba.size == 0 and (top, left) == (y, x), name
+            continue
+        assert (left - x, top - y, right - x, bottom - y) == bbox, name
+        assert np.array_equal(rgba, source[bbox[1]:bbox[3], bbox[0]:bbox[2]]), name
+
+    raw_size = sum(4 * layer["image"].width * layer["image"].height for layer in expected)
+    assert path.stat().st_size < raw_size / 10
+
+
+def test_composite_is_readable(tmp_path):
+    exporter = _puppet()
+    path = tmp_path / "puppet.psd"
+    assert exporter._create_psd_manual(path)
+    layers = exporter._flatten_layers_for_export()
+    with Image.open(path) as psd:
+        assert psd.size == (160, 120) and psd.mode == "RGBA"
+        composite = np.array(psd)
+    assert np.array_equal(composite, exporter._create_composite_image(layers, 160, 120))
@@ -0,0 +1,128 @@
+"""Tests for the content-hash keyed reference payload cache."""
+
+import io
+import os
+
+from PIL import Image
+
+from core.reference.image_compositor import ReferenceImageCompositor
+from core.reference.reference_cache import ReferenceCache, pad_to_aspect
+
+
+def _png(size=(200, 100), color=(200, 30, 30)):
+    buf = io.BytesIO()
+    Image.new("RGB", size, color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def test_pad_to_aspect_centers_on_transparent_canvas():
+    canvas = pad_to_aspect(Image.new("RGB", (100, 100), (255, 0, 0)), 16 / 9)
+    assert canvas.size == (177, 100)
+    assert canvas.mode == "RGBA"
+    assert canvas.getpixel((0, 50))[3] == 0
+    assert canvas.getpixel((canvas.width // 2, 50)) == (255, 0, 0, 255)
+
+
+def test_padded_reference_builds_once_per_content(tmp_path):
+    cache = ReferenceCache(cache_dir=tmp_path / "spill")
+    src = tmp_path / "char.png"
+    src.write_bytes(_png((100, 100)))
+    padded = []
+
+    first = cache.padded_reference(src, 16 / 9, "veo", on_padded=padded.append)
+    again = cache.padded_reference(src, 16 / 9, "veo", on_padded=padded.append)
+    # Same content under another path shares the entry
+    copy = tmp_path / "copy.png"
+    copy.write_bytes(src.read_bytes())
+    third = cache.padded_reference(copy, 16 / 9, "veo", on_padded=padded.append)
+
+    assert first == again == third
+    assert len(padded) == 1
+    assert Image.open(io.BytesIO(first)).size[1] == 100
+
+
+def test_changed_file_gets_new_entry(tmp_path):
+    cache = ReferenceCache(cache_dir=tmp_path / "spill")
+    src = tmp_path / "ref.png"
+    src.write_bytes(_png((64, 64), (1, 2, 3)))
+    before = cache.fitted_reference(src, 32, "stability")
+    src.write_bytes(_png((80, 40), (9, 9, 9)))
+    after = cache.fitted_reference(src, 32, "stability")
+    assert Image.open(io.BytesIO(before)).size == (32, 32)
+    assert Image.open(io.BytesIO(after)).size == (32, 16)
+
+
+def test_variants_do_not_collide(tmp_path):
+    cache = ReferenceCache(cache_dir=tmp_path / "spill")
+    data = _png((400, 200))
+    small = cache.fitted_reference(data, 100, "stability")
+    large = cache.fitted_reference(data, 300, "stability")
+    assert Image.open(io.BytesIO(small)).size == (100, 50)
+    assert Image.open(io.BytesIO(large)).size == (300, 150)
+
+
+def test_evicted_entries_spill_to_disk_and_promote(tmp_path):
+    cache = ReferenceCache(cache_dir=tmp_path / "spill", memory_budget=10)
+    cache.put("a", b"0123456789")
+    cache.put("b", b"abcdefghij")
+    assert cache.memory_used == 10
+    assert (tmp_path / "spill" / "a.bin").exists()
+    assert cache.get("a") == b"0123456789"
+    assert (tmp_path / "spill" / "b.bin").exists()
+
+
+def test_composite_reuses_cached_canvas(tmp_path):
+    cache = ReferenceCache(cache_dir=tmp_path / "spill")
+    paths = []
+    for i, color in enumerate([(255, 0, 0), (0, 255, 0), (0, 0, 255)]):
+        p = tmp_path / f"ref{i}.png"
+        p.write_bytes(_png((120, 160), color))
+        paths.append(p)
+    compositor = ReferenceImageCompositor(canvas_size=256, cache=cache)
+
+    out1 = compositor.composite_images(paths, tmp_path / "c1.png")
+    misses = cache.misses
+    out2 = compositor.composite_images(paths, tmp_path / "c2.png")
+
+    assert out1.read_bytes() == out2.read_bytes()
+    assert cache.misses == misses
+    assert Image.open(out2).size == (256, 256)
+
+
+def test_spill_directory_is_pruned_to_disk_budget(tmp_path):
+    spill = tmp_path / "spill"
+    cache = ReferenceCache(cache_dir=spill, memory_budget=10, disk_budget=20)
+    for key in "abcd":
+        cache.put(key, key.encode() * 10)
+    # a, b and c were spilled; only the two most recent fit the disk budget
+    assert sorted(p.stem for p in spill.glob("*.bin")) == ["b", "c"]
+    assert cache.disk_used == 20
+    # A disk hit refreshes the entry, so the next spill evicts c instead
+    assert cache.get("b") == b"b" * 10
+    cache.put("e", b"e" * 10)
+    assert sorted(p.stem for p in spill.glob("*.bin")) == ["b", "d"]
+
+
+def test_disk_budget_counts_files_from_earlier_sessions(tmp_path):
+    spill = tmp_path / "spill"
+    spill.mkdir()
+    for i, key in enumerate(["old1", "old2"]):
+        (spill / f"{key}.bin").write_bytes(b"x" * 10)
+        os.utime(spill / f"{key}.bin", ns=(i * 10**9, i * 10**9))
+    cache = ReferenceCache(cache_dir=spill, memory_budget=10, disk_budget=20)
+    assert cache.disk_used == 20
+    cache.put("a", b"a" * 10)
+    cache.put("b", b"b" * 10)
+    assert sorted(p.stem for p in spill.glob("*.bin")) == ["a", "old2"]
+
+
+def test_padded_reference_passthrough_keeps_original_bytes(tmp_path):
+    cache = ReferenceCache(cache_dir=tmp_path / "spill")
+    buf = io.BytesIO()
+    Image.new("RGB", (160, 90), (10, 20, 30)).save(buf, format="JPEG")
+    jpeg = buf.getvalue()
+
+    assert cache.padded_reference(jpeg, 16 / 9, "gemini", passthrough=True) == jpeg
+    padded = cache.padded_reference(jpeg, 1.0, "gemini", passthrough=True)
+    assert Image.open(io.BytesIO(padded)).format == "PNG"
+    assert Image.open(io.BytesIO(padded)).size == (160, 160)
@@ -0,0 +1,150 @@
+"""Tests for cached body part segmentation and the shared segmenter."""
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from core.character_animator import segmenter as segmenter_module
+from core.character_animator.segmenter import (
+    BodyPartSegmenter,
+    get_shared_segmenter,
+    release_shared_segmenter,
+)
+
+
+def _character():
+    image = Image.new("RGB", (320, 400), (255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((110, 40, 210, 160), fill=(230, 190, 160))
+    draw.rectangle((100, 170, 220, 360), fill=(60, 90, 160))
+    return image
+
+
+def _landmarks(count, columns, seed):
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(0, 1, (count, columns))
+    points[:, 0] = 110 + points[:, 0] * 100
+    points[:, 1] = 40 + points[:, 1] * 120
+    return points
+
+
+def _segmenter(tmp_path):
+    segmenter = BodyPartSegmenter(cache_dir=tmp_path)
+    segmenter.inferences = []
+    segmenter.initialize = lambda: segmenter.inferences.append("init") or True
+    segmenter._pose_landmarks = lambda image: segmenter.inferences.append("pose") or _landmarks(33, 4, 1)
+    segmenter._face_landmarks = lambda image: segmenter.inferences.append("face") or _landmarks(478, 3, 2)
+    return segmenter
+
+
+def _assert_same(a, b):
+    assert np.array_equal(a.pose_landmarks, b.pose_landmarks)
+    assert np.array_equal(a.face_landmarks, b.face_landmarks)
+    for (part, (mask_a, bbox_a)), (_, (mask_b, bbox_b)) in zip(
+            a.get_body_parts().items(), b.get_body_parts().items()):
+        assert bbox_a == bbox_b, part
+        assert (mask_a is None and mask_b is None) or np.array_equal(mask_a, mask_b), part
+    for name, region in a.get_facial_regions().items():
+        other = b.get_facial_regions()[name]
+        assert region.name == other.name and region.bbox == other.bbox, name
+        assert isinstance(other.bbox[0], int)
+        assert np.array_equal(region.landmarks, other.landmarks), name
+
+
+def test_repeated_segmentation_is_served_from_cache(tmp_path):
+    image = _character()
+    first = _segmenter(tmp_path).segment_body_parts(image)
+    assert first.head_mask is not None and first.mouth_region is not None
+
+    # A new segmenter (another wizard run) and a reloaded copy of the image
+    segmenter = _segmenter(tmp_path)
+    again = segmenter.segment_body_parts(image.copy())
+    assert segmenter.inferences == []
+    assert again.original_image.size == image.size
+    _assert_same(first, again)
+
+
+def test_cache_is_keyed_by_content_and_models(tmp_path, monkeypatch):
+    image = _character()
+    _segmenter(tmp_path).segment_body_parts(image)
+
+    edited = image.copy()
+    edited.putpixel((0, 0), (0, 0, 0))
+    segmenter = _segmenter(tmp_path)
+    segmenter.segment_body_parts(edited)
+    assert segmenter.inferences == ["init", "pose", "face"]
+
+    monkeypatch.setattr(segmenter_module, "POSE_MODEL_COMPLEXITY", 1)
+    segmenter = _segmenter(tmp_path)
+    segmenter.segment_body_parts(image)
+    assert segmenter.inferences == ["init", "pose", "face"]
+    assert len(list(tmp_path.glob("*.npz"))) == 3
+
+
+def test_use_cache_false_runs_inference_and_writes_nothing(tmp_path):
+    image = _character()
+    for _ in range(2):
+        segmenter = _segmenter(tmp_path)
+        segmenter.segment_body_parts(image, use_cache=False)
+        assert segmenter.inferences == ["init", "pose", "face"]
+    assert not list(tmp_path.iterdir())
+
+
+def test_corrupt_cache_entry_is_recomputed(tmp_path):
+    image = _character()
+    segmenter = _segmenter(tmp_path)
+    path = segmenter._get_cache_path(image)
+    path.write_bytes(b"not an npz")
+    assert segmenter.segment_body_parts(image).mouth_region is not None
+    assert segmenter.inferences == ["init", "pose", "face"]
+    assert _segmenter(tmp_path).segment_body_parts(image).mouth_region is not None
+
+
+def test_failed_detection_is_not_cached(tmp_path):
+    image = _character()
+    segmenter = _segmenter(tmp_path)
+
+    def broken(image):
+        raise RuntimeError("inference crashed")
+
+    segmenter._face_landmarks = broken
+    result = segmenter.segment_body_parts(image)
+    assert result.face_landmarks is None and result.pose_landmarks is not None
+    assert not list(tmp_path.glob("*.npz"))
+
+    # A later run that succeeds is cached as usual
+    assert _segmenter(tmp_path).segment_body_parts(image).mouth_region is not None
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+
+def test_nothing_detected_is_still_cached(tmp_path):
+    image = _character()
+    segmenter = _segmenter(tmp_path)
+    segmenter._face_landmarks = lambda image: None  # ran fine, found no face
+    segmenter.segment_body_parts(image)
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+
+def test_models_are_initialized_under_the_inference_lock(tmp_path):
+    segmenter = _segmenter(tmp_path)
+    held = []
+    segmenter.initialize = lambda: held.append(segmenter._inference_lock.locked()) or True
+    segmenter.segment_body_parts(_character(), use_cache=False)
+    assert held == [True]
+
+
+@pytest.fixture
+def no_shared_segmenter():
+    release_shared_segmenter()
+    yield
+    release_shared_segmenter()
+
+
+def test_shared_segmenter_stays_loaded_until_released(no_shared_segmenter, monkeypatch):
+    released = []
+    monkeypatch.setattr(BodyPartSegmenter, "cleanup", lambda self: released.append(self))
+    shared = get_shared_segmenter()
+    assert get_shared_segmenter() is shared
+    release_shared_segmenter()
+    assert released == [shared]
+    assert get_shared_segmenter() is not shared
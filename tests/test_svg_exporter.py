@@ -0,0 +1,149 @@
+"""Tests for alpha-traced SVG puppet export."""
+
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from core.character_animator import svg_exporter
+from core.character_animator.models import EyeBlinkSet, PuppetLayer, PuppetStructure, VisemeSet
+from core.character_animator.svg_exporter import SVGExporter, trace_layer
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def _subpaths(path_data):
+    """Point arrays of the "M x y L x y x y ... Z" subpaths."""
+    subpaths = []
+    for part in path_data.split("M")[1:]:
+        numbers = part.replace("L", " ").replace("Z", " ").split()
+        subpaths.append(np.array(numbers, dtype=float).reshape(-1, 2))
+    return subpaths
+
+
+def _render(paths, size):
+    """Rasterize traced paths with the evenodd rule, as (color, mask) pairs."""
+    rendered = []
+    for fill, path_data in paths:
+        mask = np.zeros(size[::-1], dtype=bool)
+        for points in _subpaths(path_data):
+            poly = Image.new("1", size, 0)
+            ImageDraw.Draw(poly).polygon([tuple(p) for p in points], fill=1, outline=1)
+            mask ^= np.asarray(poly)
+        rendered.append((fill, mask))
+    return rendered
+
+
+def _ring(size=(200, 160), color=(200, 60, 40, 255)):
+    image = Image.new("RGBA", size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((30, 20, 170, 140), fill=color)
+    draw.ellipse((80, 60, 120, 100), fill=(0, 0, 0, 0))
+    return image
+
+
+def test_trace_follows_the_alpha_mask_and_keeps_holes():
+    image = _ring()
+    paths = trace_layer(image, tolerance=1.0)
+    assert [fill for fill, _ in paths] == ["#c83c28"]
+    assert len(_subpaths(paths[0][1])) == 2  # outline and hole
+
+    (_, mask), = _render(paths, image.size)
+    alpha = np.asarray(image)[:, :, 3] > 0
+    iou = (mask & alpha).sum() / (mask | alpha).sum()
+    assert iou > 0.97
+    assert not mask[80, 100]  # the hole stays transparent
+
+
+def test_tolerance_trades_vertices_for_accuracy():
+    image = _ring()
+    counts = [sum(len(p) for _, d in trace_layer(image, tolerance=t) for p in _subpaths(d))
+              for t in (0, 1.0, 4.0)]
+    assert counts[0] > counts[1] > counts[2]
+
+
+def test_colors_are_traced_over_the_dominant_fill():
+    image = Image.new("RGBA", (120, 100), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((10, 10, 110, 90), fill=(240, 200, 170, 255))
+    draw.rectangle((40, 40, 70, 60), fill=(30, 30, 30, 255))
+    (base_fill, base), (detail_fill, detail) = _render(trace_layer(image), image.size)
+    assert (base_fill, detail_fill) == ("#f0c8aa", "#1e1e1e")
+    assert base[50, 55] and base[15, 15]  # the base covers the whole silhouette
+    assert detail[50, 55] and not detail[15, 15]
+
+
+def test_blank_layer_traces_to_nothing():
+    assert trace_layer(Image.new("RGBA", (50, 50), (255, 255, 255, 0))) == []
+
+
+def _puppet(size=(200, 160)):
+    body = _ring(size, color=(60, 90, 160, 255))
+    root = PuppetLayer(name="Puppet")
+    root.add_child(PuppetLayer(name="Body", image=body))
+    puppet = PuppetStructure(name="Test", root_layer=root, visemes=VisemeSet(),
+                             eye_blinks=EyeBlinkSet(), width=size[0], height=size[1])
+    exporter = SVGExporter(puppet)
+    mouths = {}
+    for i, name in enumerate(["neutral", "ah", "oh"]):
+        mouth = Image.new("RGBA", size, (0, 0, 0, 0))
+        ImageDraw.Draw(mouth).ellipse((80, 100 - 5 * i, 120, 110 + 5 * i), fill=(150, 40, 60, 255))
+        mouths[name] = mouth
+    mouths["m"] = mouths["neutral"].copy()  # identical content, another image
+    exporter.populate_from_visemes(VisemeSet(**mouths))
+    exporter.populate_from_blinks(EyeBlinkSet(left_blink=Image.new("RGBA", size, (0, 0, 0, 0))))
+    return puppet
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_traced_export_dedupes_identical_layers(tmp_path, monkeypatch, workers):
+    traced = []
+    trace = svg_exporter.trace_layer
+    monkeypatch.setattr(svg_exporter, "trace_layer",
+                        lambda image, **kw: traced.append(image) or trace(image, **kw))
+    puppet = _puppet()
+    path = tmp_path / "puppet.svg"
+    assert SVGExporter(puppet, trace_alpha=True, workers=workers).export(path)
+    assert len(traced) == 5  # body, 3 distinct mouths, blank blink
+
+    root = ET.parse(path).getroot()
+    assert not list(root.iter(f"{SVG}image"))
+    groups = {g.get("id"): g for g in root.iter(f"{SVG}g")}
+    assert groups["M"].find(f"{SVG}path").get("d") == groups["Neutral"].find(f"{SVG}path").get("d")
+    assert groups["Ah"].get("visibility") == "hidden"
+    assert groups["Left_Blink"].find(f"{SVG}path") is None
+
+    raster = tmp_path / "raster.svg"
+    assert SVGExporter(puppet).export(raster)
+    assert path.stat().st_size < raster.stat().st_size
+
+
+def test_trace_colors_and_savings_come_from_the_exporter(tmp_path, monkeypatch):
+    colors = []
+    trace = svg_exporter.trace_layer
+    monkeypatch.setattr(svg_exporter, "trace_layer",
+                        lambda image, **kw: colors.append(kw["max_colors"]) or trace(image, **kw))
+    exporter = SVGExporter(_puppet(), trace_alpha=True, trace_colors=3, report_savings=True,
+                           workers=1)
+    assert exporter.export(tmp_path / "puppet.svg")
+    assert colors and set(colors) == {3}
+    raster, traced = exporter.trace_savings
+    assert 0 < traced < raster
+
+
+def test_exporter_defaults_follow_svg_settings():
+    exporter = SVGExporter(_puppet())
+    assert exporter.trace_alpha == svg_exporter.SVG_SETTINGS["trace_alpha"]
+    assert exporter.trace_colors == svg_exporter.SVG_SETTINGS["trace_colors"]
+    assert exporter.trace_savings is None
+
+
+def test_traced_export_encodes_no_pngs_unless_savings_are_requested(tmp_path, monkeypatch):
+    encoded = []
+    to_base64 = SVGExporter._image_to_base64
+    monkeypatch.setattr(SVGExporter, "_image_to_base64",
+                        lambda self, image: encoded.append(image) or to_base64(self, image))
+    exporter = SVGExporter(_puppet(), trace_alpha=True, workers=1)
+    assert exporter.export(tmp_path / "puppet.svg")
+    assert encoded == [] and exporter.trace_savings is None
@@ -0,0 +1,109 @@
+"""Tests for the NumPy contour helpers and pooled vectorization."""
+
+import math
+import random
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+
+from core.font_generator.vectorizer import GlyphVectorizer, SmoothingLevel
+from tests.benchmarks.bench_vectorize import (
+    glyph_sheet, loop_corners, loop_resample, loop_tangents,
+)
+
+
+def _contour(rng, n):
+    # Wobbly closed curve with a few repeated points (zero-length steps)
+    points = []
+    for i in range(n):
+        a = 2 * math.pi * i / n
+        r = 100 + 20 * math.sin(5 * a) + rng.uniform(-3, 3)
+        points.append((round(200 + r * math.cos(a)), round(200 + r * math.sin(a))))
+        if rng.random() < 0.05:
+            points.append(points[-1])
+    return [(float(x), float(y)) for x, y in points]
+
+
+def test_numpy_helpers_match_point_loops():
+    rng = random.Random(3)
+    vectorizer = GlyphVectorizer(smoothing=SmoothingLevel.MEDIUM)
+    for n in (5, 21, 64, 400):
+        points = _contour(rng, n)
+        for target in (3, 8, max(8, len(points) // 3)):
+            assert np.allclose(vectorizer._resample_points(points, target),
+                               loop_resample(points, target) if len(points) > target else points)
+        assert np.allclose(vectorizer._calculate_tangents(points), loop_tangents(points))
+        assert vectorizer._detect_corners(points) == loop_corners(points,
+                                                                  vectorizer.corner_threshold)
+
+
+@pytest.mark.parametrize("use_bezier", [True, False])
+def test_pooled_vectorize_all_matches_serial(use_bezier):
+    cells = glyph_sheet(48)[:20]
+    vectorizer = GlyphVectorizer(use_bezier=use_bezier)
+    progress = []
+    serial = vectorizer.vectorize_all(cells, workers=1)
+    pooled = vectorizer.vectorize_all(cells, workers=2,
+                                      progress_callback=lambda d, t: progress.append((d, t)))
+    assert [g.label for g in pooled] == [c.label for c in cells]
+    assert [[p.to_svg_d() for p in g.paths] for g in pooled] == \
+        [[p.to_svg_d() for p in g.paths] for g in serial]
+    assert progress == [(i + 1, len(cells)) for i in range(len(cells))]
+
+
+class _BreakingPool:
+    """Stands in for the process pool; dies after ``survive`` results."""
+
+    contexts = []
+
+    def __init__(self, max_workers, mp_context):
+        self.contexts.append(mp_context.get_start_method())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, vectorizers, jobs, chunksize):
+        for done, (vectorizer, job) in enumerate(zip(vectorizers, jobs)):
+            if done == self.survive:
+                raise BrokenProcessPool("worker died")
+            yield fn(vectorizer, job)
+
+
+def test_broken_pool_finishes_remaining_glyphs_serially(monkeypatch):
+    from core.font_generator import vectorizer as module
+    monkeypatch.setattr(_BreakingPool, "survive", 7, raising=False)
+    monkeypatch.setattr(module, "ProcessPoolExecutor", _BreakingPool)
+    cells = glyph_sheet(48)[:20]
+    vectorizer = GlyphVectorizer()
+    vectorized = []
+    original = vectorizer.vectorize
+    monkeypatch.setattr(vectorizer, "vectorize",
+                        lambda image, label: vectorized.append(label) or original(image, label))
+    progress = []
+    glyphs = vectorizer.vectorize_all(cells, workers=2,
+                                      progress_callback=lambda d, t: progress.append(d))
+    assert _BreakingPool.contexts[-1] == "spawn"
+    assert [g.label for g in glyphs] == [c.label for c in cells]
+    assert vectorized == [c.label for c in cells]  # each glyph exactly once
+    assert progress == list(range(1, len(cells) + 1))
+
+
+def test_glyph_errors_are_not_retried_serially(monkeypatch):
+    from core.font_generator import vectorizer as module
+    monkeypatch.setattr(_BreakingPool, "survive", None, raising=False)
+    monkeypatch.setattr(module, "ProcessPoolExecutor", _BreakingPool)
+    vectorizer = GlyphVectorizer()
+    calls = []
+
+    def vectorize(image, label):
+        calls.append(label)
+        raise ValueError("bad glyph")
+
+    monkeypatch.setattr(vectorizer, "vectorize", vectorize)
+    with pytest.raises(ValueError):
+        vectorizer.vectorize_all(glyph_sheet(48)[:20], workers=2)
+    assert len(calls) == 1
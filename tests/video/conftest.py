@@ -0,0 +1,12 @@
+import pytest
+
+from core.video import lro_poller
+
+
+@pytest.fixture(autouse=True)
+def _isolated_lro_poller(monkeypatch):
+    """Keep operation timing stats in memory and lift the status-call budget."""
+    monkeypatch.setattr(lro_poller, "_shared_stats", lro_poller.CompletionStats())
+    monkeypatch.setattr(lro_poller, "_shared_budget",
+                        lro_poller.RequestBudget(requests_per_minute=600_000, burst=1000))
+    monkeypatch.setattr(lro_poller, "_pollers", lro_poller.weakref.WeakKeyDictionary())
@@ -0,0 +1,177 @@
+"""Tests for the shared adaptive long-running-operation poller."""
+
+import asyncio
+import gc
+import threading
+import time
+
+import pytest
+
+from core.video.lro_poller import CompletionStats, LROPoller, RequestBudget
+
+
+class _Operation:
+    """Becomes done once ``ready_at`` has passed; counts status checks."""
+
+    def __init__(self, duration):
+        self.ready_at = time.time() + duration
+        self.checks = 0
+        self.done = False
+        self._lock = threading.Lock()
+
+    def refresh(self, _current):
+        with self._lock:
+            self.checks += 1
+            self.done = time.time() >= self.ready_at
+        return self
+
+
+def _poller(**kwargs):
+    kwargs.setdefault("budget", RequestBudget(requests_per_minute=600_000, burst=1000))
+    return LROPoller(CompletionStats(), jitter=0.0, **kwargs)
+
+
+def test_next_delay_uses_base_interval_without_history():
+    stats = CompletionStats()
+    stats.record("m", 60)
+    assert stats.next_delay("m", elapsed=5, base_interval=10) == 10
+
+
+def test_next_delay_adapts_to_observed_durations():
+    stats = CompletionStats()
+    for seconds in (60, 62, 65, 70, 90):
+        stats.record("m", seconds)
+
+    # Early on, skip ahead toward the fastest completions (capped at 3x base)
+    assert stats.next_delay("m", elapsed=0, base_interval=10) == 30
+    assert stats.next_delay("m", elapsed=50, base_interval=10) == 10
+    # Near the typical completion time, check more often (floored at 0.2x base)
+    assert stats.next_delay("m", elapsed=64, base_interval=10) == pytest.approx(3.0)
+    assert stats.next_delay("m", elapsed=69.8, base_interval=10) == 2.0
+    # Slower than everything seen: back off to the maximum
+    assert stats.next_delay("m", elapsed=120, base_interval=10) == 30
+
+
+def test_stats_persist_across_instances(tmp_path):
+    path = tmp_path / "timings.json"
+    CompletionStats(path).record("veo-3", 42.0)
+    assert CompletionStats(path).samples("veo-3") == [42.0]
+
+
+def test_budget_limits_burst():
+    budget = RequestBudget(requests_per_minute=60, burst=2)
+    assert budget.reserve() == 0.0
+    assert budget.reserve() == 0.0
+    assert budget.reserve() == pytest.approx(1.0, abs=0.05)
+
+
+def test_many_operations_share_one_driver():
+    poller = _poller()
+    operations = [_Operation(0.05 * (i + 1)) for i in range(5)]
+
+    async def run():
+        return await asyncio.gather(*(
+            poller.wait(op.refresh, lambda o: o.done, op, model="m",
+                        timeout=5, base_interval=0.01)
+            for op in operations
+        ))
+
+    results = asyncio.run(run())
+    assert all(r.done for r in results)
+    assert len(poller.stats.samples("m")) == 5
+    assert poller.status_calls == sum(op.checks for op in operations)
+
+
+def test_history_reduces_status_calls():
+    poller = _poller()
+
+    async def run_one():
+        op = _Operation(0.3)
+        await poller.wait(op.refresh, lambda o: o.done, op, model="m",
+                          timeout=5, base_interval=0.02)
+        return op.checks
+
+    async def run():
+        cold = await run_one()
+        for _ in range(3):
+            await run_one()
+        return cold, await run_one()
+
+    cold, warm = asyncio.run(run())
+    assert warm < cold
+
+
+def test_timeout_returns_last_state():
+    poller = _poller()
+    op = _Operation(60)
+
+    async def run():
+        return await poller.wait(op.refresh, lambda o: o.done, op, model="m",
+                                 timeout=0.1, base_interval=0.02)
+
+    result = asyncio.run(run())
+    assert not result.done
+    assert poller.stats.samples("m") == []
+
+
+def test_refresh_errors_raise_after_max_errors():
+    poller = _poller()
+    calls = []
+
+    def failing(_current):
+        calls.append(1)
+        raise RuntimeError("boom")
+
+    async def run():
+        return await poller.wait(failing, lambda o: False, object(), model="m",
+                                 timeout=5, base_interval=0.01, max_errors=2)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_budget_throttles_status_calls():
+    poller = _poller(budget=RequestBudget(requests_per_minute=600, burst=1))  # 10/s
+    op = _Operation(0.25)
+
+    async def run():
+        return await poller.wait(op.refresh, lambda o: o.done, op, model="m",
+                                 timeout=5, base_interval=0.0)
+
+    start = time.time()
+    asyncio.run(run())
+    elapsed = time.time() - start
+    # Unthrottled this would be hundreds of calls; the budget allows ~10/s
+    assert op.checks <= int(elapsed * 10) + 2
+
+
+@pytest.mark.parametrize("refresh_seconds", [0.0, 0.2])  # waiting, or a check in flight
+def test_cancelled_waiter_leaves_nothing_pending(refresh_seconds):
+    poller = _poller()
+    errors = []
+
+    def refresh(current):
+        time.sleep(refresh_seconds)
+        return current
+
+    async def run():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                poller.wait(refresh, lambda o: False, object(), model="m", timeout=60,
+                            base_interval=0.0 if refresh_seconds else 5.0),
+                timeout=0.05)
+
+    # Like the sync wrappers: a private loop closed as soon as the call returns
+    loop = asyncio.new_event_loop()
+    loop.set_exception_handler(lambda _loop, context: errors.append(context["message"]))
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+    assert poller._heap == []
+    assert poller._driver.done()
+    assert all(task.done() for task in poller._checks)
+    del loop
+    gc.collect()
+    assert errors == []
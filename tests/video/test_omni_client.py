@@ -12,6 +12,7 @@ import types as pytypes
 
 import pytest
 
+from core.video import remote_files
 from core.video.omni_client import (
     OmniClient,
     OmniGenerationConfig,
@@ -63,6 +64,14 @@ class _FakeGenaiClient:
         self.files = None
 
 
+@pytest.fixture(autouse=True)
+def _isolated_file_registry(tmp_path, monkeypatch):
+    """Keep upload-dedup state out of the user's home directory."""
+    registry = remote_files.RemoteFileRegistry(tmp_path / "remote_files.json")
+    monkeypatch.setattr(remote_files, "_registry", registry)
+    return registry
+
+
 def _make_client(response):
     client = OmniClient(api_key="test-key")
     client.client = _FakeGenaiClient(response)
@@ -475,3 +484,91 @@ def test_validate_config_checks_input_video_exists(tmp_path):
     is_valid, error = client.validate_config(cfg)
     assert is_valid is False
     assert "missing.mp4" in error
+
+
+def _active_files_api(uploaded, upload_calls, get_calls=None):
+    def _upload(file):
+        upload_calls.append(file)
+        return uploaded
+
+    def _get(name):
+        if get_calls is not None:
+            get_calls.append(name)
+        return uploaded
+
+    return pytypes.SimpleNamespace(upload=_upload, get=_get, download=lambda file: MP4_BYTES)
+
+
+def test_repeat_edit_reuses_active_upload(tmp_path, _isolated_file_registry):
+    vid = tmp_path / "clip.mp4"
+    vid.write_bytes(MP4_BYTES)
+    b64 = base64.b64encode(MP4_BYTES).decode("ascii")
+    client = _make_client(_FakeInteraction(output_video=_FakeVideoContent(data=b64)))
+    uploaded = pytypes.SimpleNamespace(
+        name="files/upload1", uri="https://files.example/files/upload1",
+        state=pytypes.SimpleNamespace(name="ACTIVE"),
+    )
+    upload_calls, get_calls = [], []
+    client.client.files = _active_files_api(uploaded, upload_calls, get_calls)
+    client.polling_interval = 0
+
+    # Same content under a different path is deduplicated too.
+    copy = tmp_path / "copy.mp4"
+    copy.write_bytes(MP4_BYTES)
+    for path in (vid, copy):
+        cfg = OmniGenerationConfig(prompt="ripple", input_video=path)
+        assert client.generate_video(cfg, tmp_path / "out.mp4").success is True
+
+    assert upload_calls == [str(vid)]
+    assert get_calls == ["files/upload1"]  # state check before reuse
+    sent = client.client.interactions.create_calls[1]
+    assert sent["input"][0]["uri"] == "https://files.example/files/upload1"
+
+
+def test_reupload_when_registered_file_is_gone(tmp_path, _isolated_file_registry):
+    vid = tmp_path / "clip.mp4"
+    vid.write_bytes(MP4_BYTES)
+    b64 = base64.b64encode(MP4_BYTES).decode("ascii")
+    client = _make_client(_FakeInteraction(output_video=_FakeVideoContent(data=b64)))
+    uploaded = pytypes.SimpleNamespace(
+        name="files/upload2", uri="https://files.example/files/upload2",
+        state=pytypes.SimpleNamespace(name="ACTIVE"),
+    )
+    stale = pytypes.SimpleNamespace(name="files/old", uri="https://files.example/files/old")
+    _isolated_file_registry.record(
+        remote_files.file_sha256(vid), remote_files.account_scope("test-key"), stale)
+
+    upload_calls = []
+
+    def _get(name):
+        if name == "files/old":
+            raise RuntimeError("404 not found")
+        return uploaded
+
+    client.client.files = pytypes.SimpleNamespace(
+        upload=lambda file: upload_calls.append(file) or uploaded, get=_get,
+        download=lambda file: MP4_BYTES,
+    )
+    client.polling_interval = 0
+
+    cfg = OmniGenerationConfig(prompt="ripple", input_video=vid)
+    assert client.generate_video(cfg, tmp_path / "out.mp4").success is True
+    assert upload_calls == [str(vid)]
+    handle = _isolated_file_registry.lookup(
+        remote_files.file_sha256(vid), remote_files.account_scope("test-key"))
+    assert handle.name == "files/upload2"
+
+
+def test_registry_persists_and_drops_expired(tmp_path):
+    path = tmp_path / "registry.json"
+    registry = remote_files.RemoteFileRegistry(path)
+    live = pytypes.SimpleNamespace(name="files/a", uri="u-a")
+    registry.record("hash-a", "scope", live)
+    registry.record("hash-b", "scope", pytypes.SimpleNamespace(name="files/b", uri="u-b"))
+    registry._handles["scope:hash-b"].expires_at = 0
+    registry._save()
+
+    reloaded = remote_files.RemoteFileRegistry(path)
+    assert reloaded.lookup("hash-a", "scope").uri == "u-a"
+    assert reloaded.lookup("hash-b", "scope") is None
+    assert reloaded.lookup("hash-a", "other-account") is None
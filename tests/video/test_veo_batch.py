@@ -0,0 +1,205 @@
+"""Tests for VeoClient.generate_batch scheduling, streaming, cancel and resume.
+
+The google.genai client is replaced by a fake whose operations finish after a
+configurable number of polls, so no network is used and timing is controlled.
+"""
+
+import threading
+import time
+import types as pytypes
+
+import pytest
+
+from core.video import lro_poller
+from core.video.operation_journal import OperationJournal
+from core.video.veo_client import VeoClient, VeoGenerationConfig, VeoModel
+
+
+class _FakeOperation:
+    def __init__(self, name, done=False):
+        self.name = name
+        self.done = done
+        self.error = None
+        video = pytypes.SimpleNamespace(uri=None, video_bytes=f"video:{name}".encode())
+        self.response = pytypes.SimpleNamespace(
+            generated_videos=[pytypes.SimpleNamespace(video=video)])
+
+
+class _FakeVeoApi:
+    """Operations finish after ``polls_for(prompt)`` status checks."""
+
+    def __init__(self, polls_by_prompt):
+        self.polls_by_prompt = polls_by_prompt
+        self.submitted = []
+        self.prompts = {}
+        self.polls = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.completion_order = []
+        self._lock = threading.Lock()
+        self.models = pytypes.SimpleNamespace(generate_videos=self._generate_videos)
+        self.operations = pytypes.SimpleNamespace(get=self._get)
+
+    def _generate_videos(self, model, prompt, config, image=None):
+        with self._lock:
+            name = f"operations/{len(self.submitted)}"
+            self.submitted.append(prompt)
+            self.prompts[name] = prompt
+            self.polls[name] = 0
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return _FakeOperation(name)
+
+    def _get(self, operation):
+        with self._lock:
+            name = operation.name
+            self.polls[name] = self.polls.get(name, 0) + 1
+            done = self.polls[name] >= self.polls_by_prompt.get(self.prompts.get(name), 1)
+            if done:
+                self.in_flight -= 1
+                self.completion_order.append(self.prompts.get(name, name))
+        return _FakeOperation(name, done=done)
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return OperationJournal(tmp_path / "ops.json")
+
+
+def _client(api, tmp_path, monkeypatch):
+    client = VeoClient(api_key=None, region="US")
+    client.client = api
+    client.polling_interval = 0.01
+
+    async def _save(video_bytes):
+        path = tmp_path / f"{abs(hash(video_bytes))}.mp4"
+        path.write_bytes(video_bytes)
+        return path
+
+    monkeypatch.setattr(client, "_save_video_bytes", _save)
+    return client
+
+
+def _configs(*prompts):
+    return [VeoGenerationConfig(model=VeoModel.VEO_3_1_FAST, prompt=p, resolution="720p",
+                                duration=8) for p in prompts]
+
+
+def test_slow_clip_does_not_stall_other_slots(tmp_path, monkeypatch, journal):
+    api = _FakeVeoApi({"slow": 40, "a": 2, "b": 2, "c": 2, "d": 2})
+    client = _client(api, tmp_path, monkeypatch)
+    streamed = []
+
+    results = client.generate_batch(
+        _configs("slow", "a", "b", "c", "d"), max_concurrent=2,
+        on_result=lambda i, r: streamed.append(i), journal=journal)
+
+    assert all(r.success for r in results)
+    assert [r.video_path.read_bytes() for r in results] == [
+        f"video:operations/{api.submitted.index(p)}".encode() for p in ("slow", "a", "b", "c", "d")]
+    assert api.max_in_flight == 2
+    # Fixed chunks would hold "b".."d" until "slow" finished
+    assert api.completion_order[-1] == "slow"
+    assert streamed[-1] == 0 and sorted(streamed) == [0, 1, 2, 3, 4]
+    assert journal.pending() == []
+
+
+def test_cancel_skips_queued_and_keeps_in_flight_resumable(tmp_path, monkeypatch, journal):
+    api = _FakeVeoApi({"first": 1, "long": 10_000, "queued": 1})
+    client = _client(api, tmp_path, monkeypatch)
+    cancel = threading.Event()
+
+    def on_result(index, result):
+        if result.success:
+            cancel.set()
+
+    results = client.generate_batch(
+        _configs("first", "long", "queued"), max_concurrent=2,
+        on_result=on_result, cancel_event=cancel, journal=journal)
+
+    assert results[0].success
+    assert results[1].error == "Cancelled" and results[2].error == "Cancelled"
+    assert "queued" not in api.submitted
+    assert [op.prompt for op in journal.pending()] == ["long"]
+
+
+def test_resume_polls_journaled_operation_instead_of_resubmitting(tmp_path, monkeypatch, journal):
+    api = _FakeVeoApi({})
+    client = _client(api, tmp_path, monkeypatch)
+    config = _configs("scene one")[0]
+    journal.record(config.fingerprint() + "#1", "operations/previous", config.model.value, config.prompt)
+
+    results = client.generate_batch([config], journal=OperationJournal(journal.journal_path))
+
+    assert results[0].success
+    assert results[0].operation_id == "operations/previous"
+    assert results[0].metadata["resumed"] is True
+    assert api.submitted == []
+    assert OperationJournal(journal.journal_path).pending() == []
+
+
+def test_resumed_operation_is_timed_from_its_original_submission(tmp_path, monkeypatch, journal):
+    api = _FakeVeoApi({})
+    client = _client(api, tmp_path, monkeypatch)
+    config = _configs("scene one")[0]
+    journal.record(config.fingerprint() + "#1", "operations/previous", config.model.value, config.prompt)
+    journal.get(config.fingerprint() + "#1").submitted_at = time.time() - 120
+
+    assert client.generate_batch([config], journal=journal)[0].success
+    (elapsed,) = lro_poller._shared_stats.samples(config.model.value)
+    assert elapsed >= 120
+
+
+def test_poll_errors_keep_operation_resumable(tmp_path, monkeypatch, journal):
+    api = _FakeVeoApi({})
+
+    def _failing_get(operation):
+        raise ConnectionError("status check failed")
+
+    api.operations = pytypes.SimpleNamespace(get=_failing_get)
+    client = _client(api, tmp_path, monkeypatch)
+
+    (result,) = client.generate_batch(_configs("scene"), journal=journal)
+
+    assert not result.success
+    assert result.metadata["poll_failed"] is True
+    assert "timed_out" not in result.metadata
+    assert [op.operation_name for op in journal.pending()] == ["operations/0"]
+
+
+def test_cancel_during_submission_still_journals_operation(tmp_path, monkeypatch, journal):
+    api = _FakeVeoApi({"scene": 10_000})
+    entered, release = threading.Event(), threading.Event()
+    generate_videos = api.models.generate_videos
+
+    def _slow_generate_videos(**kwargs):
+        entered.set()
+        release.wait(5)
+        return generate_videos(**kwargs)
+
+    api.models = pytypes.SimpleNamespace(generate_videos=_slow_generate_videos)
+    client = _client(api, tmp_path, monkeypatch)
+    cancel = threading.Event()
+    results = []
+    batch = threading.Thread(target=lambda: results.extend(client.generate_batch(
+        _configs("scene"), cancel_event=cancel, journal=journal)))
+    batch.start()
+
+    assert entered.wait(5)
+    cancel.set()
+    time.sleep(0.5)  # the cancel lands while generate_videos is still running
+    release.set()
+    batch.join(5)
+
+    assert results[0].error == "Cancelled"
+    assert [op.operation_name for op in journal.pending()] == ["operations/0"]
+
+
+def test_fingerprint_follows_reference_image_content(tmp_path):
+    ref = tmp_path / "character.png"
+    ref.write_bytes(b"first version")
+    config = VeoGenerationConfig(model=VeoModel.VEO_3_1_FAST, prompt="p", resolution="720p",
+                                 duration=8, reference_images=[ref])
+    before = config.fingerprint()
+    ref.write_bytes(b"edited in place")
+    assert config.fingerprint() != before